@@ -48,3 +48,41 @@ def add_version_doc(f, version):
     indents = indent_p.findall(original_doc)
     indent = ' ' * (min(len(indent) for indent in indents) if indents else 0)
     f.__doc__ = original_doc.rstrip() + "\n\n%s.. versionadded:: %s" % (indent, version)
+
+
+def install_lazy_imports(package_name, lazy_imports):
+    """
+    Makes the attributes of a package importable lazily via the module level ``__getattr__`` of
+    PEP 562, so that importing the package only loads the modules which are actually used. The
+    submodules of the package are also imported on first access. The attributes are imported
+    eagerly on Python 3.6, which doesn't support PEP 562.
+
+    :param package_name: The name of the package, i.e. ``__name__`` of its ``__init__`` module.
+    :param lazy_imports: A dict from the names of the attributes to the names of the modules which
+                         define them, in the order in which they could be imported eagerly.
+    """
+    import importlib
+    package = sys.modules[package_name]
+
+    def load(name):
+        if name in lazy_imports:
+            value = getattr(importlib.import_module(lazy_imports[name]), name)
+        elif name.startswith('__'):
+            raise AttributeError("module %r has no attribute %r" % (package_name, name))
+        else:
+            module_name = "%s.%s" % (package_name, name)
+            try:
+                value = importlib.import_module(module_name)
+            except ModuleNotFoundError as e:
+                if e.name != module_name:
+                    raise
+                raise AttributeError("module %r has no attribute %r" % (package_name, name))
+        setattr(package, name, value)
+        return value
+
+    if sys.version_info < (3, 7):
+        for attribute_name in lazy_imports:
+            load(attribute_name)
+    else:
+        package.__getattr__ = load
+        package.__dir__ = lambda: sorted(set(package.__dict__) | set(lazy_imports))
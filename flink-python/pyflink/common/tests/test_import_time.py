@@ -0,0 +1,77 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import json
+import subprocess
+import sys
+import unittest
+
+# the modules which must not be loaded by importing the packages
+HEAVY_MODULES = ['pandas', 'pyarrow', 'numpy', 'py4j', 'cloudpickle',
+                 'pyflink.table.table_environment',
+                 'pyflink.datastream.stream_execution_environment']
+
+# the budget of the cold import time of the packages in seconds
+IMPORT_TIME_BUDGET = 0.5
+
+_IMPORT_SCRIPT = """
+import json
+import sys
+import time
+start = time.perf_counter()
+import %s
+elapsed = time.perf_counter() - start
+print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))
+"""
+
+
+@unittest.skipIf(sys.version_info < (3, 7), "Lazy imports are not supported on Python 3.6.")
+class ImportTimeTests(unittest.TestCase):
+
+    def test_import_table(self):
+        self._check_import('pyflink.table')
+
+    def test_import_datastream(self):
+        self._check_import('pyflink.datastream')
+
+    def test_lazy_attributes(self):
+        script = "import pyflink.table as t, pyflink.datastream as d; " \
+                 "assert all(getattr(t, n) is not None for n in t.__all__); " \
+                 "assert all(getattr(d, n) is not None for n in d.__all__); " \
+                 "assert t.expressions.lit is not None"
+        subprocess.check_call([sys.executable, '-c', script])
+
+    def _check_import(self, package):
+        results = [self._import_in_new_process(package) for _ in range(3)]
+        loaded = set(results[0]['modules'])
+        self.assertEqual([], [m for m in HEAVY_MODULES if m in loaded])
+        self.assertLess(min(r['elapsed'] for r in results), IMPORT_TIME_BUDGET)
+
+    @staticmethod
+    def _import_in_new_process(package):
+        output = subprocess.check_output([sys.executable, '-c', _IMPORT_SCRIPT % package])
+        return json.loads(output.decode('utf-8').strip().splitlines()[-1])
+
+
+if __name__ == '__main__':
+    try:
+        import xmlrunner
+
+        testRunner = xmlrunner.XMLTestRunner(output='target/test-reports')
+    except ImportError:
+        testRunner = None
+    unittest.main(testRunner=testRunner, verbosity=2)
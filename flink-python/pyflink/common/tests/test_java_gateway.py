@@ -0,0 +1,152 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+################################################################################
+import glob
+import os
+import shutil
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+import pyflink
+from pyflink.java_gateway import _connect_gateway
+from pyflink.pyflink_gateway_server import on_windows
+from pyflink.testing.test_case_utils import PyFlinkTestCase
+
+# prints whether the JVM has been launched before the Python process, i.e. it's a standby daemon
+SCRIPT = """
+import time
+start_time = int(time.time() * 1000)
+from pyflink.java_gateway import get_gateway
+jvm = get_gateway().jvm
+print(jvm.java.lang.management.ManagementFactory.getRuntimeMXBean().getStartTime() < start_time)
+"""
+
+
+@unittest.skipIf(on_windows(), "The gateway daemons are not supported on Windows")
+class GatewayDaemonTests(PyFlinkTestCase):
+
+    def setUp(self):
+        self.daemon_dir = tempfile.mkdtemp(dir=self.tempdir)
+        # the daemons are only shared by the Python processes with the same working directory
+        self.work_dir = tempfile.mkdtemp(dir=self.tempdir)
+        # the Python processes use the same PyFlink as the tests
+        pyflink_root = os.path.dirname(os.path.dirname(os.path.abspath(pyflink.__file__)))
+        self.env = dict(os.environ)
+        self.env.pop("PYFLINK_GATEWAY_PORT", None)
+        self.env["PYTHONPATH"] = os.pathsep.join(
+            [pyflink_root, self.env.get("PYTHONPATH", "")])
+        self.env["PYFLINK_GATEWAY_DAEMON"] = "true"
+        self.env["PYFLINK_GATEWAY_DAEMON_DIR"] = self.daemon_dir
+        self.env["PYFLINK_GATEWAY_DAEMON_IDLE_TIMEOUT"] = "60"
+
+    def tearDown(self):
+        info = self._read_daemon_info()
+        if info is not None:
+            self._stop_daemon(*info)
+        shutil.rmtree(self.daemon_dir, ignore_errors=True)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_launch_and_take_daemon(self):
+        # there is no standby daemon for the first Python process
+        self.assertEqual("False", self._run_script())
+        self._wait_for_daemon_info(True)
+        self.assertEqual("True", self._run_script())
+        # the taken daemon is replaced by a new one
+        self._wait_for_daemon_info(True)
+
+    def test_authentication(self):
+        self._run_script()
+        self._wait_for_daemon_info(True)
+        info_file = self._daemon_info_files()[0]
+        self.assertEqual(0o600, stat.S_IMODE(os.stat(info_file).st_mode))
+        gateway_port, auth_token = self._read_daemon_info()
+
+        gateway = _connect_gateway(gateway_port, "invalid token")
+        try:
+            with self.assertRaises(Exception):
+                gateway.jvm.java.lang.System.currentTimeMillis()
+        finally:
+            gateway.shutdown()
+
+        gateway = _connect_gateway(gateway_port, auth_token)
+        try:
+            self.assertGreater(gateway.jvm.java.lang.System.currentTimeMillis(), 0)
+        finally:
+            gateway.shutdown()
+
+    def test_idle_timeout(self):
+        self.env["PYFLINK_GATEWAY_DAEMON_IDLE_TIMEOUT"] = "5"
+        self._run_script()
+        self._wait_for_daemon_info(True)
+        gateway_port, auth_token = self._read_daemon_info()
+        # the daemon deletes its info file before it exits
+        self._wait_for_daemon_info(False)
+        time.sleep(1)
+        gateway = _connect_gateway(gateway_port, auth_token)
+        try:
+            with self.assertRaises(Exception):
+                gateway.jvm.java.lang.System.currentTimeMillis()
+        finally:
+            gateway.shutdown()
+
+    def _run_script(self):
+        return subprocess.check_output(
+            [sys.executable, "-c", SCRIPT], env=self.env, cwd=self.work_dir,
+            universal_newlines=True).strip().splitlines()[-1]
+
+    def _daemon_info_files(self):
+        # each test has its own daemon directory, which contains the files of one daemon only,
+        # the temporary files written by the daemon are excluded
+        return [f for f in glob.glob(os.path.join(self.daemon_dir, "*.info"))
+                if not os.path.basename(f).startswith("connection")]
+
+    def _read_daemon_info(self):
+        info_files = self._daemon_info_files()
+        if not info_files:
+            return None
+        with open(info_files[0], "rb") as info:
+            content = info.read()
+        return struct.unpack("!I", content[:4])[0], content[8:].decode("utf-8")
+
+    def _wait_for_daemon_info(self, exists):
+        for _ in range(600):
+            if bool(self._daemon_info_files()) == exists:
+                return
+            time.sleep(0.1)
+        self.fail("Timed out waiting for the info file of the gateway daemon to %s."
+                  % ("appear" if exists else "disappear"))
+
+    def _stop_daemon(self, gateway_port, auth_token):
+        gateway = _connect_gateway(gateway_port, auth_token)
+        try:
+            gateway.jvm.java.lang.System.exit(0)
+        except Exception:
+            # the connection is closed by the exiting daemon
+            pass
+        finally:
+            gateway.shutdown()
+
+
+if __name__ == '__main__':
+    import logging
+    logging.getLogger().setLevel(logging.INFO)
+    unittest.main()
@@ -21,6 +21,8 @@ Important classes of Flink Streaming API:
 
     - :class:`StreamExecutionEnvironment`:
       The context in which a streaming program is executed.
+    - :class:`AsyncFunction`:
+      Async functions issue requests to external systems without blocking the other elements.
     - :class:`CheckpointConfig`:
       Configuration that captures all checkpointing related settings.
     - :class:`CheckpointingMode`:
@@ -66,24 +68,43 @@ Important classes of Flink Streaming API:
       The time characteristic defines how the system determines time for time-dependent
       order and operations that depend on time (such as time windows).
 """
-from pyflink.datastream.checkpoint_config import CheckpointConfig, ExternalizedCheckpointCleanup
-from pyflink.datastream.checkpointing_mode import CheckpointingMode
-from pyflink.datastream.data_stream import DataStream
-from pyflink.datastream.functions import (MapFunction, CoMapFunction, FlatMapFunction,
-                                          CoFlatMapFunction, ReduceFunction, RuntimeContext,
-                                          KeySelector, FilterFunction, Partitioner, SourceFunction,
-                                          SinkFunction)
-from pyflink.datastream.state_backend import (StateBackend, MemoryStateBackend, FsStateBackend,
-                                              RocksDBStateBackend, CustomStateBackend,
-                                              PredefinedOptions)
-from pyflink.datastream.stream_execution_environment import StreamExecutionEnvironment
-from pyflink.datastream.time_characteristic import TimeCharacteristic
-from pyflink.datastream.time_domain import TimeDomain
-from pyflink.datastream.functions import ProcessFunction
-from pyflink.datastream.timerservice import TimerService
+from pyflink import install_lazy_imports
+
+_LAZY_IMPORTS = {
+    'CheckpointConfig': 'pyflink.datastream.checkpoint_config',
+    'ExternalizedCheckpointCleanup': 'pyflink.datastream.checkpoint_config',
+    'CheckpointingMode': 'pyflink.datastream.checkpointing_mode',
+    'DataStream': 'pyflink.datastream.data_stream',
+    'MapFunction': 'pyflink.datastream.functions',
+    'CoMapFunction': 'pyflink.datastream.functions',
+    'FlatMapFunction': 'pyflink.datastream.functions',
+    'CoFlatMapFunction': 'pyflink.datastream.functions',
+    'ReduceFunction': 'pyflink.datastream.functions',
+    'RuntimeContext': 'pyflink.datastream.functions',
+    'KeySelector': 'pyflink.datastream.functions',
+    'FilterFunction': 'pyflink.datastream.functions',
+    'Partitioner': 'pyflink.datastream.functions',
+    'SourceFunction': 'pyflink.datastream.functions',
+    'SinkFunction': 'pyflink.datastream.functions',
+    'AsyncFunction': 'pyflink.datastream.functions',
+    'StateBackend': 'pyflink.datastream.state_backend',
+    'MemoryStateBackend': 'pyflink.datastream.state_backend',
+    'FsStateBackend': 'pyflink.datastream.state_backend',
+    'RocksDBStateBackend': 'pyflink.datastream.state_backend',
+    'CustomStateBackend': 'pyflink.datastream.state_backend',
+    'PredefinedOptions': 'pyflink.datastream.state_backend',
+    'StreamExecutionEnvironment': 'pyflink.datastream.stream_execution_environment',
+    'TimeCharacteristic': 'pyflink.datastream.time_characteristic',
+    'TimeDomain': 'pyflink.datastream.time_domain',
+    'ProcessFunction': 'pyflink.datastream.functions',
+    'TimerService': 'pyflink.datastream.timerservice',
+}
+
+install_lazy_imports(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     'StreamExecutionEnvironment',
+    'AsyncFunction',
     'CheckpointConfig',
     'CheckpointingMode',
     'CoMapFunction',
@@ -15,6 +15,9 @@
 #  See the License for the specific language governing permissions and
 # limitations under the License.
 ################################################################################
+import collections
+import queue
+import threading
 import uuid
 from typing import Callable, Union, List
 
@@ -26,9 +29,9 @@ from pyflink.datastream.functions import _get_python_env, FlatMapFunctionWrapper
     FilterFunctionWrapper, KeySelectorFunctionWrapper, KeySelector, ReduceFunction, \
     ReduceFunctionWrapper, CoMapFunction, CoFlatMapFunction, Partitioner, \
     PartitionerFunctionWrapper, RuntimeContext, ProcessFunction, KeyedProcessFunction, \
-    KeyedCoProcessFunction
+    KeyedCoProcessFunction, AsyncFunction, AsyncFunctionWrapper
 from pyflink.datastream.state import ValueStateDescriptor, ValueState
-from pyflink.datastream.utils import convert_to_python_obj
+from pyflink.datastream.utils import fetch_python_objs, pickled_bytes_to_python_obj
 from pyflink.java_gateway import get_gateway
 
 
@@ -276,6 +279,84 @@ class DataStream(object):
             j_operator
         ))
 
+    def async_map(self,
+                  func: Union[Callable, AsyncFunction],
+                  timeout: float = None,
+                  capacity: int = 100,
+                  ordered: bool = True,
+                  output_type: TypeInformation = None) -> 'DataStream':
+        """
+        Applies an async Map transformation on a DataStream. The transformation calls an
+        AsyncFunction for each element of the DataStream and each call produces exactly one
+        element. Up to `capacity` calls are in flight at the same time, so that requests to
+        external systems, e.g. lookups of a database, don't block the processing of the other
+        elements. A coroutine function is executed in an asyncio event loop and the other
+        functions are executed in a thread pool of `capacity` threads.
+
+        All the calls in flight have completed before a checkpoint barrier or a watermark is
+        emitted, so the results are never reordered across them even if `ordered` is False.
+
+        Example:
+        ::
+
+            >>> async def lookup(value):
+            ...     return await client.get(value)
+            >>> ds.async_map(lookup, timeout=10, capacity=100, output_type=Types.STRING())
+
+        :param func: The AsyncFunction, coroutine function or function which is called for each
+                     element of the DataStream.
+        :param timeout: The timeout in seconds of a call, no limit if it's None. The
+                        AsyncFunction.timeout() is called when a call times out.
+        :param capacity: The maximum number of the calls in flight.
+        :param ordered: Whether the results are emitted in the order of the input elements.
+                        Otherwise, the results are emitted as soon as the calls complete.
+        :param output_type: The type information of the output data.
+        :return: The transformed DataStream.
+        """
+        if not isinstance(func, AsyncFunction):
+            if callable(func):
+                func = AsyncFunctionWrapper(func)  # type: ignore
+            else:
+                raise TypeError("The input must be an AsyncFunction or a callable function")
+        if capacity <= 0:
+            raise ValueError("The capacity should be positive, got %s" % capacity)
+        if timeout is not None and timeout <= 0:
+            raise ValueError("The timeout should be positive, got %s" % timeout)
+
+        class AsyncMapFunction(Function):
+            """
+            A wrapper class for the async function and its options. It indicates that it is an
+            async map operation that we need to apply PythonAsyncMapOperator to run the async
+            function.
+            """
+
+            def __init__(self, async_function):
+                self.async_function = async_function
+                self.capacity = capacity
+                self.timeout = timeout
+                self.ordered = ordered
+
+            def open(self, runtime_context: RuntimeContext):
+                self.async_function.open(runtime_context)
+
+            def close(self):
+                self.async_function.close()
+
+            def __repr__(self) -> str:
+                return '_Flink_AsyncMapFunction'
+
+        from pyflink.fn_execution import flink_fn_execution_pb2
+        j_operator, j_output_type_info = _get_one_input_stream_operator(
+            self,
+            AsyncMapFunction(func),  # type: ignore
+            flink_fn_execution_pb2.UserDefinedDataStreamFunction.MAP,  # type: ignore
+            output_type)
+        return DataStream(self._j_data_stream.transform(
+            "AsyncMap",
+            j_output_type_info,
+            j_operator
+        ))
+
     def key_by(self, key_selector: Union[Callable, KeySelector],
                key_type_info: TypeInformation = None) -> 'KeyedStream':
         """
@@ -595,8 +676,8 @@ class DataStream(object):
         """
         return DataStreamSink(self._j_data_stream.addSink(sink_func.get_java_function()))
 
-    def execute_and_collect(self, job_execution_name: str = None, limit: int = None) \
-            -> Union['CloseableIterator', list]:
+    def execute_and_collect(self, job_execution_name: str = None, limit: int = None,
+                            fetch_size: int = 1024) -> Union['CloseableIterator', list]:
         """
         Triggers the distributed execution of the streaming dataflow and returns an iterator over
         the elements of the given DataStream.
@@ -609,18 +690,28 @@ class DataStream(object):
 
         :param job_execution_name: The name of the job execution.
         :param limit: The limit for the collected elements.
+        :param fetch_size: The maximum number of the elements which are transferred from the JVM
+                           at once. The iterator prefetches the elements in a background thread.
         """
         if job_execution_name is None and limit is None:
-            return CloseableIterator(self._j_data_stream.executeAndCollect(), self.get_type())
+            return CloseableIterator(self._j_data_stream.executeAndCollect(), self.get_type(),
+                                     fetch_size)
         elif job_execution_name is not None and limit is None:
             return CloseableIterator(self._j_data_stream.executeAndCollect(job_execution_name),
-                                     self.get_type())
+                                     self.get_type(), fetch_size)
         if job_execution_name is None and limit is not None:
-            return list(map(lambda data: convert_to_python_obj(data, self.get_type()),
-                            self._j_data_stream.executeAndCollect(limit)))
+            j_results = self._j_data_stream.executeAndCollect(limit)
         else:
-            return list(map(lambda data: convert_to_python_obj(data, self.get_type()),
-                            self._j_data_stream.executeAndCollect(job_execution_name, limit)))
+            j_results = self._j_data_stream.executeAndCollect(job_execution_name, limit)
+        type_info = self.get_type()
+        results = []
+        j_iterator = j_results.iterator()
+        while True:
+            objs = fetch_python_objs(j_iterator, type_info, fetch_size)
+            results.extend(pickled_bytes_to_python_obj(obj, type_info) for obj in objs)
+            # the elements of the list are always available, only the last batch is not full
+            if len(objs) < fetch_size:
+                return results
 
     def print(self, sink_identifier: str = None) -> 'DataStreamSink':
         """
@@ -1205,6 +1296,8 @@ def _get_one_input_stream_operator(data_stream: DataStream,
     if func_type == UserDefinedDataStreamFunction.MAP:  # type: ignore
         if str(func) == '_Flink_PartitionCustomMapFunction':
             JDataStreamPythonFunctionOperator = gateway.jvm.PythonPartitionCustomOperator
+        elif str(func) == '_Flink_AsyncMapFunction':
+            JDataStreamPythonFunctionOperator = gateway.jvm.PythonAsyncMapOperator
         else:
             JDataStreamPythonFunctionOperator = gateway.jvm.PythonMapOperator
     elif func_type == UserDefinedDataStreamFunction.FLAT_MAP:  # type: ignore
@@ -1286,11 +1379,33 @@ def _get_two_input_stream_operator(connected_streams: ConnectedStreams,
 class CloseableIterator(object):
     """
     Representing an Iterator that is also auto closeable.
+
+    The elements are fetched from the JVM in batches by a background thread, which prefetches the
+    next batch while the current batch is converted to Python objects. A batch contains at most
+    fetch size elements which are available when it is fetched, the elements of slow or unbounded
+    streams are not held back until the batch is full.
     """
 
-    def __init__(self, j_closeable_iterator, type_info: TypeInformation = None):
-        self._j_closeable_iterator = j_closeable_iterator
+    # the maximum seconds to wait for the prefetch thread to finish when closing the iterator
+    _CLOSE_TIMEOUT = 10
+
+    def __init__(self, j_closeable_iterator, type_info: TypeInformation = None,
+                 fetch_size: int = 1024):
+        if fetch_size <= 0:
+            raise ValueError("The fetch size must be positive, got %s." % fetch_size)
+        # the elements are fetched by a background thread of the JVM, so that the elements which
+        # are already available could be transferred at once without waiting for the following
+        self._j_closeable_iterator = get_gateway().jvm.PrefetchingIterator(
+            j_closeable_iterator, fetch_size)
         self._type_info = type_info
+        self._fetch_size = fetch_size
+        # the prefetch thread puts at most one batch and the end marker after the queue has been
+        # drained by close, which never blocks
+        self._batches = queue.Queue(maxsize=2)
+        self._buffer = collections.deque()
+        self._prefetch_thread = None
+        self._exhausted = False
+        self._closed = False
 
     def __iter__(self):
         return self
@@ -1305,9 +1420,55 @@ class CloseableIterator(object):
         self.close()
 
     def next(self):
-        if not self._j_closeable_iterator.hasNext():
-            raise StopIteration('No more data.')
-        return convert_to_python_obj(self._j_closeable_iterator.next(), self._type_info)
+        while not self._buffer:
+            if self._exhausted or self._closed:
+                raise StopIteration('No more data.')
+            if self._prefetch_thread is None:
+                self._prefetch_thread = threading.Thread(
+                    target=self._prefetch, name="pyflink-collect-prefetch", daemon=True)
+                self._prefetch_thread.start()
+            batch = self._batches.get()
+            if batch is None:
+                self._exhausted = True
+            elif isinstance(batch, BaseException):
+                self._exhausted = True
+                raise batch
+            else:
+                self._buffer.extend(batch)
+        return pickled_bytes_to_python_obj(self._buffer.popleft(), self._type_info)
 
     def close(self):
-        self._j_closeable_iterator.close()
+        if self._closed:
+            return
+        self._closed = True
+        self._buffer.clear()
+        try:
+            self._j_closeable_iterator.close()
+        finally:
+            if self._prefetch_thread is not None:
+                # unblocks the prefetch thread if it is waiting for the space of the queue
+                self._drain()
+                self._prefetch_thread.join(CloseableIterator._CLOSE_TIMEOUT)
+                self._drain()
+
+    def _prefetch(self):
+        try:
+            while not self._closed:
+                batch = fetch_python_objs(
+                    self._j_closeable_iterator, self._type_info, self._fetch_size)
+                if not batch:
+                    break
+                self._batches.put(batch)
+        except BaseException as e:
+            if not self._closed:
+                self._batches.put(e)
+                return
+        # the end marker is always put, so that a pending next never blocks forever
+        self._batches.put(None)
+
+    def _drain(self):
+        while True:
+            try:
+                self._batches.get_nowait()
+            except queue.Empty:
+                return
@@ -39,6 +39,7 @@ __all__ = [
     'KeySelector',
     'FilterFunction',
     'Partitioner',
+    'AsyncFunction',
     'SourceFunction',
     'SinkFunction',
     'ProcessFunction',
@@ -489,6 +490,43 @@ class Partitioner(Function):
         pass
 
 
+class AsyncFunction(Function):
+    """
+    Base class for async functions which are used by async_map() to issue requests to external
+    systems, e.g. looking up a database, without blocking the processing of the other elements.
+    Either a coroutine function or a blocking function could be used to implement async_invoke().
+    Coroutine functions are executed in an asyncio event loop and blocking functions are executed
+    in a thread pool. The basic syntax for using an AsyncFunction is as follows:
+
+    ::
+        >>> class LookupFunction(AsyncFunction):
+        ...     async def async_invoke(self, value):
+        ...         return await client.get(value)
+        >>> ds = ...
+        >>> new_ds = ds.async_map(LookupFunction(), timeout=10, capacity=100)
+    """
+
+    @abstractmethod
+    def async_invoke(self, value):
+        """
+        Triggers the async operation for the input element. It produces exactly one element.
+
+        :param value: The input value.
+        :return: The result of the async operation.
+        """
+        pass
+
+    def timeout(self, value):
+        """
+        Called when the async operation of the input element times out. By default, a TimeoutError
+        is raised which fails the job.
+
+        :param value: The input value.
+        :return: The result used instead of the result of the async operation.
+        """
+        raise TimeoutError("The async operation for input %s timed out." % str(value))
+
+
 class FunctionWrapper(Function):
     """
     A basic wrapper class for user defined function.
@@ -639,6 +677,37 @@ class PartitionerFunctionWrapper(FunctionWrapper):
         return self._func(key, num_partitions)
 
 
+class AsyncFunctionWrapper(FunctionWrapper):
+    """
+    A wrapper class for AsyncFunction. It's used for wrapping up user defined function in an
+    AsyncFunction when user does not implement an AsyncFunction but directly pass a function
+    object, a coroutine function or a lambda function to async_map() function.
+    """
+
+    def __init__(self, func):
+        """
+        The constructor of AsyncFunctionWrapper.
+
+        :param func: user defined function object.
+        """
+        super(AsyncFunctionWrapper, self).__init__(func)
+
+    def async_invoke(self, value):
+        """
+        A delegated async_invoke function to invoke user defined function.
+
+        :param value: The input value.
+        :return: the return value of user defined function.
+        """
+        return self._func(value)
+
+    def get_async_invoke_function(self):
+        """
+        Returns the user defined function, so that a coroutine function could be recognized.
+        """
+        return self._func
+
+
 def _get_python_env():
     """
     An util function to get a python user defined function execution environment.
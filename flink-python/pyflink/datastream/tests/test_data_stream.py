@@ -26,7 +26,7 @@ from pyflink.common.watermark_strategy import WatermarkStrategy, TimestampAssign
 from pyflink.datastream import TimeCharacteristic, RuntimeContext
 from pyflink.datastream.data_stream import DataStream
 from pyflink.datastream.functions import CoMapFunction, CoFlatMapFunction, AggregateFunction, \
-    ReduceFunction, KeyedCoProcessFunction
+    ReduceFunction, KeyedCoProcessFunction, AsyncFunction
 from pyflink.datastream.functions import FilterFunction, ProcessFunction, KeyedProcessFunction
 from pyflink.datastream.functions import KeySelector
 from pyflink.datastream.functions import MapFunction, FlatMapFunction
@@ -392,6 +392,30 @@ class DataStreamTests(object):
                 actual.append(result)
             self.assertEqual(expected, actual)
 
+    def test_execute_and_collect_in_batches(self):
+        test_data = list(range(100))
+        ds = self.env.from_collection(test_data, type_info=Types.INT())
+        self.assertEqual(test_data[:50], ds.execute_and_collect(limit=50, fetch_size=7))
+        with ds.execute_and_collect(fetch_size=7) as results:
+            self.assertEqual(test_data, list(results))
+
+    def test_execute_and_collect_close_early(self):
+        test_data = list(range(100))
+        ds = self.env.from_collection(test_data, type_info=Types.INT())
+        results = ds.execute_and_collect(fetch_size=7)
+        self.assertEqual(0, next(results))
+        results.close()
+        with self.assertRaises(StopIteration):
+            next(results)
+
+    def test_execute_and_collect_close_then_next(self):
+        ds = self.env.from_collection(list(range(100)), type_info=Types.INT())
+        results = ds.execute_and_collect()
+        results.close()
+        self.assertEqual([], list(results))
+        # closing again is a no-op
+        results.close()
+
     def test_key_by_map(self):
         ds = self.env.from_collection([('a', 0), ('b', 0), ('c', 1), ('d', 1), ('e', 2)],
                                       type_info=Types.ROW([Types.STRING(), Types.INT()]))
@@ -648,6 +672,47 @@ class DataStreamTests(object):
         expected = ['+I[2021-01-09, 12:00:00, 2021-01-09 12:00:00.011]']
         self.assertEqual(expected, results)
 
+    def test_async_map(self):
+        self.env.set_parallelism(1)
+        ds = self.env.from_collection([(1, 'a'), (2, 'b'), (3, 'c'), (4, 'd')],
+                                      type_info=Types.ROW([Types.INT(), Types.STRING()]))
+
+        class MyAsyncFunction(AsyncFunction):
+
+            async def async_invoke(self, value):
+                import asyncio
+                await asyncio.sleep(0.01 * (5 - value[0]))
+                if value[0] == 2:
+                    await asyncio.sleep(10)
+                return value[1] * value[0]
+
+            def timeout(self, value):
+                return 'timeout'
+
+        ds.async_map(MyAsyncFunction(), timeout=1, capacity=2, output_type=Types.STRING()) \
+            .add_sink(self.test_sink)
+        self.env.execute('async_map_function_test')
+        results = self.test_sink.get_results(True)
+        self.assertEqual(['a', 'timeout', 'ccc', 'dddd'], results)
+
+    def test_async_map_unordered(self):
+        ds = self.env.from_collection([(1, 'a'), (2, 'b'), (3, 'c'), (4, 'd')],
+                                      type_info=Types.ROW([Types.INT(), Types.STRING()]))
+
+        def blocking_lookup(value):
+            import time
+            time.sleep(0.01 * (5 - value[0]))
+            return Row(value[1], value[0])
+
+        ds.async_map(blocking_lookup, capacity=4, ordered=False,
+                     output_type=Types.ROW([Types.STRING(), Types.INT()])) \
+            .add_sink(self.test_sink)
+        self.env.execute('async_map_function_test')
+        results = self.test_sink.get_results(False)
+        expected = ['+I[a, 1]', '+I[b, 2]', '+I[c, 3]', '+I[d, 4]']
+        results.sort()
+        self.assertEqual(expected, results)
+
     def test_process_function(self):
         self.env.set_parallelism(1)
         self.env.get_config().set_auto_watermark_interval(2000)
@@ -22,27 +22,54 @@ import pickle
 from pyflink.common.typeinfo import RowTypeInfo, TupleTypeInfo, Types, \
     BasicArrayTypeInfo, \
     PrimitiveArrayTypeInfo, MapTypeInfo, ListTypeInfo
+from pyflink.fn_execution.utils import pickle_utils
 from pyflink.java_gateway import get_gateway
 
 
 def convert_to_python_obj(data, type_info):
     if type_info == Types.PICKLED_BYTE_ARRAY():
-        return pickle.loads(data)
+        return pickle_utils.loads(data)
     else:
         gateway = get_gateway()
         pickle_bytes = gateway.jvm.PythonBridgeUtils. \
             getPickledBytesFromJavaObject(data, type_info.get_java_type_info())
-        if isinstance(type_info, RowTypeInfo) or isinstance(type_info, TupleTypeInfo):
-            field_data = zip(list(pickle_bytes[1:]), type_info.get_field_types())
-            fields = []
-            for data, field_type in field_data:
-                if len(data) == 0:
-                    fields.append(None)
-                else:
-                    fields.append(pickled_bytes_to_python_converter(data, field_type))
-            return tuple(fields)
-        else:
-            return pickled_bytes_to_python_converter(pickle_bytes, type_info)
+        return _pickled_bytes_to_python_obj(pickle_bytes, type_info)
+
+
+def fetch_python_objs(j_iterator, type_info, max_num: int) -> list:
+    """
+    Fetches at most max_num elements of the Java iterator with one round trip and returns them in
+    the pickled form. It waits for the first element only, the following elements are fetched if
+    they are already available. The result is empty only if the iterator has been exhausted. Use
+    :func:`pickled_bytes_to_python_obj` to convert them to Python objects.
+    """
+    gateway = get_gateway()
+    return pickle.loads(gateway.jvm.PythonBridgeUtils.getPickledBytesFromJavaObjects(
+        j_iterator, type_info.get_java_type_info(), max_num))
+
+
+def pickled_bytes_to_python_obj(pickle_bytes, type_info):
+    """
+    Converts an element fetched by :func:`fetch_python_objs` to the Python object.
+    """
+    if type_info == Types.PICKLED_BYTE_ARRAY():
+        return pickle_utils.loads(pickle_bytes)
+    else:
+        return _pickled_bytes_to_python_obj(pickle_bytes, type_info)
+
+
+def _pickled_bytes_to_python_obj(pickle_bytes, type_info):
+    if isinstance(type_info, RowTypeInfo) or isinstance(type_info, TupleTypeInfo):
+        field_data = zip(list(pickle_bytes[1:]), type_info.get_field_types())
+        fields = []
+        for data, field_type in field_data:
+            if len(data) == 0:
+                fields.append(None)
+            else:
+                fields.append(pickled_bytes_to_python_converter(data, field_type))
+        return tuple(fields)
+    else:
+        return pickled_bytes_to_python_converter(pickle_bytes, type_info)
 
 
 def pickled_bytes_to_python_converter(data, field_type):
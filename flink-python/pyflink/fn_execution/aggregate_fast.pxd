@@ -32,6 +32,7 @@ cdef class RowKeySelector:
 cdef class AggsHandleFunctionBase:
     cdef void open(self, object state_data_view_store)
     cdef void accumulate(self, list input_data)
+    cdef void prefetch_data_views(self, list input_rows)
     cdef void retract(self, list input_data)
     cdef void merge(self, list accumulators)
     cdef void set_accumulators(self, list accumulators)
@@ -84,6 +84,15 @@ cdef class AggsHandleFunctionBase:
         """
         pass
 
+    cdef void prefetch_data_views(self, list input_rows):
+        """
+        Prefetches the state backed data views which will be accessed when processing the given
+        input rows. By default, this method does nothing.
+
+        :param input_rows: The input rows of the current key.
+        """
+        pass
+
     cdef void retract(self, list input_data):
         """
         Retracts the input values from the accumulators.
@@ -253,6 +262,15 @@ cdef class SimpleAggsHandleFunctionBase(AggsHandleFunctionBase):
                         "The args are not in the distinct data view, this should not happen.")
             self._udfs[i].accumulate(self._accumulators[i], *args)
 
+    cdef void prefetch_data_views(self, list input_rows):
+        cdef InternalRow input_row
+        cdef DistinctViewDescriptor distinct_view_descriptor
+        for i, distinct_data_view in self._distinct_data_views.items():
+            distinct_view_descriptor = self._distinct_view_descriptors[i]
+            distinct_data_view.prefetch(
+                [distinct_view_descriptor.input_extractor(input_row.values)
+                 for input_row in input_rows])
+
     cdef void retract(self, list input_data):
         cdef size_t i, j, filter_length
         cdef int distinct_index, filter_arg
@@ -483,7 +501,8 @@ cdef class GroupAggFunction(GroupAggFunctionBase):
         cdef object accumulator_state, state_backend
         aggs_handle = <SimpleAggsHandleFunction> self.aggs_handle
         state_backend = self.state_backend
-        for current_key in self.buffer:
+        for current_key in state_backend.iterate_keys_with_prefetch(
+                "accumulators", self.state_value_coder, self.buffer):
             input_rows = self.buffer[current_key]
             input_rows_num = len(input_rows)
             key = list(current_key)
@@ -508,6 +527,7 @@ cdef class GroupAggFunction(GroupAggFunctionBase):
 
             # set accumulators to handler first
             aggs_handle.set_accumulators(accumulators)
+            aggs_handle.prefetch_data_views(input_rows[start_index:])
             # get previous aggregate result
             pre_agg_value = aggs_handle.get_value()
 
@@ -589,7 +609,8 @@ cdef class GroupTableAggFunction(GroupAggFunctionBase):
         results = []
         aggs_handle = <SimpleTableAggsHandleFunction> self.aggs_handle
         state_backend = self.state_backend
-        for current_key in self.buffer:
+        for current_key in state_backend.iterate_keys_with_prefetch(
+                "accumulators", self.state_value_coder, self.buffer):
             input_rows = self.buffer[current_key]
             input_rows_num = len(input_rows)
             key = list(current_key)
@@ -614,6 +635,7 @@ cdef class GroupTableAggFunction(GroupAggFunctionBase):
 
             # set accumulators to handler first
             aggs_handle.set_accumulators(accumulators)
+            aggs_handle.prefetch_data_views(input_rows[start_index:])
 
             if not first_row and self.generate_update_before:
                 results.append(aggs_handle.emit_value(key, True))
@@ -81,6 +81,15 @@ class AggsHandleFunctionBase(ABC):
         """
         pass
 
+    def prefetch_data_views(self, input_rows: List[Row]):
+        """
+        Prefetches the state backed data views which will be accessed when processing the given
+        input rows. By default, this method does nothing.
+
+        :param input_rows: The input rows of the current key.
+        """
+        pass
+
     @abstractmethod
     def retract(self, input_data: List):
         """
@@ -255,6 +264,12 @@ class SimpleAggsHandleFunctionBase(AggsHandleFunctionBase):
                         "The args are not in the distinct data view, this should not happen.")
             self._udfs[i].accumulate(self._accumulators[i], *args)
 
+    def prefetch_data_views(self, input_rows: List[Row]):
+        for i, distinct_data_view in self._distinct_data_views.items():
+            input_extractor = self._distinct_view_descriptors[i].get_input_extractor()
+            distinct_data_view.prefetch(
+                [input_extractor(input_row._values) for input_row in input_rows])
+
     def retract(self, input_data: List):
         for i in range(len(self._udfs)):
             if i in self._distinct_data_views:
@@ -458,7 +473,9 @@ class GroupAggFunction(GroupAggFunctionBase):
             state_cleaning_enabled, index_of_count_star)
 
     def finish_bundle(self):
-        for current_key, input_rows in self.buffer.items():
+        for current_key in self.state_backend.iterate_keys_with_prefetch(
+                "accumulators", self.state_value_coder, self.buffer):
+            input_rows = self.buffer[current_key]
             current_key = list(current_key)
             first_row = False
             self.state_backend.set_current_key(current_key)
@@ -480,6 +497,7 @@ class GroupAggFunction(GroupAggFunctionBase):
 
             # set accumulators to handler first
             self.aggs_handle.set_accumulators(accumulators)
+            self.aggs_handle.prefetch_data_views(input_rows[start_index:])
 
             # get previous aggregate result
             pre_agg_value = self.aggs_handle.get_value()  # type: List
@@ -553,7 +571,9 @@ class GroupTableAggFunction(GroupAggFunctionBase):
             state_cleaning_enabled, index_of_count_star)
 
     def finish_bundle(self):
-        for current_key, input_rows in self.buffer.items():
+        for current_key in self.state_backend.iterate_keys_with_prefetch(
+                "accumulators", self.state_value_coder, self.buffer):
+            input_rows = self.buffer[current_key]
             current_key = list(current_key)
             first_row = False
             self.state_backend.set_current_key(current_key)
@@ -575,6 +595,7 @@ class GroupTableAggFunction(GroupAggFunctionBase):
 
             # set accumulators to handler first
             self.aggs_handle.set_accumulators(accumulators)
+            self.aggs_handle.prefetch_data_views(input_rows[start_index:])
 
             if not first_row and self.generate_update_before:
                 yield from self.aggs_handle.emit_value(current_key, True)
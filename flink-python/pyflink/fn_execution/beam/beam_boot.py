@@ -25,10 +25,12 @@ https://github.com/apache/beam/blob/release-2.14.0/sdks/python/container/boot.go
 It is implemented in golang and will introduce unnecessary dependencies if used in pure python
 project. So we add a python implementation which will be used when the python worker runs in
 process mode. It downloads and installs users' python artifacts, then launches the python SDK
-harness of Apache Beam.
+harness of Apache Beam. If the worker pool is enabled, the SDK harness is forked by the Python
+worker pool instead, see :mod:`pyflink.fn_execution.beam.beam_worker_pool`.
 """
 import argparse
 import os
+import time
 from subprocess import call
 
 import grpc
@@ -52,6 +54,7 @@ python_exec = sys.executable
 
 
 if __name__ == "__main__":
+    boot_time = time.time()
     # print INFO and higher level messages
     logging.basicConfig(stream=sys.stdout, level=logging.INFO)
 
@@ -92,10 +95,22 @@ if __name__ == "__main__":
     os.environ["CONTROL_API_SERVICE_DESCRIPTOR"] = text_format.MessageToString(
         ApiServiceDescriptor(url=control_endpoint))
 
+    # used to measure the startup latency of the Python worker
+    os.environ["_PYTHON_WORKER_BOOT_TIME"] = repr(boot_time)
+
     env = dict(os.environ)
 
     if "FLINK_BOOT_TESTING" in os.environ and os.environ["FLINK_BOOT_TESTING"] == "1":
         exit(0)
 
+    from pyflink.fn_execution.beam import beam_worker_pool
+    if beam_worker_pool.is_worker_pool_enabled(env):
+        try:
+            exit(beam_worker_pool.run_worker([sys.argv[0]], env))
+        except Exception:
+            logging.warning("Failed to fork the Python worker from the Python worker pool, "
+                            "fall back to launch a new Python interpreter.", exc_info=True)
+            env["_PYTHON_WORKER_BOOT_TIME"] = repr(time.time())
+
     call([python_exec, "-m", "pyflink.fn_execution.beam.beam_sdk_worker_main"],
          stdout=sys.stdout, stderr=sys.stderr, env=env)
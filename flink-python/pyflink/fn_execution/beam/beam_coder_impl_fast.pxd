@@ -30,6 +30,7 @@ cdef class PassThroughLengthPrefixCoderImpl(StreamCoderImpl):
 
 cdef class BeamCoderImpl(StreamCoderImpl):
     cdef readonly BaseCoderImpl _value_coder
+    cdef readonly object _block_codec
 
 cdef class InputStreamWrapper:
     cdef BaseCoderImpl _value_coder
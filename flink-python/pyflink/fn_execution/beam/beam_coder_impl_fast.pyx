@@ -25,6 +25,8 @@ from apache_beam.coders.coder_impl cimport OutputStream as BOutputStream
 from apache_beam.coders.coder_impl cimport StreamCoderImpl
 
 from pyflink.fn_execution.beam.beam_stream cimport BeamInputStream
+from pyflink.fn_execution.flink_fn_execution_pb2 import CoderParam
+from pyflink.fn_execution.utils.block_utils import BlockCodec, is_block_enabled
 
 cdef class PassThroughLengthPrefixCoderImpl(StreamCoderImpl):
     def __cinit__(self, value_coder):
@@ -40,14 +42,24 @@ cdef class PassThroughLengthPrefixCoderImpl(StreamCoderImpl):
         return 0, []
 
 cdef class BeamCoderImpl(StreamCoderImpl):
-    def __cinit__(self, value_coder):
+    def __cinit__(self, value_coder, compression=CoderParam.NONE, shared_memory_path=''):
         self._value_coder = value_coder
+        if is_block_enabled(compression, shared_memory_path):
+            self._block_codec = BlockCodec(compression, shared_memory_path)
+        else:
+            self._block_codec = None
 
     cpdef encode_to_stream(self, value, BOutputStream out_stream, bint nested):
         self._value_coder.encode(value, out_stream)
 
     cpdef decode_from_stream(self, BInputStream in_stream, bint nested):
-        cdef BeamInputStream input_stream = BeamInputStream(in_stream, in_stream.size())
+        cdef BeamInputStream input_stream
+        if self._block_codec is not None:
+            # the rows may be a view of the shared memory which is read in place
+            rows = self._block_codec.decode(in_stream)
+            input_stream = BeamInputStream(rows, len(rows))
+        else:
+            input_stream = BeamInputStream(in_stream, in_stream.size())
         cdef InputStreamWrapper input_stream_wrapper = InputStreamWrapper(self._value_coder,
                                                                           input_stream)
         return input_stream_wrapper
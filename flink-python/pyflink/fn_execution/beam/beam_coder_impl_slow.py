@@ -23,12 +23,12 @@ import struct
 from typing import Any, Tuple
 from typing import List
 
-import pyarrow as pa
 from apache_beam.coders.coder_impl import StreamCoderImpl, create_InputStream, create_OutputStream
 
 from pyflink.fn_execution.flink_fn_execution_pb2 import CoderParam
 from pyflink.fn_execution.ResettableIO import ResettableIO
 from pyflink.common import Row, RowKind
+from pyflink.fn_execution.utils import block_utils, pickle_utils
 from pyflink.fn_execution.window import TimeWindow, CountWindow
 from pyflink.table.utils import pandas_to_arrow, arrow_to_pandas
 
@@ -308,9 +308,19 @@ class PickledBytesCoderImpl(StreamCoderImpl):
 
     def __init__(self):
         self.field_coder = BinaryCoderImpl()
+        self._out_of_band = pickle_utils.is_out_of_band_enabled()
 
     def encode_to_stream(self, value, out_stream, nested):
-        coded_data = pickle.dumps(value)
+        if self._out_of_band:
+            coded_data, buffers = pickle_utils.dumps_out_of_band(value)
+            if buffers:
+                out_stream.write_bigendian_int32(
+                    pickle_utils.out_of_band_size(coded_data, buffers))
+                for chunk in pickle_utils.encode_out_of_band(coded_data, buffers):
+                    out_stream.write(chunk if isinstance(chunk, bytes) else chunk.tobytes(), False)
+                return
+        else:
+            coded_data = pickle.dumps(value)
         self.field_coder.encode_to_stream(coded_data, out_stream, nested)
 
     def decode_from_stream(self, in_stream, nested):
@@ -318,7 +328,7 @@ class PickledBytesCoderImpl(StreamCoderImpl):
 
     def _decode_one_value_from_stream(self, in_stream: create_InputStream, nested):
         real_data = self.field_coder.decode_from_stream(in_stream, nested)
-        value = pickle.loads(real_data)
+        value = pickle_utils.loads(real_data)
         return value
 
     def __repr__(self) -> str:
@@ -644,6 +654,7 @@ class ArrowCoderImpl(StreamCoderImpl):
         self._resettable_io.set_output_stream(self.data_out_stream)
 
     def encode_to_stream(self, cols, out_stream, nested):
+        import pyarrow as pa
         data_out_stream = self.data_out_stream
         batch_writer = pa.RecordBatchStreamWriter(self._resettable_io, self._schema)
         batch_writer.write_batch(
@@ -658,6 +669,7 @@ class ArrowCoderImpl(StreamCoderImpl):
 
     @staticmethod
     def _load_from_stream(stream):
+        import pyarrow as pa
         while stream.readable():
             reader = pa.ipc.open_stream(stream)
             yield reader.read_next_batch()
@@ -700,6 +712,39 @@ class OverWindowArrowCoderImpl(StreamCoderImpl):
         return 'OverWindowArrowCoderImpl[%s]' % self._arrow_coder
 
 
+class BlockCoderImpl(StreamCoderImpl):
+    """
+    Coder impl which exchanges the rows encoded by the value coder as blocks, for more details
+    refer to pyflink.fn_execution.utils.block_utils.
+    """
+
+    def __init__(self, value_coder, compression, shared_memory_path):
+        self._value_coder = value_coder
+        self._block_codec = block_utils.BlockCodec(compression, shared_memory_path)
+        self._data_out_stream = create_OutputStream()
+
+    def encode_to_stream(self, value, out_stream, nested):
+        self._value_coder.encode_to_stream(value, self._data_out_stream, nested)
+        if self._data_out_stream.size() >= block_utils.BLOCK_SIZE:
+            self.flush(out_stream)
+
+    def flush(self, out_stream):
+        """
+        Writes the rows which are not written yet as a block.
+        """
+        data_out_stream = self._data_out_stream
+        if data_out_stream.size() > 0:
+            self._block_codec.encode(data_out_stream.get(), out_stream)
+            data_out_stream._clear()
+
+    def decode_from_stream(self, in_stream, nested):
+        return self._value_coder.decode_from_stream(
+            create_InputStream(bytes(self._block_codec.decode(in_stream))), nested)
+
+    def __repr__(self):
+        return 'BlockCoderImpl[%s]' % repr(self._value_coder)
+
+
 class PassThroughLengthPrefixCoderImpl(StreamCoderImpl):
     def __init__(self, value_coder):
         self._value_coder = value_coder
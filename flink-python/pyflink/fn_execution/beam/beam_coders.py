@@ -20,7 +20,6 @@ import os
 import pickle
 from typing import Any
 
-import pyarrow as pa
 import pytz
 from apache_beam.coders import Coder, coder_impl
 from apache_beam.coders.coders import FastCoder, LengthPrefixCoder
@@ -30,15 +29,21 @@ from apache_beam.typehints import typehints
 from pyflink.fn_execution.beam import beam_coder_impl_slow
 from pyflink.fn_execution.coders import FLINK_MAP_CODER_URN, \
     FLINK_FLAT_MAP_CODER_URN
+from pyflink.fn_execution import flink_fn_execution_pb2, coders
+from pyflink.fn_execution.utils.block_utils import is_block_enabled
 
 try:
     from pyflink.fn_execution.beam import beam_coder_impl_fast as beam_coder_impl
     from pyflink.fn_execution.beam.beam_coder_impl_fast import BeamCoderImpl
 except ImportError:
     beam_coder_impl = beam_coder_impl_slow
-    BeamCoderImpl = lambda a: a
 
-from pyflink.fn_execution import flink_fn_execution_pb2, coders
+    def BeamCoderImpl(value_coder, compression=flink_fn_execution_pb2.CoderParam.NONE,
+                      shared_memory_path=''):
+        if not is_block_enabled(compression, shared_memory_path):
+            return value_coder
+        return beam_coder_impl_slow.BlockCoderImpl(value_coder, compression, shared_memory_path)
+
 from pyflink.table.types import TinyIntType, SmallIntType, IntType, BigIntType, BooleanType, \
     FloatType, DoubleType, VarCharType, VarBinaryType, DecimalType, DateType, TimeType, \
     LocalZonedTimestampType, RowType, RowField, to_arrow_type, TimestampType, ArrayType
@@ -69,14 +74,17 @@ class BeamTableFunctionRowCoder(FastCoder):
     Coder for Table Function Row.
     """
 
-    def __init__(self, table_function_row_coder):
+    def __init__(self, table_function_row_coder,
+                 compression=flink_fn_execution_pb2.CoderParam.NONE, shared_memory_path=''):
         self._table_function_row_coder = table_function_row_coder
+        self._compression = compression
+        self._shared_memory_path = shared_memory_path
 
     def _create_impl(self):
         return self._table_function_row_coder.get_impl()
 
     def get_impl(self):
-        return BeamCoderImpl(self._create_impl())
+        return BeamCoderImpl(self._create_impl(), self._compression, self._shared_memory_path)
 
     def to_type_hint(self):
         return typehints.List
@@ -85,14 +93,17 @@ class BeamTableFunctionRowCoder(FastCoder):
                         flink_fn_execution_pb2.CoderParam)
     def _pickle_from_runner_api_parameter(coder_praram_proto, unused_components, unused_context):
         return BeamTableFunctionRowCoder(
-            coders.TableFunctionRowCoder.from_schema_proto(coder_praram_proto))
+            coders.TableFunctionRowCoder.from_schema_proto(coder_praram_proto),
+            coder_praram_proto.compression, coder_praram_proto.shared_memory_path)
 
     def __repr__(self):
         return 'TableFunctionRowCoder[%s]' % repr(self._table_function_row_coder)
 
     def __eq__(self, other):
         return (self.__class__ == other.__class__
-                and self._table_function_row_coder == other._table_function_row_coder)
+                and self._table_function_row_coder == other._table_function_row_coder
+                and self._compression == other._compression
+                and self._shared_memory_path == other._shared_memory_path)
 
     def __ne__(self, other):
         return not self == other
@@ -106,14 +117,17 @@ class BeamAggregateFunctionRowCoder(FastCoder):
     Coder for Aggregate Function input row.
     """
 
-    def __init__(self, aggregate_function_row_coder):
+    def __init__(self, aggregate_function_row_coder,
+                 compression=flink_fn_execution_pb2.CoderParam.NONE, shared_memory_path=''):
         self._aggregate_function_row_coder = aggregate_function_row_coder
+        self._compression = compression
+        self._shared_memory_path = shared_memory_path
 
     def _create_impl(self):
         return self._aggregate_function_row_coder.get_impl()
 
     def get_impl(self):
-        return BeamCoderImpl(self._create_impl())
+        return BeamCoderImpl(self._create_impl(), self._compression, self._shared_memory_path)
 
     def to_type_hint(self):
         return typehints.List
@@ -122,14 +136,17 @@ class BeamAggregateFunctionRowCoder(FastCoder):
                         flink_fn_execution_pb2.CoderParam)
     def _pickle_from_runner_api_parameter(coder_praram_proto, unused_components, unused_context):
         return BeamAggregateFunctionRowCoder(
-            coders.AggregateFunctionRowCoder.from_schema_proto(coder_praram_proto))
+            coders.AggregateFunctionRowCoder.from_schema_proto(coder_praram_proto),
+            coder_praram_proto.compression, coder_praram_proto.shared_memory_path)
 
     def __repr__(self):
         return 'BeamAggregateFunctionRowCoder[%s]' % repr(self._aggregate_function_row_coder)
 
     def __eq__(self, other):
         return (self.__class__ == other.__class__
-                and self._aggregate_function_row_coder == other._aggregate_function_row_coder)
+                and self._aggregate_function_row_coder == other._aggregate_function_row_coder
+                and self._compression == other._compression
+                and self._shared_memory_path == other._shared_memory_path)
 
     def __ne__(self, other):
         return not self == other
@@ -144,14 +161,17 @@ class BeamFlattenRowCoder(FastCoder):
     of a row object.
     """
 
-    def __init__(self, flatten_coder):
+    def __init__(self, flatten_coder, compression=flink_fn_execution_pb2.CoderParam.NONE,
+                 shared_memory_path=''):
         self._flatten_coder = flatten_coder
+        self._compression = compression
+        self._shared_memory_path = shared_memory_path
 
     def _create_impl(self):
         return self._flatten_coder.get_impl()
 
     def get_impl(self):
-        return BeamCoderImpl(self._create_impl())
+        return BeamCoderImpl(self._create_impl(), self._compression, self._shared_memory_path)
 
     def to_type_hint(self):
         return typehints.List
@@ -159,14 +179,18 @@ class BeamFlattenRowCoder(FastCoder):
     @Coder.register_urn(coders.FLINK_SCALAR_FUNCTION_SCHEMA_CODER_URN,
                         flink_fn_execution_pb2.CoderParam)
     def _pickle_from_runner_api_parameter(coder_praram_proto, unused_components, unused_context):
-        return BeamFlattenRowCoder(coders.FlattenRowCoder.from_schema_proto(coder_praram_proto))
+        return BeamFlattenRowCoder(coders.FlattenRowCoder.from_schema_proto(coder_praram_proto),
+                                   coder_praram_proto.compression,
+                                   coder_praram_proto.shared_memory_path)
 
     def __repr__(self):
         return 'BeamFlattenRowCoder[%s]' % repr(self._flatten_coder)
 
     def __eq__(self, other):
         return (self.__class__ == other.__class__
-                and self._flatten_coder == other._flatten_coder)
+                and self._flatten_coder == other._flatten_coder
+                and self._compression == other._compression
+                and self._shared_memory_path == other._shared_memory_path)
 
     def __ne__(self, other):
         return not self == other
@@ -199,6 +223,7 @@ class ArrowCoder(FastCoder):
     def _pickle_from_runner_api_parameter(coder_praram_proto, unused_components, unused_context):
 
         def _to_arrow_schema(row_type):
+            import pyarrow as pa
             return pa.schema([pa.field(n, to_arrow_type(t), t._nullable)
                               for n, t in zip(row_type.field_names(), row_type.field_types())])
 
@@ -15,7 +15,9 @@
 #  See the License for the specific language governing permissions and
 # limitations under the License.
 ################################################################################
+import os
 
+from apache_beam.coders.coders import LengthPrefixCoder
 from apache_beam.runners.worker import bundle_processor, operation_specs
 
 from pyflink.fn_execution import flink_fn_execution_pb2
@@ -30,6 +32,13 @@ try:
 except ImportError:
     import pyflink.fn_execution.beam.beam_operations_slow as beam_operations
 
+# The job options which are passed to the Python worker as environment variables
+STATE_CACHE_SIZE = "python.state.cache-size"
+MAP_STATE_READ_CACHE_SIZE = "python.map-state.read-cache-size"
+MAP_STATE_WRITE_CACHE_SIZE = "python.map-state.write-cache-size"
+STATE_CACHE_MAX_BYTES = "python.state.cache-max-bytes"
+STATE_CACHE_EVICTION_POLICY = "python.state.cache-eviction-policy"
+
 
 @bundle_processor.BeamTransformFactory.register_urn(
     operations.SCALAR_FUNCTION_URN, flink_fn_execution_pb2.UserDefinedFunctions)
@@ -59,6 +68,17 @@ def create_data_stream_function(factory, transform_id, transform_proto, paramete
         operations.DataStreamStatelessFunctionOperation)
 
 
+@bundle_processor.BeamTransformFactory.register_urn(
+    operations.ASYNC_FUNCTION_URN,
+    flink_fn_execution_pb2.UserDefinedDataStreamFunction)
+def create_data_stream_async_function(factory, transform_id, transform_proto, parameter,
+                                      consumers):
+    return _create_user_defined_function_operation(
+        factory, transform_proto, consumers, parameter,
+        beam_operations.StatelessFunctionOperation,
+        operations.AsyncFunctionOperation)
+
+
 @bundle_processor.BeamTransformFactory.register_urn(
     operations.PANDAS_AGGREGATE_FUNCTION_URN, flink_fn_execution_pb2.UserDefinedFunctions)
 def create_pandas_aggregate_function(factory, transform_id, transform_proto, parameter, consumers):
@@ -159,9 +179,10 @@ def _create_user_defined_function_operation(factory, transform_proto, consumers,
             window_coder,
             spec.serialized_fn.state_cache_size,
             spec.serialized_fn.map_state_read_cache_size,
-            spec.serialized_fn.map_state_write_cache_size)
+            spec.serialized_fn.map_state_write_cache_size,
+            *_get_state_cache_options())
 
-        return beam_operation_cls(
+        operation = beam_operation_cls(
             transform_proto.unique_name,
             spec,
             factory.counter_factory,
@@ -175,10 +196,11 @@ def _create_user_defined_function_operation(factory, transform_proto, consumers,
             factory.state_handler,
             key_row_coder,
             None,
-            1000,
-            1000,
-            1000)
-        return beam_operation_cls(
+            int(os.environ.get(STATE_CACHE_SIZE, 1000)),
+            int(os.environ.get(MAP_STATE_READ_CACHE_SIZE, 1000)),
+            int(os.environ.get(MAP_STATE_WRITE_CACHE_SIZE, 1000)),
+            *_get_state_cache_options())
+        operation = beam_operation_cls(
             transform_proto.unique_name,
             spec,
             factory.counter_factory,
@@ -187,10 +209,36 @@ def _create_user_defined_function_operation(factory, transform_proto, consumers,
             internal_operation_cls,
             keyed_state_backend)
     else:
-        return beam_operation_cls(
+        operation = beam_operation_cls(
             transform_proto.unique_name,
             spec,
             factory.counter_factory,
             factory.state_sampler,
             consumers,
             internal_operation_cls)
+
+    operation.shared_memory_paths = _get_shared_memory_paths(
+        list(factory.get_input_coders(transform_proto).values()) +
+        list(factory.get_output_coders(transform_proto).values()))
+    return operation
+
+
+def _get_shared_memory_paths(windowed_coders):
+    """
+    Returns the paths of the shared memory configured for the given coders of the data exchanged
+    with the Java operator.
+    """
+    paths = []
+    for windowed_coder in windowed_coders:
+        coder = windowed_coder.wrapped_value_coder
+        if isinstance(coder, LengthPrefixCoder):
+            coder = coder.value_coder()
+        path = getattr(coder, '_shared_memory_path', '')
+        if path:
+            paths.append(path)
+    return paths
+
+
+def _get_state_cache_options():
+    return (int(os.environ.get(STATE_CACHE_MAX_BYTES, 0)),
+            os.environ.get(STATE_CACHE_EVICTION_POLICY, "LRU"))
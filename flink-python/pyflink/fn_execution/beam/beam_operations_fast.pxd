@@ -27,9 +27,13 @@ cdef class FunctionOperation(Operation):
     cdef bint _is_python_coder
     cdef StreamCoderImpl _value_coder_impl
     cdef BaseCoderImpl _output_coder
+    cdef object _output_block_codec
+    cdef size_t _output_flush_size
     cdef object func
+    cdef object async_executor
     cdef object operation
     cdef object operation_cls
+    cdef public list shared_memory_paths
     cdef object generate_operation(self)
 
 cdef class StatelessFunctionOperation(FunctionOperation):
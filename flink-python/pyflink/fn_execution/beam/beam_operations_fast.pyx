@@ -25,6 +25,8 @@ from apache_beam.utils.windowed_value cimport WindowedValue
 from pyflink.fn_execution.coder_impl_fast cimport BaseCoderImpl
 from pyflink.fn_execution.beam.beam_stream cimport BeamInputStream, BeamOutputStream
 from pyflink.fn_execution.beam.beam_coder_impl_fast cimport InputStreamWrapper
+from pyflink.fn_execution.utils.output_utils import get_output_flush_size
+from pyflink.fn_execution.utils.shared_memory_utils import close_shared_memory
 
 cdef class FunctionOperation(Operation):
     """
@@ -44,10 +46,15 @@ cdef class FunctionOperation(Operation):
         else:
             self._is_python_coder = False
             self._output_coder = self._value_coder_impl._value_coder
+            self._output_block_codec = self._value_coder_impl._block_codec
+        self._output_flush_size = get_output_flush_size()
 
         self.operation_cls = operation_cls
         self.operation = self.generate_operation()
         self.func = self.operation.func
+        self.async_executor = self.operation.async_executor
+        # the files via which the data of this operation is exchanged with the Java operator
+        self.shared_memory_paths = []
         self.operation.open()
 
     cpdef start(self):
@@ -55,13 +62,25 @@ cdef class FunctionOperation(Operation):
             super(FunctionOperation, self).start()
 
     cpdef finish(self):
+        cdef BeamOutputStream output_stream
         with self.scoped_finish_state:
+            if self.async_executor is not None:
+                # the results of all the inputs of the bundle should be emitted before the bundle
+                # finishes, e.g. before the checkpoint barrier is forwarded
+                output_stream = BeamOutputStream(self.consumer.output_stream,
+                                                 self._output_block_codec,
+                                                 self._output_flush_size)
+                for result in self.async_executor.flush():
+                    self._output_coder.encode_to_stream(result, output_stream)
+                output_stream.flush()
             super(FunctionOperation, self).finish()
             self.operation.finish()
 
     cpdef teardown(self):
         with self.scoped_finish_state:
             self.operation.close()
+            for path in self.shared_memory_paths:
+                close_shared_memory(path)
 
     cpdef process(self, WindowedValue o):
         cdef InputStreamWrapper input_stream_wrapper
@@ -70,19 +89,28 @@ cdef class FunctionOperation(Operation):
         cdef BeamOutputStream output_stream
         with self.scoped_process_state:
             if self._is_python_coder:
-                for value in o.value:
+                for result in self.operation.process_elements(o.value):
                     self._value_coder_impl.encode_to_stream(
-                        self.func(value), self.consumer.output_stream, True)
-                    self.consumer.output_stream.maybe_flush()
+                        result, self.consumer.output_stream, True)
+                    if self.consumer.output_stream.size() > self._output_flush_size:
+                        self.consumer.output_stream.flush()
             else:
                 input_stream_wrapper = o.value
                 input_stream = input_stream_wrapper._input_stream
                 input_coder = input_stream_wrapper._value_coder
-                output_stream = BeamOutputStream(self.consumer.output_stream)
-                while input_stream.available():
-                    input_data = input_coder.decode_from_stream(input_stream)
-                    result = self.func(input_data)
-                    self._output_coder.encode_to_stream(result, output_stream)
+                output_stream = BeamOutputStream(self.consumer.output_stream,
+                                                 self._output_block_codec,
+                                                 self._output_flush_size)
+                if self.async_executor is None:
+                    while input_stream.available():
+                        input_data = input_coder.decode_from_stream(input_stream)
+                        result = self.func(input_data)
+                        self._output_coder.encode_to_stream(result, output_stream)
+                else:
+                    # the calls still in flight are emitted by the following inputs or at finish
+                    for result in self.async_executor.process_futures(
+                            self.func, _decode_inputs(input_coder, input_stream)):
+                        self._output_coder.encode_to_stream(result, output_stream)
                 output_stream.flush()
 
     def progress_metrics(self):
@@ -105,6 +133,11 @@ cdef class FunctionOperation(Operation):
         pass
 
 
+def _decode_inputs(BaseCoderImpl input_coder, BeamInputStream input_stream):
+    while input_stream.available():
+        yield input_coder.decode_from_stream(input_stream)
+
+
 cdef class StatelessFunctionOperation(FunctionOperation):
     def __init__(self, name, spec, counter_factory, sampler, consumers, operation_cls):
         super(StatelessFunctionOperation, self).__init__(
@@ -20,6 +20,10 @@ from abc import abstractmethod
 from apache_beam.runners.worker.operations import Operation
 from apache_beam.utils.windowed_value import WindowedValue
 
+from pyflink.fn_execution.beam.beam_coder_impl_slow import BlockCoderImpl
+from pyflink.fn_execution.utils.output_utils import get_output_flush_size
+from pyflink.fn_execution.utils.shared_memory_utils import close_shared_memory
+
 
 class FunctionOperation(Operation):
     """
@@ -31,9 +35,15 @@ class FunctionOperation(Operation):
         super(FunctionOperation, self).__init__(name, spec, counter_factory, sampler)
         self.consumer = consumers['output'][0]
         self._value_coder_impl = self.consumer.windowed_coder.wrapped_value_coder.get_impl()
+        self._output_blocked = isinstance(
+            getattr(self._value_coder_impl, '_value_coder', None), BlockCoderImpl)
+        self._output_flush_size = get_output_flush_size()
         self.operation_cls = operation_cls
         self.operation = self.generate_operation()
         self.func = self.operation.func
+        self.async_executor = self.operation.async_executor
+        # the files via which the data of this operation is exchanged with the Java operator
+        self.shared_memory_paths = []
         self.operation.open()
 
     def setup(self):
@@ -45,6 +55,10 @@ class FunctionOperation(Operation):
 
     def finish(self):
         with self.scoped_finish_state:
+            if self.async_executor is not None:
+                # the results of all the inputs of the bundle should be emitted before the bundle
+                # finishes, e.g. before the checkpoint barrier is forwarded
+                self._output_results(self.async_executor.flush())
             super(FunctionOperation, self).finish()
             self.operation.finish()
 
@@ -57,6 +71,8 @@ class FunctionOperation(Operation):
     def teardown(self):
         with self.scoped_finish_state:
             self.operation.close()
+            for path in self.shared_memory_paths:
+                close_shared_memory(path)
 
     def progress_metrics(self):
         metrics = super(FunctionOperation, self).progress_metrics()
@@ -69,10 +85,26 @@ class FunctionOperation(Operation):
 
     def process(self, o: WindowedValue):
         with self.scoped_process_state:
-            output_stream = self.consumer.output_stream
-            for value in o.value:
-                self._value_coder_impl.encode_to_stream(self.func(value), output_stream, True)
-                output_stream.maybe_flush()
+            if self.async_executor is None:
+                results = self.operation.process_elements(o.value)
+            else:
+                # the calls still in flight are emitted by the following inputs or at finish
+                results = self.async_executor.process_futures(self.func, o.value)
+            self._output_results(results)
+
+    def _output_results(self, results):
+        output_stream = self.consumer.output_stream
+        for result in results:
+            self._value_coder_impl.encode_to_stream(result, output_stream, True)
+            self._maybe_flush(output_stream)
+        if self._output_blocked:
+            self._value_coder_impl._value_coder.flush(output_stream)
+            self._maybe_flush(output_stream)
+
+    def _maybe_flush(self, output_stream):
+        # bounds the memory used by the results which haven't been sent
+        if output_stream.size() > self._output_flush_size:
+            output_stream.flush()
 
     def monitoring_infos(self, transform_id, tag_to_pcollection_id):
         """
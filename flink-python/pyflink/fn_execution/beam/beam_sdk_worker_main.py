@@ -15,7 +15,10 @@
 #  See the License for the specific language governing permissions and
 # limitations under the License.
 ################################################################################
+import logging
+import os
 import sys
+import time
 
 # force to register the operations to SDK Harness
 import pyflink.fn_execution.beam.beam_operations # noqa # pylint: disable=unused-import
@@ -25,5 +28,36 @@ import pyflink.fn_execution.beam.beam_coders # noqa # pylint: disable=unused-imp
 
 import apache_beam.runners.worker.sdk_worker_main
 
-if __name__ == '__main__':
+
+# the time in seconds from launching "beam_boot.py" to starting the SDK harness, which is reported
+# as a metric of the operations if the metrics are enabled
+startup_latency = None
+
+
+def report_startup_latency():
+    """
+    Logs the time from launching "beam_boot.py" to starting the SDK harness to stdout, which is
+    written to the boot log, as the logging of the SDK harness hasn't been set up yet.
+    """
+    global startup_latency
+    boot_time = os.environ.get("_PYTHON_WORKER_BOOT_TIME")
+    if boot_time is None:
+        return
+    startup_latency = time.time() - float(boot_time)
+    logger = logging.getLogger(__name__)
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    handler = logging.StreamHandler(sys.stdout)
+    logger.addHandler(handler)
+    logger.info("Python worker %s started in %.3f seconds.",
+                os.environ.get("WORKER_ID"), startup_latency)
+    logger.removeHandler(handler)
+
+
+def main():
+    report_startup_latency()
     apache_beam.runners.worker.sdk_worker_main.main(sys.argv)
+
+
+if __name__ == '__main__':
+    main()
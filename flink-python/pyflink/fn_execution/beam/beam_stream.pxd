@@ -26,13 +26,19 @@ cdef class BeamInputStream(LengthPrefixInputStream):
     cdef char*_input_data
     cdef size_t _input_buffer_size
     cdef size_t _input_pos
+    cdef object _input_buffer
     cdef void _parse_input_stream(self, BInputStream input_stream)
+    cdef void _parse_input_buffer(self, input_buffer)
 
 cdef class BeamOutputStream(LengthPrefixOutputStream):
     cdef char*_output_data
     cdef size_t _output_pos
     cdef size_t _output_buffer_size
+    cdef size_t _flush_size
     cdef BOutputStream _output_stream
+    cdef object _block_codec
     cdef void _map_output_data_to_output_stream(self)
+    cdef void _write_block(self)
+    cdef void _extend(self, size_t missing)
     cdef void _maybe_flush(self)
     cdef void _parse_output_stream(self, BOutputStream output_stream)
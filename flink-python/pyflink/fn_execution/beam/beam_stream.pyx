@@ -20,14 +20,23 @@
 # cython: profile=True
 # cython: boundscheck=False, wraparound=False, initializedcheck=False, cdivision=True
 
-from libc.stdlib cimport realloc
+from cpython.bytes cimport PyBytes_FromStringAndSize
+from libc.stdlib cimport free, malloc, realloc
 from libc.string cimport memcpy
 
+from pyflink.fn_execution.utils.block_utils import BLOCK_SIZE
+from pyflink.fn_execution.utils.output_utils import DEFAULT_OUTPUT_FLUSH_SIZE
+
+cdef size_t _BLOCK_SIZE = BLOCK_SIZE
+
 cdef class BeamInputStream(LengthPrefixInputStream):
     def __cinit__(self, input_stream, size):
         self._input_buffer_size = size
         self._input_pos = 0
-        self._parse_input_stream(input_stream)
+        if isinstance(input_stream, BInputStream):
+            self._parse_input_stream(input_stream)
+        else:
+            self._parse_input_buffer(input_stream)
 
     cdef size_t read(self, char** data):
         cdef size_t length = 0
@@ -50,22 +59,44 @@ cdef class BeamInputStream(LengthPrefixInputStream):
         return self._input_buffer_size - self._input_pos
 
     cdef void _parse_input_stream(self, BInputStream input_stream):
+        # holds the input stream as the input data is owned by it
+        self._input_buffer = input_stream
         self._input_data = input_stream.allc
         input_stream.pos = self._input_buffer_size
 
+    cdef void _parse_input_buffer(self, input_buffer):
+        # reads the bytes-like object in place, e.g. a view of the shared memory
+        cdef const unsigned char[::1] view
+        self._input_buffer = input_buffer
+        if self._input_buffer_size > 0:
+            view = input_buffer
+            self._input_data = <char*> &view[0]
+
 cdef class BeamOutputStream(LengthPrefixOutputStream):
-    def __cinit__(self, output_stream):
+    def __cinit__(self, output_stream, block_codec=None,
+                  size_t flush_size=DEFAULT_OUTPUT_FLUSH_SIZE):
         self._output_stream = output_stream
-        self._parse_output_stream(output_stream)
+        self._block_codec = block_codec
+        self._flush_size = flush_size
+        if block_codec is not None:
+            # the rows are collected in a separate buffer and written to the output stream as
+            # blocks
+            self._output_buffer_size = _BLOCK_SIZE
+            self._output_data = <char*> malloc(self._output_buffer_size)
+            self._output_pos = 0
+        else:
+            self._parse_output_stream(output_stream)
+
+    def __dealloc__(self):
+        if self._block_codec is not None:
+            free(self._output_data)
 
     cdef void write(self, char*data, size_t length):
         cdef char bits
         cdef size_t size = length
         # the length of the variable prefix length will be less than 9 bytes
         if self._output_buffer_size < self._output_pos + length + 9:
-            self._output_buffer_size += length + 9
-            self._output_data = <char*> realloc(self._output_data,
-                                                self._output_buffer_size)
+            self._extend(length + 9)
         # write variable prefix length
         while size:
             bits = size & 0x7F
@@ -85,9 +116,16 @@ cdef class BeamOutputStream(LengthPrefixOutputStream):
         self._maybe_flush()
 
     cpdef void flush(self):
-        cdef size_t i
-        self._map_output_data_to_output_stream()
-        self._output_stream.maybe_flush()
+        if self._block_codec is not None:
+            self._write_block()
+        else:
+            self._map_output_data_to_output_stream()
+
+    cdef void _extend(self, size_t missing):
+        # grows the buffer geometrically to amortize the cost of the reallocations
+        while self._output_buffer_size < self._output_pos + missing:
+            self._output_buffer_size *= 2
+        self._output_data = <char*> realloc(self._output_data, self._output_buffer_size)
 
     cdef void _parse_output_stream(self, BOutputStream output_stream):
         self._output_data = output_stream.data
@@ -95,12 +133,29 @@ cdef class BeamOutputStream(LengthPrefixOutputStream):
         self._output_buffer_size = output_stream.buffer_size
 
     cdef void _maybe_flush(self):
-        if self._output_pos > 10_000_000:
+        if self._block_codec is not None:
+            if self._output_pos >= _BLOCK_SIZE:
+                self._write_block()
+        elif self._output_pos > self._flush_size:
             self._map_output_data_to_output_stream()
             self._output_stream.flush()
             self._output_pos = 0
+            if self._output_buffer_size > 2 * self._flush_size:
+                # releases the memory held for the large results which have been sent
+                self._output_buffer_size = self._flush_size
+                self._output_data = <char*> realloc(self._output_data, self._output_buffer_size)
+                self._map_output_data_to_output_stream()
 
     cdef void _map_output_data_to_output_stream(self):
         self._output_stream.data = self._output_data
         self._output_stream.pos = self._output_pos
         self._output_stream.buffer_size = self._output_buffer_size
+
+    cdef void _write_block(self):
+        if self._output_pos == 0:
+            return
+        self._block_codec.encode(
+            PyBytes_FromStringAndSize(self._output_data, self._output_pos), self._output_stream)
+        self._output_pos = 0
+        if self._output_stream.size() > self._flush_size:
+            self._output_stream.flush()
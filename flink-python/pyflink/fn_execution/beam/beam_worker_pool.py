@@ -0,0 +1,368 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+"""
+A pool of warm Python workers for the process mode. The pool is a long-lived process which has
+already imported Apache Beam and PyFlink, and it forks a Python worker for each request of
+"beam_boot.py" instead of launching a new interpreter. The forked worker applies the environment
+variables, the working directory and the Python path of the request before starting the SDK
+harness, so only the user code is imported on startup.
+
+The pools are shared by the Python workers of the same user, Python interpreter, PyFlink
+installation and Python dependencies, and are discovered via the file locks and the Unix domain
+sockets in the directory _PYTHON_WORKER_POOL_DIR, which is a directory in the temporary directory
+by default. A pool exits after it has been idle for _PYTHON_WORKER_POOL_IDLE_TIMEOUT seconds
+(600 by default).
+"""
+import array
+import hashlib
+import json
+import logging
+import os
+import selectors
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+try:
+    import fcntl
+except ImportError:
+    # the worker pool is only supported on POSIX systems
+    fcntl = None
+
+PYTHON_WORKER_POOL_ENABLED = "_PYTHON_WORKER_POOL_ENABLED"
+PYTHON_WORKER_POOL_DIR = "_PYTHON_WORKER_POOL_DIR"
+PYTHON_WORKER_POOL_IDLE_TIMEOUT = "_PYTHON_WORKER_POOL_IDLE_TIMEOUT"
+
+# the environment variables of the Python dependencies, which affect the modules to import
+_PYTHON_DEPENDENCY_ENV_KEYS = ["PYTHONPATH", "_PYTHON_REQUIREMENTS_INSTALL_DIR",
+                               "_PYTHON_WORKING_DIR"]
+
+# the modules imported by the pool before forking the Python workers
+_PRELOADED_MODULES = [
+    "apache_beam.runners.worker.sdk_worker_main",
+    "pyflink.fn_execution.beam.beam_sdk_worker_main",
+    "pyflink.table",
+    "pyflink.datastream",
+]
+# the optional modules imported by the pool if they are installed
+_OPTIONAL_PRELOADED_MODULES = ["pandas", "pyarrow"]
+
+_LAUNCH_TIMEOUT = 60
+_REQUEST_TIMEOUT = 10
+_HEADER = struct.Struct("!i")
+_STANDARD_FDS = 3
+
+
+def is_worker_pool_enabled(env):
+    return env.get(PYTHON_WORKER_POOL_ENABLED, "").lower() == "true" \
+        and fcntl is not None and hasattr(os, "fork") and hasattr(socket, "AF_UNIX")
+
+
+def run_worker(argv, env):
+    """
+    Runs a Python worker forked by the worker pool with the given arguments and environment
+    variables, and waits until it exits. The pool is launched if it's not running yet.
+
+    :param argv: The command line arguments of the Python worker.
+    :param env: The environment variables of the Python worker.
+    :return: The exit code of the Python worker. An exception is raised if the Python worker
+             couldn't be forked.
+    """
+    pool_dir = env.get(
+        PYTHON_WORKER_POOL_DIR,
+        os.path.join(tempfile.gettempdir(), "pyflink-worker-pools-%d" % os.getuid()))
+    os.makedirs(pool_dir, mode=0o700, exist_ok=True)
+    path_prefix = os.path.join(pool_dir, _worker_pool_key(env))
+    socket_path = path_prefix + ".sock"
+    with open(path_prefix + ".lock", "a") as lock_file:
+        # prevents the concurrently started Python workers from launching multiple pools
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        sock = _connect_worker_pool(socket_path)
+        if sock is None:
+            _launch_worker_pool(socket_path, path_prefix + ".log", env)
+            sock = _connect_worker_pool(socket_path)
+            if sock is None:
+                raise RuntimeError("Failed to connect to the Python worker pool, see %s.log for "
+                                   "more details." % path_prefix)
+
+    with sock:
+        request = json.dumps({"argv": argv, "env": env, "cwd": os.getcwd()}).encode("utf-8")
+        fds = [sys.stdin.fileno(), sys.stdout.fileno(), sys.stderr.fileno()]
+        sys.stdout.flush()
+        sys.stderr.flush()
+        sock.sendmsg([_HEADER.pack(len(request))],
+                     [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", fds))])
+        sock.sendall(request)
+        pid = _HEADER.unpack(_recv_exactly(sock, _HEADER.size))[0]
+        logging.info("Python worker %d was forked by the Python worker pool." % pid)
+
+        # the Python worker is not a child process, forward the termination signals to it
+        def forward_signal(signum, frame):
+            try:
+                os.kill(pid, signum)
+            except OSError:
+                pass
+
+        for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+            signal.signal(signum, forward_signal)
+        # the pool kills the Python worker when the connection is closed, e.g. if this process
+        # has been killed
+        try:
+            return _HEADER.unpack(_recv_exactly(sock, _HEADER.size))[0]
+        except (OSError, EOFError):
+            # don't raise the exception as the Python worker has been started
+            logging.exception("Lost the connection to the Python worker pool.")
+            forward_signal(signal.SIGKILL, None)
+            return 1
+
+
+def serve(socket_path, idle_timeout):
+    """
+    Serves the requests of "beam_boot.py" until the pool has been idle for idle_timeout seconds.
+    """
+    for module in _PRELOADED_MODULES:
+        __import__(module)
+    for module in _OPTIONAL_PRELOADED_MODULES:
+        try:
+            __import__(module)
+        except ImportError:
+            pass
+    if threading.active_count() > 1:
+        logging.warning("The Python worker pool has started %d threads, which are not "
+                        "available in the forked Python workers."
+                        % (threading.active_count() - 1))
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    listener.listen(16)
+    # wakes up the selector when a Python worker exits
+    wakeup_reader, wakeup_writer = socket.socketpair()
+    wakeup_reader.setblocking(False)
+    wakeup_writer.setblocking(False)
+    signal.set_wakeup_fd(wakeup_writer.fileno())
+    signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+    selector = selectors.DefaultSelector()
+    selector.register(listener, selectors.EVENT_READ)
+    selector.register(wakeup_reader, selectors.EVENT_READ)
+    logging.info("Python worker pool is listening on %s." % socket_path)
+
+    # pid -> the connection of the Python worker
+    workers = {}
+    last_active_time = time.monotonic()
+    try:
+        while workers or time.monotonic() - last_active_time < idle_timeout:
+            for key, _ in selector.select(timeout=1):
+                if key.fileobj is listener:
+                    conn = listener.accept()[0]
+                    inherited_sockets = [listener, wakeup_reader, wakeup_writer]
+                    inherited_sockets.extend(workers.values())
+                    try:
+                        pid = _fork_worker(conn, selector, inherited_sockets)
+                    except Exception:
+                        logging.exception("Failed to fork a Python worker.")
+                        conn.close()
+                        continue
+                    workers[pid] = conn
+                    selector.register(conn, selectors.EVENT_READ, pid)
+                elif key.fileobj is wakeup_reader:
+                    while True:
+                        try:
+                            if not wakeup_reader.recv(4096):
+                                break
+                        except BlockingIOError:
+                            break
+                else:
+                    # the connection is closed by the client, e.g. because it has been killed
+                    selector.unregister(key.fileobj)
+                    _kill(key.data)
+            while workers:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+                if pid == 0:
+                    break
+                conn = workers.pop(pid, None)
+                if conn is not None:
+                    if conn in selector.get_map():
+                        selector.unregister(conn)
+                    try:
+                        conn.sendall(_HEADER.pack(_exit_code(status)))
+                    except OSError:
+                        pass
+                    conn.close()
+                last_active_time = time.monotonic()
+    finally:
+        listener.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        for pid in workers:
+            _kill(pid)
+
+
+def _fork_worker(conn, selector, inherited_sockets):
+    conn.settimeout(_REQUEST_TIMEOUT)
+    size_bytes, ancdata, _, _ = conn.recvmsg(
+        _HEADER.size, socket.CMSG_SPACE(_STANDARD_FDS * array.array("i").itemsize))
+    fds = array.array("i")
+    for level, kind, data in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(data[:len(data) - (len(data) % fds.itemsize)])
+    try:
+        if len(size_bytes) != _HEADER.size or len(fds) != _STANDARD_FDS:
+            raise RuntimeError("Invalid request of a Python worker.")
+        request = json.loads(
+            _recv_exactly(conn, _HEADER.unpack(size_bytes)[0]).decode("utf-8"))
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                signal.set_wakeup_fd(-1)
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                selector.close()
+                for inherited_socket in inherited_sockets:
+                    inherited_socket.close()
+                conn.close()
+                exit_code = _run_forked_worker(request, fds)
+            finally:
+                os._exit(exit_code)
+    finally:
+        for fd in fds:
+            os.close(fd)
+    conn.settimeout(None)
+    conn.sendall(_HEADER.pack(pid))
+    return pid
+
+
+def _run_forked_worker(request, fds):
+    for target_fd, fd in enumerate(fds):
+        os.dup2(fd, target_fd)
+    for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+        signal.signal(signum, signal.SIG_DFL)
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+    python_path = [p for p in os.environ.get("PYTHONPATH", "").split(os.pathsep) if p]
+    sys.path[:] = [request["cwd"]] + python_path + _base_sys_path
+    sys.argv = request["argv"]
+    try:
+        from pyflink.fn_execution.beam import beam_sdk_worker_main
+        beam_sdk_worker_main.main()
+        return 0
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+    except BaseException:
+        traceback.print_exc()
+        return 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+
+def _connect_worker_pool(socket_path):
+    if not os.path.exists(socket_path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+        return sock
+    except OSError:
+        # the pool has exited
+        sock.close()
+        return None
+
+
+def _launch_worker_pool(socket_path, log_file, env):
+    idle_timeout = env.get(PYTHON_WORKER_POOL_IDLE_TIMEOUT, "600")
+    with open(log_file, "ab") as log:
+        process = subprocess.Popen(
+            [sys.executable, "-m", __name__, socket_path, idle_timeout],
+            stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+            cwd=os.path.dirname(socket_path), env=env, start_new_session=True)
+    start_time = time.monotonic()
+    while not os.path.exists(socket_path):
+        if process.poll() is not None:
+            raise RuntimeError("The Python worker pool exited with code %d, see %s for more "
+                               "details." % (process.returncode, log_file))
+        if time.monotonic() - start_time > _LAUNCH_TIMEOUT:
+            process.kill()
+            raise RuntimeError("Timed out launching the Python worker pool, see %s for more "
+                               "details." % log_file)
+        time.sleep(0.05)
+
+
+def _worker_pool_key(env):
+    """
+    The pools are only shared by the Python workers using the same interpreter, PyFlink
+    installation and Python dependencies, as the modules preloaded by a pool, which are imported
+    with the Python path of the Python worker launching the pool, are reused by the forked Python
+    workers.
+    """
+    import pyflink
+    content = repr((sys.executable, os.path.abspath(pyflink.__file__), _PRELOADED_MODULES,
+                    _OPTIONAL_PRELOADED_MODULES,
+                    [env.get(key) for key in _PYTHON_DEPENDENCY_ENV_KEYS]))
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+def _recv_exactly(sock, size):
+    chunks = []
+    while size > 0:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise EOFError("The connection of the Python worker pool was closed unexpectedly.")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _kill(pid):
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except OSError:
+        pass
+
+
+def _exit_code(status):
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+# the Python path of the pool except the working directory and PYTHONPATH, which are replaced by
+# the ones of the request in the forked Python workers
+_base_sys_path = [p for p in sys.path[1:] if p not in os.environ.get("PYTHONPATH", "").split(
+    os.pathsep)]
+
+
+if __name__ == "__main__":
+    logging.basicConfig(stream=sys.stdout, level=logging.INFO,
+                        format="%(asctime)s %(levelname)s %(message)s")
+    serve(sys.argv[1], float(sys.argv[2]))
@@ -47,6 +47,8 @@ cdef class FlattenRowCoderImpl(BaseCoderImpl):
     cdef size_t _leading_complete_bytes_num
     cdef size_t _remaining_bits_num
     cdef bint _single_output
+    # whether the pickled bytes are encoded with out-of-band buffers
+    cdef bint _pickle_out_of_band
 
     cdef bint*_mask
     cdef unsigned char*_mask_byte_search_table
@@ -90,6 +92,7 @@ cdef class FlattenRowCoderImpl(BaseCoderImpl):
     cdef void _encode_float(self, float v)
     cdef void _encode_double(self, double v)
     cdef void _encode_bytes(self, char*b, size_t length)
+    cdef void _encode_pickled_bytes(self, item)
 
     # decode data from input_stream
     cdef void _decode_next_row(self, LengthPrefixInputStream input_stream)
@@ -104,6 +107,7 @@ cdef class FlattenRowCoderImpl(BaseCoderImpl):
     cdef float _decode_float(self) except? -1
     cdef double _decode_double(self) except? -1
     cdef bytes _decode_bytes(self)
+    cdef object _decode_pickled_bytes(self)
     cdef object _decode_field_row(self, RowCoderImpl field_coder)
 
 cdef class AggregateFunctionRowCoderImpl(FlattenRowCoderImpl):
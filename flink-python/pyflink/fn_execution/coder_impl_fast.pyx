@@ -22,12 +22,14 @@
 
 from libc.stdlib cimport free, malloc, realloc
 from libc.string cimport memcpy
+from cpython.bytearray cimport PyByteArray_FromStringAndSize
 
 import datetime
 import decimal
 import pickle
 
 from pyflink.fn_execution.flink_fn_execution_pb2 import CoderParam
+from pyflink.fn_execution.utils import pickle_utils
 from pyflink.fn_execution.window import TimeWindow, CountWindow
 from pyflink.table import Row
 from pyflink.table.types import RowKind
@@ -215,6 +217,7 @@ cdef class FlattenRowCoderImpl(BaseCoderImpl):
         self._mask = <bint*> malloc((self._field_count + ROW_KIND_BIT_SIZE) * sizeof(bint))
         self._init_attribute()
         self.row = [None for _ in range(self._field_count)]
+        self._pickle_out_of_band = pickle_utils.is_out_of_band_enabled()
         from pyflink.fn_execution import flink_fn_execution_pb2
         if output_mode == flink_fn_execution_pb2.CoderParam.MULTIPLE:
             self._single_output = False
@@ -371,8 +374,7 @@ cdef class FlattenRowCoderImpl(BaseCoderImpl):
             minutes %= 60
             return datetime.time(hours, minutes, seconds, milliseconds * 1000)
         elif field_type == PICKLED_BYTES:
-            decoded_bytes = self._decode_bytes()
-            return pickle.loads(decoded_bytes)
+            return self._decode_pickled_bytes()
         elif field_type == BIG_DEC:
             return decimal.Decimal(self._decode_bytes().decode("utf-8"))
 
@@ -531,6 +533,15 @@ cdef class FlattenRowCoderImpl(BaseCoderImpl):
         self._input_pos += size
         return self._input_data[self._input_pos - size: self._input_pos]
 
+    cdef object _decode_pickled_bytes(self):
+        cdef libc.stdint.int32_t size = self._decode_int()
+        cdef char*data = self._input_data + self._input_pos
+        self._input_pos += size
+        if size > 0 and <unsigned char> data[0] == pickle_utils.OUT_OF_BAND_MARKER:
+            # the value is copied once into a bytearray and the out-of-band buffers are views of it
+            return pickle_utils.loads(PyByteArray_FromStringAndSize(data, size))
+        return pickle.loads(data[:size])
+
     cdef void _encode_field(self, CoderType coder_type, TypeName field_type, FieldCoder field_coder,
                             item):
         if coder_type == SIMPLE:
@@ -584,8 +595,7 @@ cdef class FlattenRowCoderImpl(BaseCoderImpl):
             self._encode_int(milliseconds)
         elif field_type == PICKLED_BYTES:
             # pickled object
-            pickled_bytes = pickle.dumps(item)
-            self._encode_bytes(pickled_bytes, len(pickled_bytes))
+            self._encode_pickled_bytes(item)
         elif field_type == BIG_DEC:
             item_bytes = str(item).encode('utf-8')
             self._encode_bytes(item_bytes, len(item_bytes))
@@ -756,6 +766,26 @@ cdef class FlattenRowCoderImpl(BaseCoderImpl):
             memcpy(self._tmp_output_data + self._tmp_output_pos, b, length)
         self._tmp_output_pos += length
 
+    cdef void _encode_pickled_bytes(self, item):
+        cdef bytes pickled_bytes
+        cdef const unsigned char[::1] buffer_view
+        if not self._pickle_out_of_band:
+            pickled_bytes = pickle.dumps(item)
+            self._encode_bytes(pickled_bytes, len(pickled_bytes))
+            return
+        pickled_bytes, buffers = pickle_utils.dumps_out_of_band(item)
+        if not buffers:
+            self._encode_bytes(pickled_bytes, len(pickled_bytes))
+            return
+        self._encode_int(pickle_utils.out_of_band_size(pickled_bytes, buffers))
+        self._encode_byte(pickle_utils.OUT_OF_BAND_MARKER)
+        self._encode_int(len(buffers))
+        self._encode_bytes(pickled_bytes, len(pickled_bytes))
+        for buffer in buffers:
+            # the buffers are copied into the output buffer directly
+            buffer_view = buffer
+            self._encode_bytes(<char*> &buffer_view[0], buffer_view.shape[0])
+
     cdef void _write_mask(self, value, size_t leading_complete_bytes_num,
                           size_t remaining_bits_num, unsigned char row_kind_value, size_t field_count):
         cdef size_t field_pos, index
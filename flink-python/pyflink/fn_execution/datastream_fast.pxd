@@ -0,0 +1,65 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+# cython: language_level=3
+
+cdef class ProcessFunctionHandler:
+    cdef object _ctx
+    cdef object _process_element
+    cdef object _set_timestamp
+    cdef object _set_current_watermark
+
+    cpdef object process_element(self, value)
+
+cdef class KeyedProcessFunctionHandler:
+    cdef object _ctx
+    cdef object _on_timer_ctx
+    cdef object _collector
+    cdef object _process_element
+    cdef object _on_timer
+    cdef object _set_timestamp
+    cdef object _set_current_key
+    cdef object _set_timer_timestamp
+    cdef object _set_timer_current_key
+    cdef object _set_time_domain
+    cdef object _set_current_watermark
+    cdef object _set_state_current_key
+
+    cpdef list process_element(self, value)
+
+cdef class TimerRowInputHandler:
+    cpdef list process_element(self, operation_input)
+    cdef void advance_watermark(self, watermark)
+    cdef list on_normal_record(self, normal_data, timestamp)
+    cdef list on_event_time(self, key, timestamp, serialized_namespace)
+    cdef list on_processing_time(self, key, timestamp, serialized_namespace)
+
+cdef class KeyedTwoInputTimerRowHandler(TimerRowInputHandler):
+    cdef object _ctx
+    cdef object _on_timer_ctx
+    cdef object _collector
+    cdef object _process_element1
+    cdef object _process_element2
+    cdef object _on_timer
+    cdef object _set_timestamp
+    cdef object _set_timer_timestamp
+    cdef object _set_timer_current_key
+    cdef object _set_time_domain
+    cdef object _set_current_watermark
+    cdef object _set_state_current_key
+
+    cdef list _on_timer_internal(self, time_domain, key, timestamp)
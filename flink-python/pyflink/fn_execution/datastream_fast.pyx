@@ -0,0 +1,228 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+# cython: language_level = 3
+# cython: infer_types = True
+# cython: profile=True
+# cython: boundscheck=False, wraparound=False, initializedcheck=False, cdivision=True
+from pyflink.common import Row
+from pyflink.datastream.time_domain import TimeDomain
+
+# the values of RunnerInputType and TimerType of pyflink.fn_execution.utils.input_handler
+cdef enum RunnerInputType:
+    NORMAL_RECORD = 0
+    TRIGGER_TIMER = 1
+
+cdef enum TimerType:
+    EVENT_TIME = 0
+    PROCESSING_TIME = 1
+
+# the values of KeyedProcessFunctionInputFlag of pyflink.fn_execution.operation_utils
+cdef enum KeyedProcessFunctionInputFlag:
+    EVENT_TIME_TIMER = 0
+    PROC_TIME_TIMER = 1
+
+cdef list emit_output(output_result, collector):
+    # The results are emitted as tuples instead of Rows, which are encoded in the same way by the
+    # Cython coders.
+    # result_row: [TIMER_FLAG, TIMER TYPE, TIMER_KEY, RESULT_DATA]
+    cdef list results = []
+    if output_result:
+        for result in output_result:
+            results.append((None, None, None, result))
+
+    cdef list buf = collector.buf
+    if buf:
+        for result in buf:
+            # 0: proc time timer data
+            # 1: event time timer data
+            # 2: normal data
+            results.append((result[0], result[1], result[2], None))
+        collector.clear()
+    return results
+
+cdef class ProcessFunctionHandler:
+    """
+    Calls the ProcessFunction for each input element.
+    """
+
+    def __init__(self, process_function, ctx):
+        self._ctx = ctx
+        self._process_element = process_function.process_element
+        self._set_timestamp = ctx.set_timestamp
+        self._set_current_watermark = ctx.timer_service().set_current_watermark
+
+    cpdef object process_element(self, value):
+        # VALUE[CURRENT_TIMESTAMP, CURRENT_WATERMARK, NORMAL_DATA]
+        self._set_timestamp(value[0])
+        self._set_current_watermark(value[1])
+        return self._process_element(value[2], self._ctx)
+
+cdef class KeyedProcessFunctionHandler:
+    """
+    Calls the KeyedProcessFunction for each input element or fired timer.
+    """
+
+    def __init__(self, keyed_process_function, ctx, on_timer_ctx, collector, keyed_state_backend):
+        self._ctx = ctx
+        self._on_timer_ctx = on_timer_ctx
+        self._collector = collector
+        self._process_element = keyed_process_function.process_element
+        self._on_timer = keyed_process_function.on_timer
+        self._set_timestamp = ctx.set_timestamp
+        self._set_current_key = ctx.set_current_key
+        self._set_timer_timestamp = on_timer_ctx.set_timestamp
+        self._set_timer_current_key = on_timer_ctx.set_current_key
+        self._set_time_domain = on_timer_ctx.set_time_domain
+        # the timer service is shared by both contexts
+        self._set_current_watermark = ctx.timer_service().set_current_watermark
+        self._set_state_current_key = keyed_state_backend.set_current_key
+
+    cpdef list process_element(self, value):
+        timer_flag = value[0]
+        if timer_flag is not None:
+            # it is timer data
+            # VALUE:
+            # TIMER_FLAG, TIMESTAMP_OF_TIMER, CURRENT_WATERMARK, CURRENT_KEY_OF_TIMER, None
+            timestamp = value[1]
+            self._set_timer_timestamp(timestamp)
+            self._set_current_watermark(value[2])
+            state_current_key = value[3]
+            self._set_timer_current_key(state_current_key[0])
+            self._set_state_current_key(state_current_key)
+            if timer_flag == EVENT_TIME_TIMER:
+                self._set_time_domain(TimeDomain.EVENT_TIME)
+            elif timer_flag == PROC_TIME_TIMER:
+                self._set_time_domain(TimeDomain.PROCESSING_TIME)
+            else:
+                raise TypeError("TimeCharacteristic[%s] is not supported." % str(timer_flag))
+            output_result = self._on_timer(timestamp, self._on_timer_ctx)
+        else:
+            # it is normal data
+            # VALUE: TIMER_FLAG, CURRENT_TIMESTAMP, CURRENT_WATERMARK, None, NORMAL_DATA
+            # NORMAL_DATA: CURRENT_KEY, DATA
+            self._set_timestamp(value[1])
+            self._set_current_watermark(value[2])
+            normal_data = value[4]
+            user_current_key = normal_data[0]
+            self._set_current_key(user_current_key)
+            self._set_state_current_key(Row(user_current_key))
+            output_result = self._process_element(normal_data[1], self._ctx)
+        return emit_output(output_result, self._collector)
+
+cdef class TimerRowInputHandler:
+    """
+    Handles the input elements which are either normal records or fired timers.
+    """
+
+    cpdef list process_element(self, operation_input):
+        input_type = operation_input[0]
+        timestamp = operation_input[2]
+
+        self.advance_watermark(operation_input[3])
+        if input_type == NORMAL_RECORD:
+            return self.on_normal_record(operation_input[1], timestamp)
+        elif input_type == TRIGGER_TIMER:
+            timer_data = operation_input[4]
+            timer_type = timer_data[0]
+            if timer_type == EVENT_TIME:
+                return self.on_event_time(timer_data[1], timestamp, timer_data[2])
+            elif timer_type == PROCESSING_TIME:
+                return self.on_processing_time(timer_data[1], timestamp, timer_data[2])
+            else:
+                raise Exception("Unsupported timer type: %d" % timer_type)
+        else:
+            raise Exception("Unsupported input type: %d" % input_type)
+
+    cdef void advance_watermark(self, watermark):
+        pass
+
+    cdef list on_normal_record(self, normal_data, timestamp):
+        pass
+
+    cdef list on_event_time(self, key, timestamp, serialized_namespace):
+        pass
+
+    cdef list on_processing_time(self, key, timestamp, serialized_namespace):
+        pass
+
+cdef class KeyedTwoInputTimerRowHandler(TimerRowInputHandler):
+    """
+    Calls the KeyedCoProcessFunction for each input element of either input or fired timer.
+    """
+
+    def __init__(self,
+                 context,
+                 timer_context,
+                 internal_collector,
+                 state_backend,
+                 keyed_co_process_function):
+        self._ctx = context
+        self._on_timer_ctx = timer_context
+        self._collector = internal_collector
+        self._process_element1 = keyed_co_process_function.process_element1
+        self._process_element2 = keyed_co_process_function.process_element2
+        self._on_timer = keyed_co_process_function.on_timer
+        self._set_timestamp = context.set_timestamp
+        self._set_timer_timestamp = timer_context.set_timestamp
+        self._set_timer_current_key = timer_context.set_current_key
+        self._set_time_domain = timer_context.set_time_domain
+        self._set_current_watermark = timer_context.timer_service().set_current_watermark
+        self._set_state_current_key = state_backend.set_current_key
+
+    cdef void advance_watermark(self, watermark):
+        self._set_current_watermark(watermark)
+
+    cdef list on_normal_record(self, unified_input, timestamp):
+        self._set_timestamp(timestamp)
+        is_left = unified_input[0]
+        if is_left:
+            user_input = unified_input[1]
+        else:
+            user_input = unified_input[2]
+        user_current_key = user_input[0]
+        user_element = user_input[1]
+
+        self._set_timer_current_key(user_current_key)
+        self._set_state_current_key(Row(user_current_key))
+
+        if is_left:
+            output_result = self._process_element1(user_element, self._ctx)
+        else:
+            output_result = self._process_element2(user_element, self._ctx)
+
+        return emit_output(output_result, self._collector)
+
+    cdef list on_event_time(self, key, timestamp, serialized_namespace):
+        return self._on_timer_internal(TimeDomain.EVENT_TIME, key, timestamp)
+
+    cdef list on_processing_time(self, key, timestamp, serialized_namespace):
+        return self._on_timer_internal(TimeDomain.PROCESSING_TIME, key, timestamp)
+
+    cdef list _on_timer_internal(self, time_domain, key, timestamp):
+        self._set_timer_timestamp(timestamp)
+        state_current_key = key
+        user_current_key = state_current_key[0]
+
+        self._set_timer_current_key(user_current_key)
+        self._set_state_current_key(state_current_key)
+
+        self._set_time_domain(time_domain)
+
+        output_result = self._on_timer(timestamp, self._on_timer_ctx)
+
+        return emit_output(output_result, self._collector)
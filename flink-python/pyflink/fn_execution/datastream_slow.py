@@ -0,0 +1,95 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+from pyflink.common import Row
+from pyflink.datastream.time_domain import TimeDomain
+from pyflink.fn_execution.operation_utils import KeyedProcessFunctionInputFlag
+from pyflink.fn_execution.utils.input_handler import KeyedTwoInputTimerRowHandler  # noqa: F401
+
+
+class ProcessFunctionHandler(object):
+    """
+    Calls the ProcessFunction for each input element.
+    """
+
+    def __init__(self, process_function, ctx):
+        self._ctx = ctx
+        self._process_element = process_function.process_element
+
+    def process_element(self, value):
+        # VALUE[CURRENT_TIMESTAMP, CURRENT_WATERMARK, NORMAL_DATA]
+        self._ctx.set_timestamp(value[0])
+        self._ctx.timer_service().set_current_watermark(value[1])
+        return self._process_element(value[2], self._ctx)
+
+
+class KeyedProcessFunctionHandler(object):
+    """
+    Calls the KeyedProcessFunction for each input element or fired timer.
+    """
+
+    def __init__(self, keyed_process_function, ctx, on_timer_ctx, collector, keyed_state_backend):
+        self._ctx = ctx
+        self._on_timer_ctx = on_timer_ctx
+        self._collector = collector
+        self._keyed_state_backend = keyed_state_backend
+        self._process_element = keyed_process_function.process_element
+        self._on_timer = keyed_process_function.on_timer
+
+    def process_element(self, value):
+        if value[0] is not None:
+            # it is timer data
+            # VALUE:
+            # TIMER_FLAG, TIMESTAMP_OF_TIMER, CURRENT_WATERMARK, CURRENT_KEY_OF_TIMER, None
+            self._on_timer_ctx.set_timestamp(value[1])
+            self._on_timer_ctx.timer_service().set_current_watermark(value[2])
+            state_current_key = value[3]
+            user_current_key = state_current_key[0]
+            self._on_timer_ctx.set_current_key(user_current_key)
+            self._keyed_state_backend.set_current_key(state_current_key)
+            if value[0] == KeyedProcessFunctionInputFlag.EVENT_TIME_TIMER.value:
+                self._on_timer_ctx.set_time_domain(TimeDomain.EVENT_TIME)
+            elif value[0] == KeyedProcessFunctionInputFlag.PROC_TIME_TIMER.value:
+                self._on_timer_ctx.set_time_domain(TimeDomain.PROCESSING_TIME)
+            else:
+                raise TypeError("TimeCharacteristic[%s] is not supported." % str(value[0]))
+            output_result = self._on_timer(value[1], self._on_timer_ctx)
+        else:
+            # it is normal data
+            # VALUE: TIMER_FLAG, CURRENT_TIMESTAMP, CURRENT_WATERMARK, None, NORMAL_DATA
+            # NORMAL_DATA: CURRENT_KEY, DATA
+            self._ctx.set_timestamp(value[1])
+            self._ctx.timer_service().set_current_watermark(value[2])
+            user_current_key = value[4][0]
+            state_current_key = Row(user_current_key)
+            self._ctx.set_current_key(user_current_key)
+            self._keyed_state_backend.set_current_key(state_current_key)
+
+            output_result = self._process_element(value[4][1], self._ctx)
+
+        if output_result:
+            for result in output_result:
+                yield Row(None, None, None, result)
+
+        for result in self._collector.buf:
+            # 0: proc time timer data
+            # 1: event time timer data
+            # 2: normal data
+            # result_row: [TIMER_FLAG, TIMER TYPE, TIMER_KEY, RESULT_DATA]
+            yield Row(result[0], result[1], result[2], None)
+
+        self._collector.clear()
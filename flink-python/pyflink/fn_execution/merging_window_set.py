@@ -0,0 +1,165 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+from bisect import insort, bisect_left
+from typing import Generic, Set, Callable, Iterable
+
+from pyflink.datastream.state import MapState
+from pyflink.fn_execution.window_assigner import MergingWindowAssigner
+from pyflink.fn_execution.window_context import K, W
+
+
+class MergingWindowSet(Generic[K, W]):
+    """
+    Utility for keeping track of merging Windows when using a MergingWindowAssigner.
+
+    A MergingWindowSet is a set of Windows that also keeps track of which windows are
+    "in-flight", i.e. which windows currently have state associated with them. The state window
+    of a window is the window whose namespace holds the accumulators, so that merging windows only
+    needs to update the mapping and merge the accumulators of the state windows instead of
+    re-accumulating the input rows.
+
+    The mapping is persisted in a MapState whose entries are loaded into the local cache each time
+    the current key changes.
+    """
+
+    def __init__(self, window_assigner: MergingWindowAssigner[W], state: MapState):
+        self._window_assigner = window_assigner
+        # mapping from window to the window that keeps the window state. When we are
+        # incrementally merging windows starting from some window we keep that starting
+        # window as the state window to prevent costly state juggling.
+        self._mapping = {}
+        self._sorted_windows = []
+        self._state = state
+        self._current_key = None  # type: K
+
+    def initialize_cache(self, key: K):
+        """
+        Loads the mapping of the given key from state if it's not the key the cache belongs to.
+        """
+        if key != self._current_key:
+            self._mapping.clear()
+            self._sorted_windows.clear()
+            for window, state_window in self._state.items():
+                self._mapping[window] = state_window
+                self._sorted_windows.append(window)
+            self._sorted_windows.sort()
+            self._current_key = key
+
+    def get_state_window(self, window: W) -> W:
+        """
+        Returns the state window for the given in-flight Window. The state window is the Window
+        in which we keep the actual state of a given in-flight window. Windows might expand but
+        we keep to original state window for keeping the elements of the window to avoid costly
+        state juggling.
+        """
+        return self._mapping.get(window)
+
+    def retire_window(self, window: W):
+        """
+        Removes the given window from the set of in-flight windows.
+        """
+        removed = self._mapping.pop(window, None)
+        if removed is None:
+            raise Exception("Window %s is not in in-flight window set." % window)
+        self._remove_sorted_window(window)
+        self._state.remove(window)
+
+    def add_window(self,
+                   new_window: W,
+                   merge_function: Callable[[W, Set[W], W, Iterable[W]], None]) -> W:
+        """
+        Adds a new Window to the set of in-flight windows. It might happen that this triggers
+        merging of previously in-flight windows. In that case, the provided merge_function is
+        called with the merge result, the merged windows, the state window of the merge result
+        and the state windows which should be merged into it.
+
+        This returns the window that is the representative of the added window after adding.
+        This can either be the new window itself, if no merge occurred, or the newly merged
+        window. Adding an element to a window or calling trigger functions should only happen
+        on the returned representative. This way, we never have to deal with a new window that
+        is immediately swallowed up by another window.
+
+        If the new window is merged, the merge_function callback arguments also don't contain
+        the new window as part of the list of merged windows.
+        """
+        merge_results = {}
+
+        def collect_merge_result(merge_result: W, merged_windows: Set[W]):
+            merge_results[merge_result] = merged_windows
+
+        self._window_assigner.merge_windows(new_window, self._sorted_windows, collect_merge_result)
+
+        result_window = new_window
+        is_new_window_merged = False
+
+        # perform the merge
+        for merge_result, merged_windows in merge_results.items():
+            # if our new window is in the merged windows make the merge result the
+            # result window
+            if new_window in merged_windows:
+                merged_windows.remove(new_window)
+                is_new_window_merged = True
+                result_window = merge_result
+
+            # if our new window is the same as a pre-existing window, nothing to do
+            if not merged_windows:
+                continue
+
+            # pick any of the merged windows and choose that window's state window
+            # as the state window for the merge result
+            merged_state_namespace = self._mapping[next(iter(merged_windows))]
+
+            # figure out the state windows that we are merging
+            merged_state_windows = []
+            for merged_window in merged_windows:
+                res = self._mapping.pop(merged_window, None)
+                if res is not None:
+                    merged_state_windows.append(res)
+                self._state.remove(merged_window)
+                self._remove_sorted_window(merged_window)
+
+            self._mapping[merge_result] = merged_state_namespace
+            self._state.put(merge_result, merged_state_namespace)
+            insort(self._sorted_windows, merge_result)
+
+            # don't put the target state window into the merged windows
+            if merged_state_namespace in merged_state_windows:
+                merged_state_windows.remove(merged_state_namespace)
+
+            # don't merge the new window itself, it never had any state associated with it
+            # i.e. if we are only merging one pre-existing window into itself
+            # without extending the pre-existing window
+            if not (merge_result in merged_windows and len(merged_windows) == 1):
+                merge_function(
+                    merge_result,
+                    merged_windows,
+                    self._mapping[merge_result],
+                    merged_state_windows)
+
+        # the new window created a new, self-contained window without merging
+        if not merge_results or (result_window == new_window and not is_new_window_merged):
+            self._mapping[result_window] = result_window
+            self._state.put(result_window, result_window)
+            insort(self._sorted_windows, result_window)
+
+        return result_window
+
+    def _remove_sorted_window(self, window: W):
+        index = bisect_left(self._sorted_windows, window)
+        if index < len(self._sorted_windows) and self._sorted_windows[index] == window:
+            del self._sorted_windows[index]
@@ -15,32 +15,57 @@
 #  See the License for the specific language governing permissions and
 # limitations under the License.
 ################################################################################
+import asyncio
 import datetime
+import functools
+import inspect
+import threading
+from collections.abc import Iterator
+from concurrent import futures
 from enum import Enum
 
 from typing import Any, Tuple, Dict, List
 
 from pyflink.common import Row
-from pyflink.datastream.time_domain import TimeDomain
 from pyflink.fn_execution import flink_fn_execution_pb2, pickle
-from pyflink.fn_execution.utils.input_handler import KeyedTwoInputTimerRowHandler
+from pyflink.fn_execution.utils.async_executor import AsyncExecutor, run_coroutine
 from pyflink.serializers import PickleSerializer
 from pyflink.table import functions
 from pyflink.table.udf import DelegationTableFunction, DelegatingScalarFunction, \
-    ImperativeAggregateFunction, PandasAggregateFunctionWrapper
+    ImperativeAggregateFunction, PandasAggregateFunctionWrapper, AsyncFunctionWrapper
 
 _func_num = 0
 _constant_num = 0
 
 
-def wrap_pandas_result(it):
+def wrap_pandas_result(results):
+    """
+    Assembles the results of the pandas aggregate functions for a batch of groups column by
+    column, so that they are converted to a single arrow batch.
+
+    :param results: the results of each group, i.e. a list of the results of the functions.
+    :return: a pd.Series for each function or a pd.DataFrame if the function returns rows.
+    """
     import pandas as pd
+
+    def to_series(values):
+        series = pd.Series(values)
+        if series.dtype.kind == 'f' and any(v is None for v in values):
+            # pandas converts the integers to floats if there are nulls, which loses the precision
+            # of the large integers, e.g. BIGINT, so the values are kept as they are
+            series = pd.Series(values, dtype=object)
+        return series
+
     arrays = []
-    for result in it:
-        if isinstance(result, (Row, Tuple)):
-            arrays.append(pd.concat([pd.Series([item]) for item in result], axis=1))
+    for column in zip(*results):
+        row_results = [result for result in column if isinstance(result, (Row, Tuple))]
+        if row_results:
+            null_row = [None] * len(row_results[0])
+            rows = [list(result) if result is not None else null_row for result in column]
+            arrays.append(pd.DataFrame(
+                {i: to_series(list(field)) for i, field in enumerate(zip(*rows))}))
         else:
-            arrays.append(pd.Series([result]))
+            arrays.append(to_series(list(column)))
     return arrays
 
 
@@ -84,6 +109,9 @@ def extract_user_defined_function(user_defined_function_proto, pandas_udaf=False
             if arg.HasField("udf"):
                 # for chaining Python UDF input: the input argument is a Python ScalarFunction
                 udf_arg, udf_variable_dict, udf_funcs = extract_user_defined_function(arg.udf)
+                if isinstance(udf_funcs[0], AsyncFunctionWrapper):
+                    # the result of the async function is needed at once by the chained function
+                    udf_arg = "%s.result()" % udf_arg
                 args_str.append(udf_arg)
                 local_variable_dict.update(udf_variable_dict)
                 local_funcs.extend(udf_funcs)
@@ -105,7 +133,10 @@ def extract_user_defined_function(user_defined_function_proto, pandas_udaf=False
     if pandas_udaf:
         user_defined_func = PandasAggregateFunctionWrapper(user_defined_func)
     func_name = 'f%s' % _next_func_num()
-    if isinstance(user_defined_func, DelegatingScalarFunction) \
+    if isinstance(user_defined_func, AsyncFunctionWrapper):
+        variable_dict[func_name] = _wrap_async_eval_function(
+            user_defined_func.get_eval_function(), user_defined_func.timeout)
+    elif isinstance(user_defined_func, DelegatingScalarFunction) \
             or isinstance(user_defined_func, DelegationTableFunction):
         variable_dict[func_name] = user_defined_func.func
     else:
@@ -123,6 +154,133 @@ def extract_user_defined_function(user_defined_function_proto, pandas_udaf=False
     return func_str, variable_dict, user_defined_funcs
 
 
+class AsyncCall(object):
+    """
+    A call of an async function in the row function of an operation. The call is not executed by
+    the row function, it's started by the :class:`AsyncExecutor` of the operation instead. So only
+    the async functions are executed concurrently, while the other functions chained with them
+    are executed in the thread which processes the bundle.
+    """
+
+    __slots__ = ('func', 'args')
+
+    def __init__(self, func, args):
+        self.func = func
+        self.args = args
+
+    def result(self):
+        """
+        Executes the call in the current thread and returns its result.
+        """
+        if asyncio.iscoroutinefunction(self.func):
+            return run_coroutine(self.func(*self.args))
+        else:
+            return self.func(*self.args)
+
+
+def _wrap_async_eval_function(eval_func, timeout):
+    """
+    Wraps the eval function of an async function as a function which returns the
+    :class:`AsyncCall` of the eval function. The async generators are collected as lists.
+    """
+    if asyncio.iscoroutinefunction(eval_func):
+        async def func(*args):
+            return await asyncio.wait_for(eval_func(*args), timeout)
+    elif inspect.isasyncgenfunction(eval_func):
+        async def collect(*args):
+            return [result async for result in eval_func(*args)]
+
+        async def func(*args):
+            return await asyncio.wait_for(collect(*args), timeout)
+    else:
+        func = eval_func
+
+    def wrapper(*args):
+        return AsyncCall(func, args)
+
+    return functools.wraps(eval_func)(wrapper)
+
+
+def create_async_executor(user_defined_funcs):
+    """
+    Creates the :class:`AsyncExecutor` of an operation if any of the user-defined functions is
+    an async function. The concurrency and the timeout of the operation are the most restrictive
+    ones of the async functions.
+    """
+    async_funcs = [func for func in user_defined_funcs if isinstance(func, AsyncFunctionWrapper)]
+    if not async_funcs:
+        return None
+    timeouts = [func.timeout for func in async_funcs if func.timeout is not None]
+    return AsyncExecutor(
+        min(func.concurrency for func in async_funcs),
+        min(timeouts) if timeouts else None)
+
+
+def submit_async_calls(async_executor, results):
+    """
+    Starts the async calls in the results of a row with the :class:`AsyncExecutor` and returns the
+    future of the results, in which the async calls are replaced with their results.
+    """
+    call_futures = [(i, async_executor.submit(result.func, *result.args))
+                    for i, result in enumerate(results) if isinstance(result, AsyncCall)]
+    future = futures.Future()
+    if not call_futures:
+        future.set_result(results)
+        return future
+
+    lock = threading.Lock()
+    remaining_calls = [len(call_futures)]
+
+    def on_call_done(_):
+        with lock:
+            remaining_calls[0] -= 1
+            if remaining_calls[0] > 0:
+                return
+        if not future.set_running_or_notify_cancel():
+            # the row has timed out
+            return
+        try:
+            for index, call_future in call_futures:
+                results[index] = call_future.result()
+            future.set_result(results)
+        except BaseException as e:
+            future.set_exception(e)
+
+    def on_row_done(_):
+        if future.cancelled():
+            for _, call_future in call_futures:
+                call_future.cancel()
+
+    future.add_done_callback(on_row_done)
+    for _, call_future in call_futures:
+        call_future.add_done_callback(on_call_done)
+    return future
+
+
+def submit_async_table_function_call(async_executor, result):
+    """
+    Starts the async call of a table function with the :class:`AsyncExecutor` and returns the
+    future of the result.
+    """
+    if not isinstance(result, AsyncCall):
+        future = futures.Future()
+        future.set_result(result)
+        return future
+    if asyncio.iscoroutinefunction(result.func):
+        return async_executor.submit(result.func, *result.args)
+    else:
+        return async_executor.submit(_materialize_table_function_call, result.func, result.args)
+
+
+def _materialize_table_function_call(func, args):
+    result = func(*args)
+    # the results of a table function may be generated lazily, they should be generated in the
+    # thread of the async call instead of the thread which emits them
+    if isinstance(result, Iterator):
+        return list(result)
+    return result
+
+
 def _parse_constant_value(constant_value) -> Tuple[str, Any]:
     j_type = constant_value[0]
     serializer = PickleSerializer()
@@ -268,83 +426,39 @@ def extract_data_stream_stateless_function(udf_proto):
     return func, user_defined_func
 
 
-def extract_process_function(user_defined_function_proto, ctx):
-    process_function = pickle.loads(user_defined_function_proto.payload)
-    process_element = process_function.process_element
-
-    def wrapped_process_function(value):
-        # VALUE[CURRENT_TIMESTAMP, CURRENT_WATERMARK, NORMAL_DATA]
-        ctx.set_timestamp(value[0])
-        ctx.timer_service().set_current_watermark(value[1])
-        output_result = process_element(value[2], ctx)
-        return output_result
+def extract_async_function(user_defined_function_proto):
+    """
+    Extracts the async function from the proto representation of a :class:`Function` which wraps
+    an :class:`AsyncFunction`. The input of the function is [TIMESTAMP, NORMAL_DATA] and the
+    timestamp is returned together with the result, as the results may be emitted out of order.
+
+    :param user_defined_function_proto: the proto representation of the Python :class:`Function`
+    :return: the async function, the function called when an async call times out (None if
+             the default behavior, raising a TimeoutError, should be used) and the function which
+             wraps the async function.
+    """
+    async_map_function = pickle.loads(user_defined_function_proto.payload)
+    async_function = async_map_function.async_function
+    if hasattr(async_function, 'get_async_invoke_function'):
+        async_invoke = async_function.get_async_invoke_function()
+    else:
+        async_invoke = async_function.async_invoke
 
-    return wrapped_process_function, process_function
+    if asyncio.iscoroutinefunction(async_invoke):
+        async def wrapped_func(value):
+            return Row(value[0], await async_invoke(value[1]))
+    else:
+        def wrapped_func(value):
+            return Row(value[0], async_invoke(value[1]))
 
+    if hasattr(async_function, 'timeout'):
+        def on_timeout(value):
+            return Row(value[0], async_function.timeout(value[1]))
+    else:
+        # a TimeoutError will be raised
+        on_timeout = None
 
-def extract_keyed_process_function(user_defined_function_proto, ctx, on_timer_ctx,
-                                   collector, keyed_state_backend):
-    func_type = user_defined_function_proto.function_type
-    UserDefinedDataStreamFunction = flink_fn_execution_pb2.UserDefinedDataStreamFunction
-    func = None
-    process_function = pickle.loads(user_defined_function_proto.payload)
-    on_timer = process_function.on_timer
-
-    if func_type == UserDefinedDataStreamFunction.KEYED_PROCESS:
-        process_element = process_function.process_element
-
-        def wrapped_keyed_process_function(value):
-            if value[0] is not None:
-                # it is timer data
-                # VALUE:
-                # TIMER_FLAG, TIMESTAMP_OF_TIMER, CURRENT_WATERMARK, CURRENT_KEY_OF_TIMER, None
-                on_timer_ctx.set_timestamp(value[1])
-                on_timer_ctx.timer_service().set_current_watermark(value[2])
-                state_current_key = value[3]
-                user_current_key = state_current_key[0]
-                on_timer_ctx.set_current_key(user_current_key)
-                keyed_state_backend.set_current_key(state_current_key)
-                if value[0] == KeyedProcessFunctionInputFlag.EVENT_TIME_TIMER.value:
-                    on_timer_ctx.set_time_domain(TimeDomain.EVENT_TIME)
-                elif value[0] == KeyedProcessFunctionInputFlag.PROC_TIME_TIMER.value:
-                    on_timer_ctx.set_time_domain(TimeDomain.PROCESSING_TIME)
-                else:
-                    raise TypeError("TimeCharacteristic[%s] is not supported." % str(value[0]))
-                output_result = on_timer(value[1], on_timer_ctx)
-            else:
-                # it is normal data
-                # VALUE: TIMER_FLAG, CURRENT_TIMESTAMP, CURRENT_WATERMARK, None, NORMAL_DATA
-                # NORMAL_DATA: CURRENT_KEY, DATA
-                ctx.set_timestamp(value[1])
-                ctx.timer_service().set_current_watermark(value[2])
-                user_current_key = value[4][0]
-                state_current_key = Row(user_current_key)
-                ctx.set_current_key(user_current_key)
-                keyed_state_backend.set_current_key(state_current_key)
-
-                output_result = process_element(value[4][1], ctx)
-
-            if output_result:
-                for result in output_result:
-                    yield Row(None, None, None, result)
-
-            for result in collector.buf:
-                # 0: proc time timer data
-                # 1: event time timer data
-                # 2: normal data
-                # result_row: [TIMER_FLAG, TIMER TYPE, TIMER_KEY, RESULT_DATA]
-                yield Row(result[0], result[1], result[2], None)
-
-            collector.clear()
-
-        func = wrapped_keyed_process_function
-    elif func_type == UserDefinedDataStreamFunction.KEYED_CO_PROCESS:
-        input_handler = KeyedTwoInputTimerRowHandler(
-            ctx, on_timer_ctx, collector, keyed_state_backend, process_function)
-
-        func = input_handler.process_element
-
-    return func, process_function
+    return wrapped_func, on_timeout, async_map_function
 
 
 """
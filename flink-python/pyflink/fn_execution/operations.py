@@ -17,7 +17,7 @@
 ################################################################################
 import abc
 import time
-from functools import reduce
+from functools import partial, reduce
 from itertools import chain
 from typing import List, Tuple, Any, Dict, Union
 
@@ -30,13 +30,16 @@ from pyflink.datastream import TimeDomain, TimerService
 from pyflink.datastream.functions import RuntimeContext, ProcessFunction, KeyedProcessFunction, \
     KeyedCoProcessFunction
 from pyflink.datastream.timerservice import TimerOperandType, InternalTimer, InternalTimerImpl
-from pyflink.fn_execution import flink_fn_execution_pb2, operation_utils
+from pyflink.fn_execution import flink_fn_execution_pb2, operation_utils, pickle
 from pyflink.fn_execution.state_data_view import extract_data_view_specs
 from pyflink.fn_execution.beam.beam_coders import DataViewFilterCoder
 from pyflink.fn_execution.operation_utils import extract_user_defined_aggregate_function
 from pyflink.fn_execution.state_impl import RemoteKeyedStateBackend
+from pyflink.fn_execution.utils.async_executor import AsyncExecutor
 
-from pyflink.fn_execution.window_assigner import TumblingWindowAssigner, CountTumblingWindowAssigner
+from pyflink.fn_execution.window_assigner import TumblingWindowAssigner, \
+    CountTumblingWindowAssigner, SlidingWindowAssigner, CountSlidingWindowAssigner, \
+    SessionWindowAssigner
 from pyflink.fn_execution.window_trigger import EventTimeTrigger, ProcessingTimeTrigger, \
     CountTrigger
 
@@ -47,6 +50,8 @@ try:
     from pyflink.fn_execution.window_aggregate_fast import SimpleNamespaceAggsHandleFunction, \
         GroupWindowAggFunction
     from pyflink.fn_execution.coder_impl_fast import InternalRow
+    from pyflink.fn_execution.datastream_fast import ProcessFunctionHandler, \
+        KeyedProcessFunctionHandler, KeyedTwoInputTimerRowHandler
     has_cython = True
 except ImportError:
     from pyflink.fn_execution.aggregate_slow import RowKeySelector, SimpleAggsHandleFunction, \
@@ -54,6 +59,8 @@ except ImportError:
         GroupTableAggFunction
     from pyflink.fn_execution.window_aggregate_slow import SimpleNamespaceAggsHandleFunction, \
         GroupWindowAggFunction
+    from pyflink.fn_execution.datastream_slow import ProcessFunctionHandler, \
+        KeyedProcessFunctionHandler, KeyedTwoInputTimerRowHandler
     has_cython = False
 
 from pyflink.metrics.metricbase import GenericMetricGroup
@@ -74,15 +81,21 @@ PANDAS_BATCH_OVER_WINDOW_AGGREGATE_FUNCTION_URN = \
 DATA_STREAM_STATELESS_FUNCTION_URN = "flink:transform:datastream_stateless_function:v1"
 PROCESS_FUNCTION_URN = "flink:transform:process_function:v1"
 KEYED_PROCESS_FUNCTION_URN = "flink:transform:keyed_process_function:v1"
+ASYNC_FUNCTION_URN = "flink:transform:datastream_async_function:v1"
 
 
 class Operation(abc.ABC):
     def __init__(self, spec):
         super(Operation, self).__init__()
         self.spec = spec
+        # the executor which calls the function for the input elements concurrently, it's only
+        # created by the operations which support async functions. The function of such an
+        # operation starts the call for an input element and returns the future of it.
+        self.async_executor = None
         self.func, self.user_defined_funcs = self.generate_func(self.spec.serialized_fn)
         if self.spec.serialized_fn.metric_enabled:
             self.base_metric_group = GenericMetricGroup(None, None)
+            self._register_startup_latency(self.base_metric_group)
         else:
             self.base_metric_group = None
 
@@ -95,10 +108,27 @@ class Operation(abc.ABC):
         for user_defined_func in self.user_defined_funcs:
             if hasattr(user_defined_func, 'close'):
                 user_defined_func.close()
+        if self.async_executor is not None:
+            self.async_executor.close()
 
     def finish(self):
         self._update_gauge(self.base_metric_group)
 
+    def process_elements(self, elements):
+        """
+        Processes the input elements which arrive together and returns the results to emit.
+        """
+        return (self.func(element) for element in elements)
+
+    @staticmethod
+    def _register_startup_latency(base_metric_group):
+        from pyflink.fn_execution.beam import beam_sdk_worker_main
+        startup_latency = beam_sdk_worker_main.startup_latency
+        # the latency is only available in the Python workers launched by "beam_boot.py"
+        if startup_latency is not None:
+            base_metric_group.add_group("pythonWorker").gauge(
+                "startupLatencyMs", lambda: int(startup_latency * 1000))
+
     def _update_gauge(self, base_metric_group):
         if base_metric_group is not None:
             for name in base_metric_group._flink_gauge:
@@ -116,6 +146,12 @@ class Operation(abc.ABC):
 class ScalarFunctionOperation(Operation):
     def __init__(self, spec):
         super(ScalarFunctionOperation, self).__init__(spec)
+        self.async_executor = operation_utils.create_async_executor(self.user_defined_funcs)
+        if self.async_executor is not None:
+            # only the async calls of a row are executed by the async executor
+            func = self.func
+            self.func = lambda value: operation_utils.submit_async_calls(
+                self.async_executor, func(value))
 
     def generate_func(self, serialized_fn):
         """
@@ -137,6 +173,11 @@ class ScalarFunctionOperation(Operation):
 class TableFunctionOperation(Operation):
     def __init__(self, spec):
         super(TableFunctionOperation, self).__init__(spec)
+        self.async_executor = operation_utils.create_async_executor(self.user_defined_funcs)
+        if self.async_executor is not None:
+            func = self.func
+            self.func = lambda value: operation_utils.submit_async_table_function_call(
+                self.async_executor, func(value))
 
     def generate_func(self, serialized_fn):
         """
@@ -163,11 +204,16 @@ class PandasAggregateFunctionOperation(Operation):
                 x[2] + y[2]),
             [operation_utils.extract_user_defined_function(udf, True)
              for udf in serialized_fn.udfs])
-        variable_dict['wrap_pandas_result'] = operation_utils.wrap_pandas_result
-        generate_func = eval('lambda value: wrap_pandas_result([%s])' %
-                             pandas_functions, variable_dict)
+        generate_func = eval('lambda value: [%s]' % pandas_functions, variable_dict)
         return generate_func, user_defined_funcs
 
+    def process_elements(self, elements):
+        results = [self.func(element) for element in elements]
+        if not results:
+            return []
+        # the results of all the groups are emitted as a single arrow batch
+        return [operation_utils.wrap_pandas_result(results)]
+
 
 class PandasBatchOverWindowAggregateFunctionOperation(Operation):
     def __init__(self, spec):
@@ -195,12 +241,21 @@ class PandasBatchOverWindowAggregateFunctionOperation(Operation):
         user_defined_funcs = []
         self.window_indexes = []
         self.mapper = []
+        # the reduction and the input offset of the agg functions which could be evaluated
+        # incrementally, None for the others
+        self.reductions = []
         for udf in serialized_fn.udfs:
             pandas_agg_function, variable_dict, user_defined_func, window_index = \
                 operation_utils.extract_over_window_user_defined_function(udf)
             user_defined_funcs.extend(user_defined_func)
             self.window_indexes.append(window_index)
             self.mapper.append(eval('lambda value: %s' % pandas_agg_function, variable_dict))
+            reduction = user_defined_func[0].reduction
+            if reduction is not None and not udf.takes_row_as_input and len(udf.inputs) == 1 \
+                    and udf.inputs[0].HasField("inputOffset"):
+                self.reductions.append((reduction, udf.inputs[0].inputOffset))
+            else:
+                self.reductions.append(None)
         return self.wrapped_over_window_function, user_defined_funcs
 
     def wrapped_over_window_function(self, boundaries_series):
@@ -217,6 +272,17 @@ class PandasBatchOverWindowAggregateFunctionOperation(Operation):
             window = self.windows[window_index]
             window_type = window.window_type
             func = self.mapper[i]
+            if self.reductions[i] is not None:
+                if self.is_bounded_range_window[window_index]:
+                    window_boundaries = boundaries_series[
+                        self.bounded_range_window_index[window_index]]
+                else:
+                    window_boundaries = None
+                result = self._reduce_over_window(
+                    input_series, input_cnt, window, window_boundaries, *self.reductions[i])
+                if result is not None:
+                    results.append(result)
+                    continue
             result = []
             if self.is_bounded_range_window[window_index]:
                 window_boundaries = boundaries_series[
@@ -273,12 +339,55 @@ class PandasBatchOverWindowAggregateFunctionOperation(Operation):
             results.append(pd.Series(result))
         return results
 
+    @staticmethod
+    def _reduce_over_window(input_series, input_cnt, window, window_boundaries, reduction,
+                            input_offset):
+        """
+        Evaluates the reduction for the windows of all the rows at once with cumulative and
+        sliding kernels. Returns None if it should be evaluated per row, e.g. for unbounded
+        windows or non-numeric inputs.
+        """
+        import numpy as np
+        from pyflink.fn_execution.utils.window_reduction import reduce_windows
+        OverWindow = flink_fn_execution_pb2.OverWindow
+        window_type = window.window_type
+        if window_type is OverWindow.RANGE_UNBOUNDED_PRECEDING:
+            ends = np.asarray(window_boundaries, dtype=np.int64)
+            starts = np.zeros(input_cnt, dtype=np.int64)
+        elif window_type is OverWindow.RANGE_UNBOUNDED_FOLLOWING:
+            starts = np.asarray(window_boundaries, dtype=np.int64)
+            ends = np.full(input_cnt, input_cnt, dtype=np.int64)
+        elif window_type is OverWindow.RANGE_SLIDING:
+            boundaries = np.asarray(window_boundaries, dtype=np.int64)
+            starts = boundaries[0::2]
+            ends = boundaries[1::2]
+        else:
+            rows = np.arange(input_cnt, dtype=np.int64)
+            if window_type is OverWindow.ROW_UNBOUNDED_PRECEDING:
+                starts = np.zeros(input_cnt, dtype=np.int64)
+                ends = rows + window.upper_boundary + 1
+            elif window_type is OverWindow.ROW_UNBOUNDED_FOLLOWING:
+                starts = rows + window.lower_boundary
+                ends = np.full(input_cnt, input_cnt, dtype=np.int64)
+            elif window_type is OverWindow.ROW_SLIDING:
+                starts = rows + window.lower_boundary
+                ends = rows + window.upper_boundary + 1
+            else:
+                # the unbounded windows are evaluated only once
+                return None
+            starts = np.clip(starts, 0, input_cnt)
+            ends = np.maximum(np.clip(ends, 0, input_cnt), starts)
+        return reduce_windows(input_series[input_offset], reduction, starts, ends)
+
 
 class StatefulFunctionOperation(Operation):
 
     def __init__(self, spec, keyed_state_backend):
         self.keyed_state_backend = keyed_state_backend
         super(StatefulFunctionOperation, self).__init__(spec)
+        if self.base_metric_group is not None and self.keyed_state_backend is not None:
+            self.keyed_state_backend.register_metrics(
+                self.base_metric_group.add_group("stateCache"))
 
     def finish(self):
         super().finish()
@@ -442,11 +551,16 @@ class StreamGroupWindowAggregateOperation(AbstractStreamGroupAggregateOperation)
             else:
                 window_assigner = CountTumblingWindowAssigner(self._window.window_size)
         elif self._window.window_type == flink_fn_execution_pb2.GroupWindow.SLIDING_GROUP_WINDOW:
-            raise Exception("General Python UDAF in Sliding window will be implemented in "
-                            "FLINK-21629")
+            if self._is_time_window:
+                window_assigner = SlidingWindowAssigner(
+                    self._window.window_size, self._window.window_slide, 0,
+                    self._window.is_row_time)
+            else:
+                window_assigner = CountSlidingWindowAssigner(
+                    self._window.window_size, self._window.window_slide)
         else:
-            raise Exception("General Python UDAF in Sessiong window will be implemented in "
-                            "FLINK-21630")
+            window_assigner = SessionWindowAssigner(
+                self._window.window_gap, self._window.is_row_time)
         if self._is_time_window:
             if self._window.is_row_time:
                 trigger = EventTimeTrigger()
@@ -487,17 +601,6 @@ class StreamGroupWindowAggregateOperation(AbstractStreamGroupAggregateOperation)
             for result_data in result_datas:
                 result = [NORMAL_RECORD, result_data, None]
                 results.append(result)
-            timers = self.group_agg_function.get_timers()
-            for timer in timers:
-                timer_operand_type = timer[0]  # type: TimerOperandType
-                internal_timer = timer[1]  # type: InternalTimer
-                window = internal_timer.get_namespace()
-                key = internal_timer.get_key()
-                timestamp = internal_timer.get_timestamp()
-                encoded_window = self._namespace_coder.encode_nested(window)
-                timer_data = [TRIGGER_TIMER, None,
-                              [timer_operand_type.value, key, timestamp, encoded_window]]
-                results.append(timer_data)
         else:
             timestamp = input_data[2]
             timer_data = input_data[4]
@@ -512,6 +615,17 @@ class StreamGroupWindowAggregateOperation(AbstractStreamGroupAggregateOperation)
             for result_data in result_datas:
                 result = [NORMAL_RECORD, result_data, None]
                 results.append(result)
+        timers = self.group_agg_function.get_timers()
+        for timer in timers:
+            timer_operand_type = timer[0]  # type: TimerOperandType
+            internal_timer = timer[1]  # type: InternalTimer
+            window = internal_timer.get_namespace()
+            key = internal_timer.get_key()
+            timestamp = internal_timer.get_timestamp()
+            encoded_window = self._namespace_coder.encode_nested(window)
+            timer_data = [TRIGGER_TIMER, None,
+                          [timer_operand_type.value, key, timestamp, encoded_window]]
+            results.append(timer_data)
         return results
 
     def _create_named_property_function(self):
@@ -662,6 +776,28 @@ class DataStreamStatelessFunctionOperation(Operation):
         return func, [user_defined_func]
 
 
+class AsyncFunctionOperation(DataStreamStatelessFunctionOperation):
+    """
+    Executes an async function with at most `capacity` calls in flight. The calls are kept in
+    flight across the input elements of a bundle and all of them complete when the bundle finishes.
+    """
+
+    def __init__(self, spec):
+        super(AsyncFunctionOperation, self).__init__(spec)
+        async_map_function = self.user_defined_funcs[0]
+        self.async_executor = AsyncExecutor(
+            async_map_function.capacity,
+            async_map_function.timeout,
+            async_map_function.ordered,
+            self._on_timeout)
+        self.func = partial(self.async_executor.submit, self.func)
+
+    def generate_func(self, serialized_fn):
+        func, self._on_timeout, async_map_function = \
+            operation_utils.extract_async_function(serialized_fn)
+        return func, [async_map_function]
+
+
 class ProcessFunctionOperation(DataStreamStatelessFunctionOperation):
 
     def __init__(self, spec):
@@ -671,9 +807,9 @@ class ProcessFunctionOperation(DataStreamStatelessFunctionOperation):
         super(ProcessFunctionOperation, self).__init__(spec)
 
     def generate_func(self, serialized_fn) -> tuple:
-        func, proc_func = operation_utils.extract_process_function(
-            serialized_fn, self.function_context)
-        return func, [proc_func]
+        proc_func = pickle.loads(serialized_fn.payload)
+        handler = ProcessFunctionHandler(proc_func, self.function_context)
+        return handler.process_element, [proc_func]
 
     class InternalProcessFunctionContext(ProcessFunction.Context):
         """
@@ -729,9 +865,18 @@ class KeyedProcessFunctionOperation(StatefulFunctionOperation):
         super(KeyedProcessFunctionOperation, self).__init__(spec, keyed_state_backend)
 
     def generate_func(self, serialized_fn) -> Tuple:
-        func, proc_func = operation_utils.extract_keyed_process_function(
-            serialized_fn, self.function_context, self.on_timer_ctx, self._collector,
-            self.keyed_state_backend)
+        func_type = serialized_fn.function_type
+        UserDefinedDataStreamFunction = flink_fn_execution_pb2.UserDefinedDataStreamFunction
+        func = None
+        proc_func = pickle.loads(serialized_fn.payload)
+        if func_type == UserDefinedDataStreamFunction.KEYED_PROCESS:
+            func = KeyedProcessFunctionHandler(
+                proc_func, self.function_context, self.on_timer_ctx, self._collector,
+                self.keyed_state_backend).process_element
+        elif func_type == UserDefinedDataStreamFunction.KEYED_CO_PROCESS:
+            func = KeyedTwoInputTimerRowHandler(
+                self.function_context, self.on_timer_ctx, self._collector,
+                self.keyed_state_backend, proc_func).process_element
         return func, [proc_func]
 
     def open(self):
@@ -149,6 +149,9 @@ class StateMapView(MapView, StateDataView[N], ABC):
     def get(self, key):
         return self._map_state.get(key)
 
+    def prefetch(self, keys) -> None:
+        self._map_state.prefetch(keys)
+
     def put(self, key, value) -> None:
         self._map_state.put(key, value)
 
@@ -16,6 +16,8 @@
 # limitations under the License.
 ################################################################################
 import collections
+import itertools
+import sys
 from abc import ABC, abstractmethod
 from enum import Enum
 from functools import partial
@@ -33,6 +35,10 @@ from pyflink.fn_execution.internal_state import InternalKvState, N, InternalValu
     InternalMapState
 
 
+# the number of the elements sampled when estimating the size of an internal state
+_SIZE_ESTIMATION_SAMPLES = 8
+
+
 class LRUCache(object):
     """
     A simple LRUCache implementation used to manage the internal runtime state.
@@ -83,6 +89,274 @@ class LRUCache(object):
         return iter(self._cache.values())
 
 
+class EvictionPolicy(ABC):
+    """
+    Decides which entry of a :class:`StateCache` should be evicted when the cache exceeds its
+    bounds. The policy only tracks the keys of the cache, the values and the bounds are managed
+    by the cache itself.
+    """
+
+    @abstractmethod
+    def on_insert(self, key):
+        pass
+
+    @abstractmethod
+    def on_access(self, key):
+        pass
+
+    @abstractmethod
+    def on_remove(self, key):
+        pass
+
+    @abstractmethod
+    def select_victim(self):
+        """
+        Returns the key of the entry which should be evicted next.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+    @staticmethod
+    def of(policy_name, max_entries):
+        policy_name = policy_name.upper()
+        if policy_name == "LRU":
+            return LRUEvictionPolicy()
+        elif policy_name == "W-TINYLFU":
+            return WTinyLFUEvictionPolicy(max_entries)
+        else:
+            raise Exception("Unsupported state cache eviction policy: %s" % policy_name)
+
+
+class LRUEvictionPolicy(EvictionPolicy):
+    """
+    Evicts the least recently used entry.
+    """
+
+    def __init__(self):
+        self._order = collections.OrderedDict()
+
+    def on_insert(self, key):
+        self._order.pop(key, None)
+        self._order[key] = None
+
+    def on_access(self, key):
+        self._order.move_to_end(key)
+
+    def on_remove(self, key):
+        self._order.pop(key, None)
+
+    def select_victim(self):
+        return next(iter(self._order))
+
+    def clear(self):
+        self._order.clear()
+
+
+class FrequencySketch(object):
+    """
+    A Count-Min sketch with 4-bit counters which estimates the access frequency of the keys.
+    All the counters are halved periodically so that the estimation favors the recent accesses.
+    """
+
+    _DEPTH = 4
+    _MAX_COUNT = 15
+    _SEEDS = (0x5bd1e995, 0x1b873593, 0xcc9e2d51, 0x27d4eb2f)
+
+    def __init__(self, max_entries):
+        width = 16
+        while width < max_entries:
+            width <<= 1
+        self._mask = width - 1
+        self._table = [[0] * width for _ in range(self._DEPTH)]
+        self._sample_size = 10 * width
+        self._additions = 0
+
+    def increment(self, key):
+        h = hash(key)
+        for i in range(self._DEPTH):
+            row = self._table[i]
+            index = ((h ^ self._SEEDS[i]) * self._SEEDS[i] >> 16) & self._mask
+            if row[index] < self._MAX_COUNT:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._reset()
+
+    def frequency(self, key):
+        h = hash(key)
+        return min(self._table[i][((h ^ self._SEEDS[i]) * self._SEEDS[i] >> 16) & self._mask]
+                   for i in range(self._DEPTH))
+
+    def _reset(self):
+        for row in self._table:
+            for i in range(len(row)):
+                row[i] >>= 1
+        self._additions //= 2
+
+
+class WTinyLFUEvictionPolicy(EvictionPolicy):
+    """
+    The Window TinyLFU policy. New entries enter a small LRU admission window. Entries leaving
+    the window are moved into a segmented LRU main space (probation and protected segments),
+    where they have to win against the eviction victim of the main space according to their
+    estimated access frequencies, which makes the cache resistant to scans of one-off keys.
+    """
+
+    _WINDOW_RATIO = 0.01
+    _PROTECTED_RATIO = 0.8
+
+    def __init__(self, max_entries):
+        self._max_entries = max(max_entries, 1)
+        self._sketch = FrequencySketch(self._max_entries)
+        self._window = collections.OrderedDict()
+        self._probation = collections.OrderedDict()
+        self._protected = collections.OrderedDict()
+        # the key most recently moved out of the admission window, it competes with the victim
+        # of the probation segment when an entry should be evicted
+        self._candidate = None
+
+    def on_insert(self, key):
+        self.on_remove(key)
+        self._sketch.increment(key)
+        self._window[key] = None
+        window_size = max(1, int(len(self) * self._WINDOW_RATIO))
+        while len(self._window) > window_size:
+            candidate, _ = self._window.popitem(last=False)
+            self._probation[candidate] = None
+            self._candidate = candidate
+
+    def on_access(self, key):
+        self._sketch.increment(key)
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._probation:
+            del self._probation[key]
+            self._protected[key] = None
+            protected_size = max(1, int(len(self) * self._PROTECTED_RATIO))
+            while len(self._protected) > protected_size:
+                demoted, _ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+
+    def on_remove(self, key):
+        if self._window.pop(key, self) is self and self._probation.pop(key, self) is self:
+            self._protected.pop(key, None)
+        if key == self._candidate:
+            self._candidate = None
+
+    def select_victim(self):
+        if self._probation:
+            victim = next(iter(self._probation))
+            candidate = self._candidate
+            if candidate is not None and candidate != victim:
+                if self._sketch.frequency(candidate) <= self._sketch.frequency(victim):
+                    return candidate
+            return victim
+        elif self._protected:
+            return next(iter(self._protected))
+        else:
+            return next(iter(self._window))
+
+    def clear(self):
+        self._window.clear()
+        self._probation.clear()
+        self._protected.clear()
+        self._candidate = None
+
+    def __len__(self):
+        return len(self._window) + len(self._probation) + len(self._protected)
+
+
+class StateCache(object):
+    """
+    A cache used to manage the internal runtime states, which is bounded by both the number of
+    the entries and the estimated size in bytes of the entries. Which entry is evicted when the
+    cache exceeds its bounds is decided by the given :class:`EvictionPolicy`. The statistics of
+    the cache (hits, misses, evictions and resident bytes) are collected to be reported as
+    metrics.
+    """
+
+    def __init__(self, max_entries, max_bytes, weigher, eviction_policy: EvictionPolicy):
+        self._max_entries = max_entries
+        # a non-positive max_bytes means that the cache is only bounded by the number of entries
+        self._max_bytes = max_bytes
+        self._weigher = weigher
+        self._eviction_policy = eviction_policy
+        self._cache = {}
+        self._weights = {}
+        self._on_evict = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.resident_bytes = 0
+
+    def get(self, key):
+        value = self._cache.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._eviction_policy.on_access(key)
+        return value
+
+    def put(self, key, value):
+        weight = self._weigher(value)
+        self.resident_bytes += weight - self._weights.get(key, 0)
+        self._cache[key] = value
+        self._weights[key] = weight
+        self._eviction_policy.on_insert(key)
+        while len(self._cache) > self._max_entries or \
+                (0 < self._max_bytes < self.resident_bytes):
+            victim = self._eviction_policy.select_victim()
+            self._remove(victim)
+            self.evictions += 1
+
+    def evict(self, key):
+        if key in self._cache:
+            self._remove(key)
+
+    def evict_all(self):
+        if self._on_evict is not None:
+            for item in self._cache.items():
+                self._on_evict(*item)
+        self._cache.clear()
+        self._weights.clear()
+        self._eviction_policy.clear()
+        self.resident_bytes = 0
+
+    def refresh_weights(self):
+        """
+        Re-estimates the sizes of all the entries, e.g. after the pending writes of the cached
+        states have been flushed.
+        """
+        for key, value in self._cache.items():
+            self._weights[key] = self._weigher(value)
+        self.resident_bytes = sum(self._weights.values())
+
+    def set_on_evict(self, func):
+        self._on_evict = func
+
+    def _remove(self, key):
+        value = self._cache.pop(key)
+        self.resident_bytes -= self._weights.pop(key)
+        self._eviction_policy.on_remove(key)
+        if self._on_evict is not None:
+            self._on_evict(key, value)
+
+    def __contains__(self, key):
+        return key in self._cache
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __iter__(self):
+        return iter(self._cache.values())
+
+
 class SynchronousKvRuntimeState(InternalKvState, ABC):
     """
     Base Class for partitioned State implementation.
@@ -380,6 +654,36 @@ class CachingMapStateHandler(object):
             else:
                 return cached_value
 
+    def prefetch(self, state_key, map_keys, map_key_coder, map_value_coder):
+        """
+        Fetches the given map keys into the cached map state. All the GET requests are sent
+        before waiting for any of the responses, so that the latency of the state requests is
+        paid once per batch instead of once per map key.
+        """
+        cache_token = self._get_cache_token()
+        if not cache_token:
+            # the fetched data could not be kept anywhere
+            return
+
+        cache_state_key = self._convert_to_cache_key(state_key)
+        cached_map_state = self._state_cache.get(cache_state_key, cache_token)
+        if cached_map_state is None:
+            cached_map_state = CachedMapState(self._max_cached_map_key_entries)
+            self._state_cache.put(cache_state_key, cache_token, cached_map_state)
+        elif cached_map_state.is_all_data_cached():
+            return
+
+        futures = {}
+        for map_key in map_keys:
+            if len(futures) >= self._max_cached_map_key_entries:
+                # the remaining keys would evict the keys fetched by this batch
+                break
+            if map_key not in futures and cached_map_state.get(map_key) is None:
+                futures[map_key] = self._get_raw_async(state_key, map_key, map_key_coder)
+        for map_key, future in futures.items():
+            cached_map_state.put(
+                map_key, self._parse_get_response(self._await(future), map_value_coder))
+
     def lazy_iterator(self, state_key, iterate_type, map_key_coder, map_value_coder, iterated_keys):
         cache_token = self._get_cache_token()
         if cache_token:
@@ -427,37 +731,41 @@ class CachingMapStateHandler(object):
             iterator_token,
             current_batch):
         if iterate_type == IterateType.KEYS:
-            while True:
-                for key in current_batch:
-                    if key in iterated_keys:
-                        continue
-                    yield key, key
-                if iterator_token == IteratorToken.FINISHED:
-                    break
-                current_batch, iterator_token = self._iterate_raw(
-                    state_key, iterate_type, iterator_token, map_key_coder, map_value_coder)
+            def batch_iterator(batch):
+                return ((key, key) for key in batch)
         elif iterate_type == IterateType.VALUES:
-            while True:
-                for key, value in current_batch.items():
-                    if key in iterated_keys:
-                        continue
-                    yield key, value
-                if iterator_token == IteratorToken.FINISHED:
-                    break
-                current_batch, iterator_token = self._iterate_raw(
-                    state_key, iterate_type, iterator_token, map_key_coder, map_value_coder)
+            def batch_iterator(batch):
+                return batch.items()
         elif iterate_type == IterateType.ITEMS:
+            def batch_iterator(batch):
+                return ((key, (key, value)) for key, value in batch.items())
+        else:
+            raise Exception("Unsupported iterate type: %s" % iterate_type)
+
+        next_batch_future = None
+        try:
             while True:
-                for key, value in current_batch.items():
+                if iterator_token != IteratorToken.FINISHED:
+                    # request the next batch before consuming the current one, so that the state
+                    # request is in flight while the current batch is being processed.
+                    next_batch_future = self._iterate_raw_async(
+                        state_key, iterate_type, iterator_token)
+                for key, value in batch_iterator(current_batch):
                     if key in iterated_keys:
                         continue
-                    yield key, (key, value)
-                if iterator_token == IteratorToken.FINISHED:
+                    yield key, value
+                if next_batch_future is None:
                     break
-                current_batch, iterator_token = self._iterate_raw(
-                    state_key, iterate_type, iterator_token, map_key_coder, map_value_coder)
-        else:
-            raise Exception("Unsupported iterate type: %s" % iterate_type)
+                response = self._await(next_batch_future)
+                next_batch_future = None
+                current_batch, iterator_token = self._parse_iterate_response(
+                    response, iterate_type, iterator_token, map_key_coder, map_value_coder)
+        finally:
+            if next_batch_future is not None:
+                # the iteration stopped early, e.g. the loop over the map state was broken. The
+                # in-flight batch is discarded, but whether the iterator cached at the Java side
+                # has finished with it is still tracked.
+                self._discard_iterate_response(next_batch_future, iterator_token)
 
     def extend(self, state_key, items: List[Tuple[int, Any, Any]], map_key_coder, map_value_coder):
         cache_token = self._get_cache_token()
@@ -520,7 +828,7 @@ class CachingMapStateHandler(object):
         output_stream = coder_impl.create_OutputStream()
         output_stream.write_byte(self.CHECK_EMPTY_FLAG)
         continuation_token = output_stream.get()
-        data, response_token = self._underlying.get_raw(state_key, continuation_token)
+        data = self._await(self._get_raw_async_internal(state_key, continuation_token)).get.data
         if data[0] == self.IS_EMPTY_FLAG:
             return True
         elif data[0] == self.NOT_EMPTY_FLAG:
@@ -529,12 +837,19 @@ class CachingMapStateHandler(object):
             raise Exception("Unknown response flag: " + str(data[0]))
 
     def _get_raw(self, state_key, map_key, map_key_coder, map_value_coder):
+        return self._parse_get_response(
+            self._await(self._get_raw_async(state_key, map_key, map_key_coder)),
+            map_value_coder)
+
+    def _get_raw_async(self, state_key, map_key, map_key_coder):
         output_stream = coder_impl.create_OutputStream()
         output_stream.write_byte(self.GET_FLAG)
         map_key_coder.encode_to_stream(map_key, output_stream, True)
         continuation_token = output_stream.get()
-        data, response_token = self._underlying.get_raw(state_key, continuation_token)
-        input_stream = coder_impl.create_InputStream(data)
+        return self._get_raw_async_internal(state_key, continuation_token)
+
+    def _parse_get_response(self, response, map_value_coder):
+        input_stream = coder_impl.create_InputStream(response.get.data)
         result_flag = input_stream.read_byte()
         if result_flag == self.EXIST_FLAG:
             return True, map_value_coder.decode_from_stream(input_stream, True)
@@ -546,6 +861,11 @@ class CachingMapStateHandler(object):
             raise Exception("Unknown response flag: " + str(result_flag))
 
     def _iterate_raw(self, state_key, iterate_type, iterator_token, map_key_coder, map_value_coder):
+        return self._parse_iterate_response(
+            self._await(self._iterate_raw_async(state_key, iterate_type, iterator_token)),
+            iterate_type, iterator_token, map_key_coder, map_value_coder)
+
+    def _iterate_raw_async(self, state_key, iterate_type, iterator_token):
         output_stream = coder_impl.create_OutputStream()
         output_stream.write_byte(self.ITERATE_FLAG)
         output_stream.write_byte(iterate_type.value)
@@ -556,7 +876,14 @@ class CachingMapStateHandler(object):
         else:
             output_stream.write_bigendian_int32(0)
         continuation_token = output_stream.get()
-        data, response_token = self._underlying.get_raw(state_key, continuation_token)
+        return self._get_raw_async_internal(state_key, continuation_token)
+
+    def _discard_iterate_response(self, future, iterator_token):
+        response = future.get()
+        if not response.error:
+            self._update_cached_iterators_num(iterator_token, response.get.continuation_token)
+
+    def _update_cached_iterators_num(self, iterator_token, response_token):
         if len(response_token) != 0:
             # The new iterator token is an UUID which represents a cached iterator at Java
             # side.
@@ -572,6 +899,12 @@ class CachingMapStateHandler(object):
                 # It means the cached iterator created at Java side has been removed as
                 # current iteration has finished.
                 self._dec_cached_iterators_num()
+        return new_iterator_token
+
+    def _parse_iterate_response(
+            self, response, iterate_type, iterator_token, map_key_coder, map_value_coder):
+        data, response_token = response.get.data, response.get.continuation_token
+        new_iterator_token = self._update_cached_iterators_num(iterator_token, response_token)
         input_stream = coder_impl.create_InputStream(data)
         if iterate_type == IterateType.ITEMS or iterate_type == IterateType.VALUES:
             # decode both key and value
@@ -592,6 +925,19 @@ class CachingMapStateHandler(object):
                 current_batch.append(key)
         return current_batch, new_iterator_token
 
+    def _get_raw_async_internal(self, state_key, continuation_token):
+        return self._underlying._request(
+            beam_fn_api_pb2.StateRequest(
+                state_key=state_key,
+                get=beam_fn_api_pb2.StateGetRequest(continuation_token=continuation_token)))
+
+    @staticmethod
+    def _await(future):
+        response = future.get()
+        if response.error:
+            raise RuntimeError(response.error)
+        return response
+
     def _append_raw(self, state_key, items, map_key_coder, map_value_coder):
         output_stream = coder_impl.create_OutputStream()
         output_stream.write_bigendian_int32(len(items))
@@ -705,6 +1051,15 @@ class InternalSynchronousMapRuntimeState(object):
         else:
             raise KeyError("Map key %s not found!" % str(map_key))
 
+    def prefetch(self, map_keys):
+        if self._is_empty or self._cleared:
+            return
+        self._map_state_handler.prefetch(
+            self._state_key,
+            [map_key for map_key in map_keys if map_key not in self._write_cache],
+            self._map_key_coder_impl,
+            self._map_value_coder_impl)
+
     def put(self, map_key, map_value):
         self._write_cache[map_key] = (True, map_value)
         self._is_empty = False
@@ -833,6 +1188,9 @@ class SynchronousMapRuntimeState(SynchronousKvRuntimeState, InternalMapState):
     def get(self, key):
         return self.get_internal_state().get(key)
 
+    def prefetch(self, keys):
+        self.get_internal_state().prefetch(keys)
+
     def put(self, key, value):
         self.get_internal_state().put(key, value)
 
@@ -861,6 +1219,47 @@ class SynchronousMapRuntimeState(SynchronousKvRuntimeState, InternalMapState):
         self.get_internal_state().clear()
 
 
+def estimate_internal_state_size(internal_state, cached_data=None):
+    """
+    Estimates the size in bytes of an internal runtime state, which is dominated by the pending
+    writes buffered in it and the data read from the remote side which is cached for it, i.e. the
+    contents of a bag state or the cached entries of a map state. The size of the elements is
+    extrapolated from a few samples to keep the estimation cheap.
+    """
+    if isinstance(internal_state, SynchronousBagRuntimeState):
+        size = _estimate_elements_size(internal_state._added_elements)
+        # the contents of a bag state which is too large to be returned in one response are
+        # read lazily and are not cached entirely
+        if isinstance(cached_data, list):
+            size += _estimate_elements_size(cached_data)
+    elif isinstance(internal_state, InternalSynchronousMapRuntimeState):
+        size = _estimate_map_entries_size(internal_state._write_cache)
+        if isinstance(cached_data, CachedMapState):
+            size += _estimate_map_entries_size(cached_data._cache)
+    else:
+        return sys.getsizeof(internal_state)
+    return sys.getsizeof(internal_state) + size
+
+
+def _estimate_elements_size(elements):
+    samples = [sys.getsizeof(element)
+               for element in itertools.islice(elements, _SIZE_ESTIMATION_SAMPLES)]
+    size = sys.getsizeof(elements)
+    if samples:
+        size += sum(samples) * len(elements) // len(samples)
+    return size
+
+
+def _estimate_map_entries_size(entries):
+    samples = [sys.getsizeof(map_key) + sys.getsizeof(map_value)
+               for map_key, (_, map_value) in
+               itertools.islice(entries.items(), _SIZE_ESTIMATION_SAMPLES)]
+    size = sys.getsizeof(entries)
+    if samples:
+        size += sum(samples) * len(entries) // len(samples)
+    return size
+
+
 class RemoteKeyedStateBackend(object):
     """
     A keyed state backend provides methods for managing keyed state.
@@ -872,7 +1271,9 @@ class RemoteKeyedStateBackend(object):
                  namespace_coder,
                  state_cache_size,
                  map_state_read_cache_size,
-                 map_state_write_cache_size):
+                 map_state_write_cache_size,
+                 state_cache_max_bytes=0,
+                 state_cache_eviction_policy="LRU"):
         self._state_handler = state_handler
         self._map_state_handler = CachingMapStateHandler(
             state_handler, map_state_read_cache_size)
@@ -885,9 +1286,13 @@ class RemoteKeyedStateBackend(object):
         self._state_cache_size = state_cache_size
         self._map_state_write_cache_size = map_state_write_cache_size
         self._all_states = {}
-        self._internal_state_cache = LRUCache(self._state_cache_size, None)
+        self._internal_state_cache = StateCache(
+            self._state_cache_size,
+            state_cache_max_bytes,
+            self._estimate_internal_state_size,
+            EvictionPolicy.of(state_cache_eviction_policy, self._state_cache_size))
         self._internal_state_cache.set_on_evict(
-            lambda key, value: self.commit_internal_state(value))
+            lambda key, value: self._evict_internal_state(value))
         self._current_key = None
         self._encoded_current_key = None
         self._clear_iterator_mark = beam_fn_api_pb2.StateKey(
@@ -896,6 +1301,13 @@ class RemoteKeyedStateBackend(object):
                 side_input_id="clear_iterators",
                 key=self._encoded_current_key))
 
+    def register_metrics(self, metric_group):
+        cache = self._internal_state_cache
+        metric_group.gauge("hits", lambda: cache.hits)
+        metric_group.gauge("misses", lambda: cache.misses)
+        metric_group.gauge("evictions", lambda: cache.evictions)
+        metric_group.gauge("residentBytes", lambda: cache.resident_bytes)
+
     def get_list_state(self, name, element_coder):
         return self._wrap_internal_bag_state(
             name, element_coder, SynchronousListRuntimeState, SynchronousListRuntimeState)
@@ -978,17 +1390,22 @@ class RemoteKeyedStateBackend(object):
         if isinstance(state_spec, userstate.BagStateSpec):
             bag_state = SynchronousBagRuntimeState(
                 self._state_handler,
-                state_key=beam_fn_api_pb2.StateKey(
-                    bag_user_state=beam_fn_api_pb2.StateKey.BagUserState(
-                        transform_id="",
-                        window=encoded_namespace,
-                        user_state_id=state_spec.name,
-                        key=self._encoded_current_key)),
+                state_key=self._create_bag_state_key(
+                    state_spec.name, self._encoded_current_key, encoded_namespace),
                 value_coder=state_spec.coder)
             return bag_state
         else:
             raise NotImplementedError(state_spec)
 
+    @staticmethod
+    def _create_bag_state_key(name, encoded_key, encoded_namespace):
+        return beam_fn_api_pb2.StateKey(
+            bag_user_state=beam_fn_api_pb2.StateKey.BagUserState(
+                transform_id="",
+                window=encoded_namespace,
+                user_state_id=name,
+                key=encoded_key))
+
     def _create_internal_map_state(self, name, encoded_namespace, map_key_coder, map_value_coder):
         # Currently the `beam_fn_api.proto` does not support MapState, so we use the
         # the `MultimapSideInput` message to mark the state as a MapState for now.
@@ -1034,12 +1451,44 @@ class RemoteKeyedStateBackend(object):
     def get_current_key(self):
         return self._current_key
 
+    def iterate_keys_with_prefetch(self, name, value_coder, keys):
+        """
+        Iterates the given keys. The values of the bag based state (e.g. the value state) with the
+        given name and the default namespace under the keys are requested from the remote side
+        batch by batch ahead of the iteration. The requests of a batch are sent without waiting
+        for the responses of the previous ones and the results are put into the state cache, so
+        that reading the state of the keys doesn't need a blocking round trip per key.
+        """
+        cache_token = self._get_cache_token()
+        if not cache_token or self._state_cache_size <= 0:
+            # the prefetched values could not be kept anywhere
+            yield from keys
+            return
+
+        batch = []
+        for key in keys:
+            batch.append(key)
+            if len(batch) >= self._state_cache_size:
+                self._prefetch_bag_states(name, value_coder, batch, cache_token)
+                yield from batch
+                batch = []
+        if batch:
+            self._prefetch_bag_states(name, value_coder, batch, cache_token)
+            yield from batch
+
     def commit(self):
+        # send all the commit requests of the bag based states first and then wait for the
+        # responses, instead of waiting for the response of each state one by one
+        to_await = []
         for internal_state in self._internal_state_cache:
-            self.commit_internal_state(internal_state)
+            to_await.extend(self._commit_internal_state_async(internal_state))
         for name, state in self._all_states.items():
             if (name, self._encoded_current_key) not in self._internal_state_cache:
-                self.commit_internal_state(state._internal_state)
+                to_await.extend(self._commit_internal_state_async(state._internal_state))
+        for future in to_await:
+            future.get()
+        # the pending writes of the cached states have been flushed into the cached data
+        self._internal_state_cache.refresh_weights()
 
     def clear_cached_iterators(self):
         if self._map_state_handler.get_cached_iterators_num() > 0:
@@ -1054,3 +1503,80 @@ class RemoteKeyedStateBackend(object):
         if isinstance(internal_state, SynchronousBagRuntimeState):
             internal_state._cleared = False
             internal_state._added_elements = []
+
+    def _evict_internal_state(self, internal_state):
+        self.commit_internal_state(internal_state)
+        # the cached data of the state is counted in the size of the state, it's evicted together
+        # with the state to keep the cache within its bounds
+        cache_token = self._get_cache_token()
+        if cache_token and isinstance(
+                internal_state, (SynchronousBagRuntimeState, InternalSynchronousMapRuntimeState)):
+            self._state_handler._state_cache.evict(
+                internal_state._state_key.SerializeToString(), cache_token)
+
+    def _estimate_internal_state_size(self, internal_state):
+        cached_data = None
+        cache_token = self._get_cache_token()
+        if cache_token and isinstance(
+                internal_state, (SynchronousBagRuntimeState, InternalSynchronousMapRuntimeState)):
+            cached_data = self._state_handler._state_cache.get(
+                internal_state._state_key.SerializeToString(), cache_token)
+        return estimate_internal_state_size(internal_state, cached_data)
+
+    def _commit_internal_state_async(self, internal_state):
+        """
+        Sends the commit requests of the given internal state and returns the futures of them.
+        """
+        if not isinstance(internal_state, SynchronousBagRuntimeState):
+            self.commit_internal_state(internal_state)
+            return []
+        futures = []
+        if internal_state._cleared:
+            futures.append(self._state_handler.clear(internal_state._state_key))
+        if internal_state._added_elements:
+            futures.append(self._state_handler.extend(
+                internal_state._state_key,
+                internal_state._value_coder.get_impl(),
+                internal_state._added_elements))
+        # reset the status of the internal state to reuse the object cross bundle
+        internal_state._cleared = False
+        internal_state._added_elements = []
+        return futures
+
+    def _prefetch_bag_states(self, name, value_coder, keys, cache_token):
+        state_cache = self._state_handler._state_cache
+        value_coder_impl = value_coder.get_impl()
+        encoded_namespace = self._encode_namespace(None)
+        futures = []
+        for key in keys:
+            state_key = self._create_bag_state_key(
+                name, self._key_coder_impl.encode_nested(list(key)), encoded_namespace)
+            cache_state_key = state_key.SerializeToString()
+            if state_cache.get(cache_state_key, cache_token) is None:
+                # pipeline the requests, the responses are collected after all the requests of
+                # the batch have been sent
+                futures.append((cache_state_key, self._state_handler._underlying._request(
+                    beam_fn_api_pb2.StateRequest(
+                        state_key=state_key, get=beam_fn_api_pb2.StateGetRequest()))))
+        for cache_state_key, future in futures:
+            response = future.get()
+            if response.error:
+                raise RuntimeError(response.error)
+            if response.get.continuation_token:
+                # the state is too large to be returned in one response, it will be read lazily
+                continue
+            input_stream = coder_impl.create_InputStream(response.get.data)
+            values = []
+            while input_stream.size() > 0:
+                values.append(value_coder_impl.decode_from_stream(input_stream, True))
+            state_cache.put(cache_state_key, cache_token, values)
+
+    def _get_cache_token(self):
+        state_cache = self._state_handler._state_cache
+        if not state_cache.is_cache_enabled():
+            return None
+        context = self._state_handler._context
+        if context.user_state_cache_token:
+            return context.user_state_cache_token
+        else:
+            return context.bundle_cache_token
@@ -0,0 +1,111 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import asyncio
+import threading
+import time
+import unittest
+
+from pyflink.fn_execution.utils.async_executor import AsyncExecutor
+
+
+class AsyncExecutorTests(unittest.TestCase):
+
+    def test_ordered_coroutine_function(self):
+        async def func(i):
+            await asyncio.sleep(0.01 * (5 - i))
+            return i * 2
+
+        executor = AsyncExecutor(3)
+        self.assertEqual([0, 2, 4, 6, 8], self._process(executor, func, range(5)))
+        executor.close()
+
+    def test_ordered_blocking_function(self):
+        def func(i):
+            time.sleep(0.01 * (5 - i))
+            return i * 2
+
+        executor = AsyncExecutor(3)
+        self.assertEqual([0, 2, 4, 6, 8], self._process(executor, func, range(5)))
+        executor.close()
+
+    def test_unordered(self):
+        async def func(i):
+            await asyncio.sleep(0.05 if i == 0 else 0)
+            return i
+
+        executor = AsyncExecutor(4, ordered=False)
+        results = self._process(executor, func, range(4))
+        self.assertEqual([0, 1, 2, 3], sorted(results))
+        self.assertEqual(0, results[-1])
+
+    def test_capacity(self):
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def func(i):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[0], in_flight[1])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return i
+
+        executor = AsyncExecutor(2)
+        self.assertEqual(list(range(10)), self._process(executor, func, range(10)))
+        self.assertLessEqual(in_flight[1], 2)
+        executor.close()
+
+    def test_timeout(self):
+        async def func(i):
+            await asyncio.sleep(10 if i == 1 else 0)
+            return i
+
+        executor = AsyncExecutor(2, timeout=0.05, on_timeout=lambda i: -1)
+        self.assertEqual([0, -1, 2], self._process(executor, func, range(3)))
+        executor = AsyncExecutor(2, timeout=0.05)
+        with self.assertRaises(TimeoutError):
+            self._process(executor, func, range(3))
+
+    def test_calls_in_flight_across_inputs(self):
+        event = threading.Event()
+
+        def func(i):
+            event.wait()
+            return i
+
+        executor = AsyncExecutor(4)
+        self.assertEqual([], list(executor.process(func, range(2))))
+        self.assertEqual([], list(executor.process(func, range(2, 4))))
+        event.set()
+        self.assertEqual([0, 1, 2, 3], list(executor.flush()))
+        executor.close()
+
+    @staticmethod
+    def _process(executor, func, inputs):
+        return list(executor.process(func, inputs)) + list(executor.flush())
+
+
+if __name__ == '__main__':
+    try:
+        import xmlrunner
+
+        testRunner = xmlrunner.XMLTestRunner(output='target/test-reports')
+    except ImportError:
+        testRunner = None
+    unittest.main(testRunner=testRunner, verbosity=2)
@@ -0,0 +1,119 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import os
+import unittest
+from unittest import mock
+
+from apache_beam.coders.coders import WindowedValueCoder
+from apache_beam.portability.api import beam_runner_api_pb2
+
+from pyflink.fn_execution import flink_fn_execution_pb2, operations
+from pyflink.fn_execution.beam import beam_operations
+from pyflink.fn_execution.beam.beam_coders import BeamFlattenRowCoder, \
+    PassThroughLengthPrefixCoder
+from pyflink.fn_execution.coders import BigIntCoder, FlattenRowCoder
+
+
+class FakeOperation(object):
+    """
+    Replaces the created Beam operation, which keeps the arguments it's created with.
+    """
+
+    def __init__(self, *args):
+        self.args = args
+
+
+def create_operation(factory, udf_proto, internal_operation_cls):
+    return beam_operations._create_user_defined_function_operation(
+        factory, beam_runner_api_pb2.PTransform(unique_name="keyed_process"), {},
+        udf_proto, FakeOperation, internal_operation_cls)
+
+
+class KeyedStateBackendOptionsTests(unittest.TestCase):
+    """
+    Tests that the job options, which are passed to the Python worker as environment variables,
+    reach the keyed state backend of the keyed DataStream operators.
+    """
+
+    def create_keyed_state_backend(self):
+        key_type_info = flink_fn_execution_pb2.TypeInfo(
+            type_name=flink_fn_execution_pb2.TypeInfo.ROW,
+            row_type_info=flink_fn_execution_pb2.TypeInfo.RowTypeInfo(fields=[
+                flink_fn_execution_pb2.TypeInfo.RowTypeInfo.Field(
+                    field_name="f0",
+                    field_type=flink_fn_execution_pb2.TypeInfo(
+                        type_name=flink_fn_execution_pb2.TypeInfo.LONG))]))
+        udf_proto = flink_fn_execution_pb2.UserDefinedDataStreamFunction(
+            key_type_info=key_type_info)
+        factory = mock.MagicMock()
+        factory.get_output_coders.return_value = {}
+        operation = create_operation(
+            factory, udf_proto, operations.KeyedProcessFunctionOperation)
+        return operation.args[-1]
+
+    def test_configured_state_cache_size(self):
+        with mock.patch.dict(os.environ, {beam_operations.STATE_CACHE_SIZE: "42",
+                                          beam_operations.STATE_CACHE_MAX_BYTES: "4096"}):
+            keyed_state_backend = self.create_keyed_state_backend()
+        self.assertEqual(42, keyed_state_backend._state_cache_size)
+        self.assertEqual(42, keyed_state_backend._internal_state_cache._max_entries)
+        self.assertEqual(4096, keyed_state_backend._internal_state_cache._max_bytes)
+
+    def test_default_state_cache_size(self):
+        with mock.patch.dict(os.environ):
+            os.environ.pop(beam_operations.STATE_CACHE_SIZE, None)
+            os.environ.pop(beam_operations.STATE_CACHE_MAX_BYTES, None)
+            keyed_state_backend = self.create_keyed_state_backend()
+        # the same as the default value of PythonOptions.STATE_CACHE_SIZE
+        self.assertEqual(1000, keyed_state_backend._state_cache_size)
+        self.assertEqual(1000, keyed_state_backend._internal_state_cache._max_entries)
+        self.assertEqual(0, keyed_state_backend._internal_state_cache._max_bytes)
+
+
+class SharedMemoryPathsTests(unittest.TestCase):
+
+    def test_shared_memory_paths(self):
+        def windowed_coder(shared_memory_path):
+            return WindowedValueCoder(PassThroughLengthPrefixCoder(BeamFlattenRowCoder(
+                FlattenRowCoder([BigIntCoder()]), shared_memory_path=shared_memory_path)))
+
+        factory = mock.MagicMock()
+        factory.get_input_coders.return_value = {'input': windowed_coder('/input.shm')}
+        factory.get_output_coders.return_value = {'output': windowed_coder('/output.shm')}
+        operation = create_operation(
+            factory, flink_fn_execution_pb2.UserDefinedFunctions(),
+            operations.ScalarFunctionOperation)
+        # the files are unmapped when the operation is torn down
+        self.assertEqual(['/input.shm', '/output.shm'], operation.shared_memory_paths)
+
+        factory.get_input_coders.return_value = {'input': windowed_coder('')}
+        factory.get_output_coders.return_value = {'output': windowed_coder('')}
+        operation = create_operation(
+            factory, flink_fn_execution_pb2.UserDefinedFunctions(),
+            operations.ScalarFunctionOperation)
+        self.assertEqual([], operation.shared_memory_paths)
+
+
+if __name__ == '__main__':
+    try:
+        import xmlrunner
+
+        testRunner = xmlrunner.XMLTestRunner(output='target/test-reports')
+    except ImportError:
+        testRunner = None
+    unittest.main(testRunner=testRunner, verbosity=2)
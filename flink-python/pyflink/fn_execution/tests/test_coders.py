@@ -19,13 +19,18 @@
 """Tests common to all coder implementations."""
 import decimal
 import logging
+import os
+import sys
+import tempfile
 import unittest
+from unittest import mock
 
 from pyflink.fn_execution.coders import BigIntCoder, TinyIntCoder, BooleanCoder, \
     SmallIntCoder, IntCoder, FloatCoder, DoubleCoder, BinaryCoder, CharCoder, DateCoder, \
     TimeCoder, TimestampCoder, BasicArrayCoder, MapCoder, DecimalCoder, FlattenRowCoder, RowCoder, \
     LocalZonedTimestampCoder, BigDecimalCoder, TupleCoder, PrimitiveArrayCoder, TimeWindowCoder, \
-    CountWindowCoder
+    CountWindowCoder, PickledBytesCoder
+from pyflink.fn_execution.utils import block_utils, pickle_utils, shared_memory_utils
 from pyflink.fn_execution.window import TimeWindow, CountWindow
 from pyflink.testing.test_case_utils import PyFlinkTestCase
 
@@ -36,6 +41,13 @@ try:
 except ImportError:
     have_cython = False
 
+try:
+    import lz4  # noqa # pylint: disable=unused-import
+
+    have_lz4 = True
+except ImportError:
+    have_lz4 = False
+
 
 @unittest.skipIf(have_cython,
                  "Found cython implementation, we don't need to test non-compiled implementation")
@@ -188,6 +200,114 @@ class CodersTest(PyFlinkTestCase):
         coder = CountWindowCoder()
         self.check_coder(coder, CountWindow(100))
 
+    def test_pickled_bytes_coder(self):
+        coder = PickledBytesCoder()
+        self.check_coder(coder, {'a': [1, 2]}, "hello", None)
+
+    @unittest.skipIf(sys.version_info < (3, 8), "Out-of-band buffers require Python 3.8+.")
+    def test_pickled_bytes_coder_with_out_of_band_buffers(self):
+        import numpy as np
+        with mock.patch.dict(
+                os.environ, {pickle_utils.PYTHON_PICKLE_OUT_OF_BAND_ENABLED: "true"}):
+            coder_impl = PickledBytesCoder().get_impl()
+        for v in ({'a': [1, 2]}, "hello", None):
+            self.assertEqual(v, coder_impl.decode(coder_impl.encode(v)))
+        value = {'small': np.arange(10), 'large': np.arange(10000, dtype=np.float64)}
+        encoded = coder_impl.encode(value)
+        # the value pickled in band can still be decoded
+        self.assertEqual([1, 2], coder_impl.decode(PickledBytesCoder().get_impl().encode([1, 2])))
+        result = coder_impl.decode(encoded)
+        np.testing.assert_array_equal(value['small'], result['small'])
+        np.testing.assert_array_equal(value['large'], result['large'])
+        self.assertTrue(result['large'].flags.writeable)
+
+    @unittest.skipUnless(have_lz4, "The Python package lz4 is not installed.")
+    def test_compressed_coder(self):
+        from pyflink.fn_execution.flink_fn_execution_pb2 import CoderParam
+        flatten_row_coder = FlattenRowCoder([BigIntCoder(), CharCoder()]).get_impl()
+        rows = [[i, "hello world" * 10] for i in range(10000)]
+        raw_size = len(b''.join(flatten_row_coder.encode(row) for row in rows))
+        encoded_size = self._check_block_coder(flatten_row_coder, rows, CoderParam.LZ4, '')
+        # the rows are compressed in multiple blocks
+        self.assertGreater(raw_size, block_utils.BLOCK_SIZE)
+        self.assertLess(encoded_size, raw_size / 5)
+
+    @unittest.skipUnless(have_lz4, "The Python package lz4 is not installed.")
+    def test_compressed_block_format(self):
+        from pyflink.fn_execution.utils import compression_utils
+        # the same block is decompressed in BeamPythonFunctionRunnerTest.java
+        block = bytes([23, 0, 0, 0, 55, 0, 0, 0, 223, 5, 102, 108, 105, 110, 107, 48, 112, 121,
+                       116, 104, 111, 110, 6, 0, 18, 80, 121, 116, 104, 111, 110])
+        data = b'\x05flink' + b'\x30' + b'python' * 8
+        self.assertEqual(data, compression_utils.decompress(block))
+        self.assertEqual(data, compression_utils.decompress(compression_utils.compress(data)))
+
+    def test_shared_memory_coder(self):
+        from pyflink.fn_execution.flink_fn_execution_pb2 import CoderParam
+        flatten_row_coder = FlattenRowCoder([BigIntCoder(), CharCoder()]).get_impl()
+        rows = [[i, "hello world" * 10] for i in range(10000)]
+        raw_size = len(b''.join(flatten_row_coder.encode(row) for row in rows))
+        with tempfile.NamedTemporaryFile() as f:
+            # the file is created by the Java operator with the initial write position
+            f.write(shared_memory_utils.HEADER_LENGTH.to_bytes(8, 'little'))
+            f.truncate(raw_size // 2)
+            f.flush()
+            encoded_size = self._check_block_coder(
+                flatten_row_coder, rows, CoderParam.NONE, f.name)
+        # only the blocks which don't fit into the shared memory are sent inline
+        self.assertGreater(encoded_size, raw_size // 2 - block_utils.BLOCK_SIZE)
+        self.assertLess(encoded_size, raw_size // 2 + block_utils.BLOCK_SIZE)
+
+    def _check_block_coder(self, value_coder, rows, compression, shared_memory_path):
+        from apache_beam.coders.coder_impl import create_InputStream, create_OutputStream
+        from pyflink.fn_execution.beam.beam_coder_impl_slow import BlockCoderImpl
+        coder_impl = BlockCoderImpl(value_coder, compression, shared_memory_path)
+        out_stream = create_OutputStream()
+        for row in rows:
+            coder_impl.encode_to_stream(row, out_stream, True)
+        coder_impl.flush(out_stream)
+        result = coder_impl.decode_from_stream(create_InputStream(out_stream.get()), True)
+        self.assertEqual(rows, list(result))
+        return out_stream.size()
+
+
+class SharedMemoryTests(unittest.TestCase):
+
+    def setUp(self):
+        # the file is created by the Java operator with the initial write position
+        self.file = tempfile.NamedTemporaryFile()
+        self.file.write(shared_memory_utils.HEADER_LENGTH.to_bytes(8, 'little'))
+        self.file.truncate(shared_memory_utils.HEADER_LENGTH + 10)
+        self.file.flush()
+
+    def tearDown(self):
+        shared_memory_utils.close_shared_memory(self.file.name)
+        self.file.close()
+
+    def test_write_and_read_block(self):
+        shared_memory = shared_memory_utils.open_shared_memory(self.file.name)
+        # the same elements are written by PythonSharedMemoryTest.java
+        element = shared_memory.write_block(b'hello')
+        self.assertEqual(bytes([1, 8, 0, 0, 0, 5, 0, 0, 0]), element)
+        self.assertEqual(b'hello', bytes(shared_memory.read_block(element)))
+        # the block which doesn't fit into the remaining space is sent inline
+        element = shared_memory.write_block(b'world!')
+        self.assertEqual(b'\x00world!', element)
+        self.assertEqual(b'world!', bytes(shared_memory.read_block(element)))
+        with open(self.file.name, 'rb') as f:
+            self.assertEqual((13).to_bytes(8, 'little') + b'hello', f.read(13))
+
+    def test_open_and_close(self):
+        shared_memory = shared_memory_utils.open_shared_memory(self.file.name)
+        self.assertIs(shared_memory, shared_memory_utils.open_shared_memory(self.file.name))
+        shared_memory_utils.close_shared_memory(self.file.name)
+        with self.assertRaises(ValueError):
+            shared_memory.view(0, 8)
+        # the file is mapped again if it's opened after being closed
+        self.assertIsNot(shared_memory, shared_memory_utils.open_shared_memory(self.file.name))
+        shared_memory_utils.close_shared_memory(self.file.name)
+        shared_memory_utils.close_shared_memory(self.file.name)
+
 
 if __name__ == '__main__':
     logging.getLogger().setLevel(logging.INFO)
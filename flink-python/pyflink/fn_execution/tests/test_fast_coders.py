@@ -18,7 +18,11 @@
 
 """Tests common to all coder implementations."""
 import logging
+import os
+import sys
+import tempfile
 import unittest
+from unittest import mock
 
 from pyflink.fn_execution.window import TimeWindow, CountWindow
 from pyflink.testing.test_case_utils import PyFlinkTestCase
@@ -31,6 +35,13 @@ try:
 except ImportError:
     have_cython = False
 
+try:
+    import lz4  # noqa # pylint: disable=unused-import
+
+    have_lz4 = True
+except ImportError:
+    have_lz4 = False
+
 
 @unittest.skipUnless(have_cython, "Uncompiled Cython Coder")
 class CodersTest(PyFlinkTestCase):
@@ -243,6 +254,127 @@ class CodersTest(PyFlinkTestCase):
         window = CountWindow(100)
         self.assertEqual(fast_coder.encode_nested(window), slow_coder.encode_nested(window))
 
+    @unittest.skipIf(sys.version_info < (3, 8), "Out-of-band buffers require Python 3.8+.")
+    def test_cython_pickled_bytes_coder_with_out_of_band_buffers(self):
+        import numpy as np
+        from apache_beam.coders.coder_impl import create_InputStream, create_OutputStream
+        from pyflink.fn_execution.beam.beam_stream import BeamInputStream, BeamOutputStream
+        from pyflink.fn_execution.utils import pickle_utils
+
+        with mock.patch.dict(
+                os.environ, {pickle_utils.PYTHON_PICKLE_OUT_OF_BAND_ENABLED: "true"}):
+            py_flatten_row_coder = coder_impl.FlattenRowCoderImpl(
+                [coder_impl.PickledBytesCoderImpl(), coder_impl.PickledBytesCoderImpl()])
+            cy_flatten_row_coder = coder_impl_fast.FlattenRowCoderImpl(
+                [coder_impl_fast.PickledBytesCoderImpl(), coder_impl_fast.PickledBytesCoderImpl()])
+        data = [{'small': np.arange(10), 'large': np.arange(10000, dtype=np.float64)}, "hello"]
+
+        def check_result(result):
+            np.testing.assert_array_equal(data[0]['small'], result[0]['small'])
+            np.testing.assert_array_equal(data[0]['large'], result[0]['large'])
+            self.assertTrue(result[0]['large'].flags.writeable)
+            self.assertEqual(data[1], result[1])
+
+        internal = py_flatten_row_coder.encode(data)
+        beam_input_stream = create_InputStream(internal)
+        input_stream = BeamInputStream(beam_input_stream, beam_input_stream.size())
+        value = list(cy_flatten_row_coder.decode_from_stream(input_stream))
+        check_result(value)
+
+        beam_output_stream = create_OutputStream()
+        output_stream = BeamOutputStream(beam_output_stream)
+        cy_flatten_row_coder.encode_to_stream(value, output_stream)
+        output_stream.flush()
+        result = list(py_flatten_row_coder.decode_from_stream(create_InputStream(
+            beam_output_stream.get()), False))
+        self.assertEqual(1, len(result))
+        check_result(result[0])
+
+    @unittest.skipUnless(have_lz4, "The Python package lz4 is not installed.")
+    def test_cython_compressed_flatten_row_coder(self):
+        from pyflink.fn_execution.flink_fn_execution_pb2 import CoderParam
+        self._check_cython_block_coder(CoderParam.LZ4, '')
+
+    def test_cython_shared_memory_flatten_row_coder(self):
+        from pyflink.fn_execution.flink_fn_execution_pb2 import CoderParam
+        from pyflink.fn_execution.utils import shared_memory_utils
+        with tempfile.NamedTemporaryFile() as f:
+            header = shared_memory_utils.HEADER_LENGTH.to_bytes(8, 'little')
+            f.write(header)
+            f.truncate(4 * 1024 * 1024)
+            f.flush()
+
+            def reset():
+                # the Java operator resets the write position at the start of each bundle
+                f.seek(0)
+                f.write(header)
+                f.flush()
+            self._check_cython_block_coder(CoderParam.NONE, f.name, reset)
+
+    def test_cython_output_stream_flush_size(self):
+        from apache_beam.coders.coder_impl import create_InputStream
+        from apache_beam.runners.worker.data_plane import SizeBasedBufferingClosableOutputStream
+        from pyflink.fn_execution.beam.beam_stream import BeamOutputStream
+        from pyflink.fn_execution.utils import output_utils
+
+        with mock.patch.dict(os.environ, {output_utils.PYTHON_OUTPUT_FLUSH_SIZE: "1048576",
+                                          output_utils.PYTHON_WORKER_MEMORY_LIMIT: "2097152"}):
+            flush_size = output_utils.get_output_flush_size()
+        self.assertEqual(2097152 // output_utils.MANAGED_MEMORY_FRACTION, flush_size)
+
+        py_flatten_row_coder = coder_impl.FlattenRowCoderImpl(
+            [coder_impl.BigIntCoderImpl(), coder_impl.CharCoderImpl()])
+        cy_flatten_row_coder = coder_impl_fast.FlattenRowCoderImpl(
+            [coder_impl_fast.BigIntCoderImpl(), coder_impl_fast.CharCoderImpl()])
+        rows = [[i, "hello world" * 10] for i in range(10000)] + [[-1, "a" * 1024 * 1024]]
+        flushed = []
+        beam_output_stream = SizeBasedBufferingClosableOutputStream(
+            flush_callback=flushed.append)
+        output_stream = BeamOutputStream(beam_output_stream, None, flush_size)
+        for row in rows:
+            cy_flatten_row_coder.encode_to_stream(row, output_stream)
+        output_stream.flush()
+        flushed.append(beam_output_stream.get())
+        self.assertGreater(len(flushed), 2)
+        # only the large row exceeds the flush size
+        self.assertEqual(1, len([data for data in flushed if len(data) > 2 * flush_size]))
+        result = py_flatten_row_coder.decode_from_stream(
+            create_InputStream(b''.join(flushed)), False)
+        self.assertEqual(rows, list(result))
+
+    def _check_cython_block_coder(self, compression, shared_memory_path, reset=None):
+        from apache_beam.coders.coder_impl import create_InputStream, create_OutputStream
+        from pyflink.fn_execution.beam.beam_stream import BeamInputStream, BeamOutputStream
+        from pyflink.fn_execution.utils.block_utils import BlockCodec
+        py_coder = coder_impl.BlockCoderImpl(
+            coder_impl.FlattenRowCoderImpl(
+                [coder_impl.BigIntCoderImpl(), coder_impl.CharCoderImpl()]),
+            compression, shared_memory_path)
+        cy_flatten_row_coder = coder_impl_fast.FlattenRowCoderImpl(
+            [coder_impl_fast.BigIntCoderImpl(), coder_impl_fast.CharCoderImpl()])
+        rows = [[i, "hello world" * 10] for i in range(10000)]
+
+        beam_input_stream = create_OutputStream()
+        for row in rows:
+            py_coder.encode_to_stream(row, beam_input_stream, True)
+        py_coder.flush(beam_input_stream)
+        block_codec = BlockCodec(compression, shared_memory_path)
+        data = block_codec.decode(create_InputStream(beam_input_stream.get()))
+        input_stream = BeamInputStream(data, len(data))
+        # the decoded row is reused by the coder
+        values = [list(cy_flatten_row_coder.decode_from_stream(input_stream)) for _ in rows]
+        self.assertEqual(rows, values)
+
+        if reset is not None:
+            reset()
+        beam_output_stream = create_OutputStream()
+        output_stream = BeamOutputStream(beam_output_stream, block_codec)
+        for value in values:
+            cy_flatten_row_coder.encode_to_stream(value, output_stream)
+        output_stream.flush()
+        self.assertEqual(beam_input_stream.size(), beam_output_stream.size())
+        result = py_coder.decode_from_stream(create_InputStream(beam_output_stream.get()), True)
+        self.assertEqual(rows, list(result))
 
 if __name__ == '__main__':
     logging.getLogger().setLevel(logging.INFO)
@@ -0,0 +1,144 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+"""Tests of the Cython implementations of the DataStream process functions."""
+import unittest
+
+from pyflink.common import Row
+from pyflink.datastream.functions import ProcessFunction, KeyedProcessFunction, \
+    KeyedCoProcessFunction
+from pyflink.fn_execution import datastream_slow
+from pyflink.fn_execution.operations import ProcessFunctionOperation, \
+    KeyedProcessFunctionOperation
+from pyflink.testing.test_case_utils import PyFlinkTestCase
+
+try:
+    from pyflink.fn_execution import datastream_fast
+
+    have_cython = True
+except ImportError:
+    have_cython = False
+
+
+class MyProcessFunction(ProcessFunction):
+
+    def process_element(self, value, ctx):
+        yield value, ctx.timestamp(), ctx.timer_service().current_watermark()
+
+
+class MyKeyedProcessFunction(KeyedProcessFunction):
+
+    def process_element(self, value, ctx):
+        ctx.timer_service().register_event_time_timer(ctx.timestamp() + 10)
+        yield ctx.get_current_key(), value, ctx.timestamp()
+
+    def on_timer(self, timestamp, ctx):
+        ctx.timer_service().delete_processing_time_timer(timestamp)
+        yield ctx.get_current_key(), timestamp, ctx.time_domain()
+
+
+class MyKeyedCoProcessFunction(KeyedCoProcessFunction):
+
+    def process_element1(self, value, ctx):
+        ctx.timer_service().register_processing_time_timer(ctx.timestamp() + 10)
+        yield 'left', value, ctx.timestamp()
+
+    def process_element2(self, value, ctx):
+        yield 'right', value, ctx.timestamp()
+
+    def on_timer(self, timestamp, ctx):
+        yield ctx.get_current_key(), timestamp, ctx.time_domain()
+
+
+class KeyedStateBackend(object):
+
+    def __init__(self):
+        self._current_key = None
+
+    def set_current_key(self, key):
+        self._current_key = key
+
+    def get_current_key(self):
+        return self._current_key
+
+
+@unittest.skipIf(not have_cython, "Cython is not available")
+class ProcessFunctionsFastTests(PyFlinkTestCase):
+
+    def test_process_function(self):
+        inputs = [[i, i - 1, 'a' * i] for i in range(5)]
+        self.assertEqual(
+            self._process(datastream_slow, inputs),
+            self._process(datastream_fast, inputs))
+
+    def test_keyed_process_function(self):
+        inputs = [[None, 5, 1, None, Row('key1', 'a')],
+                  [None, 6, 2, None, Row('key2', 'b')],
+                  [0, 15, 16, Row('key1'), None],
+                  [1, 20, 16, Row('key2'), None]]
+        self.assertEqual(
+            self._keyed_process(datastream_slow, inputs),
+            self._keyed_process(datastream_fast, inputs))
+
+    def test_keyed_co_process_function(self):
+        inputs = [[0, [True, Row('key1', 'a'), None], 5, 1, None],
+                  [0, [False, None, Row('key2', 'b')], 6, 2, None],
+                  [1, None, 15, 16, [0, Row('key1'), b'']],
+                  [1, None, 20, 16, [1, Row('key2'), b'']]]
+        self.assertEqual(
+            self._keyed_co_process(datastream_slow, inputs),
+            self._keyed_co_process(datastream_fast, inputs))
+
+    @staticmethod
+    def _process(module, inputs):
+        ctx = ProcessFunctionOperation.InternalProcessFunctionContext(
+            ProcessFunctionOperation.InternalTimerService())
+        handler = module.ProcessFunctionHandler(MyProcessFunction(), ctx)
+        return [list(handler.process_element(value)) for value in inputs]
+
+    @staticmethod
+    def _keyed_process(module, inputs):
+        handler = module.KeyedProcessFunctionHandler(
+            MyKeyedProcessFunction(), *ProcessFunctionsFastTests._create_contexts())
+        return [[tuple(result) for result in handler.process_element(value)]
+                for value in inputs]
+
+    @staticmethod
+    def _keyed_co_process(module, inputs):
+        ctx, on_timer_ctx, collector, keyed_state_backend = \
+            ProcessFunctionsFastTests._create_contexts()
+        handler = module.KeyedTwoInputTimerRowHandler(
+            ctx, on_timer_ctx, collector, keyed_state_backend, MyKeyedCoProcessFunction())
+        return [[tuple(result) for result in handler.process_element(value)]
+                for value in inputs]
+
+    @staticmethod
+    def _create_contexts():
+        collector = KeyedProcessFunctionOperation.InternalCollector()
+        keyed_state_backend = KeyedStateBackend()
+        timer_service = KeyedProcessFunctionOperation.InternalTimerService(
+            collector, keyed_state_backend)
+        ctx = KeyedProcessFunctionOperation.InternalKeyedProcessFunctionContext(timer_service)
+        on_timer_ctx = KeyedProcessFunctionOperation.InternalKeyedProcessFunctionOnTimerContext(
+            timer_service)
+        return ctx, on_timer_ctx, collector, keyed_state_backend
+
+
+if __name__ == '__main__':
+    import logging
+    logging.getLogger().setLevel(logging.INFO)
+    unittest.main()
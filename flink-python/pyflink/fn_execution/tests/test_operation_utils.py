@@ -0,0 +1,133 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import asyncio
+import cloudpickle
+import threading
+import unittest
+
+from pyflink.common import Row
+from pyflink.fn_execution import flink_fn_execution_pb2
+from pyflink.fn_execution.operation_utils import wrap_pandas_result
+from pyflink.fn_execution.operations import ScalarFunctionOperation
+from pyflink.table.udf import AsyncFunctionWrapper, DelegatingScalarFunction, ScalarFunction
+from pyflink.table.types import DataTypes, create_arrow_schema
+from pyflink.table.utils import pandas_to_arrow
+
+
+class WrapPandasResultTests(unittest.TestCase):
+
+    def test_nullable_bigint(self):
+        results = [[2 ** 60 + 1], [None], [-2 ** 62 - 1]]
+        batch = self._to_arrow(results, [DataTypes.BIGINT()])
+        self.assertEqual([2 ** 60 + 1, None, -2 ** 62 - 1], batch.column(0).to_pylist())
+
+    def test_nullable_bigint_in_row(self):
+        results = [[Row(2 ** 60 + 1, 1.5)], [None], [Row(None, 2.5)]]
+        row_type = DataTypes.ROW([DataTypes.FIELD('f0', DataTypes.BIGINT()),
+                                  DataTypes.FIELD('f1', DataTypes.DOUBLE())])
+        batch = self._to_arrow(results, [row_type])
+        self.assertEqual(
+            [{'f0': 2 ** 60 + 1, 'f1': 1.5}, {'f0': None, 'f1': None}, {'f0': None, 'f1': 2.5}],
+            batch.column(0).to_pylist())
+
+    def test_nullable_double(self):
+        results = [[1.5], [None], [float('nan')]]
+        batch = self._to_arrow(results, [DataTypes.DOUBLE()])
+        self.assertEqual([1.5, None, None], batch.column(0).to_pylist())
+
+    @staticmethod
+    def _to_arrow(results, data_types):
+        field_names = ['f%d' % i for i in range(len(data_types))]
+        schema = create_arrow_schema(field_names, data_types)
+        return pandas_to_arrow(schema, None, data_types, wrap_pandas_result(results))
+
+
+class CountingFunction(ScalarFunction):
+    """
+    A stateful function which is not thread-safe.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.threads = set()
+
+    def eval(self, i):
+        self.threads.add(threading.current_thread())
+        self.count += 1
+        return i * 10 + self.count
+
+
+async def async_add_one(i):
+    # the later inputs complete earlier
+    await asyncio.sleep(0.01 * (5 - i % 5))
+    return i + 1
+
+
+class AsyncScalarFunctionOperationTests(unittest.TestCase):
+
+    def test_chain_async_function_with_stateful_function(self):
+        # async_add_one(a), counting(a), async_add_one(counting(a)), counting(async_add_one(a))
+        async_func = self._udf(self._async_add_one(), self._input(0))
+        counting_func = self._udf(CountingFunction(), self._input(0))
+        operation = self._create_operation([
+            async_func,
+            counting_func,
+            self._udf(self._async_add_one(), flink_fn_execution_pb2.Input(udf=counting_func)),
+            self._udf(CountingFunction(), flink_fn_execution_pb2.Input(udf=async_func))])
+        operation.open()
+        try:
+            executor = operation.async_executor
+            results = list(executor.process_futures(operation.func, [[i] for i in range(10)]))
+            results.extend(executor.flush())
+        finally:
+            operation.close()
+
+        self.assertEqual(
+            [[i + 1, i * 10 + i + 1, i * 10 + i + 2, (i + 1) * 10 + i + 1] for i in range(10)],
+            results)
+        counting_funcs = [func for func in operation.user_defined_funcs
+                          if isinstance(func, CountingFunction)]
+        self.assertEqual(3, len(counting_funcs))
+        for func in counting_funcs:
+            # the functions which are not async are called in the thread processing the bundle
+            self.assertEqual({threading.current_thread()}, func.threads)
+            self.assertEqual(10, func.count)
+
+    @staticmethod
+    def _async_add_one():
+        return AsyncFunctionWrapper(DelegatingScalarFunction(async_add_one), 4, None)
+
+    @staticmethod
+    def _input(offset):
+        return flink_fn_execution_pb2.Input(inputOffset=offset)
+
+    @staticmethod
+    def _udf(func, arg):
+        return flink_fn_execution_pb2.UserDefinedFunction(
+            payload=cloudpickle.dumps(func), inputs=[arg])
+
+    @staticmethod
+    def _create_operation(udfs):
+        class Spec(object):
+            serialized_fn = flink_fn_execution_pb2.UserDefinedFunctions(udfs=udfs)
+
+        return ScalarFunctionOperation(Spec())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import unittest
+
+from pyflink.fn_execution.state_impl import StateCache, EvictionPolicy, LRUEvictionPolicy, \
+    WTinyLFUEvictionPolicy
+
+
+class StateCacheTests(unittest.TestCase):
+
+    def test_bounded_by_entries(self):
+        evicted = []
+        cache = StateCache(2, 0, len, LRUEvictionPolicy())
+        cache.set_on_evict(lambda key, value: evicted.append(key))
+        cache.put("a", "1")
+        cache.put("b", "1")
+        self.assertEqual("1", cache.get("a"))
+        cache.put("c", "1")
+        self.assertEqual(["b"], evicted)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(1, cache.evictions)
+
+    def test_bounded_by_bytes(self):
+        evicted = []
+        cache = StateCache(100, 10, len, LRUEvictionPolicy())
+        cache.set_on_evict(lambda key, value: evicted.append(key))
+        cache.put("a", "xxxx")
+        cache.put("b", "xxxx")
+        self.assertEqual(8, cache.resident_bytes)
+        cache.put("c", "xxxx")
+        self.assertEqual(["a"], evicted)
+        self.assertEqual(8, cache.resident_bytes)
+        # replacing an entry updates its weight
+        cache.put("c", "x")
+        self.assertEqual(5, cache.resident_bytes)
+        # an entry larger than the cache is evicted at once
+        cache.put("d", "x" * 20)
+        self.assertEqual(["a", "b", "c", "d"], evicted)
+        self.assertEqual(0, cache.resident_bytes)
+        self.assertEqual(0, len(cache))
+
+    def test_refresh_weights(self):
+        value = ["x"] * 4
+        cache = StateCache(100, 0, len, LRUEvictionPolicy())
+        cache.put("a", value)
+        value.clear()
+        cache.refresh_weights()
+        self.assertEqual(0, cache.resident_bytes)
+
+    def test_w_tiny_lfu_keeps_frequent_entries(self):
+        cache = StateCache(10, 0, len, EvictionPolicy.of("W-TinyLFU", 10))
+        self.assertIsInstance(cache._eviction_policy, WTinyLFUEvictionPolicy)
+        for i in range(10):
+            cache.put("hot%d" % i, "1")
+        for _ in range(5):
+            for i in range(10):
+                cache.get("hot%d" % i)
+        # a scan of one-off keys should not flush the frequently accessed entries
+        for i in range(100):
+            cache.put("cold%d" % i, "1")
+        hot_entries = sum(1 for i in range(10) if "hot%d" % i in cache)
+        self.assertGreaterEqual(hot_entries, 8)
+        self.assertEqual(10, len(cache))
+
+    def test_unsupported_eviction_policy(self):
+        with self.assertRaises(Exception):
+            EvictionPolicy.of("FIFO", 10)
+
+
+if __name__ == '__main__':
+    try:
+        import xmlrunner
+
+        testRunner = xmlrunner.XMLTestRunner(output='target/test-reports')
+    except ImportError:
+        testRunner = None
+    unittest.main(testRunner=testRunner, verbosity=2)
@@ -0,0 +1,460 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import unittest
+import uuid
+
+from apache_beam.coders import coder_impl
+from apache_beam.coders.coders import PickleCoder
+from apache_beam.portability.api import beam_fn_api_pb2
+
+from pyflink.fn_execution.coders import BigIntCoder, FlattenRowCoder
+from pyflink.fn_execution.state_impl import CachingMapStateHandler, IterateType, \
+    RemoteKeyedStateBackend
+
+
+class FakeFuture(object):
+
+    def __init__(self, response):
+        self._response = response
+
+    def get(self):
+        return self._response
+
+
+class FakeStateChannel(object):
+    """
+    Serves the state requests of the bag states and the map states from the data kept in memory
+    in the same way as the Java side, and records the requests sent to it.
+    """
+
+    def __init__(self, map_key_coder=None, map_value_coder=None, iterate_batch_size=3):
+        self.bags = {}
+        self.maps = {}
+        self.iterators = {}
+        self.requests = []
+        self._map_key_coder = map_key_coder
+        self._map_value_coder = map_value_coder
+        self._iterate_batch_size = iterate_batch_size
+
+    def _request(self, request):
+        self.requests.append(request)
+        if request.state_key.HasField('multimap_side_input'):
+            return FakeFuture(self._handle_map_request(request))
+        state_key = request.state_key.SerializeToString()
+        if request.HasField('get'):
+            return FakeFuture(beam_fn_api_pb2.StateResponse(
+                get=beam_fn_api_pb2.StateGetResponse(data=self.bags.get(state_key, b''))))
+        elif request.HasField('append'):
+            self.bags[state_key] = self.bags.get(state_key, b'') + request.append.data
+            return FakeFuture(beam_fn_api_pb2.StateResponse(
+                append=beam_fn_api_pb2.StateAppendResponse()))
+        else:
+            self.bags.pop(state_key, None)
+            return FakeFuture(beam_fn_api_pb2.StateResponse(
+                clear=beam_fn_api_pb2.StateClearResponse()))
+
+    def append_raw(self, state_key, data):
+        return self._request(beam_fn_api_pb2.StateRequest(
+            state_key=state_key, append=beam_fn_api_pb2.StateAppendRequest(data=data)))
+
+    def clear(self, state_key):
+        return self._request(beam_fn_api_pb2.StateRequest(
+            state_key=state_key, clear=beam_fn_api_pb2.StateClearRequest()))
+
+    def map_requests(self, flag):
+        return [request for request in self.requests
+                if request.state_key.HasField('multimap_side_input')
+                and request.HasField('get') and request.get.continuation_token[0] == flag]
+
+    def _handle_map_request(self, request):
+        if request.state_key.multimap_side_input.transform_id == "clear_iterators":
+            self.iterators.clear()
+            return beam_fn_api_pb2.StateResponse(clear=beam_fn_api_pb2.StateClearResponse())
+        map_state = self.maps.setdefault(request.state_key.SerializeToString(), {})
+        if request.HasField('append'):
+            input_stream = coder_impl.create_InputStream(request.append.data)
+            for _ in range(input_stream.read_bigendian_int32()):
+                flag = input_stream.read_byte()
+                map_key = self._decode(self._map_key_coder, input_stream)
+                if flag == CachingMapStateHandler.DELETE:
+                    map_state.pop(map_key, None)
+                elif flag == CachingMapStateHandler.SET_NONE:
+                    map_state[map_key] = None
+                else:
+                    map_state[map_key] = self._decode(self._map_value_coder, input_stream)
+            return beam_fn_api_pb2.StateResponse(append=beam_fn_api_pb2.StateAppendResponse())
+        elif request.HasField('clear'):
+            map_state.clear()
+            return beam_fn_api_pb2.StateResponse(clear=beam_fn_api_pb2.StateClearResponse())
+
+        input_stream = coder_impl.create_InputStream(request.get.continuation_token)
+        out = coder_impl.create_OutputStream()
+        response_token = b''
+        flag = input_stream.read_byte()
+        if flag == CachingMapStateHandler.GET_FLAG:
+            map_key = self._map_key_coder.decode_from_stream(input_stream, True)
+            if map_key not in map_state:
+                out.write_byte(CachingMapStateHandler.NOT_EXIST_FLAG)
+            elif map_state[map_key] is None:
+                out.write_byte(CachingMapStateHandler.IS_NONE_FLAG)
+            else:
+                out.write_byte(CachingMapStateHandler.EXIST_FLAG)
+                self._map_value_coder.encode_to_stream(map_state[map_key], out, True)
+        elif flag == CachingMapStateHandler.ITERATE_FLAG:
+            iterate_type = IterateType(input_stream.read_byte())
+            iterator_token = input_stream.read(input_stream.read_bigendian_int32())
+            if iterator_token:
+                remaining_items = self.iterators.pop(iterator_token)
+            else:
+                remaining_items = list(map_state.items())
+            for map_key, map_value in remaining_items[:self._iterate_batch_size]:
+                self._map_key_coder.encode_to_stream(map_key, out, True)
+                if iterate_type != IterateType.KEYS:
+                    out.write_byte(map_value is not None)
+                    if map_value is not None:
+                        self._map_value_coder.encode_to_stream(map_value, out, True)
+            if len(remaining_items) > self._iterate_batch_size:
+                response_token = str(uuid.uuid4()).encode("utf-8")
+                self.iterators[response_token] = remaining_items[self._iterate_batch_size:]
+        else:
+            out.write_byte(CachingMapStateHandler.IS_EMPTY_FLAG if not map_state
+                           else CachingMapStateHandler.NOT_EMPTY_FLAG)
+        return beam_fn_api_pb2.StateResponse(get=beam_fn_api_pb2.StateGetResponse(
+            data=out.get(), continuation_token=response_token))
+
+    @staticmethod
+    def _decode(coder, input_stream):
+        # the keys and the values are prefixed with their lengths
+        data = input_stream.read(input_stream.read_bigendian_int32())
+        return coder.decode_from_stream(coder_impl.create_InputStream(data), True)
+
+
+class FakeStateCache(object):
+    """
+    The cross bundle state cache of the Beam state handler, which is not bounded.
+    """
+
+    def __init__(self):
+        self.cache = {}
+
+    def is_cache_enabled(self):
+        return True
+
+    def get(self, state_key, cache_token):
+        return self.cache.get((state_key, cache_token))
+
+    def put(self, state_key, cache_token, value):
+        self.cache[(state_key, cache_token)] = value
+
+    def evict(self, state_key, cache_token):
+        self.cache.pop((state_key, cache_token), None)
+
+
+class FakeContext(object):
+
+    def __init__(self, user_state_cache_token):
+        self.user_state_cache_token = user_state_cache_token
+        self.bundle_cache_token = None
+
+
+class FakeCachingStateHandler(object):
+    """
+    The caching state handler of Beam, which caches the contents of the bag states read from and
+    written to the fake state channel.
+    """
+
+    def __init__(self, cache_token=b'token'):
+        self._state_cache = FakeStateCache()
+        self._underlying = FakeStateChannel(PickleCoder().get_impl(), PickleCoder().get_impl())
+        self._context = FakeContext(cache_token)
+
+    def blocking_get(self, state_key, coder):
+        cache_key = state_key.SerializeToString()
+        cached_value = self._state_cache.get(cache_key, self._context.user_state_cache_token)
+        if cached_value is None:
+            response = self._underlying._request(beam_fn_api_pb2.StateRequest(
+                state_key=state_key, get=beam_fn_api_pb2.StateGetRequest())).get()
+            input_stream = coder_impl.create_InputStream(response.get.data)
+            cached_value = []
+            while input_stream.size() > 0:
+                cached_value.append(coder.decode_from_stream(input_stream, True))
+            self._state_cache.put(cache_key, self._context.user_state_cache_token, cached_value)
+        return cached_value
+
+    def extend(self, state_key, coder, elements):
+        cached_value = self._state_cache.get(
+            state_key.SerializeToString(), self._context.user_state_cache_token)
+        if cached_value is not None:
+            cached_value.extend(elements)
+        out = coder_impl.create_OutputStream()
+        for element in elements:
+            coder.encode_to_stream(element, out, True)
+        return self._underlying._request(beam_fn_api_pb2.StateRequest(
+            state_key=state_key, append=beam_fn_api_pb2.StateAppendRequest(data=out.get())))
+
+    def clear(self, state_key):
+        self._state_cache.put(
+            state_key.SerializeToString(), self._context.user_state_cache_token, [])
+        return self._underlying._request(beam_fn_api_pb2.StateRequest(
+            state_key=state_key, clear=beam_fn_api_pb2.StateClearRequest()))
+
+
+class RemoteKeyedStateBackendTests(unittest.TestCase):
+
+    def setUp(self):
+        self.state_handler = FakeCachingStateHandler()
+        self.key_coder_impl = FlattenRowCoder([BigIntCoder()]).get_impl()
+
+    def create_state_backend(self, state_cache_size=100, state_cache_max_bytes=0):
+        return RemoteKeyedStateBackend(
+            self.state_handler,
+            FlattenRowCoder([BigIntCoder()]),
+            None,
+            state_cache_size,
+            1000,
+            1000,
+            state_cache_max_bytes)
+
+    def put_remote_value(self, name, key, value):
+        state_key = RemoteKeyedStateBackend._create_bag_state_key(
+            name, self.key_coder_impl.encode_nested(key), b'')
+        out = coder_impl.create_OutputStream()
+        PickleCoder().get_impl().encode_to_stream(value, out, True)
+        self.state_handler._underlying.bags[state_key.SerializeToString()] = out.get()
+
+    def read_values(self, state_backend, name, key_num):
+        state_backend.set_current_key([0])
+        state = state_backend.get_value_state(name, PickleCoder())
+        for i in range(key_num):
+            state_backend.set_current_key([i])
+            self.assertEqual("x" * 1000, state.value())
+        # caches the state of the last key
+        state_backend.set_current_key([key_num])
+        return state
+
+    def test_state_cache_weighs_read_data(self):
+        for i in range(10):
+            self.put_remote_value("state", [i], "x" * 1000)
+        state_backend = self.create_state_backend()
+        self.read_values(state_backend, "state", 10)
+        # the read-only states are weighed by the contents cached for them
+        self.assertEqual(10, len(state_backend._internal_state_cache))
+        self.assertGreater(state_backend._internal_state_cache.resident_bytes, 10 * 1000)
+
+    def test_state_cache_evicts_read_only_states_by_bytes(self):
+        for i in range(10):
+            self.put_remote_value("state", [i], "x" * 1000)
+        state_backend = self.create_state_backend(state_cache_max_bytes=5000)
+        self.read_values(state_backend, "state", 10)
+        internal_state_cache = state_backend._internal_state_cache
+        self.assertLessEqual(internal_state_cache.resident_bytes, 5000)
+        self.assertGreater(internal_state_cache.evictions, 0)
+        self.assertEqual(10 - internal_state_cache.evictions, len(internal_state_cache))
+        # the contents of the evicted states are evicted from the state cache together
+        self.assertEqual(len(internal_state_cache), len(self.state_handler._state_cache.cache))
+        # the evicted states are read from the remote side again
+        state_backend.set_current_key([0])
+        self.assertEqual("x" * 1000, state_backend.get_value_state("state", PickleCoder()).value())
+
+    def test_state_cache_weight_kept_after_commit(self):
+        state_backend = self.create_state_backend()
+        state_backend.set_current_key([0])
+        state = state_backend.get_value_state("state", PickleCoder())
+        for i in range(3):
+            state_backend.set_current_key([i])
+            state.update("x" * 1000)
+        state_backend.set_current_key([3])
+        internal_state_cache = state_backend._internal_state_cache
+        resident_bytes = internal_state_cache.resident_bytes
+        self.assertGreater(resident_bytes, 3 * 1000)
+        state_backend.commit()
+        # the pending writes are moved into the cached contents of the states
+        self.assertGreater(internal_state_cache.resident_bytes, 3 * 1000)
+        self.assertEqual(sum(internal_state_cache._weights.values()),
+                         internal_state_cache.resident_bytes)
+
+
+class PrefetchTests(unittest.TestCase):
+
+    def setUp(self):
+        self.state_handler = FakeCachingStateHandler()
+        self.channel = self.state_handler._underlying
+        self.key_coder_impl = FlattenRowCoder([BigIntCoder()]).get_impl()
+        # the keys with an odd value don't have a state at the remote side
+        for i in range(0, 10, 2):
+            self.put_remote_value("state", [i], "value_%d" % i)
+        self.keys = [(i,) for i in range(10)]
+
+    def create_state_backend(self, state_handler, state_cache_size=4):
+        return RemoteKeyedStateBackend(
+            state_handler, FlattenRowCoder([BigIntCoder()]), None, state_cache_size, 1000, 1000)
+
+    def state_key(self, name, key):
+        return RemoteKeyedStateBackend._create_bag_state_key(
+            name, self.key_coder_impl.encode_nested(key), b'').SerializeToString()
+
+    def put_remote_value(self, name, key, value):
+        out = coder_impl.create_OutputStream()
+        PickleCoder().get_impl().encode_to_stream(value, out, True)
+        self.channel.bags[self.state_key(name, key)] = out.get()
+
+    def read_remote_value(self, name, key):
+        input_stream = coder_impl.create_InputStream(
+            self.channel.bags.get(self.state_key(name, key), b''))
+        values = []
+        while input_stream.size() > 0:
+            values.append(PickleCoder().get_impl().decode_from_stream(input_stream, True))
+        return values
+
+    def get_requests(self):
+        return [request for request in self.channel.requests if request.HasField('get')]
+
+    def read_values(self, state_backend, keys):
+        values = []
+        for key in keys:
+            state_backend.set_current_key(list(key))
+            values.append(state_backend.get_value_state("state", PickleCoder()).value())
+        return values
+
+    def test_prefetched_values(self):
+        # the values read without prefetching from the same remote side
+        state_handler = FakeCachingStateHandler()
+        state_handler._underlying.bags = self.channel.bags
+        expected = self.read_values(self.create_state_backend(state_handler), self.keys)
+
+        state_backend = self.create_state_backend(self.state_handler)
+        iterator = state_backend.iterate_keys_with_prefetch("state", PickleCoder(), self.keys)
+        values = []
+        for i, key in enumerate(iterator):
+            # the keys are prefetched batch by batch of the state cache size
+            self.assertEqual(min((i // 4 + 1) * 4, 10), len(self.get_requests()))
+            values.extend(self.read_values(state_backend, [key]))
+        self.assertEqual([None if i % 2 else "value_%d" % i for i in range(10)], values)
+        self.assertEqual(expected, values)
+        # the values are read from the state cache only
+        self.assertEqual(10, len(self.get_requests()))
+
+    def test_prefetch_honours_cache_token(self):
+        state_cache = self.state_handler._state_cache
+        # the values cached with the current token are not requested again
+        state_cache.put(self.state_key("state", [0]), b'token', ["cached_0"])
+        # the values cached with another token are stale
+        state_cache.put(self.state_key("state", [2]), b'stale', ["stale_2"])
+        state_backend = self.create_state_backend(self.state_handler)
+        keys = list(state_backend.iterate_keys_with_prefetch("state", PickleCoder(), self.keys))
+        self.assertEqual(self.keys, keys)
+        self.assertEqual(9, len(self.get_requests()))
+        self.assertEqual(["value_2"], state_cache.get(self.state_key("state", [2]), b'token'))
+        self.assertEqual(["stale_2"], state_cache.get(self.state_key("state", [2]), b'stale'))
+        self.assertEqual(["cached_0", None, "value_2"],
+                         self.read_values(state_backend, self.keys[:3]))
+
+    def test_no_prefetch_without_cache_token(self):
+        self.state_handler._context.user_state_cache_token = None
+        state_backend = self.create_state_backend(self.state_handler)
+        keys = list(state_backend.iterate_keys_with_prefetch("state", PickleCoder(), self.keys))
+        self.assertEqual(self.keys, keys)
+        self.assertEqual(0, len(self.channel.requests))
+
+    def test_commit_after_prefetch(self):
+        state_backend = self.create_state_backend(self.state_handler)
+        for key in state_backend.iterate_keys_with_prefetch("state", PickleCoder(), self.keys):
+            state_backend.set_current_key(list(key))
+            state = state_backend.get_value_state("state", PickleCoder())
+            state.update("%s_updated" % state.value())
+        # the updates of the evicted states have already been written to the remote side, the
+        # remaining ones are written by the commit which happens before the bundle finishes
+        state_backend.commit()
+        for i in range(10):
+            expected = ["%s_updated" % (None if i % 2 else "value_%d" % i)]
+            self.assertEqual(expected, self.read_remote_value("state", [i]))
+            # the state cache doesn't keep stale values for the following bundles, the contents
+            # of the evicted states have been evicted from it together
+            self.assertIn(self.state_handler._state_cache.get(
+                self.state_key("state", [i]), b'token'), [None, expected])
+        self.assertEqual(["None_updated"], self.state_handler._state_cache.get(
+            self.state_key("state", [9]), b'token'))
+
+
+class CachingMapStateHandlerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.state_handler = FakeCachingStateHandler()
+        self.state_backend = RemoteKeyedStateBackend(
+            self.state_handler, FlattenRowCoder([BigIntCoder()]), None, 100, 1000, 1000)
+        self.state_backend.set_current_key([0])
+        self.map_state = self.state_backend.get_map_state("map", PickleCoder(), PickleCoder())
+        # the map state at the Java side
+        self.map_state.put_all((i, str(i)) for i in range(10))
+        self.map_state.get_internal_state().commit()
+        self.state_handler._state_cache.cache.clear()
+        self.channel = self.state_handler._underlying
+        self.map_state_handler = self.state_backend._map_state_handler
+
+    def test_full_iteration(self):
+        self.assertEqual([(i, str(i)) for i in range(10)], list(self.map_state.items()))
+        self.assertEqual(list(range(10)), list(self.map_state.keys()))
+        self.assertEqual([str(i) for i in range(10)], list(self.map_state.values()))
+        # 4 batches of 3 entries per iteration
+        self.assertEqual(12, len(self.channel.map_requests(CachingMapStateHandler.ITERATE_FLAG)))
+        self.assertEqual(0, len(self.channel.iterators))
+        self.assertEqual(0, self.map_state_handler.get_cached_iterators_num())
+
+    def test_early_break_and_iterate_again(self):
+        for stop_at in [1, 4, 9]:
+            keys = []
+            for key in self.map_state.keys():
+                keys.append(key)
+                if len(keys) == stop_at:
+                    break
+            self.assertEqual(list(range(stop_at)), keys)
+            # the in-flight batch has been received, so the iterators cached at the Java side are
+            # tracked correctly, e.g. the iterator has finished if the last batch was in flight
+            self.assertEqual(len(self.channel.iterators),
+                             self.map_state_handler.get_cached_iterators_num())
+        self.assertEqual([(i, str(i)) for i in range(10)], list(self.map_state.items()))
+
+        self.state_backend.clear_cached_iterators()
+        self.map_state_handler.reset_cached_iterators_num()
+        self.assertEqual(0, len(self.channel.iterators))
+
+    def test_prefetch(self):
+        self.map_state.prefetch([1, 2, 3])
+        self.assertEqual(3, len(self.channel.map_requests(CachingMapStateHandler.GET_FLAG)))
+        # the prefetched keys are read from the cache
+        self.map_state.prefetch([1, 2, 3])
+        self.assertEqual("2", self.map_state.get(2))
+        self.assertTrue(self.map_state.contains(3))
+        self.assertEqual(3, len(self.channel.map_requests(CachingMapStateHandler.GET_FLAG)))
+        # the key which doesn't exist is cached too
+        self.map_state.prefetch([3, 42])
+        self.assertFalse(self.map_state.contains(42))
+        self.assertEqual(4, len(self.channel.map_requests(CachingMapStateHandler.GET_FLAG)))
+        # the key which hasn't been prefetched is requested
+        self.assertEqual("5", self.map_state.get(5))
+        self.assertEqual(5, len(self.channel.map_requests(CachingMapStateHandler.GET_FLAG)))
+
+
+if __name__ == '__main__':
+    try:
+        import xmlrunner
+
+        testRunner = xmlrunner.XMLTestRunner(output='target/test-reports')
+    except ImportError:
+        testRunner = None
+    unittest.main(testRunner=testRunner, verbosity=2)
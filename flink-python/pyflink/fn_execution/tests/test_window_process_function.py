@@ -0,0 +1,140 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import unittest
+
+from pyflink.fn_execution.window import TimeWindow
+from pyflink.fn_execution.window_assigner import SessionWindowAssigner
+from pyflink.fn_execution.window_process_function import MergingWindowProcessFunction
+
+
+class MapState(object):
+
+    def __init__(self):
+        self._data = {}
+
+    def items(self):
+        return list(self._data.items())
+
+    def put(self, key, value):
+        self._data[key] = value
+
+    def remove(self, key):
+        self._data.pop(key, None)
+
+
+class KeyedContext(object):
+    """
+    The context whose states are partitioned by the current key.
+    """
+
+    def __init__(self):
+        self.key = None
+        self._mapping_states = {}
+        self._accumulators = {}
+
+    def get_partitioned_state(self, state_descriptor):
+        context = self
+
+        class PartitionedMapState(object):
+
+            def items(self):
+                return context._mapping_state().items()
+
+            def put(self, key, value):
+                context._mapping_state().put(key, value)
+
+            def remove(self, key):
+                context._mapping_state().remove(key)
+
+        return PartitionedMapState()
+
+    def _mapping_state(self):
+        return self._mapping_states.setdefault(self.key, MapState())
+
+    def current_key(self):
+        return self.key
+
+    def current_processing_time(self):
+        return 0
+
+    def current_watermark(self):
+        return -1
+
+    def get_window_accumulators(self, window):
+        return self._accumulators.get((self.key, window))
+
+    def set_window_accumulators(self, window, acc):
+        self._accumulators[(self.key, window)] = acc
+
+    def clear_window_state(self, window):
+        self._accumulators.pop((self.key, window), None)
+
+    def clear_trigger(self, window):
+        pass
+
+    def on_merge(self, new_window, merged_windows):
+        pass
+
+    def delete_cleanup_timer(self, window):
+        pass
+
+
+class WindowAggregator(object):
+
+    def __init__(self):
+        self.accumulators = None
+
+    def create_accumulators(self):
+        return [0]
+
+    def set_accumulators(self, window, acc):
+        self.accumulators = acc
+
+    def cleanup(self, window):
+        pass
+
+
+class MergingWindowProcessFunctionTests(unittest.TestCase):
+
+    def test_emit_after_processing_other_key(self):
+        ctx = KeyedContext()
+        aggregator = WindowAggregator()
+        process_function = MergingWindowProcessFunction(
+            0, SessionWindowAssigner(10, True), aggregator)
+        process_function.open(ctx)
+
+        for key, count, timestamp in [('a', 1, 0), ('b', 2, 100), ('a', 1, 5)]:
+            ctx.key = key
+            for state_window in process_function.assign_state_namespace([key], timestamp):
+                acc = ctx.get_window_accumulators(state_window) or [0]
+                ctx.set_window_accumulators(state_window, [acc[0] + count])
+
+        # the timer of the key 'a' fires after the key 'b' has been processed
+        ctx.key = 'b'
+        process_function.assign_state_namespace(['b'], 101)
+        ctx.key = 'a'
+        process_function.prepare_aggregate_accumulator_for_emit(TimeWindow(0, 15))
+        self.assertEqual([2], aggregator.accumulators)
+
+        ctx.key = 'b'
+        process_function.prepare_aggregate_accumulator_for_emit(TimeWindow(100, 111))
+        self.assertEqual([2], aggregator.accumulators)
+
+
+if __name__ == '__main__':
+    unittest.main()
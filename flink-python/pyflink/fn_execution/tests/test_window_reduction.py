@@ -0,0 +1,87 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from pyflink.fn_execution.utils.window_reduction import reduce_windows
+
+
+class WindowReductionTests(unittest.TestCase):
+
+    def test_reductions(self):
+        rng = np.random.RandomState(0)
+        size = 40
+        rows = np.arange(size)
+        input_series = [
+            pd.Series(rng.randint(-100, 100, size).astype(np.int8)),
+            pd.Series(rng.normal(size=size)),
+            pd.Series(np.where(rng.rand(size) < 0.3, np.nan, rng.normal(size=size)))]
+        windows = [(np.zeros(size, dtype=np.int64), np.minimum(rows + 2, size)),
+                   (np.maximum(rows - 2, 0), np.full(size, size)),
+                   (np.zeros(size, dtype=np.int64), np.zeros(size, dtype=np.int64))]
+        for lower, upper in [(-3, 0), (-1, 1), (2, 4), (-6, -2), (-20, 10)]:
+            starts = np.clip(rows + lower, 0, size)
+            windows.append((starts, np.maximum(np.clip(rows + upper + 1, 0, size), starts)))
+
+        for series in input_series:
+            for starts, ends in windows:
+                for reduction in ['sum', 'mean', 'min', 'max', 'count']:
+                    expected = [getattr(series.iloc[start:end], reduction)()
+                                for start, end in zip(starts, ends)]
+                    actual = reduce_windows(series, reduction, starts, ends)
+                    np.testing.assert_allclose(
+                        actual.to_numpy(dtype=float), np.array(expected, dtype=float))
+
+    def test_large_magnitude_input(self):
+        series = pd.Series([1e16, 1.0, 1.0, 1.0])
+        starts = np.array([0, 1, 2, 3], dtype=np.int64)
+        ends = np.array([2, 3, 4, 4], dtype=np.int64)
+        np.testing.assert_array_equal(
+            [1e16, 2.0, 2.0, 1.0], reduce_windows(series, 'sum', starts, ends).to_numpy())
+        np.testing.assert_array_equal(
+            [5e15, 1.0, 1.0, 1.0], reduce_windows(series, 'mean', starts, ends).to_numpy())
+
+    def test_non_finite_input(self):
+        series = pd.Series([1.0, np.inf, 2.0, -np.inf, 3.0, np.nan, 4.0])
+        rows = np.arange(len(series))
+        starts = np.maximum(rows - 1, 0)
+        ends = rows + 1
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', RuntimeWarning)
+            for reduction in ['sum', 'mean']:
+                expected = [getattr(series.iloc[start:end], reduction)()
+                            for start, end in zip(starts, ends)]
+                np.testing.assert_array_equal(
+                    expected, reduce_windows(series, reduction, starts, ends).to_numpy())
+
+    def test_non_numeric_input(self):
+        self.assertIsNone(reduce_windows(
+            pd.Series(['a', 'b']), 'max', np.zeros(2, dtype=np.int64), np.ones(2, dtype=np.int64)))
+
+
+if __name__ == '__main__':
+    try:
+        import xmlrunner
+
+        testRunner = xmlrunner.XMLTestRunner(output='target/test-reports')
+    except ImportError:
+        testRunner = None
+    unittest.main(testRunner=testRunner, verbosity=2)
@@ -0,0 +1,111 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+from pyflink.fn_execution.beam import beam_worker_pool
+
+_RUN_WORKER_SCRIPT = """
+import os, sys
+from pyflink.fn_execution.beam import beam_worker_pool
+sys.exit(beam_worker_pool.run_worker(["worker"], dict(os.environ)))
+"""
+
+
+@unittest.skipIf(not beam_worker_pool.is_worker_pool_enabled(
+    {beam_worker_pool.PYTHON_WORKER_POOL_ENABLED: "true"}),
+    "The Python worker pool is only supported on POSIX systems.")
+class PythonWorkerPoolTests(unittest.TestCase):
+
+    def setUp(self):
+        self.pool_dir = tempfile.mkdtemp()
+        self.env = dict(os.environ)
+        self.env[beam_worker_pool.PYTHON_WORKER_POOL_ENABLED] = "true"
+        self.env[beam_worker_pool.PYTHON_WORKER_POOL_DIR] = self.pool_dir
+        self.env[beam_worker_pool.PYTHON_WORKER_POOL_IDLE_TIMEOUT] = "2"
+        self.env["WORKER_ID"] = "worker-1"
+        self.env["PIPELINE_OPTIONS"] = "{}"
+        # the SDK harness fails as there is no control service
+        self.env.pop("CONTROL_API_SERVICE_DESCRIPTOR", None)
+
+    def test_fork_worker(self):
+        for _ in range(2):
+            self.env["_PYTHON_WORKER_BOOT_TIME"] = repr(time.time())
+            process = subprocess.run(
+                [sys.executable, "-c", _RUN_WORKER_SCRIPT], env=self.env,
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            output = process.stdout.decode("utf-8")
+            # the output of the forked Python worker is written to the stdout of the client
+            self.assertIn("Python worker worker-1 started in", output)
+            self.assertIn("CONTROL_API_SERVICE_DESCRIPTOR", output)
+            self.assertEqual(1, process.returncode)
+        # the second Python worker is forked by the same pool
+        self.assertEqual(1, len([f for f in os.listdir(self.pool_dir) if f.endswith(".sock")]))
+
+    def test_idle_timeout(self):
+        subprocess.run([sys.executable, "-c", _RUN_WORKER_SCRIPT], env=self.env,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.time() + 30
+        while any(f.endswith(".sock") for f in os.listdir(self.pool_dir)):
+            self.assertLess(time.time(), deadline, "The Python worker pool didn't exit.")
+            time.sleep(0.1)
+
+    def test_pool_per_python_path(self):
+        python_path = self.env.get("PYTHONPATH", "")
+        for extra_path in ["dependency-1", "dependency-2", "dependency-1"]:
+            # the modules preloaded by a pool may be imported from the Python path
+            self.env["PYTHONPATH"] = os.pathsep.join(
+                [python_path, os.path.join(self.pool_dir, extra_path)])
+            subprocess.run([sys.executable, "-c", _RUN_WORKER_SCRIPT], env=self.env,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.assertEqual(2, len([f for f in os.listdir(self.pool_dir) if f.endswith(".sock")]))
+
+    def tearDown(self):
+        shutil.rmtree(self.pool_dir, ignore_errors=True)
+
+
+class StartupLatencyMetricTests(unittest.TestCase):
+
+    def test_startup_latency_metric(self):
+        from pyflink.fn_execution.beam import beam_sdk_worker_main
+        from pyflink.fn_execution.operations import Operation
+        from pyflink.metrics.metricbase import GenericMetricGroup
+
+        base_metric_group = GenericMetricGroup(None, None)
+        beam_sdk_worker_main.startup_latency = 1.5
+        try:
+            Operation._register_startup_latency(base_metric_group)
+        finally:
+            beam_sdk_worker_main.startup_latency = None
+        gauge = base_metric_group.add_group("pythonWorker")._flink_gauge["startupLatencyMs"]
+        self.assertEqual(1500, gauge())
+
+
+if __name__ == '__main__':
+    try:
+        import xmlrunner
+
+        testRunner = xmlrunner.XMLTestRunner(output='target/test-reports')
+    except ImportError:
+        testRunner = None
+    unittest.main(testRunner=testRunner, verbosity=2)
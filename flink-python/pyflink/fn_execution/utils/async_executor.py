@@ -0,0 +1,204 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import asyncio
+import collections
+import functools
+import threading
+import time
+from concurrent import futures
+from typing import Callable, Iterable
+
+_event_loop = None
+_event_loop_lock = threading.Lock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Returns the asyncio event loop shared by all the async functions of the Python worker. The
+    loop runs in a daemon thread which is started on the first call.
+    """
+    global _event_loop
+    with _event_loop_lock:
+        if _event_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="pyflink-async-event-loop", daemon=True)
+            thread.start()
+            _event_loop = loop
+        return _event_loop
+
+
+def run_coroutine(coroutine, timeout=None):
+    """
+    Runs the coroutine in the shared event loop and waits for its result.
+    """
+    if timeout is not None:
+        coroutine = asyncio.wait_for(coroutine, timeout)
+    return asyncio.run_coroutine_threadsafe(coroutine, get_event_loop()).result()
+
+
+class AsyncExecutor(object):
+    """
+    Executes a function for a sequence of inputs concurrently. Coroutine functions are executed
+    in the shared asyncio event loop and the other functions are executed in a thread pool.
+
+    At most `capacity` calls are in flight at the same time. The calls which are still in flight
+    when the inputs have been consumed are kept across the calls of :func:`process` and their
+    results are emitted by :func:`flush`, e.g. when the bundle finishes.
+
+    :param capacity: The maximum number of the calls in flight.
+    :param timeout: The maximum time in seconds to wait for a call, no limit if it's None.
+    :param ordered: Whether the results are emitted in the order of the inputs. Otherwise, the
+                    results are emitted in the order in which the calls complete.
+    :param on_timeout: Called with the input of a call which times out, its return value is used
+                       as the result of the call. A TimeoutError is raised if it's None.
+    """
+
+    def __init__(self,
+                 capacity: int,
+                 timeout: float = None,
+                 ordered: bool = True,
+                 on_timeout: Callable = None):
+        if capacity <= 0:
+            raise ValueError("The capacity must be positive, got %s." % capacity)
+        self._capacity = capacity
+        self._timeout = timeout
+        self._ordered = ordered
+        self._on_timeout = on_timeout
+        self._thread_pool = None
+        # the calls in flight: (future, input, deadline)
+        if ordered:
+            self._pending = collections.deque()
+        else:
+            self._pending = {}
+
+    def process(self, func: Callable, inputs: Iterable):
+        """
+        Calls the function for each input and yields the results of the calls which have
+        completed. The calls which are still in flight are left to :func:`flush`.
+
+        :param func: The function or coroutine function to call.
+        :param inputs: The inputs of the calls.
+        """
+        yield from self.process_futures(functools.partial(self.submit, func), inputs)
+
+    def process_futures(self, submit: Callable, inputs: Iterable):
+        """
+        The same as :func:`process`, except that the calls are started by `submit` in the current
+        thread, which returns the future of the call for an input, e.g. a future combining the
+        calls started by :func:`submit`.
+
+        :param submit: The function which starts the call for an input.
+        :param inputs: The inputs of the calls.
+        """
+        for value in inputs:
+            while len(self._pending) >= self._capacity:
+                yield from self._poll(True)
+            self._add_call(submit, value)
+        yield from self._poll(False)
+
+    def submit(self, func: Callable, *args) -> futures.Future:
+        """
+        Starts a call of the function and returns its future. Coroutine functions are called in
+        the shared asyncio event loop and the other functions are called in the thread pool.
+        """
+        if asyncio.iscoroutinefunction(func):
+            coroutine = func(*args)
+            if self._timeout is not None:
+                coroutine = asyncio.wait_for(coroutine, self._timeout)
+            return asyncio.run_coroutine_threadsafe(coroutine, get_event_loop())
+        else:
+            if self._thread_pool is None:
+                self._thread_pool = futures.ThreadPoolExecutor(
+                    max_workers=self._capacity, thread_name_prefix="pyflink-async")
+            return self._thread_pool.submit(func, *args)
+
+    def flush(self):
+        """
+        Waits for all the calls in flight and yields their results.
+        """
+        while self._pending:
+            yield from self._poll(True)
+
+    def close(self):
+        for call in self._calls():
+            call[0].cancel()
+        self._pending.clear()
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=True)
+            self._thread_pool = None
+
+    def _add_call(self, submit, value):
+        if self._timeout is None:
+            deadline = None
+        else:
+            deadline = time.monotonic() + self._timeout
+        call = (submit(value), value, deadline)
+        if self._ordered:
+            self._pending.append(call)
+        else:
+            self._pending[call[0]] = call
+
+    def _calls(self):
+        if self._ordered:
+            return list(self._pending)
+        else:
+            return list(self._pending.values())
+
+    def _poll(self, block):
+        """
+        Yields the results of the calls which have completed. If block is True, waits until the
+        result of at least one call is available.
+        """
+        if self._ordered:
+            pending = self._pending
+            if block:
+                yield self._get_result(pending.popleft())
+            while pending and pending[0][0].done():
+                yield self._get_result(pending.popleft())
+        else:
+            pending = self._pending
+            if not pending:
+                return
+            if not block:
+                wait_timeout = 0
+            elif self._timeout is None:
+                wait_timeout = None
+            else:
+                earliest_deadline = min(deadline for _, _, deadline in pending.values())
+                wait_timeout = max(earliest_deadline - time.monotonic(), 0)
+            done, _ = futures.wait(
+                list(pending.keys()), timeout=wait_timeout, return_when=futures.FIRST_COMPLETED)
+            if not done and block:
+                # the earliest call has timed out
+                done = [min(pending.values(), key=lambda call: call[2])[0]]
+            for future in done:
+                yield self._get_result(pending.pop(future))
+
+    def _get_result(self, call):
+        future, value, deadline = call
+        try:
+            if deadline is None:
+                return future.result()
+            else:
+                return future.result(max(deadline - time.monotonic(), 0))
+        except (futures.TimeoutError, asyncio.TimeoutError):
+            future.cancel()
+            if self._on_timeout is None:
+                raise TimeoutError("The async call for input %s timed out." % str(value))
+            return self._on_timeout(value)
@@ -0,0 +1,88 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+from pyflink.fn_execution import flink_fn_execution_pb2
+from pyflink.fn_execution.utils import compression_utils
+from pyflink.fn_execution.utils.shared_memory_utils import open_shared_memory
+
+# the size in bytes of the rows which are written as one block
+BLOCK_SIZE = compression_utils.BLOCK_SIZE
+
+
+def is_block_enabled(compression, shared_memory_path) -> bool:
+    """
+    Whether the rows are exchanged as blocks instead of one by one.
+    """
+    return compression != flink_fn_execution_pb2.CoderParam.NONE or bool(shared_memory_path)
+
+
+class BlockCodec(object):
+    """
+    Encodes and decodes the blocks of the rows exchanged between the Java operator and the Python
+    worker. A block consists of the length-prefixed rows, it's compressed according to
+    CoderParam.compression (see pyflink.fn_execution.utils.compression_utils) and then sent via
+    the memory mapped file of CoderParam.shared_memory_path if any (see
+    pyflink.fn_execution.utils.shared_memory_utils).
+    """
+
+    def __init__(self, compression, shared_memory_path):
+        compression_utils.check_compression(compression)
+        self._compressed = compression != flink_fn_execution_pb2.CoderParam.NONE
+        self._shared_memory = \
+            open_shared_memory(shared_memory_path) if shared_memory_path else None
+
+    def encode(self, data, out_stream):
+        """
+        Writes the length-prefixed rows contained in the given bytes-like object as one block.
+        """
+        if self._compressed:
+            data = compression_utils.compress(data)
+        if self._shared_memory is not None:
+            data = self._shared_memory.write_block(data)
+        out_stream.write(data, True)
+
+    def decode(self, in_stream):
+        """
+        Reads all the blocks of the given Beam input stream and returns the length-prefixed rows.
+        The result is a view of the shared memory if the blocks are written to it contiguously
+        and are not compressed.
+        """
+        shared_memory = self._shared_memory
+        blocks = []
+        # the range of the uncompressed blocks which are written to the shared memory contiguously
+        offset = end = -1
+        while in_stream.size() > 0:
+            block = in_stream.read_all(True)
+            if shared_memory is not None:
+                reference = None if self._compressed else shared_memory.reference(block)
+                if reference is not None:
+                    if reference[0] != end:
+                        if offset >= 0:
+                            blocks.append(shared_memory.view(offset, end - offset))
+                        offset = reference[0]
+                    end = reference[0] + reference[1]
+                    continue
+                block = shared_memory.read_block(block)
+            if offset >= 0:
+                blocks.append(shared_memory.view(offset, end - offset))
+                offset = end = -1
+            if self._compressed:
+                block = compression_utils.decompress(block)
+            blocks.append(block)
+        if offset >= 0:
+            blocks.append(shared_memory.view(offset, end - offset))
+        return blocks[0] if len(blocks) == 1 else b''.join(blocks)
@@ -0,0 +1,71 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+"""
+Block compression of the rows exchanged between the Java operator and the Python worker, which is
+negotiated via CoderParam.compression. The length-prefixed rows are collected into blocks of about
+BLOCK_SIZE bytes and each block is compressed as:
+
+    length of compressed data | length of original data | compressed data
+
+where the lengths are little endian 32-bit integers. It's the same as the format of
+org.apache.flink.runtime.io.compression.Lz4BlockCompressor which is used on the Java side.
+"""
+import struct
+
+from pyflink.fn_execution import flink_fn_execution_pb2
+
+# the size in bytes of the rows which are compressed as one block
+BLOCK_SIZE = 64 * 1024
+
+_HEADER = struct.Struct("<ii")
+
+
+def check_compression(compression):
+    """
+    Checks that the given compression is supported in the current Python environment.
+    """
+    if compression == flink_fn_execution_pb2.CoderParam.LZ4:
+        try:
+            import lz4.block  # noqa: F401
+        except ImportError:
+            raise RuntimeError("The Python package lz4 is required to use the LZ4 compression "
+                               "of the Python data channel, please install it via "
+                               "`pip install apache-flink[lz4]`.")
+    elif compression != flink_fn_execution_pb2.CoderParam.NONE:
+        raise ValueError("Unsupported compression of the Python data channel: %s." % compression)
+
+
+def compress(data) -> bytes:
+    """
+    Compresses the given bytes-like object as one block.
+    """
+    from lz4.block import compress as lz4_compress
+    compressed = lz4_compress(data, store_size=False)
+    return _HEADER.pack(len(compressed), len(data)) + compressed
+
+
+def decompress(block) -> bytes:
+    """
+    Decompresses the given block which is compressed by compress or the Java operator.
+    """
+    from lz4.block import decompress as lz4_decompress
+    compressed_length, original_length = _HEADER.unpack_from(block)
+    if compressed_length != len(block) - _HEADER.size:
+        raise ValueError("The compressed block is corrupted, expected %d bytes but got %d bytes."
+                         % (compressed_length, len(block) - _HEADER.size))
+    return lz4_decompress(memoryview(block)[_HEADER.size:], uncompressed_size=original_length)
@@ -0,0 +1,45 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import os
+
+PYTHON_WORKER_MEMORY_LIMIT = "_PYTHON_WORKER_MEMORY_LIMIT"
+PYTHON_OUTPUT_FLUSH_SIZE = "_PYTHON_OUTPUT_FLUSH_SIZE"
+
+# the default value of python.fn-execution.output.flush-size
+DEFAULT_OUTPUT_FLUSH_SIZE = 10 * 1024 * 1024
+# the minimum size in bytes of the results which are sent at once
+MIN_OUTPUT_FLUSH_SIZE = 64 * 1024
+# the buffered results use at most 1/MANAGED_MEMORY_FRACTION of the managed memory of the worker,
+# as the managed memory is shared by all the operators and the states cached in the worker
+MANAGED_MEMORY_FRACTION = 16
+
+
+def get_output_flush_size() -> int:
+    """
+    Returns the maximum size in bytes of the results buffered in the Python worker before they are
+    sent to the Java operator. It's the configured python.fn-execution.output.flush-size which is
+    further bounded by the managed memory of the worker if any. It should be called after the
+    environment of the worker is set up.
+    """
+    flush_size = int(os.environ.get(PYTHON_OUTPUT_FLUSH_SIZE, DEFAULT_OUTPUT_FLUSH_SIZE))
+    if flush_size <= 0:
+        flush_size = DEFAULT_OUTPUT_FLUSH_SIZE
+    memory_limit = int(os.environ.get(PYTHON_WORKER_MEMORY_LIMIT, -1))
+    if memory_limit > 0:
+        flush_size = min(flush_size, memory_limit // MANAGED_MEMORY_FRACTION)
+    return max(flush_size, MIN_OUTPUT_FLUSH_SIZE)
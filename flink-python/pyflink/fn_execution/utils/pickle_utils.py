@@ -0,0 +1,118 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+"""
+Pickling with out-of-band buffers (pickle protocol 5, see PEP 574) for the data of
+PickledByteArrayTypeInfo, e.g. the NumPy arrays contained in the records. The buffers which are
+larger than OUT_OF_BAND_THRESHOLD are not copied into the pickled bytes, but are written after
+them in the same length-prefixed value:
+
+    OUT_OF_BAND_MARKER | number of buffers | length of pickled bytes | pickled bytes |
+    (length of buffer | buffer)*
+
+where the lengths and the number of buffers are big endian 32-bit integers. The marker is not a
+valid opcode of pickle, so such values can be distinguished from the values which are pickled in
+band. On decoding, the buffers are views of the decoded value and are not copied again.
+"""
+import os
+import pickle
+import struct
+import sys
+
+PYTHON_PICKLE_OUT_OF_BAND_ENABLED = "_PYTHON_PICKLE_OUT_OF_BAND_ENABLED"
+
+OUT_OF_BAND_MARKER = 0
+# the minimum size in bytes of the buffers pickled out of band
+OUT_OF_BAND_THRESHOLD = 4096
+
+_HEADER = struct.Struct("!Bii")
+_LENGTH = struct.Struct("!i")
+
+
+def is_out_of_band_enabled() -> bool:
+    """
+    Whether the values are pickled with out-of-band buffers, which requires Python 3.8 or later.
+    """
+    return os.environ.get(PYTHON_PICKLE_OUT_OF_BAND_ENABLED, "").lower() == "true" \
+        and sys.version_info >= (3, 8)
+
+
+def dumps_out_of_band(value):
+    """
+    Pickles the value with protocol 5 and returns the pickled bytes and the contiguous memoryviews
+    of the buffers pickled out of band. The pickled bytes should be written as is if there is no
+    such buffer.
+    """
+    buffers = []
+
+    def buffer_callback(buffer):
+        try:
+            view = buffer.raw()
+        except BufferError:
+            # pickles the non-contiguous buffers in band
+            return True
+        if view.nbytes < OUT_OF_BAND_THRESHOLD:
+            return True
+        buffers.append(view)
+        return False
+
+    return pickle.dumps(value, protocol=5, buffer_callback=buffer_callback), buffers
+
+
+def out_of_band_size(pickled_bytes, buffers) -> int:
+    """
+    Returns the size of the value which consists of the pickled bytes and the out-of-band buffers.
+    """
+    return _HEADER.size + len(pickled_bytes) + sum(
+        _LENGTH.size + buffer.nbytes for buffer in buffers)
+
+
+def encode_out_of_band(pickled_bytes, buffers) -> list:
+    """
+    Returns the chunks of the value which consists of the pickled bytes and the out-of-band
+    buffers, excluding the length prefix of the value.
+    """
+    chunks = [_HEADER.pack(OUT_OF_BAND_MARKER, len(buffers), len(pickled_bytes)), pickled_bytes]
+    for buffer in buffers:
+        chunks.append(_LENGTH.pack(buffer.nbytes))
+        chunks.append(buffer)
+    return chunks
+
+
+def loads(data):
+    """
+    Unpickles the value which is pickled either in band or with out-of-band buffers.
+    """
+    if len(data) == 0 or data[0] != OUT_OF_BAND_MARKER:
+        return pickle.loads(data)
+    if sys.version_info < (3, 8):
+        raise RuntimeError("The value is pickled with out-of-band buffers which require "
+                           "Python 3.8 or later.")
+    if isinstance(data, bytes):
+        # the objects reconstructed from the buffers should be writable
+        data = bytearray(data)
+    view = memoryview(data)
+    _, buffers_num, pickled_bytes_length = _HEADER.unpack_from(view)
+    pos = _HEADER.size + pickled_bytes_length
+    pickled_bytes = view[_HEADER.size:pos]
+    buffers = []
+    for _ in range(buffers_num):
+        length = _LENGTH.unpack_from(view, pos)[0]
+        pos += _LENGTH.size
+        buffers.append(view[pos:pos + length])
+        pos += length
+    return pickle.loads(pickled_bytes, buffers=buffers)
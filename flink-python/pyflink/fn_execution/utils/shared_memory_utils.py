@@ -0,0 +1,134 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+"""
+Exchange of the blocks of data between the Java operator and the Python worker via memory mapped
+files, which is negotiated via CoderParam.shared_memory_path. There is one file for each direction
+and the file is only written by one side:
+
+    write position | blocks
+
+where the write position is a little endian 64-bit integer. The writer appends a block after the
+write position and only sends a reference to it via gRPC. The Java operator resets the write
+positions of both files at the start of each bundle, as all the blocks of the previous bundle have
+been consumed by then. A block which doesn't fit into the remaining space is sent via gRPC as is.
+So each block is sent via gRPC as one element of either:
+
+    INLINE | block
+    SHARED_MEMORY | offset | length
+
+where the offset and the length are little endian 32-bit integers. It's the same as the format of
+org.apache.flink.streaming.api.runners.python.beam.PythonSharedMemory.
+
+Each file is mapped once per worker by open_shared_memory, and it's unmapped by
+close_shared_memory when the operation which exchanges data via it is torn down, as the memory of
+a deleted file is only released once it's no longer mapped by any process.
+"""
+import mmap
+import struct
+import threading
+
+INLINE = 0
+SHARED_MEMORY = 1
+
+HEADER_LENGTH = 8
+
+_POSITION = struct.Struct("<q")
+_REFERENCE = struct.Struct("<Bii")
+
+# the files mapped by this worker
+_shared_memories = {}
+_shared_memories_lock = threading.Lock()
+
+
+def open_shared_memory(path) -> 'SharedMemory':
+    """
+    Returns the mapping of the given file, which is shared by the coders of the same file.
+    """
+    with _shared_memories_lock:
+        shared_memory = _shared_memories.get(path)
+        if shared_memory is None:
+            shared_memory = _shared_memories[path] = SharedMemory(path)
+        return shared_memory
+
+
+def close_shared_memory(path):
+    """
+    Unmaps the given file if it has been mapped by open_shared_memory.
+    """
+    with _shared_memories_lock:
+        shared_memory = _shared_memories.pop(path, None)
+    if shared_memory is not None:
+        shared_memory.close()
+
+
+class SharedMemory(object):
+    """
+    A memory mapped file created by the Java operator.
+    """
+
+    def __init__(self, path):
+        with open(path, "r+b") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0)
+        self._view = memoryview(self._mmap)
+        self._size = len(self._mmap)
+
+    def write_block(self, block) -> bytes:
+        """
+        Appends the block to this file if there is enough space and returns the element which
+        should be sent via gRPC.
+        """
+        position = max(_POSITION.unpack_from(self._mmap, 0)[0], HEADER_LENGTH)
+        length = len(block)
+        if position + length > self._size:
+            return bytes([INLINE]) + block
+        self._view[position:position + length] = block
+        _POSITION.pack_into(self._mmap, 0, position + length)
+        return _REFERENCE.pack(SHARED_MEMORY, position, length)
+
+    def read_block(self, element):
+        """
+        Returns the block of the element received via gRPC, it's a view of this file if the block
+        is written to this file.
+        """
+        reference = self.reference(element)
+        if reference is None:
+            return memoryview(element)[1:]
+        return self.view(*reference)
+
+    def view(self, offset, length):
+        """
+        Returns the view of the given range of this file.
+        """
+        return self._view[offset:offset + length]
+
+    def close(self):
+        """
+        Unmaps the file. The views of the file returned before must not be used any more.
+        """
+        self._view.release()
+        self._mmap.close()
+
+    @staticmethod
+    def reference(element):
+        """
+        Returns the offset and the length of the block if the element received via gRPC references
+        a block written to the file, otherwise None.
+        """
+        if element[0] == INLINE:
+            return None
+        return _REFERENCE.unpack(element)[1:]
@@ -0,0 +1,120 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import numpy as np
+import pandas as pd
+
+
+def reduce_windows(series: pd.Series, reduction: str, starts: np.ndarray, ends: np.ndarray):
+    """
+    Evaluates the reduction for each window [starts[i], ends[i]) of the series with cumulative
+    and sliding kernels. The results are the same as calling the corresponding method of
+    pd.Series on each window, e.g. `series.iloc[start:end].sum()`, i.e. the null values are
+    skipped.
+
+    :param series: The input column of the partition.
+    :param reduction: One of sum, mean, min, max and count.
+    :param starts: The inclusive start offsets of the windows, non-decreasing.
+    :param ends: The exclusive end offsets of the windows, non-decreasing and not less than the
+                 starts.
+    :return: The results as a pd.Series or None if the series is not numeric, in which case the
+             reduction should be evaluated per window.
+    """
+    if pd.api.types.is_integer_dtype(series.dtype):
+        values = series.to_numpy(dtype=np.int64)
+        valid = None
+    elif pd.api.types.is_float_dtype(series.dtype):
+        values = series.to_numpy()
+        valid = ~np.isnan(values)
+    else:
+        return None
+
+    if reduction in ('sum', 'mean', 'count'):
+        counts = _window_sums(np.ones(len(values), dtype=np.int64) if valid is None
+                              else valid.astype(np.int64), starts, ends)
+        if reduction == 'count':
+            return pd.Series(counts)
+        sums = _window_sums(values if valid is None else np.where(valid, values, 0.0),
+                            starts, ends)
+        if reduction == 'sum':
+            return pd.Series(sums)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return pd.Series(np.where(counts > 0, sums / np.maximum(counts, 1), np.nan))
+    elif reduction == 'min':
+        return pd.Series(_window_extremes(values, starts, ends, np.fmin))
+    elif reduction == 'max':
+        return pd.Series(_window_extremes(values, starts, ends, np.fmax))
+    else:
+        raise ValueError("Unsupported reduction %s." % reduction)
+
+
+def _window_sums(values, starts, ends):
+    if values.dtype.kind in 'iu':
+        # the sum of a window is the difference of the prefix sums of its boundaries, which is
+        # exact for integers
+        prefix_sums = np.concatenate((np.zeros(1, dtype=values.dtype), np.cumsum(values)))
+        return prefix_sums[ends] - prefix_sums[starts]
+    # the difference of the prefix sums of floats loses the small values after the large ones and
+    # turns every window after a non-finite value into NaN, so each window is summed on its own
+    if len(starts) == 0:
+        return np.zeros(0, dtype=values.dtype)
+    # reduceat sums values[starts[i]:ends[i]] at the even positions, the appended zero makes the
+    # ends which are equal to the length of the values valid indices
+    indices = np.stack((starts, ends), axis=1).ravel()
+    sums = np.add.reduceat(np.append(values, values.dtype.type(0)), indices)[::2]
+    # reduceat returns values[starts[i]] for the empty windows
+    sums[starts >= ends] = 0
+    return sums
+
+
+def _window_extremes(values, starts, ends, ufunc):
+    lengths = ends - starts
+    non_empty = lengths > 0
+    if non_empty.all():
+        results = np.empty(len(starts), dtype=values.dtype)
+    else:
+        # the extreme of an empty window is null
+        results = np.full(len(starts), np.nan)
+    if not non_empty.any():
+        return results
+    starts = starts[non_empty]
+    ends = ends[non_empty]
+    lengths = lengths[non_empty]
+    if (starts == 0).all():
+        # expanding windows
+        results[non_empty] = ufunc.accumulate(values)[ends - 1]
+    elif (ends == len(values)).all():
+        # shrinking windows
+        results[non_empty] = ufunc.accumulate(values[::-1])[::-1][starts]
+    else:
+        # sliding windows: levels[k][i] is the extreme of values[i: i + 2^k], the extreme of a
+        # window is that of the two overlapping ranges of length 2^k which cover it
+        levels = [values]
+        width = 1
+        max_length = lengths.max()
+        while width * 2 <= max_length:
+            previous = levels[-1]
+            levels.append(ufunc(previous[:-width], previous[width:]))
+            width *= 2
+        level_indexes = np.floor(np.log2(lengths)).astype(np.int64)
+        extremes = np.empty(len(starts), dtype=values.dtype)
+        for level_index in np.unique(level_indexes):
+            mask = level_indexes == level_index
+            level = levels[level_index]
+            extremes[mask] = ufunc(level[starts[mask]], level[ends[mask] - (1 << level_index)])
+        results[non_empty] = extremes
+    return results
@@ -33,10 +33,11 @@ from pyflink.datastream.timerservice import InternalTimerServiceImpl
 from pyflink.fn_execution.state_data_view import DataViewSpec, ListViewSpec, MapViewSpec, \
     PerWindowStateDataViewStore
 from pyflink.fn_execution.state_impl import RemoteKeyedStateBackend
-from pyflink.fn_execution.window_assigner import WindowAssigner
+from pyflink.fn_execution.window_assigner import WindowAssigner, PanedWindowAssigner, \
+    MergingWindowAssigner
 from pyflink.fn_execution.window_context import WindowContext, TriggerContext, K, W
 from pyflink.fn_execution.window_process_function import GeneralWindowProcessFunction, \
-    InternalWindowProcessFunction
+    InternalWindowProcessFunction, PanedWindowProcessFunction, MergingWindowProcessFunction
 from pyflink.fn_execution.window_trigger import Trigger
 from pyflink.table.udf import ImperativeAggregateFunction
 
@@ -69,7 +70,7 @@ cdef class NamespaceAggsHandleFunctionBase:
         :param input_data: Input values bundled in a List.
         """
 
-    cdef void merge(self, object namespace, list accumulators):
+    cpdef void merge(self, object namespace, list accumulators):
         """
         Merges the other accumulators into current accumulators.
         """
@@ -81,7 +82,7 @@ cdef class NamespaceAggsHandleFunctionBase:
         """
         pass
 
-    cdef list get_accumulators(self):
+    cpdef list get_accumulators(self):
         """
         Gets the current accumulators (saved in a list) which contains the current
         aggregated results.
@@ -258,7 +259,7 @@ cdef class SimpleNamespaceAggsHandleFunction(NamespaceAggsHandleFunction):
                 continue
             self._udfs[i].retract(self._accumulators[i], *args)
 
-    cdef void merge(self, object namespace, list accumulators):
+    cpdef void merge(self, object namespace, list accumulators):
         cdef size_t i
         if self._udf_data_views:
             for i in range(len(self._udf_data_views)):
@@ -277,7 +278,7 @@ cdef class SimpleNamespaceAggsHandleFunction(NamespaceAggsHandleFunction):
                     accumulators[i][index] = data_view
         self._accumulators = accumulators
 
-    cdef list get_accumulators(self):
+    cpdef list get_accumulators(self):
         return self._accumulators
 
     cpdef list create_accumulators(self):
@@ -341,8 +342,15 @@ cdef class GroupWindowAggFunctionBase:
         self._window_aggregator.open(
             PerWindowStateDataViewStore(function_context, self._state_backend))
 
-        self._window_function = GeneralWindowProcessFunction(
-            self._allowed_lateness, self._window_assigner, self._window_aggregator)
+        if isinstance(self._window_assigner, MergingWindowAssigner):
+            self._window_function = MergingWindowProcessFunction(
+                self._allowed_lateness, self._window_assigner, self._window_aggregator)
+        elif isinstance(self._window_assigner, PanedWindowAssigner):
+            self._window_function = PanedWindowProcessFunction(
+                self._allowed_lateness, self._window_assigner, self._window_aggregator)
+        else:
+            self._window_function = GeneralWindowProcessFunction(
+                self._allowed_lateness, self._window_assigner, self._window_aggregator)
         self._trigger_context = TriggerContext(
             self._trigger, self._internal_timer_service, self._state_backend)
         self._trigger_context.open()
@@ -440,6 +448,7 @@ cdef class GroupWindowAggFunctionBase:
         timers = []
         for timer in self._internal_timer_service.timers:
             timers.append(timer)
+        self._internal_timer_service.timers.clear()
         return timers
 
     cpdef void close(self):
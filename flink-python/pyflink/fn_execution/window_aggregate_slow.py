@@ -28,10 +28,11 @@ from pyflink.fn_execution.aggregate_slow import DistinctViewDescriptor, RowKeySe
 from pyflink.fn_execution.state_data_view import DataViewSpec, ListViewSpec, MapViewSpec, \
     PerWindowStateDataViewStore
 from pyflink.fn_execution.state_impl import RemoteKeyedStateBackend
-from pyflink.fn_execution.window_assigner import WindowAssigner
+from pyflink.fn_execution.window_assigner import WindowAssigner, PanedWindowAssigner, \
+    MergingWindowAssigner
 from pyflink.fn_execution.window_context import WindowContext, TriggerContext, K, W
 from pyflink.fn_execution.window_process_function import GeneralWindowProcessFunction, \
-    InternalWindowProcessFunction
+    InternalWindowProcessFunction, PanedWindowProcessFunction, MergingWindowProcessFunction
 from pyflink.fn_execution.window_trigger import Trigger
 from pyflink.table.udf import ImperativeAggregateFunction, FunctionContext
 
@@ -311,8 +312,15 @@ class GroupWindowAggFunctionBase(Generic[K, W]):
         self._window_aggregator.open(
             PerWindowStateDataViewStore(function_context, self._state_backend))
 
-        self._window_function = GeneralWindowProcessFunction(
-            self._allowed_lateness, self._window_assigner, self._window_aggregator)
+        if isinstance(self._window_assigner, MergingWindowAssigner):
+            self._window_function = MergingWindowProcessFunction(
+                self._allowed_lateness, self._window_assigner, self._window_aggregator)
+        elif isinstance(self._window_assigner, PanedWindowAssigner):
+            self._window_function = PanedWindowProcessFunction(
+                self._allowed_lateness, self._window_assigner, self._window_aggregator)
+        else:
+            self._window_function = GeneralWindowProcessFunction(
+                self._allowed_lateness, self._window_assigner, self._window_aggregator)
         self._trigger_context = TriggerContext(
             self._trigger, self._internal_timer_service, self._state_backend)
         self._trigger_context.open()
@@ -398,6 +406,7 @@ class GroupWindowAggFunctionBase(Generic[K, W]):
         timers = []
         for timer in self._internal_timer_service.timers:
             timers.append(timer)
+        self._internal_timer_service.timers.clear()
         return timers
 
     def close(self):
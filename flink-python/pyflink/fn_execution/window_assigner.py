@@ -15,8 +15,10 @@
 #  See the License for the specific language governing permissions and
 # limitations under the License.
 ################################################################################
+import math
 from abc import ABC, abstractmethod
-from typing import Generic, List, Any, Iterable
+from bisect import bisect_left, bisect_right
+from typing import Generic, List, Any, Iterable, Set
 
 from pyflink.common.typeinfo import Types
 from pyflink.datastream.state import ValueStateDescriptor, ValueState
@@ -58,6 +60,62 @@ class WindowAssigner(Generic[W], ABC):
         pass
 
 
+class PanedWindowAssigner(WindowAssigner[W], ABC):
+    """
+    A WindowAssigner that window can be split into panes.
+    """
+
+    @abstractmethod
+    def assign_pane(self, element, timestamp: int) -> W:
+        """
+        Given the timestamp and element, returns the pane into which it should be placed.
+
+        :param element: The element to which windows should be assigned.
+        :param timestamp: The timestamp of the element when {@link #isEventTime()} returns true, or
+            the current system time when {@link #isEventTime()} returns false.
+        """
+        pass
+
+    @abstractmethod
+    def split_into_panes(self, window: W) -> Iterable[W]:
+        """
+        Splits the given window into panes collection.
+
+        :param window: The window to be split.
+        :return: The panes of the given window.
+        """
+        pass
+
+    @abstractmethod
+    def get_last_window(self, pane: W) -> W:
+        """
+        Gets the last window which the pane belongs to.
+
+        :param pane: The pane.
+        :return: The last window which the pane belongs to.
+        """
+        pass
+
+
+class MergingWindowAssigner(WindowAssigner[W], ABC):
+    """
+    A WindowAssigner that can merge windows.
+    """
+
+    @abstractmethod
+    def merge_windows(self, new_window: W, sorted_windows: List[W], merge_callback):
+        """
+        Determines which windows (if any) should be merged.
+
+        :param new_window: The new window.
+        :param sorted_windows: The sorted window candidates.
+        :param merge_callback: A callback that can be invoked to signal which windows should be
+            merged. It is called with the merge result and the set of the windows which are
+            merged into it.
+        """
+        pass
+
+
 class TumblingWindowAssigner(WindowAssigner[TimeWindow]):
     """
     A WindowAssigner that windows elements into fixed-size windows based on the timestamp of
@@ -109,3 +167,133 @@ class CountTumblingWindowAssigner(WindowAssigner[CountWindow]):
 
     def __repr__(self):
         return "CountTumblingWindow(%s)" % self._size
+
+
+class SlidingWindowAssigner(PanedWindowAssigner[TimeWindow]):
+    """
+    A WindowAssigner that windows elements into sliding windows based on the timestamp of the
+    elements. Windows can possibly overlap.
+
+    Each element is only placed into one pane whose size is the greatest common divisor of the
+    window size and the window slide. The panes which make up a window are merged when the window
+    fires, so that an element is accumulated only once no matter how many windows it belongs to.
+    """
+
+    def __init__(self, size: int, slide: int, offset: int, is_event_time: bool):
+        self._size = size
+        self._slide = slide
+        self._offset = offset
+        self._is_event_time = is_event_time
+        self._pane_size = math.gcd(size, slide)
+        self._num_panes_per_window = size // self._pane_size
+
+    def assign_pane(self, element, timestamp: int) -> TimeWindow:
+        start = TimeWindow.get_window_start_with_offset(timestamp, self._offset, self._pane_size)
+        return TimeWindow(start, start + self._pane_size)
+
+    def split_into_panes(self, window: TimeWindow) -> Iterable[TimeWindow]:
+        start = window.start
+        for i in range(self._num_panes_per_window):
+            yield TimeWindow(start, start + self._pane_size)
+            start += self._pane_size
+
+    def get_last_window(self, pane: TimeWindow) -> TimeWindow:
+        last_start = TimeWindow.get_window_start_with_offset(pane.start, self._offset, self._slide)
+        return TimeWindow(last_start, last_start + self._size)
+
+    def assign_windows(self, element: List, timestamp: int) -> Iterable[TimeWindow]:
+        last_start = TimeWindow.get_window_start_with_offset(timestamp, self._offset, self._slide)
+        windows = [TimeWindow(start, start + self._size)
+                   for start in range(last_start, timestamp - self._size, -self._slide)]
+        return windows
+
+    def is_event_time(self) -> bool:
+        return self._is_event_time
+
+    def __repr__(self):
+        return "SlidingWindow(%s, %s)" % (self._size, self._slide)
+
+
+class CountSlidingWindowAssigner(WindowAssigner[CountWindow]):
+    """
+    A WindowAssigner that windows elements into sliding windows based on the count number of
+    the elements. Windows can possibly overlap.
+    """
+
+    def __init__(self, size: int, slide: int):
+        self._size = size
+        self._slide = slide
+        self._count = None  # type: ValueState
+
+    def open(self, ctx: Context[Any, CountWindow]):
+        count_descriptor = ValueStateDescriptor('slide-count-assigner', Types.LONG())
+        self._count = ctx.get_partitioned_state(count_descriptor)
+
+    def assign_windows(self, element: List, timestamp: int) -> Iterable[CountWindow]:
+        count_value = self._count.value()
+        if count_value is None:
+            current_count = 0
+        else:
+            current_count = count_value
+        self._count.update(current_count + 1)
+        last_id = current_count // self._slide
+        last_start = last_id * self._slide
+        last_end = last_start + self._size - 1
+        windows = []
+        while last_id >= 0 and last_start <= current_count <= last_end:
+            windows.append(CountWindow(last_id))
+            last_id -= 1
+            last_start -= self._slide
+            last_end -= self._slide
+        return windows
+
+    def is_event_time(self) -> bool:
+        return False
+
+    def __repr__(self):
+        return "CountSlidingWindow(%s, %s)" % (self._size, self._slide)
+
+
+class SessionWindowAssigner(MergingWindowAssigner[TimeWindow]):
+    """
+    WindowAssigner that windows elements into sessions based on the timestamp. Windows cannot
+    overlap.
+    """
+
+    def __init__(self, session_gap: int, is_event_time: bool):
+        self._session_gap = session_gap
+        self._is_event_time = is_event_time
+
+    def merge_windows(self, new_window: TimeWindow, sorted_windows: List[TimeWindow],
+                      merge_callback):
+        ceiling_index = bisect_left(sorted_windows, new_window)
+        floor_index = bisect_right(sorted_windows, new_window) - 1
+        merged_windows = set()  # type: Set[TimeWindow]
+        merge_result = new_window
+        if ceiling_index < len(sorted_windows):
+            merge_result = self._merge_window(
+                merge_result, sorted_windows[ceiling_index], merged_windows)
+        if floor_index >= 0:
+            merge_result = self._merge_window(
+                merge_result, sorted_windows[floor_index], merged_windows)
+        if merged_windows:
+            # merge happens, add new_window into the collection as well.
+            merged_windows.add(new_window)
+            merge_callback(merge_result, merged_windows)
+
+    def assign_windows(self, element: List, timestamp: int) -> Iterable[TimeWindow]:
+        return [TimeWindow(timestamp, timestamp + self._session_gap)]
+
+    def is_event_time(self) -> bool:
+        return self._is_event_time
+
+    @staticmethod
+    def _merge_window(cur_window: TimeWindow, other: TimeWindow, merged_windows: Set[TimeWindow]):
+        if cur_window.intersects(other):
+            merged_windows.add(other)
+            return cur_window.cover(other)
+        else:
+            return cur_window
+
+    def __repr__(self):
+        return "SessionWindow(%s)" % self._session_gap
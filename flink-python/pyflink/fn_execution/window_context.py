@@ -239,7 +239,7 @@ class TriggerContext(object):
         return state
 
     def merge_partitioned_state(self, state_descriptor: StateDescriptor):
-        if not self.merged_windows:
+        if self.merged_windows:
             state = self.get_partitioned_state(state_descriptor)
             if isinstance(state, InternalMergingState):
                 state.merge_namespaces(self.window, self.merged_windows)
@@ -17,10 +17,14 @@
 ################################################################################
 import sys
 from abc import abstractmethod, ABC
-from typing import Generic, List
+from typing import Generic, List, Iterable
 
 from pyflink.common import Row
-from pyflink.fn_execution.window_assigner import WindowAssigner
+from pyflink.common.typeinfo import Types
+from pyflink.datastream.state import MapStateDescriptor
+from pyflink.fn_execution.merging_window_set import MergingWindowSet
+from pyflink.fn_execution.window_assigner import WindowAssigner, PanedWindowAssigner, \
+    MergingWindowAssigner
 from pyflink.fn_execution.window_context import Context, K, W
 
 MAX_LONG_VALUE = sys.maxsize
@@ -152,3 +156,164 @@ class GeneralWindowProcessFunction(InternalWindowProcessFunction[K, W]):
             self._ctx.clear_window_state(window)
             self._window_aggregator.cleanup(window)
             self._ctx.clear_trigger(window)
+
+
+class PanedWindowProcessFunction(InternalWindowProcessFunction[K, W]):
+    """
+    The implementation of InternalWindowProcessFunction for PanedWindowAssigner.
+    """
+
+    def __init__(self,
+                 allowed_lateness: int,
+                 window_assigner: PanedWindowAssigner[W],
+                 window_aggregator):
+        super(PanedWindowProcessFunction, self).__init__(
+            allowed_lateness, window_assigner, window_aggregator)
+        self._window_assigner = window_assigner
+
+    def assign_state_namespace(self, input_row: List, timestamp: int) -> List[W]:
+        pane = self._window_assigner.assign_pane(input_row, timestamp)
+        if not self._is_pane_late(pane):
+            return [pane]
+        else:
+            return []
+
+    def assign_actual_windows(self, input_row: List, timestamp: int) -> List[W]:
+        element_windows = self._window_assigner.assign_windows(input_row, timestamp)
+        actual_windows = []
+        for window in element_windows:
+            if not self.is_window_late(window):
+                actual_windows.append(window)
+        return actual_windows
+
+    def prepare_aggregate_accumulator_for_emit(self, window: W):
+        panes = self._window_assigner.split_into_panes(window)
+        acc = self._window_aggregator.create_accumulators()
+        # null namespace means use heap data views
+        self._window_aggregator.set_accumulators(None, acc)
+        for pane in panes:
+            pane_acc = self._ctx.get_window_accumulators(pane)
+            if pane_acc is not None:
+                self._window_aggregator.merge(pane, pane_acc)
+
+    def clean_window_if_needed(self, window: W, current_time: int):
+        if self.is_cleanup_time(window, current_time):
+            panes = self._window_assigner.split_into_panes(window)
+            for pane in panes:
+                # a pane is shared by several windows, it could only be cleared when the last
+                # window it belongs to is cleared
+                last_window = self._window_assigner.get_last_window(pane)
+                if window == last_window:
+                    self._ctx.clear_window_state(pane)
+                    self._window_aggregator.cleanup(pane)
+            self._ctx.clear_trigger(window)
+            self._ctx.delete_cleanup_timer(window)
+
+    def _is_pane_late(self, pane: W):
+        # whether the pane is late depends on the last window which the pane is belongs to is late
+        return self._window_assigner.is_event_time() and \
+            self.is_window_late(self._window_assigner.get_last_window(pane))
+
+
+class MergingWindowProcessFunction(InternalWindowProcessFunction[K, W]):
+    """
+    The implementation of InternalWindowProcessFunction for MergingWindowAssigner.
+    """
+
+    def __init__(self,
+                 allowed_lateness: int,
+                 window_assigner: MergingWindowAssigner[W],
+                 window_aggregator):
+        super(MergingWindowProcessFunction, self).__init__(
+            allowed_lateness, window_assigner, window_aggregator)
+        self._window_assigner = window_assigner
+        self._reuse_actual_windows = None  # type: List[W]
+        self._merging_windows = None  # type: MergingWindowSet[K, W]
+
+    def open(self, ctx: Context[K, W]):
+        super(MergingWindowProcessFunction, self).open(ctx)
+        mapping_state_descriptor = MapStateDescriptor(
+            'session-window-mapping', Types.PICKLED_BYTE_ARRAY(), Types.PICKLED_BYTE_ARRAY())
+        window_mapping = self._ctx.get_partitioned_state(mapping_state_descriptor)
+        self._merging_windows = MergingWindowSet(self._window_assigner, window_mapping)
+
+    def assign_state_namespace(self, input_row: List, timestamp: int) -> List[W]:
+        element_windows = self._window_assigner.assign_windows(input_row, timestamp)
+        self._merging_windows.initialize_cache(self._ctx.current_key())
+        self._reuse_actual_windows = []
+        for window in element_windows:
+            # adding the new window might result in a merge, in that case the actual_window
+            # is the merged window and we work with that. If we don't merge then
+            # actual_window == window
+            actual_window = self._merging_windows.add_window(window, self._merge)
+
+            # drop if the window is already late
+            if self.is_window_late(actual_window):
+                self._merging_windows.retire_window(actual_window)
+            else:
+                self._reuse_actual_windows.append(actual_window)
+
+        affected_windows = [self._merging_windows.get_state_window(actual)
+                            for actual in self._reuse_actual_windows]
+        return affected_windows
+
+    def assign_actual_windows(self, input_row: List, timestamp: int) -> List[W]:
+        # the actual windows is calculated in assign_state_namespace
+        return self._reuse_actual_windows
+
+    def prepare_aggregate_accumulator_for_emit(self, window: W):
+        # the window is emitted when a timer fires, the cache may belong to another key then
+        self._merging_windows.initialize_cache(self._ctx.current_key())
+        state_window = self._merging_windows.get_state_window(window)
+        acc = self._ctx.get_window_accumulators(state_window)
+        if acc is None:
+            acc = self._window_aggregator.create_accumulators()
+        self._window_aggregator.set_accumulators(state_window, acc)
+
+    def clean_window_if_needed(self, window: W, current_time: int):
+        if self.is_cleanup_time(window, current_time):
+            self._ctx.clear_trigger(window)
+            self._merging_windows.initialize_cache(self._ctx.current_key())
+            state_window = self._merging_windows.get_state_window(window)
+            self._ctx.clear_window_state(state_window)
+            self._window_aggregator.cleanup(state_window)
+            # retire expired window
+            self._merging_windows.retire_window(window)
+
+    def _merge(self, merge_result: W, merged_windows: Iterable[W], state_window_result: W,
+               state_windows_to_be_merged: Iterable[W]):
+        if self._window_assigner.is_event_time() and \
+                merge_result.max_timestamp() + self._allowed_lateness <= \
+                self._ctx.current_watermark():
+            raise Exception("The end timestamp of an event-time window cannot become earlier "
+                            "than the current watermark by merging. Current watermark: %d "
+                            "window: %s" % (self._ctx.current_watermark(), merge_result))
+        elif not self._window_assigner.is_event_time() and \
+                merge_result.max_timestamp() <= self._ctx.current_processing_time():
+            raise Exception("The end timestamp of a processing-time window cannot become earlier "
+                            "than the current processing time by merging. Current processing "
+                            "time: %d window: %s"
+                            % (self._ctx.current_processing_time(), merge_result))
+
+        self._ctx.on_merge(merge_result, merged_windows)
+
+        # clear registered timers
+        for window in merged_windows:
+            self._ctx.clear_trigger(window)
+            self._ctx.delete_cleanup_timer(window)
+
+        # merge the merged state windows into the newly resulting state window
+        if state_windows_to_be_merged:
+            target_acc = self._ctx.get_window_accumulators(state_window_result)
+            if target_acc is None:
+                target_acc = self._window_aggregator.create_accumulators()
+            self._window_aggregator.set_accumulators(state_window_result, target_acc)
+            for window in state_windows_to_be_merged:
+                acc = self._ctx.get_window_accumulators(window)
+                if acc is not None:
+                    self._window_aggregator.merge(window, acc)
+                # clear merged window
+                self._ctx.clear_window_state(window)
+                self._window_aggregator.cleanup(window)
+            target_acc = self._window_aggregator.get_accumulators()
+            self._ctx.set_window_accumulators(state_window_result, target_acc)
@@ -15,11 +15,14 @@
 #  See the License for the specific language governing permissions and
 # limitations under the License.
 ################################################################################
+import hashlib
 import importlib
 import os
+import secrets
 import shlex
 import shutil
 import struct
+import sys
 import tempfile
 import time
 from logging import WARN
@@ -30,9 +33,20 @@ from py4j.java_gateway import (java_import, logger, JavaGateway, GatewayParamete
 from pyflink.pyflink_gateway_server import launch_gateway_server_process
 from pyflink.util.exceptions import install_exception_handler, install_py4j_hooks
 
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+
 _gateway = None
 _lock = RLock()
 
+# the seconds after which a standby gateway daemon which hasn't written its info file is
+# considered to have failed, see connect_gateway_daemon
+_GATEWAY_DAEMON_LAUNCH_TIMEOUT = 60
+_VOLATILE_ENVIRONMENT_VARIABLES = {"_", "OLDPWD", "PWD", "SHLVL", "_PYFLINK_CONN_INFO_PATH"}
+
 
 def is_launch_gateway_disabled():
     if "PYFLINK_GATEWAY_DISABLED" in os.environ \
@@ -58,6 +72,8 @@ def get_gateway():
                     gateway_parameters=gateway_param,
                     callback_server_parameters=CallbackServerParameters(
                         port=0, daemonize=True, daemonize_connections=True))
+            elif is_gateway_daemon_enabled():
+                _gateway = connect_gateway_daemon()
             else:
                 _gateway = launch_gateway()
 
@@ -82,17 +98,157 @@ def launch_gateway():
     """
     launch jvm gateway
     """
+    _check_launch_gateway_enabled()
+    return _connect_gateway(*_launch_gateway_server())
+
+
+def is_gateway_daemon_enabled():
+    if "PYFLINK_GATEWAY_DAEMON" in os.environ \
+            and os.environ["PYFLINK_GATEWAY_DAEMON"].lower() not in ["0", "false", ""]:
+        # the daemons are discovered with file locks which are only supported on POSIX systems
+        return fcntl is not None
+    else:
+        return False
+
+
+def connect_gateway_daemon():
+    # type: () -> JavaGateway
+    """
+    Connects to the standby gateway daemon which has been launched by a previous Python process
+    with the same environment variables and working directory, and launches a new standby daemon
+    for the next Python process. It falls back to :func:`launch_gateway` if there is no standby
+    daemon, e.g. for the first Python process.
+
+    A daemon only serves the Python process which takes it and exits with that process, so that no
+    state, e.g. the running jobs or the jars loaded by the process, is shared between the Python
+    processes. A standby daemon exits after it has not been taken for
+    PYFLINK_GATEWAY_DAEMON_IDLE_TIMEOUT seconds (600 by default). The clients of a daemon have to
+    authenticate with the token in its info file, which is only readable by the owner.
+
+    The daemons are kept in the directory PYFLINK_GATEWAY_DAEMON_DIR, which is a directory in the
+    temporary directory by default.
+    """
+    _check_launch_gateway_enabled()
+    daemon_dir = os.environ.get(
+        "PYFLINK_GATEWAY_DAEMON_DIR",
+        os.path.join(tempfile.gettempdir(), "pyflink-gateway-daemons-%d" % os.getuid()))
+    os.makedirs(daemon_dir, mode=0o700, exist_ok=True)
+    path_prefix = os.path.join(daemon_dir, _gateway_daemon_key())
+    with open(path_prefix + ".lock", "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        daemon_info = _take_gateway_daemon(path_prefix)
+        _launch_gateway_daemon(path_prefix)
+    if daemon_info is not None:
+        gateway = _connect_gateway_daemon(*daemon_info)
+        if gateway is not None:
+            return gateway
+    return launch_gateway()
+
+
+def _take_gateway_daemon(path_prefix):
+    """
+    Takes the standby daemon by deleting its info file, after which the daemon waits for the
+    current Python process only. Returns the port and the authentication token of the daemon, or
+    None if there is no standby daemon. It must be called with the lock of the daemons held.
+    """
+    info_file = path_prefix + ".info"
+    try:
+        with open(info_file, "rb") as info:
+            content = info.read()
+        # the daemon deletes the info file as well when it exits after the idle timeout, only one
+        # of the deletions succeeds
+        os.unlink(info_file)
+    except FileNotFoundError:
+        return None
+    _remove_file(path_prefix + ".pending")
+    gateway_port = struct.unpack("!I", content[:4])[0]
+    return gateway_port, content[8:].decode("utf-8")
+
+
+def _launch_gateway_daemon(path_prefix):
+    """
+    Launches a standby daemon for the next Python process unless there is one already or one is
+    being launched. The daemon writes its info file itself once it's ready. It must be called with
+    the lock of the daemons held.
+    """
+    pending_file = path_prefix + ".pending"
+    if os.path.isfile(path_prefix + ".info"):
+        return
+    try:
+        if time.time() - os.path.getmtime(pending_file) < _GATEWAY_DAEMON_LAUNCH_TIMEOUT:
+            return
+    except FileNotFoundError:
+        pass
+    with open(pending_file, "w"):
+        pass
+    idle_timeout = float(os.environ.get("PYFLINK_GATEWAY_DAEMON_IDLE_TIMEOUT", "600"))
+    env = dict(os.environ)
+    env["_PYFLINK_CONN_INFO_PATH"] = path_prefix + ".info"
+    env["_PYFLINK_GATEWAY_AUTH_TOKEN"] = secrets.token_hex(32)
+    env["_PYFLINK_GATEWAY_DAEMON_IDLE_TIMEOUT"] = str(int(idle_timeout * 1000))
+    launch_gateway_server_process(env, _gateway_server_args(), path_prefix + ".log")
+
+
+def _connect_gateway_daemon(gateway_port, auth_token):
+    """
+    Connects to the daemon which has been taken and checks whether it's still alive. Returns None
+    if the daemon has exited in the meantime.
+    """
+    gateway = None
+    try:
+        gateway = _connect_gateway(gateway_port, auth_token)
+        gateway.jvm.java.lang.System.currentTimeMillis()
+        return gateway
+    except Exception:
+        if gateway is not None:
+            try:
+                gateway.shutdown()
+            except Exception:
+                pass
+        return None
+
+
+def _remove_file(path):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _gateway_daemon_key():
+    """
+    The daemons are only shared by the Python processes with the same environment, as the
+    environment and the working directory are inherited by the daemon and the Python workers
+    launched by it.
+    """
+    env = sorted((k, v) for k, v in os.environ.items()
+                 if k not in _VOLATILE_ENVIRONMENT_VARIABLES
+                 and not k.startswith("PYFLINK_GATEWAY_DAEMON"))
+    content = repr((os.getcwd(), sys.executable, os.path.abspath(__file__), env))
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+def _check_launch_gateway_enabled():
     if is_launch_gateway_disabled():
         raise Exception("It's launching the PythonGatewayServer during Python UDF execution "
                         "which is unexpected. It usually happens when the job codes are "
                         "in the top level of the Python script file and are not enclosed in a "
                         "`if name == 'main'` statement.")
 
+
+def _gateway_server_args():
     args = ['-c', 'org.apache.flink.client.python.PythonGatewayServer']
 
     submit_args = os.environ.get("SUBMIT_ARGS", "local")
     args += shlex.split(submit_args)
+    return args
 
+
+def _launch_gateway_server():
+    """
+    Launches the gateway server process and returns the port and the authentication token of the
+    gateway server.
+    """
     # Create a temporary directory where the gateway server should write the connection information.
     conn_info_dir = tempfile.mkdtemp()
     try:
@@ -100,10 +256,12 @@ def launch_gateway():
         os.close(fd)
         os.unlink(conn_info_file)
 
+        auth_token = secrets.token_hex(32)
         env = dict(os.environ)
         env["_PYFLINK_CONN_INFO_PATH"] = conn_info_file
+        env["_PYFLINK_GATEWAY_AUTH_TOKEN"] = auth_token
 
-        p = launch_gateway_server_process(env, args)
+        p = launch_gateway_server_process(env, _gateway_server_args())
 
         while not p.poll() and not os.path.isfile(conn_info_file):
             time.sleep(0.1)
@@ -112,18 +270,18 @@ def launch_gateway():
             raise Exception("Java gateway process exited before sending its port number")
 
         with open(conn_info_file, "rb") as info:
-            gateway_port = struct.unpack("!I", info.read(4))[0]
+            return struct.unpack("!I", info.read(4))[0], auth_token
     finally:
         shutil.rmtree(conn_info_dir)
 
-    # Connect to the gateway
-    gateway = JavaGateway(
-        gateway_parameters=GatewayParameters(port=gateway_port, auto_convert=True),
+
+def _connect_gateway(gateway_port, auth_token=None):
+    return JavaGateway(
+        gateway_parameters=GatewayParameters(
+            port=gateway_port, auto_convert=True, auth_token=auth_token),
         callback_server_parameters=CallbackServerParameters(
             port=0, daemonize=True, daemonize_connections=True))
 
-    return gateway
-
 
 def import_flink_view(gateway):
     """
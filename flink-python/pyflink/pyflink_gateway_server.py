@@ -26,7 +26,7 @@ import socket
 import sys
 from collections import namedtuple
 from string import Template
-from subprocess import Popen, PIPE, check_output
+from subprocess import Popen, PIPE, DEVNULL, STDOUT, check_output
 
 from pyflink.find_flink_home import _find_flink_home, _find_flink_source_root
 
@@ -188,7 +188,12 @@ def prepare_environment_variable(env):
     return env
 
 
-def launch_gateway_server_process(env, args):
+def launch_gateway_server_process(env, args, daemon_log_file=None):
+    """
+    Launches the gateway server process. If daemon_log_file is specified, the process is detached
+    from the current process, i.e. it outlives the current process, and its output is redirected
+    to the log file.
+    """
     java_executable = find_java_executable()
     log_settings = construct_log_settings()
     classpath = construct_classpath()
@@ -212,7 +217,12 @@ def launch_gateway_server_process(env, args):
             # ignore ctrl-c / SIGINT
             signal.signal(signal.SIGINT, signal.SIG_IGN)
         preexec_fn = preexec_func
-    return Popen(command, stdin=PIPE, preexec_fn=preexec_fn, env=env)
+    if daemon_log_file is None:
+        return Popen(command, stdin=PIPE, preexec_fn=preexec_fn, env=env)
+    else:
+        with open(daemon_log_file, "ab") as log:
+            return Popen(command, stdin=DEVNULL, stdout=log, stderr=STDOUT,
+                         preexec_fn=preexec_fn, env=env, start_new_session=not on_windows())
 
 
 if __name__ == "__main__":
@@ -36,10 +36,19 @@ class ArrowSerializer(Serializer):
         return "ArrowSerializer"
 
     def dump_to_stream(self, iterator, stream):
+        self.dump_batches_to_stream(
+            (pandas_to_arrow(self._schema, self._timezone, self._field_types, cols)
+             for cols in iterator),
+            stream)
+
+    def dump_batches_to_stream(self, batches, stream):
+        """
+        Writes Arrow record batches, which already conform to the schema, in the Arrow streaming
+        format.
+        """
         writer = None
         try:
-            for cols in iterator:
-                batch = pandas_to_arrow(self._schema, self._timezone, self._field_types, cols)
+            for batch in batches:
                 if writer is None:
                     import pyarrow as pa
                     writer = pa.RecordBatchStreamWriter(stream, batch.schema)
@@ -31,7 +31,8 @@ from pyflink.table.table_schema import TableSchema
 from pyflink.table.types import create_arrow_schema
 from pyflink.table.udf import UserDefinedScalarFunctionWrapper, \
     UserDefinedAggregateFunctionWrapper, UserDefinedTableFunctionWrapper
-from pyflink.table.utils import tz_convert_from_internal, to_expression_jarray
+from pyflink.table.utils import tz_convert_from_internal, to_expression_jarray, \
+    create_record_batch_reader
 from pyflink.table.window import OverWindow, GroupWindow
 
 from pyflink.util.java_utils import to_jarray
@@ -991,33 +992,129 @@ class Table(object):
 
         .. versionadded:: 1.11.0
         """
+        batches, timezone = self._collect_arrow_batches()
+        first_batch = next(batches, None)
+        if first_batch is not None:
+            import itertools
+            import pyarrow as pa
+            table = pa.Table.from_batches(itertools.chain([first_batch], batches))
+            return self._to_pandas_with_timezone(table, self.get_schema(), timezone)
+        else:
+            import pandas as pd
+            return pd.DataFrame.from_records([], columns=self.get_schema().get_field_names())
+
+    def to_pandas_batches(self, max_rows: int = None):
+        """
+        Converts the table to an iterator of pandas DataFrames. Different from :func:`to_pandas`,
+        the content of the table is converted chunk by chunk as it arrives at the client side and
+        so only one chunk needs to fit in memory at a time.
+
+        Example:
+        ::
+
+            >>> table = table_env.from_pandas(pdf, ["a", "b"])
+            >>> for pdf in table.filter(table.a > 0.5).to_pandas_batches(max_rows=10000):
+            ...     print(pdf.shape)
+
+        :param max_rows: The maximum number of rows of each DataFrame. If not specified, each
+                         DataFrame holds one Arrow batch which contains at most
+                         `python.fn-execution.arrow.batch.size` rows.
+        :return: An iterator of the result pandas DataFrames.
+
+        .. versionadded:: 1.13.0
+        """
+        if max_rows is not None and max_rows <= 0:
+            raise ValueError("The max_rows must be positive, got %s." % max_rows)
+        batches, timezone = self._collect_arrow_batches()
+        schema = self.get_schema()
+
+        def to_pandas_batches():
+            for batch in batches:
+                step = batch.num_rows if max_rows is None else max_rows
+                for offset in range(0, batch.num_rows, max(step, 1)):
+                    yield self._to_pandas_with_timezone(
+                        batch.slice(offset, step), schema, timezone)
+
+        return to_pandas_batches()
+
+    def to_arrow_batch_reader(self):
+        """
+        Converts the table to a pyarrow.RecordBatchReader which reads the Arrow batches as they
+        arrive at the client side. The values of the TIMESTAMP WITH LOCAL TIME ZONE columns are
+        kept in UTC. With the versions of pyarrow which don't support
+        pyarrow.RecordBatchReader.from_batches, all the batches are collected before the reader is
+        returned.
+
+        Example:
+        ::
+
+            >>> reader = table.to_arrow_batch_reader()
+            >>> for batch in reader:
+            ...     print(batch.num_rows)
+
+        :return: The pyarrow.RecordBatchReader of the content of the table.
+
+        .. versionadded:: 1.13.0
+        """
+        import itertools
+        batches, _ = self._collect_arrow_batches()
+        first_batch = next(batches, None)
+        if first_batch is not None:
+            return create_record_batch_reader(
+                first_batch.schema, itertools.chain([first_batch], batches))
+        else:
+            return create_record_batch_reader(
+                create_arrow_schema(self.get_schema().get_field_names(),
+                                    self.get_schema().get_field_data_types()), [])
+
+    def to_arrow(self):
+        """
+        Converts the table to a pyarrow.Table without going through pandas. It will collect the
+        content of the table to the client side and so please make sure that the content of the
+        table could fit in memory before calling this method. The values of the TIMESTAMP WITH
+        LOCAL TIME ZONE columns are kept in UTC.
+
+        Example:
+        ::
+
+            >>> arrow_table = table_env.from_arrow(arrow_table).select(col('a') + 1).to_arrow()
+
+        :return: The result pyarrow.Table.
+
+        .. versionadded:: 1.13.0
+        """
+        return self.to_arrow_batch_reader().read_all()
+
+    def _collect_arrow_batches(self):
+        """
+        Executes the table and returns an iterator of the Arrow batches of the content of the
+        table, which are fetched from the JVM lazily, together with the local time zone.
+        """
         self._t_env._before_execute()
         gateway = get_gateway()
         max_arrow_batch_size = self._j_table.getTableEnvironment().getConfig().getConfiguration()\
             .getInteger(gateway.jvm.org.apache.flink.python.PythonOptions.MAX_ARROW_BATCH_SIZE)
         batches = gateway.jvm.org.apache.flink.table.runtime.arrow.ArrowUtils\
             .collectAsPandasDataFrame(self._j_table, max_arrow_batch_size)
-        if batches.hasNext():
-            import pytz
-            timezone = pytz.timezone(
-                self._j_table.getTableEnvironment().getConfig().getLocalTimeZone().getId())
-            serializer = ArrowSerializer(
-                create_arrow_schema(self.get_schema().get_field_names(),
-                                    self.get_schema().get_field_data_types()),
-                self.get_schema().to_row_data_type(),
-                timezone)
-            import pyarrow as pa
-            table = pa.Table.from_batches(serializer.load_from_iterator(batches))
-            pdf = table.to_pandas()
-
-            schema = self.get_schema()
-            for field_name in schema.get_field_names():
-                pdf[field_name] = tz_convert_from_internal(
-                    pdf[field_name], schema.get_field_data_type(field_name), timezone)
-            return pdf
-        else:
-            import pandas as pd
-            return pd.DataFrame.from_records([], columns=self.get_schema().get_field_names())
+        import pytz
+        timezone = pytz.timezone(
+            self._j_table.getTableEnvironment().getConfig().getLocalTimeZone().getId())
+        if not batches.hasNext():
+            return iter([]), timezone
+        serializer = ArrowSerializer(
+            create_arrow_schema(self.get_schema().get_field_names(),
+                                self.get_schema().get_field_data_types()),
+            self.get_schema().to_row_data_type(),
+            timezone)
+        return serializer.load_from_iterator(batches), timezone
+
+    @staticmethod
+    def _to_pandas_with_timezone(arrow_data, schema, timezone):
+        pdf = arrow_data.to_pandas()
+        for field_name in schema.get_field_names():
+            pdf[field_name] = tz_convert_from_internal(
+                pdf[field_name], schema.get_field_data_type(field_name), timezone)
+        return pdf
 
     def get_schema(self) -> 'TableSchema':
         """
@@ -15,10 +15,12 @@
 #  See the License for the specific language governing permissions and
 # limitations under the License.
 ################################################################################
+import collections
 import os
 import sys
 import tempfile
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, List, Tuple, Iterable
 
 from py4j.java_gateway import get_java_class, get_method
@@ -29,7 +31,7 @@ from pyflink.table.sources import TableSource
 from pyflink.common.typeinfo import TypeInformation
 from pyflink.datastream.data_stream import DataStream
 
-from pyflink.common import JobExecutionResult
+from pyflink.common import JobExecutionResult, Row
 from pyflink.dataset import ExecutionEnvironment
 from pyflink.java_gateway import get_gateway
 from pyflink.serializers import BatchedSerializer, PickleSerializer
@@ -44,10 +46,12 @@ from pyflink.table.table_config import TableConfig
 from pyflink.table.table_result import TableResult
 from pyflink.table.types import _to_java_type, _create_type_verifier, RowType, DataType, \
     _infer_schema_from_data, _create_converter, from_arrow_type, RowField, create_arrow_schema, \
-    _to_java_data_type
+    _to_java_data_type, TinyIntType, SmallIntType, IntType, BigIntType, BooleanType, FloatType, \
+    DoubleType, VarCharType, VarBinaryType, DecimalType, DateType, TimeType, TimestampType
 from pyflink.table.udf import UserDefinedFunctionWrapper, AggregateFunction, udaf, \
     UserDefinedAggregateFunctionWrapper, udtaf, TableAggregateFunction
-from pyflink.table.utils import to_expression_jarray
+from pyflink.table.utils import to_expression_jarray, LocalSocketServer, cast_arrow_batch, \
+    pandas_to_arrow, is_record_batch_reader
 from pyflink.util import java_utils
 from pyflink.util.java_utils import get_j_env_configuration, is_local_deployment, load_java_class, \
     to_j_explain_detail_arr, to_jarray
@@ -58,6 +62,11 @@ __all__ = [
     'TableEnvironment'
 ]
 
+# the field types for which from_elements converts the elements to Arrow columns
+_ARROW_ELEMENT_TYPES = (TinyIntType, SmallIntType, IntType, BigIntType, BooleanType, FloatType,
+                        DoubleType, VarCharType, VarBinaryType, DecimalType, DateType, TimeType,
+                        TimestampType)
+
 
 class TableEnvironment(object):
     """
@@ -91,6 +100,9 @@ class TableEnvironment(object):
 
     """
 
+    # the maximum number of the elements pickled at once by from_elements
+    _PICKLE_BATCH_SIZE = 1000
+
     def __init__(self, j_tenv, serializer=PickleSerializer()):
         self._j_tenv = j_tenv
         self._is_blink_planner = TableEnvironment._judge_blink_planner(j_tenv)
@@ -1420,11 +1432,68 @@ class TableEnvironment(object):
                              "others are not.")
 
         # verifies the elements against the specified schema
-        elements = map(verify_obj, elements)
+        elements = [verify_obj(element) for element in elements]
+        arrow_batches = self._elements_to_arrow_batches(elements, schema)
+        if arrow_batches is not None:
+            arrow_schema = create_arrow_schema(schema.field_names(), schema.field_types())
+            serializer = ArrowSerializer(arrow_schema, schema, None)
+            return self._from_arrow_stream(
+                schema, lambda stream: serializer.dump_batches_to_stream(arrow_batches, stream))
         # converts python data to sql data
         elements = [schema.to_sql_type(element) for element in elements]
         return self._from_elements(elements, schema)
 
+    def _elements_to_arrow_batches(self, elements: List, schema: RowType):
+        """
+        Converts the elements to Arrow batches column by column, so that they could be read by
+        the Arrow table source. Returns None if the elements couldn't be converted, e.g. if the
+        schema contains types which aren't supported by the conversion.
+        """
+        if len(elements) == 0 or \
+                (not self._is_blink_planner and isinstance(self, BatchTableEnvironment)):
+            return None
+        field_types = schema.field_types()
+        if any(type(field_type) not in _ARROW_ELEMENT_TYPES for field_type in field_types):
+            return None
+
+        # extracts the fields the same way as RowType.to_sql_type
+        names = schema.names
+        by_names = not schema._need_serialize_any_field
+        rows = []
+        for obj in elements:
+            if isinstance(obj, dict):
+                rows.append([obj.get(n) for n in names])
+            elif by_names and isinstance(obj, Row) and hasattr(obj, "_fields"):
+                rows.append([obj[n] for n in names])
+            elif isinstance(obj, (list, tuple, Row)):
+                rows.append(obj)
+            elif hasattr(obj, "__dict__"):
+                rows.append([obj.__dict__.get(n) for n in names])
+            else:
+                return None
+
+        import pyarrow as pa
+        arrow_schema = create_arrow_schema(schema.field_names(), field_types)
+        batch_size = self.get_config().get_configuration().get_integer(
+            "python.fn-execution.arrow.batch.size", 10000)
+        batches = []
+        for start in range(0, len(rows), batch_size):
+            columns = list(zip(*rows[start:start + batch_size]))
+            if len(columns) != len(field_types):
+                return None
+            arrays = []
+            for column, field_type, arrow_type in zip(columns, field_types, arrow_schema.types):
+                # the timezone aware datetimes are converted differently by pyarrow
+                if isinstance(field_type, TimestampType) and \
+                        any(v is not None and v.tzinfo is not None for v in column):
+                    return None
+                try:
+                    arrays.append(pa.array(column, type=arrow_type))
+                except (pa.ArrowException, TypeError, ValueError):
+                    return None
+            batches.append(pa.RecordBatch.from_arrays(arrays, schema=arrow_schema))
+        return batches
+
     def _from_elements(self, elements: List, schema: Union[DataType, List[str]]) -> Table:
         """
         Creates a table from a collection of elements.
@@ -1432,9 +1501,9 @@ class TableEnvironment(object):
         :param elements: The elements to create a table from.
         :return: The result :class:`~pyflink.table.Table`.
         """
-        # serializes to a file, and we read the file in java
+        # serializes to a file in bounded batches, and we read the file in java
         temp_file = tempfile.NamedTemporaryFile(delete=False, dir=tempfile.mkdtemp())
-        serializer = BatchedSerializer(self._serializer)
+        serializer = BatchedSerializer(self._serializer, TableEnvironment._PICKLE_BATCH_SIZE)
         try:
             with temp_file:
                 serializer.dump_to_stream(elements, temp_file)
@@ -1499,40 +1568,123 @@ class TableEnvironment(object):
 
         import pyarrow as pa
         arrow_schema = pa.Schema.from_pandas(pdf, preserve_index=False)
+        result_type = self._get_result_type(arrow_schema, schema)
+
+        import pytz
+        arrow_schema = create_arrow_schema(result_type.field_names(), result_type.field_types())
+        timezone = pytz.timezone(self.get_config().get_local_timezone())
+        field_types = result_type.field_types()
+        serializer = ArrowSerializer(arrow_schema, result_type, timezone)
+        step = -(-len(pdf) // splits_num)
+        parallelism = min(splits_num, os.cpu_count() or 1)
+
+        def convert_split(start):
+            return pandas_to_arrow(
+                arrow_schema, timezone, field_types,
+                [c for (_, c) in pdf.iloc[start:start + step].iteritems()])
+
+        def split_batches():
+            # the splits are converted by a bounded thread pool, as pyarrow releases the GIL,
+            # and are produced lazily in order to only hold a few Arrow batches at a time
+            with ThreadPoolExecutor(max_workers=parallelism,
+                                    thread_name_prefix="pyflink-from-pandas") as pool:
+                pending = collections.deque()
+                for start in range(0, len(pdf), step):
+                    pending.append(pool.submit(convert_split, start))
+                    if len(pending) > parallelism:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+
+        return self._from_arrow_stream(
+            result_type, lambda stream: serializer.dump_batches_to_stream(split_batches(), stream))
+
+    def from_arrow(self, data,
+                   schema: Union[RowType, List[str], Tuple[str], List[DataType],
+                                 Tuple[DataType]] = None) -> Table:
+        """
+        Creates a table from a pyarrow.Table or a pyarrow.RecordBatchReader. The Arrow batches
+        are sent to the JVM as they are, without being converted to pandas. Each Arrow batch
+        becomes a split of the source, and the batches of a pyarrow.RecordBatchReader are read
+        lazily.
+
+        Example:
+        ::
+
+            >>> arrow_table = pa.Table.from_pydict({"a": [1, 2], "b": ["x", "y"]})
+            >>> table_env.from_arrow(arrow_table)
+            # use the second parameter to specify custom field names
+            >>> table_env.from_arrow(arrow_table, ["c", "d"])
+
+        :param data: The pyarrow.Table or pyarrow.RecordBatchReader.
+        :param schema: The schema of the converted table. It could be a RowType, a list of field
+                       names or a list of field types, see :func:`from_pandas`.
+        :return: The result table.
+
+        .. versionadded:: 1.13.0
+        """
+
+        if not self._is_blink_planner and isinstance(self, BatchTableEnvironment):
+            raise TypeError("It doesn't support to convert from Arrow data in the batch "
+                            "mode of old planner")
+
+        import pyarrow as pa
+        if isinstance(data, pa.Table):
+            batches = data.to_batches()
+        elif is_record_batch_reader(data):
+            batches = data
+        else:
+            raise TypeError("Unsupported type, expected pyarrow.Table or "
+                            "pyarrow.RecordBatchReader, got %s" % type(data))
+        result_type = self._get_result_type(data.schema, schema)
+        arrow_schema = create_arrow_schema(result_type.field_names(), result_type.field_types())
+        serializer = ArrowSerializer(arrow_schema, result_type, None)
+
+        return self._from_arrow_stream(
+            result_type,
+            lambda stream: serializer.dump_batches_to_stream(
+                (cast_arrow_batch(batch, arrow_schema) for batch in batches), stream))
+
+    @staticmethod
+    def _get_result_type(arrow_schema, schema) -> RowType:
+        """
+        Returns the type of the table converted from the Arrow data of the given schema.
+        """
+        import pyarrow as pa
+
+        def from_arrow_field_type(field):
+            # dictionary encoded columns are decoded before being sent to the JVM
+            if pa.types.is_dictionary(field.type):
+                return from_arrow_type(field.type.value_type, field.nullable)
+            else:
+                return from_arrow_type(field.type, field.nullable)
 
         if schema is not None:
             if isinstance(schema, RowType):
-                result_type = schema
+                return schema
             elif isinstance(schema, (list, tuple)) and isinstance(schema[0], str):
-                result_type = RowType(
-                    [RowField(field_name, from_arrow_type(field.type, field.nullable))
+                return RowType(
+                    [RowField(field_name, from_arrow_field_type(field))
                      for field_name, field in zip(schema, arrow_schema)])
             elif isinstance(schema, (list, tuple)) and isinstance(schema[0], DataType):
-                result_type = RowType(
+                return RowType(
                     [RowField(field_name, field_type) for field_name, field_type in zip(
                         arrow_schema.names, schema)])
             else:
                 raise TypeError("Unsupported schema type, it could only be of RowType, a "
                                 "list of str or a list of DataType, got %s" % schema)
         else:
-            result_type = RowType([RowField(field.name, from_arrow_type(field.type, field.nullable))
-                                   for field in arrow_schema])
+            return RowType([RowField(field.name, from_arrow_field_type(field))
+                            for field in arrow_schema])
 
-        # serializes to a file, and we read the file in java
-        temp_file = tempfile.NamedTemporaryFile(delete=False, dir=tempfile.mkdtemp())
-        import pytz
-        serializer = ArrowSerializer(
-            create_arrow_schema(result_type.field_names(), result_type.field_types()),
-            result_type,
-            pytz.timezone(self.get_config().get_local_timezone()))
-        step = -(-len(pdf) // splits_num)
-        pdf_slices = [pdf.iloc[start:start + step] for start in range(0, len(pdf), step)]
-        data = [[c for (_, c) in pdf_slice.iteritems()] for pdf_slice in pdf_slices]
+    def _from_arrow_stream(self, result_type: RowType, write_func) -> Table:
+        """
+        Creates a table of the given type from the Arrow stream written by write_func. The stream
+        is sent to the JVM over a local socket.
+        """
+        server = LocalSocketServer(write_func)
+        jvm = get_gateway().jvm
         try:
-            with temp_file:
-                serializer.dump_to_stream(data, temp_file)
-            jvm = get_gateway().jvm
-
             data_type = jvm.org.apache.flink.table.types.utils.TypeConversions\
                 .fromLegacyInfoToDataType(_to_java_type(result_type)).notNull()
             if self._is_blink_planner:
@@ -1541,10 +1693,15 @@ class TableEnvironment(object):
 
             j_arrow_table_source = \
                 jvm.org.apache.flink.table.runtime.arrow.ArrowUtils.createArrowTableSource(
-                    data_type, temp_file.name)
-            return Table(self._j_tenv.fromTableSource(j_arrow_table_source), self)
-        finally:
-            os.unlink(temp_file.name)
+                    data_type, server.host, server.port, server.secret)
+        except BaseException:
+            try:
+                server.close()
+            except BaseException:
+                pass
+            raise
+        server.close()
+        return Table(self._j_tenv.fromTableSource(j_arrow_table_source), self)
 
     def _set_python_executable_for_local_executor(self):
         jvm = get_gateway().jvm
@@ -15,6 +15,8 @@
 #  See the License for the specific language governing permissions and
 # limitations under the License.
 ################################################################################
+import collections
+import pickle
 from typing import Optional
 
 from py4j.java_gateway import get_method
@@ -26,7 +28,7 @@ from pyflink.java_gateway import get_gateway
 from pyflink.table.result_kind import ResultKind
 from pyflink.table.table_schema import TableSchema
 from pyflink.table.types import _from_java_type
-from pyflink.table.utils import pickled_bytes_to_python_converter
+from pyflink.table.utils import _create_nullable_converter
 
 __all__ = ['TableResult']
 
@@ -191,7 +193,10 @@ class TableResult(object):
         """
         field_data_types = self._j_table_result.getTableSchema().getFieldDataTypes()
 
-        j_iter = self._j_table_result.collect()
+        # the rows are fetched by a background thread of the JVM, so that the rows which are
+        # already available could be transferred at once without waiting for the following ones
+        j_iter = get_gateway().jvm.PrefetchingIterator(
+            self._j_table_result.collect(), CloseableIterator.MAX_FETCH_SIZE)
 
         return CloseableIterator(j_iter, field_data_types)
 
@@ -222,36 +227,50 @@ class TableResult(object):
 class CloseableIterator(object):
     """
     Representing an Iterator that is also auto closeable.
+
+    The rows are fetched from the JVM in batches of at most
+    :data:`CloseableIterator.MAX_FETCH_SIZE` rows, so that large results are fetched with a few
+    round trips only. A batch contains the rows which are available when it is fetched, the rows
+    of slow or unbounded queries are not held back until the batch is full.
     """
+
+    MAX_FETCH_SIZE = 1024
+
     def __init__(self, j_closeable_iterator, field_data_types):
         self._j_closeable_iterator = j_closeable_iterator
         self._j_field_data_types = field_data_types
         self._data_types = [_from_java_type(j_field_data_type)
                             for j_field_data_type in self._j_field_data_types]
+        self._field_converters = [_create_nullable_converter(data_type)
+                                  for data_type in self._data_types]
+        self._buffer = collections.deque()
+        self._exhausted = False
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        if not self._j_closeable_iterator.hasNext():
-            raise StopIteration("No more data.")
-        gateway = get_gateway()
-        pickle_bytes = gateway.jvm.PythonBridgeUtils. \
-            getPickledBytesFromRow(self._j_closeable_iterator.next(),
-                                   self._j_field_data_types)
+        if not self._buffer:
+            if not self._exhausted:
+                self._fetch()
+            if not self._buffer:
+                raise StopIteration("No more data.")
+        pickle_bytes = self._buffer.popleft()
         row_kind = RowKind(int.from_bytes(pickle_bytes[0], byteorder='big', signed=False))
-        pickle_bytes = list(pickle_bytes[1:])
-        field_data = zip(pickle_bytes, self._data_types)
-        fields = []
-        for data, field_type in field_data:
-            if len(data) == 0:
-                fields.append(None)
-            else:
-                fields.append(pickled_bytes_to_python_converter(data, field_type))
-        result_row = Row(*fields)
+        result_row = Row(*[converter(data) for converter, data
+                           in zip(self._field_converters, pickle_bytes[1:])])
         result_row.set_row_kind(row_kind)
         return result_row
 
+    def _fetch(self):
+        gateway = get_gateway()
+        rows = pickle.loads(gateway.jvm.PythonBridgeUtils.getPickledBytesFromRows(
+            self._j_closeable_iterator, self._j_field_data_types,
+            CloseableIterator.MAX_FETCH_SIZE))
+        if not rows:
+            self._exhausted = True
+        self._buffer.extend(rows)
+
     def next(self):
         return self.__next__()
 
@@ -122,6 +122,24 @@ class StreamTableCalcTests(PyFlinkBlinkStreamTableTestCase):
         expected = ['+I[1, abc, 2.0]', '+I[2, def, 3.0]']
         self.assert_equals(actual, expected)
 
+    def test_from_element_in_batches(self):
+        t_env = self.t_env
+        t_env.get_config().get_configuration().set_string(
+            "python.fn-execution.arrow.batch.size", "3")
+        field_names = ["a", "b", "c"]
+        field_types = [DataTypes.BIGINT(), DataTypes.STRING(), DataTypes.DATE()]
+        schema = DataTypes.ROW(
+            [DataTypes.FIELD(name, field_type)
+             for name, field_type in zip(field_names, field_types)])
+        elements = [(i, str(i), datetime.date(1970, 1, 1 + i)) for i in range(10)]
+        table_sink = source_sink_utils.TestAppendSink(field_names, field_types)
+        t_env.register_table_sink("Results", table_sink)
+        t_env.from_elements(elements, schema).execute_insert("Results").wait()
+        actual = source_sink_utils.results()
+
+        expected = ['+I[%s, %s, 1970-01-%02d]' % (i, i, i + 1) for i in range(10)]
+        self.assert_equals(actual, expected)
+
     def test_blink_from_element(self):
         t_env = BatchTableEnvironment.create(environment_settings=EnvironmentSettings
                                              .new_instance().use_blink_planner()
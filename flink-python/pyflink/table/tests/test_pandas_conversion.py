@@ -17,11 +17,16 @@
 ################################################################################
 import datetime
 import decimal
+import socket
+import struct
+import unittest
 
 from pandas.util.testing import assert_frame_equal
 
 from pyflink.common import Row
 from pyflink.table.types import DataTypes
+from pyflink.table.utils import create_record_batch_reader, _read_batches_from_stream, \
+    is_record_batch_reader, LocalSocketServer
 from pyflink.testing import source_sink_utils
 from pyflink.testing.test_case_utils import PyFlinkBlinkBatchTableTestCase, \
     PyFlinkBlinkStreamTableTestCase, PyFlinkOldStreamTableTestCase
@@ -133,6 +138,26 @@ class PandasConversionITTests(PandasConversionTestBase):
                             "1970-01-01 00:00:00.123, [hello, 中文], +I[1, hello, "
                             "1970-01-01 00:00:00.123, [1, 2]]]"])
 
+    def test_from_pandas_with_uneven_splits(self):
+        # the splits are read in order by a single source task
+        self.t_env.get_config().get_configuration().set_string("parallelism.default", "1")
+        import pandas as pd
+        import numpy as np
+        pdf = pd.DataFrame(data={'a': np.int64(range(10)), 'b': [str(i) for i in range(10)]})
+        # the splits of 4, 4, 2 rows and 3, 3, 3, 1 rows
+        for splits_num in [3, 4]:
+            result_pdf = self.t_env.from_pandas(pdf, splits_num=splits_num).to_pandas()
+            assert_frame_equal(pdf, result_pdf)
+
+    def test_from_pandas_with_more_splits_than_rows(self):
+        self.t_env.get_config().get_configuration().set_string("parallelism.default", "1")
+        import pandas as pd
+        import numpy as np
+        pdf = pd.DataFrame(data={'a': np.int64([1, 2, 3]), 'b': ['x', 'y', 'z']})
+        result_pdf = self.t_env.from_pandas(pdf, splits_num=10).to_pandas()
+        # each row is a split
+        assert_frame_equal(pdf, result_pdf)
+
     def test_to_pandas(self):
         table = self.t_env.from_pandas(self.pdf, self.data_type)
         result_pdf = table.to_pandas()
@@ -149,6 +174,46 @@ class PandasConversionITTests(PandasConversionTestBase):
         pdf = table.filter(table.f1 < 0).to_pandas()
         self.assertTrue(pdf.empty)
 
+    def test_to_pandas_batches(self):
+        table = self.t_env.from_pandas(self.pdf, self.data_type)
+        result_pdfs = list(table.to_pandas_batches(max_rows=1))
+        self.assertEqual([1, 1], [len(pdf) for pdf in result_pdfs])
+        import pandas as pd
+        assert_frame_equal(table.to_pandas(), pd.concat(result_pdfs, ignore_index=True))
+
+        self.assertEqual([], list(table.filter(table.f1 < 0).to_pandas_batches()))
+        with self.assertRaises(ValueError):
+            table.to_pandas_batches(max_rows=0)
+
+    def test_to_arrow_batch_reader(self):
+        table = self.t_env.from_pandas(self.pdf, self.data_type)
+        self.assertEqual(2, table.to_arrow_batch_reader().read_all().num_rows)
+        reader = table.filter(table.f1 < 0).to_arrow_batch_reader()
+        self.assertEqual(self.data_type.field_names(), reader.schema.names)
+        self.assertEqual(0, reader.read_all().num_rows)
+
+    def test_from_arrow_and_to_arrow(self):
+        import pyarrow as pa
+        arrow_table = pa.Table.from_pydict({
+            "a": pa.array([1, 2, 3], pa.int64()),
+            "b": pa.array(["x", "y", "x"]).dictionary_encode(),
+            "c": pa.array([1.5, None, 2.5])})
+        table = self.t_env.from_arrow(arrow_table)
+        self.assertEqual(["a", "b", "c"], table.get_schema().get_field_names())
+        result = table.to_arrow()
+        self.assertEqual([1, 2, 3], result.column("a").to_pylist())
+        self.assertEqual(["x", "y", "x"], result.column("b").to_pylist())
+        self.assertEqual([1.5, None, 2.5], result.column("c").to_pylist())
+
+        reader = create_record_batch_reader(
+            arrow_table.schema, arrow_table.to_batches(max_chunksize=1))
+        table = self.t_env.from_arrow(reader, ["d", "e", "f"])
+        self.assertEqual(["d", "e", "f"], table.get_schema().get_field_names())
+        self.assertEqual(3, table.to_arrow().num_rows)
+
+        with self.assertRaises(TypeError):
+            self.t_env.from_arrow(self.pdf)
+
     def test_to_pandas_for_retract_table(self):
         table = self.t_env.from_pandas(self.pdf, self.data_type)
         result_pdf = table.group_by(table.f1).select(table.f2.max.alias('f2')).to_pandas()
@@ -172,6 +237,65 @@ class PandasConversionITTests(PandasConversionTestBase):
             self.assertTrue(expected_field == result_field)
 
 
+class RecordBatchReaderTests(unittest.TestCase):
+
+    def test_create_record_batch_reader(self):
+        import pyarrow as pa
+        arrow_table = pa.Table.from_pydict({"a": [1, 2, 3], "b": ["x", None, "z"]})
+        batches = arrow_table.to_batches(max_chunksize=2)
+        # the fallback for the versions of pyarrow without RecordBatchReader.from_batches
+        for create in [create_record_batch_reader, _read_batches_from_stream]:
+            reader = create(arrow_table.schema, iter(batches))
+            self.assertTrue(is_record_batch_reader(reader))
+            self.assertEqual(arrow_table.schema, reader.schema)
+            self.assertTrue(arrow_table.equals(reader.read_all()))
+
+            reader = create(arrow_table.schema, [])
+            self.assertEqual(0, reader.read_all().num_rows)
+
+
+class LocalSocketServerTests(unittest.TestCase):
+
+    def connect(self, server, secret):
+        # connects to the server the same way as ArrowUtils#createArrowTableSource
+        client = socket.create_connection((server.host, server.port))
+        encoded_secret = secret.encode('utf-8')
+        client.sendall(struct.pack('>H', len(encoded_secret)) + encoded_secret)
+        return client
+
+    def test_round_trip(self):
+        server = LocalSocketServer(lambda stream: stream.write(b'x' * 100000))
+        self.assertEqual("127.0.0.1", server.host)
+        with self.connect(server, server.secret) as client, client.makefile('rb') as reader:
+            self.assertEqual(b'x' * 100000, reader.read())
+        server.close()
+
+    def test_unauthenticated_connection(self):
+        written = []
+        server = LocalSocketServer(written.append)
+        with self.connect(server, "invalid secret") as client, client.makefile('rb') as reader:
+            self.assertEqual(b'', reader.read())
+        with self.assertRaisesRegex(RuntimeError, "not been authenticated"):
+            server.close()
+        self.assertEqual([], written)
+
+    def test_client_never_connects(self):
+        written = []
+        server = LocalSocketServer(written.append, accept_timeout=0.1)
+        server._thread.join(10)
+        self.assertFalse(server._thread.is_alive())
+        with self.assertRaises(socket.timeout):
+            server.close()
+        self.assertEqual([], written)
+
+        # the server stops waiting for the connection once it's closed
+        server = LocalSocketServer(written.append)
+        with self.assertRaises(OSError):
+            server.close()
+        self.assertFalse(server._thread.is_alive())
+        self.assertEqual([], written)
+
+
 class StreamPandasConversionTests(PandasConversionITTests,
                                   PyFlinkOldStreamTableTestCase):
     pass
@@ -279,6 +279,70 @@ class BatchPandasUDAFITTests(PyFlinkBlinkBatchTableTestCase):
                             "+I[2, 2.0, 3, 2.0, 2.0, 4.0, 1.0, 2.0, 4.0, 2.0]",
                             "+I[3, 2.0, 3, 2.0, 1.0, 1.0, 2.0, 2.0, 1.0, 1.0]"])
 
+    def test_over_window_aggregate_function_with_reduction(self):
+        import datetime
+        t = self.t_env.from_elements(
+            [
+                (1, 2, 3, datetime.datetime(2018, 3, 11, 3, 10, 0, 0)),
+                (3, 2, 1, datetime.datetime(2018, 3, 11, 3, 10, 0, 0)),
+                (2, 1, 2, datetime.datetime(2018, 3, 11, 3, 10, 0, 0)),
+                (1, 3, 1, datetime.datetime(2018, 3, 11, 3, 10, 0, 0)),
+                (1, 8, 5, datetime.datetime(2018, 3, 11, 4, 20, 0, 0)),
+                (2, 3, 6, datetime.datetime(2018, 3, 11, 3, 30, 0, 0))
+            ],
+            DataTypes.ROW(
+                [DataTypes.FIELD("a", DataTypes.TINYINT()),
+                 DataTypes.FIELD("b", DataTypes.SMALLINT()),
+                 DataTypes.FIELD("c", DataTypes.INT()),
+                 DataTypes.FIELD("rowtime", DataTypes.TIMESTAMP(3))]))
+
+        table_sink = source_sink_utils.TestAppendSink(
+            ['a', 'b', 'c', 'd'],
+            [DataTypes.TINYINT(), DataTypes.SMALLINT(), DataTypes.INT(), DataTypes.BIGINT()])
+        self.t_env.register_table_sink("Results", table_sink)
+        self.t_env.create_temporary_system_function(
+            "max_udaf",
+            udaf(lambda v: v.max(), result_type=DataTypes.SMALLINT(), func_type="pandas",
+                 reduction="max"))
+        self.t_env.create_temporary_system_function(
+            "sum_udaf",
+            udaf(lambda v: v.sum(), result_type=DataTypes.INT(), func_type="pandas",
+                 reduction="sum"))
+        self.t_env.create_temporary_system_function(
+            "count_udaf",
+            udaf(lambda v: v.count(), result_type=DataTypes.BIGINT(), func_type="pandas",
+                 reduction="count"))
+        self.t_env.register_table("T", t)
+        self.t_env.execute_sql("""
+            insert into Results
+            select a,
+             max_udaf(b)
+             over (PARTITION BY a ORDER BY rowtime
+             RANGE BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW),
+             sum_udaf(c)
+             over (PARTITION BY a ORDER BY rowtime
+             RANGE BETWEEN INTERVAL '20' MINUTE PRECEDING AND CURRENT ROW),
+             count_udaf(b)
+             over (PARTITION BY a ORDER BY rowtime
+             ROWS BETWEEN CURRENT ROW AND UNBOUNDED FOLLOWING)
+            from T
+        """).wait()
+        actual = source_sink_utils.results()
+        self.assert_equals(actual,
+                           ["+I[1, 3, 4, 3]",
+                            "+I[1, 3, 4, 2]",
+                            "+I[1, 8, 5, 1]",
+                            "+I[2, 1, 2, 2]",
+                            "+I[2, 3, 8, 1]",
+                            "+I[3, 2, 1, 1]"])
+
+    def test_invalid_reduction(self):
+        with self.assertRaises(ValueError):
+            udaf(lambda v: v.median(), result_type=DataTypes.FLOAT(), func_type="pandas",
+                 reduction="median")
+        with self.assertRaises(ValueError):
+            udaf(MaxAdd(), result_type=DataTypes.INT(), func_type="pandas", reduction="max")
+
 
 class StreamPandasUDAFITTests(PyFlinkBlinkStreamTableTestCase):
     def test_sliding_group_window_over_time(self):
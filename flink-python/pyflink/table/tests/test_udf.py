@@ -86,6 +86,31 @@ class UserDefinedFunctionTests(object):
         actual = source_sink_utils.results()
         self.assert_equals(actual, ["+I[3, 1, 1]", "+I[7, 2, 1]", "+I[4, 3, 1]"])
 
+    def test_async_scalar_function(self):
+        import asyncio
+        import time
+
+        @udf(result_type=DataTypes.BIGINT(), func_type="async", concurrency=4)
+        async def async_add_one(i):
+            await asyncio.sleep(0.01 * (3 - i))
+            return i + 1
+
+        @udf(result_type=DataTypes.BIGINT(), func_type="async", concurrency=4, timeout=60)
+        def blocking_subtract_one(i):
+            time.sleep(0.01 * (3 - i))
+            return i - 1
+
+        table_sink = source_sink_utils.TestAppendSink(
+            ['a', 'b', 'c'],
+            [DataTypes.BIGINT(), DataTypes.BIGINT(), DataTypes.BIGINT()])
+        self.t_env.register_table_sink("Results", table_sink)
+
+        t = self.t_env.from_elements([(1, 2), (2, 5), (3, 1)], ['a', 'b'])
+        t.select(t.a, async_add_one(t.b), blocking_subtract_one(t.b)) \
+            .execute_insert("Results").wait()
+        actual = source_sink_utils.results()
+        self.assert_equals(actual, ["+I[1, 3, 1]", "+I[2, 6, 4]", "+I[3, 2, 0]"])
+
     def test_udf_in_join_condition(self):
         t1 = self.t_env.from_elements([(2, "Hi")], ['a', 'b'])
         t2 = self.t_env.from_elements([(2, "Flink")], ['c', 'd'])
@@ -46,6 +46,29 @@ class UserDefinedTableFunctionTests(object):
                             "+I[3, 0, 0]", "+I[3, 0, 1]", "+I[3, 0, 2]", "+I[3, 1, 1]",
                             "+I[3, 1, 2]", "+I[3, 2, 2]", "+I[3, 3, null]"])
 
+    def test_async_table_function(self):
+        self._register_table_sink(
+            ['a', 'b', 'c'],
+            [DataTypes.BIGINT(), DataTypes.BIGINT(), DataTypes.BIGINT()])
+
+        @udtf(result_types=DataTypes.BIGINT(), func_type="async", concurrency=2)
+        async def async_range(i):
+            import asyncio
+            await asyncio.sleep(0.01)
+            return range(i)
+
+        @udtf(result_types=DataTypes.BIGINT(), func_type="async", timeout=60)
+        def blocking_range(i):
+            for x in range(i):
+                yield x
+
+        t = self.t_env.from_elements([(1,), (2,), (3,)], ['a'])
+        t = t.join_lateral(async_range(t.a).alias('x')) \
+            .join_lateral(blocking_range(t.x).alias('y')) \
+            .select("a, x, y")
+        actual = self._get_output(t)
+        self.assert_equals(actual, ["+I[2, 1, 0]", "+I[3, 1, 0]", "+I[3, 2, 0]", "+I[3, 2, 1]"])
+
     def test_table_function_with_sql_query(self):
         self._register_table_sink(
             ['a', 'b', 'c'],
@@ -275,8 +275,10 @@ class DelegatingPandasAggregateFunction(AggregateFunction):
     It's for internal use only.
     """
 
-    def __init__(self, func):
+    def __init__(self, func, reduction=None):
         self.func = func
+        # the vectorizable reduction which the function is equivalent to, e.g. 'sum'
+        self.reduction = reduction
 
     def get_value(self, accumulator):
         return accumulator[0]
@@ -294,6 +296,10 @@ class PandasAggregateFunctionWrapper(object):
     """
     def __init__(self, func: AggregateFunction):
         self.func = func
+        if isinstance(func, DelegatingPandasAggregateFunction):
+            self.reduction = func.reduction
+        else:
+            self.reduction = None
 
     def open(self, function_context: FunctionContext):
         self.func.open(function_context)
@@ -307,6 +313,36 @@ class PandasAggregateFunctionWrapper(object):
         self.func.close()
 
 
+class AsyncFunctionWrapper(UserDefinedFunction):
+    """
+    Wrapper for the Python user-defined scalar or table function which is executed
+    asynchronously. It's for internal use only.
+    """
+
+    def __init__(self, func: UserDefinedFunction, concurrency: int, timeout: float):
+        self.func = func
+        self.concurrency = concurrency
+        self.timeout = timeout
+
+    def open(self, function_context: FunctionContext):
+        self.func.open(function_context)
+
+    def eval(self, *args):
+        return self.func.eval(*args)
+
+    def close(self):
+        self.func.close()
+
+    def is_deterministic(self) -> bool:
+        return self.func.is_deterministic()
+
+    def get_eval_function(self) -> Callable:
+        if isinstance(self.func, (DelegatingScalarFunction, DelegationTableFunction)):
+            return self.func.func
+        else:
+            return self.func.eval
+
+
 class UserDefinedFunctionWrapper(object):
     """
     Base Wrapper for Python user-defined function. It handles things like converting lambda
@@ -314,7 +350,8 @@ class UserDefinedFunctionWrapper(object):
     etc. It's for internal use only.
     """
 
-    def __init__(self, func, input_types, func_type, deterministic=None, name=None):
+    def __init__(self, func, input_types, func_type, deterministic=None, name=None,
+                 concurrency=None, timeout=None):
         if inspect.isclass(func) or (
                 not isinstance(func, UserDefinedFunction) and not callable(func)):
             raise TypeError(
@@ -347,6 +384,8 @@ class UserDefinedFunctionWrapper(object):
         self._deterministic = deterministic if deterministic is not None else (
             func.is_deterministic() if isinstance(func, UserDefinedFunction) else True)
         self._func_type = func_type
+        self._concurrency = concurrency or 16
+        self._timeout = timeout
         self._judf_placeholder = None
         self._takes_row_as_input = False
 
@@ -369,7 +408,8 @@ class UserDefinedFunctionWrapper(object):
             def get_python_function_kind():
                 JPythonFunctionKind = gateway.jvm.org.apache.flink.table.functions.python. \
                     PythonFunctionKind
-                if self._func_type == "general":
+                if self._func_type == "general" or self._func_type == "async":
+                    # async functions are only executed differently in the Python worker
                     return JPythonFunctionKind.GENERAL
                 elif self._func_type == "pandas":
                     return JPythonFunctionKind.PANDAS
@@ -385,6 +425,8 @@ class UserDefinedFunctionWrapper(object):
             func = self._func
             if not isinstance(self._func, UserDefinedFunction):
                 func = self._create_delegate_function()
+            if self._func_type == "async":
+                func = AsyncFunctionWrapper(func, self._concurrency, self._timeout)
 
             import cloudpickle
             serialized_func = cloudpickle.dumps(func)
@@ -404,9 +446,10 @@ class UserDefinedScalarFunctionWrapper(UserDefinedFunctionWrapper):
     Wrapper for Python user-defined scalar function.
     """
 
-    def __init__(self, func, input_types, result_type, func_type, deterministic, name):
+    def __init__(self, func, input_types, result_type, func_type, deterministic, name,
+                 concurrency=None, timeout=None):
         super(UserDefinedScalarFunctionWrapper, self).__init__(
-            func, input_types, func_type, deterministic, name)
+            func, input_types, func_type, deterministic, name, concurrency, timeout)
 
         if not isinstance(result_type, DataType):
             raise TypeError(
@@ -439,9 +482,10 @@ class UserDefinedTableFunctionWrapper(UserDefinedFunctionWrapper):
     Wrapper for Python user-defined table function.
     """
 
-    def __init__(self, func, input_types, result_types, deterministic=None, name=None):
+    def __init__(self, func, input_types, result_types, deterministic=None, name=None,
+                 func_type="general", concurrency=None, timeout=None):
         super(UserDefinedTableFunctionWrapper, self).__init__(
-            func, input_types, "general", deterministic, name)
+            func, input_types, func_type, deterministic, name, concurrency, timeout)
 
         from pyflink.table.types import RowType
         if not isinstance(result_types, collections.Iterable) \
@@ -483,10 +527,18 @@ class UserDefinedAggregateFunctionWrapper(UserDefinedFunctionWrapper):
     Wrapper for Python user-defined aggregate function or user-defined table aggregate function.
     """
     def __init__(self, func, input_types, result_type, accumulator_type, func_type,
-                 deterministic, name, is_table_aggregate=False):
+                 deterministic, name, is_table_aggregate=False, reduction=None):
         super(UserDefinedAggregateFunctionWrapper, self).__init__(
             func, input_types, func_type, deterministic, name)
 
+        if reduction is not None:
+            if func_type != 'pandas' or isinstance(func, UserDefinedFunction):
+                raise ValueError(
+                    "The reduction is only supported for Pandas UDAFs defined by functions.")
+            if reduction not in _PANDAS_UDAF_REDUCTIONS:
+                raise ValueError("The reduction must be one of '%s', got %s."
+                                 % (', '.join(_PANDAS_UDAF_REDUCTIONS), reduction))
+
         if accumulator_type is None and func_type == "general":
             accumulator_type = func.get_accumulator_type()
         if result_type is None:
@@ -506,6 +558,7 @@ class UserDefinedAggregateFunctionWrapper(UserDefinedFunctionWrapper):
         self._result_type = result_type
         self._accumulator_type = accumulator_type
         self._is_table_aggregate = is_table_aggregate
+        self._reduction = reduction
 
     def _create_judf(self, serialized_func, j_input_types, j_function_kind):
         if self._func_type == "pandas":
@@ -540,7 +593,11 @@ class UserDefinedAggregateFunctionWrapper(UserDefinedFunctionWrapper):
 
     def _create_delegate_function(self) -> UserDefinedFunction:
         assert self._func_type == 'pandas'
-        return DelegatingPandasAggregateFunction(self._func)
+        return DelegatingPandasAggregateFunction(self._func, self._reduction)
+
+
+# The reductions which a Pandas UDAF could declare to be equivalent to
+_PANDAS_UDAF_REDUCTIONS = ('sum', 'mean', 'min', 'max', 'count')
 
 
 # TODO: support to configure the python execution environment
@@ -550,18 +607,23 @@ def _get_python_env():
     return gateway.jvm.org.apache.flink.table.functions.python.PythonEnv(exec_type)
 
 
-def _create_udf(f, input_types, result_type, func_type, deterministic, name):
+def _create_udf(f, input_types, result_type, func_type, deterministic, name, concurrency=None,
+                timeout=None):
     return UserDefinedScalarFunctionWrapper(
-        f, input_types, result_type, func_type, deterministic, name)
+        f, input_types, result_type, func_type, deterministic, name, concurrency, timeout)
 
 
-def _create_udtf(f, input_types, result_types, deterministic, name):
-    return UserDefinedTableFunctionWrapper(f, input_types, result_types, deterministic, name)
+def _create_udtf(f, input_types, result_types, deterministic, name, func_type="general",
+                 concurrency=None, timeout=None):
+    return UserDefinedTableFunctionWrapper(
+        f, input_types, result_types, deterministic, name, func_type, concurrency, timeout)
 
 
-def _create_udaf(f, input_types, result_type, accumulator_type, func_type, deterministic, name):
+def _create_udaf(f, input_types, result_type, accumulator_type, func_type, deterministic, name,
+                 reduction=None):
     return UserDefinedAggregateFunctionWrapper(
-        f, input_types, result_type, accumulator_type, func_type, deterministic, name)
+        f, input_types, result_type, accumulator_type, func_type, deterministic, name,
+        reduction=reduction)
 
 
 def _create_udtaf(f, input_types, result_type, accumulator_type, func_type, deterministic, name):
@@ -572,7 +634,8 @@ def _create_udtaf(f, input_types, result_type, accumulator_type, func_type, dete
 def udf(f: Union[Callable, ScalarFunction, Type] = None,
         input_types: Union[List[DataType], DataType] = None, result_type: DataType = None,
         deterministic: bool = None, name: str = None, func_type: str = "general",
-        udf_type: str = None) -> Union[UserDefinedScalarFunctionWrapper, Callable]:
+        udf_type: str = None, concurrency: int = None, timeout: float = None) \
+        -> Union[UserDefinedScalarFunctionWrapper, Callable]:
     """
     Helper method for creating a user-defined function.
 
@@ -591,6 +654,11 @@ def udf(f: Union[Callable, ScalarFunction, Type] = None,
             ...         return i - 1
             >>> subtract_one = udf(SubtractOne(), DataTypes.BIGINT(), DataTypes.BIGINT())
 
+            >>> # Functions which are I/O bound could be executed asynchronously.
+            >>> @udf(result_type=DataTypes.STRING(), func_type="async", concurrency=32)
+            ... async def lookup(k):
+            ...     return await client.get(k)
+
     :param f: lambda function or user-defined function.
     :param input_types: optional, the input data types.
     :param result_type: the result data type.
@@ -598,10 +666,17 @@ def udf(f: Union[Callable, ScalarFunction, Type] = None,
                           this function is guaranteed to always return the same result given the
                           same parameters. (default True)
     :param name: the function name.
-    :param func_type: the type of the python function, available value: general, pandas,
-                     (default: general)
+    :param func_type: the type of the python function, available value: general, pandas, async,
+                     (default: general). An async function is called for multiple rows
+                     concurrently, either in a thread pool or, if it's a coroutine function, in
+                     an asyncio event loop. The results are still emitted in the order of the
+                     input rows.
     :param udf_type: the type of the python function, available value: general, pandas,
                     (default: general)
+    :param concurrency: the maximum number of the concurrent calls of an async function in an
+                        operator. (default 16)
+    :param timeout: the maximum time in seconds to wait for a call of an async function, the job
+                    fails if a call times out. (default no limit)
     :return: UserDefinedScalarFunctionWrapper or function.
 
     .. versionadded:: 1.10.0
@@ -611,23 +686,25 @@ def udf(f: Union[Callable, ScalarFunction, Type] = None,
         warnings.warn("The param udf_type is deprecated in 1.12. Use func_type instead.")
         func_type = udf_type
 
-    if func_type not in ('general', 'pandas'):
-        raise ValueError("The func_type must be one of 'general, pandas', got %s."
+    if func_type not in ('general', 'pandas', 'async'):
+        raise ValueError("The func_type must be one of 'general, pandas, async', got %s."
                          % func_type)
 
     # decorator
     if f is None:
         return functools.partial(_create_udf, input_types=input_types, result_type=result_type,
                                  func_type=func_type, deterministic=deterministic,
-                                 name=name)
+                                 name=name, concurrency=concurrency, timeout=timeout)
     else:
-        return _create_udf(f, input_types, result_type, func_type, deterministic, name)
+        return _create_udf(f, input_types, result_type, func_type, deterministic, name,
+                           concurrency, timeout)
 
 
 def udtf(f: Union[Callable, TableFunction, Type] = None,
          input_types: Union[List[DataType], DataType] = None,
          result_types: Union[List[DataType], DataType] = None, deterministic: bool = None,
-         name: str = None) -> Union[UserDefinedTableFunctionWrapper, Callable]:
+         name: str = None, func_type: str = "general", concurrency: int = None,
+         timeout: float = None) -> Union[UserDefinedTableFunctionWrapper, Callable]:
     """
     Helper method for creating a user-defined table function.
 
@@ -652,22 +729,37 @@ def udtf(f: Union[Callable, TableFunction, Type] = None,
     :param deterministic: the determinism of the function's results. True if and only if a call to
                           this function is guaranteed to always return the same result given the
                           same parameters. (default True)
+    :param func_type: the type of the python function, available value: general, async,
+                     (default: general). An async function is called for multiple rows
+                     concurrently, either in a thread pool or, if it's a coroutine function, in
+                     an asyncio event loop. The results are still emitted in the order of the
+                     input rows.
+    :param concurrency: the maximum number of the concurrent calls of an async function in an
+                        operator. (default 16)
+    :param timeout: the maximum time in seconds to wait for a call of an async function, the job
+                    fails if a call times out. (default no limit)
     :return: UserDefinedTableFunctionWrapper or function.
 
     .. versionadded:: 1.11.0
     """
+    if func_type not in ('general', 'async'):
+        raise ValueError("The func_type must be one of 'general, async', got %s." % func_type)
+
     # decorator
     if f is None:
         return functools.partial(_create_udtf, input_types=input_types, result_types=result_types,
-                                 deterministic=deterministic, name=name)
+                                 deterministic=deterministic, name=name, func_type=func_type,
+                                 concurrency=concurrency, timeout=timeout)
     else:
-        return _create_udtf(f, input_types, result_types, deterministic, name)
+        return _create_udtf(f, input_types, result_types, deterministic, name, func_type,
+                            concurrency, timeout)
 
 
 def udaf(f: Union[Callable, AggregateFunction, Type] = None,
          input_types: Union[List[DataType], DataType] = None, result_type: DataType = None,
          accumulator_type: DataType = None, deterministic: bool = None, name: str = None,
-         func_type: str = "general") -> Union[UserDefinedAggregateFunctionWrapper, Callable]:
+         func_type: str = "general", reduction: str = None) \
+        -> Union[UserDefinedAggregateFunctionWrapper, Callable]:
     """
     Helper method for creating a user-defined aggregate function.
 
@@ -679,6 +771,11 @@ def udaf(f: Union[Callable, AggregateFunction, Type] = None,
             ... def mean_udaf(v):
             ...     return v.mean()
 
+            >>> # The over window aggregations of the function are evaluated incrementally.
+            >>> @udaf(result_type=DataTypes.BIGINT(), func_type="pandas", reduction="sum")
+            ... def sum_udaf(v):
+            ...     return v.sum()
+
     :param f: user-defined aggregate function.
     :param input_types: optional, the input data types.
     :param result_type: the result data type.
@@ -689,6 +786,11 @@ def udaf(f: Union[Callable, AggregateFunction, Type] = None,
     :param name: the function name.
     :param func_type: the type of the python function, available value: general, pandas,
                      (default: general)
+    :param reduction: optional, only for Pandas UDAFs defined by functions which take one
+                      column. It declares that the function is equivalent to the reduction of
+                      pandas.Series, available value: sum, mean, min, max, count. The bounded over
+                      window aggregations of the function are then evaluated incrementally for
+                      all the rows of a partition at once instead of once per row.
     :return: UserDefinedAggregateFunctionWrapper or function.
 
     .. versionadded:: 1.12.0
@@ -700,10 +802,10 @@ def udaf(f: Union[Callable, AggregateFunction, Type] = None,
     if f is None:
         return functools.partial(_create_udaf, input_types=input_types, result_type=result_type,
                                  accumulator_type=accumulator_type, func_type=func_type,
-                                 deterministic=deterministic, name=name)
+                                 deterministic=deterministic, name=name, reduction=reduction)
     else:
         return _create_udaf(f, input_types, result_type, accumulator_type, func_type,
-                            deterministic, name)
+                            deterministic, name, reduction)
 
 
 def udtaf(f: Union[Callable, TableAggregateFunction, Type] = None,
@@ -16,12 +16,17 @@
 # limitations under the License.
 ################################################################################
 import ast
+import hmac
+import secrets
+import socket
+import struct
+import threading
 
 from pyflink.common.types import RowKind
 
 from pyflink.java_gateway import get_gateway
 from pyflink.table.types import DataType, LocalZonedTimestampType, Row, RowType, \
-    TimeType, DateType, ArrayType, MapType, TimestampType, FloatType
+    TimeType, ArrayType, MapType, TimestampType, FloatType
 from pyflink.util.java_utils import to_jarray
 import datetime
 import pickle
@@ -55,6 +60,58 @@ def pandas_to_arrow(schema, timezone, field_types, series):
     return pa.RecordBatch.from_arrays(arrays, schema)
 
 
+def cast_arrow_batch(batch, schema):
+    """
+    Casts the columns of the Arrow batch to the types of the given schema, which is created by
+    :func:`~pyflink.table.types.create_arrow_schema`. The dictionary encoded columns are decoded
+    as the JVM only supports plain columns.
+    """
+    import pyarrow as pa
+    arrays = []
+    for array, field in zip(batch.columns, schema):
+        if pa.types.is_dictionary(array.type):
+            array = array.dictionary_decode()
+        if not array.type.equals(field.type):
+            array = array.cast(field.type)
+        arrays.append(array)
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def create_record_batch_reader(schema, batches):
+    """
+    Creates a pyarrow.RecordBatchReader which reads the given Arrow batches lazily. The versions
+    of pyarrow which don't support RecordBatchReader.from_batches read the batches from an
+    in-memory Arrow stream instead, i.e. all the batches are collected before the first one is
+    read.
+    """
+    import pyarrow as pa
+    if hasattr(getattr(pa, "RecordBatchReader", None), "from_batches"):
+        return pa.RecordBatchReader.from_batches(schema, batches)
+    else:
+        return _read_batches_from_stream(schema, batches)
+
+
+def _read_batches_from_stream(schema, batches):
+    import pyarrow as pa
+    sink = pa.BufferOutputStream()
+    writer = pa.RecordBatchStreamWriter(sink, schema)
+    for batch in batches:
+        writer.write_batch(batch)
+    writer.close()
+    return pa.ipc.open_stream(sink.getvalue())
+
+
+def is_record_batch_reader(data):
+    """
+    Returns whether the data is a pyarrow.RecordBatchReader. The versions of pyarrow which don't
+    export pyarrow.RecordBatchReader only provide the stream readers.
+    """
+    import pyarrow as pa
+    reader_types = tuple(getattr(pa, name) for name in
+                         ("RecordBatchReader", "RecordBatchStreamReader") if hasattr(pa, name))
+    return isinstance(data, reader_types)
+
+
 def arrow_to_pandas(timezone, field_types, batches):
     def arrow_column_to_pandas(arrow_column, t: DataType):
         if type(t) == RowType:
@@ -104,41 +161,117 @@ def to_expression_jarray(exprs):
     return to_jarray(gateway.jvm.Expression, [expr._j_expr for expr in exprs])
 
 
+class LocalSocketServer(object):
+    """
+    A server socket bound to the loopback interface which serves a single connection from the
+    JVM. Once the JVM has connected and sent the secret with ``DataOutputStream.writeUTF``,
+    ``write_func`` is called with a binary file object of the connection in a daemon thread.
+
+    It's used to stream data to the JVM without materializing it on the client, e.g. in a
+    temporary file.
+    """
+
+    def __init__(self, write_func, accept_timeout: float = 60):
+        self._write_func = write_func
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen(1)
+        self._server.settimeout(accept_timeout)
+        # the JVM connects to the address the server is actually bound to
+        self.host, self.port = self._server.getsockname()
+        self.secret = secrets.token_hex(16)
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._serve, name="pyflink-local-socket-server", daemon=True)
+        self._thread.start()
+
+    def _serve(self):
+        try:
+            conn, _ = self._server.accept()
+            self._server.close()
+            with conn:
+                conn.settimeout(None)
+                with conn.makefile('rb') as reader:
+                    length, = struct.unpack('>H', reader.read(2))
+                    secret = reader.read(length).decode('utf-8')
+                if not hmac.compare_digest(secret, self.secret):
+                    raise RuntimeError("The connection to the local socket server has not "
+                                       "been authenticated.")
+                with conn.makefile('wb', buffering=1 << 16) as writer:
+                    self._write_func(writer)
+        except BaseException as e:
+            self._error = e
+        finally:
+            self._server.close()
+
+    def close(self):
+        """
+        Waits until all the data has been written and re-raises the error which occurred while
+        writing the data, if any. It shouldn't be called before the JVM has consumed the data
+        unless the JVM has failed to connect.
+        """
+        try:
+            # wakes up the thread if it's still waiting for the connection
+            self._server.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._server.close()
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+
 def pickled_bytes_to_python_converter(data, field_type: DataType):
+    return create_pickled_bytes_to_python_converter(field_type)(data)
+
+
+def create_pickled_bytes_to_python_converter(field_type: DataType):
+    """
+    Creates a function which converts the pickled bytes of a value of the given type, e.g. the
+    bytes returned by PythonBridgeUtils#getPickledBytesFromJavaObject, to the Python object. The
+    type is only inspected once, which makes it cheaper to convert a lot of values.
+    """
     if isinstance(field_type, RowType):
-        row_kind = RowKind(int.from_bytes(data[0], byteorder='big', signed=False))
-        data = zip(list(data[1:]), field_type.field_types())
-        fields = []
-        for d, d_type in data:
-            fields.append(pickled_bytes_to_python_converter(d, d_type))
-        result_row = Row(fields)
-        result_row.set_row_kind(row_kind)
-        return result_row
-    else:
-        data = pickle.loads(data)
-        if isinstance(field_type, TimeType):
-            seconds, microseconds = divmod(data, 10 ** 6)
+        field_converters = [_create_nullable_converter(t) for t in field_type.field_types()]
+
+        def convert_row(data):
+            row_kind = RowKind(int.from_bytes(data[0], byteorder='big', signed=False))
+            result_row = Row([converter(d) for converter, d in zip(field_converters, data[1:])])
+            result_row.set_row_kind(row_kind)
+            return result_row
+
+        return convert_row
+    elif isinstance(field_type, TimeType):
+        def convert_time(data):
+            seconds, microseconds = divmod(pickle.loads(data), 10 ** 6)
             minutes, seconds = divmod(seconds, 60)
             hours, minutes = divmod(minutes, 60)
             return datetime.time(hours, minutes, seconds, microseconds)
-        elif isinstance(field_type, DateType):
-            return field_type.from_sql_type(data)
-        elif isinstance(field_type, TimestampType):
-            return field_type.from_sql_type(int(data.timestamp() * 10**6))
-        elif isinstance(field_type, MapType):
-            key_type = field_type.key_type
-            value_type = field_type.value_type
-            zip_kv = zip(data[0], data[1])
-            return dict((pickled_bytes_to_python_converter(k, key_type),
-                         pickled_bytes_to_python_converter(v, value_type))
-                        for k, v in zip_kv)
-        elif isinstance(field_type, FloatType):
-            return field_type.from_sql_type(ast.literal_eval(data))
-        elif isinstance(field_type, ArrayType):
-            element_type = field_type.element_type
-            elements = []
-            for element_bytes in data:
-                elements.append(pickled_bytes_to_python_converter(element_bytes, element_type))
-            return elements
-        else:
-            return field_type.from_sql_type(data)
+
+        return convert_time
+    elif isinstance(field_type, TimestampType):
+        return lambda data: field_type.from_sql_type(int(pickle.loads(data).timestamp() * 10**6))
+    elif isinstance(field_type, MapType):
+        key_converter = _create_nullable_converter(field_type.key_type)
+        value_converter = _create_nullable_converter(field_type.value_type)
+
+        def convert_map(data):
+            keys, values = pickle.loads(data)
+            return dict((key_converter(k), value_converter(v)) for k, v in zip(keys, values))
+
+        return convert_map
+    elif isinstance(field_type, FloatType):
+        return lambda data: field_type.from_sql_type(ast.literal_eval(pickle.loads(data)))
+    elif isinstance(field_type, ArrayType):
+        element_converter = _create_nullable_converter(field_type.element_type)
+        return lambda data: [element_converter(e) for e in pickle.loads(data)]
+    elif field_type.need_conversion():
+        return lambda data: field_type.from_sql_type(pickle.loads(data))
+    else:
+        return pickle.loads
+
+
+def _create_nullable_converter(field_type: DataType):
+    # null values are represented as empty bytes
+    converter = create_pickled_bytes_to_python_converter(field_type)
+    return lambda data: None if len(data) == 0 else converter(data)
@@ -73,6 +73,10 @@ else:
                 name="pyflink.fn_execution.window_aggregate_fast",
                 sources=["pyflink/fn_execution/window_aggregate_fast.pyx"],
                 include_dirs=["pyflink/fn_execution/"]),
+            Extension(
+                name="pyflink.fn_execution.datastream_fast",
+                sources=["pyflink/fn_execution/datastream_fast.pyx"],
+                include_dirs=["pyflink/fn_execution/"]),
             Extension(
                 name="pyflink.fn_execution.stream",
                 sources=["pyflink/fn_execution/stream.pyx"],
@@ -105,6 +109,10 @@ else:
                     name="pyflink.fn_execution.window_aggregate_fast",
                     sources=["pyflink/fn_execution/window_aggregate_fast.c"],
                     include_dirs=["pyflink/fn_execution/"]),
+                Extension(
+                    name="pyflink.fn_execution.datastream_fast",
+                    sources=["pyflink/fn_execution/datastream_fast.c"],
+                    include_dirs=["pyflink/fn_execution/"]),
                 Extension(
                     name="pyflink.fn_execution.stream",
                     sources=["pyflink/fn_execution/stream.c"],
@@ -335,6 +343,7 @@ run sdist.
                           'cloudpickle==1.2.2', 'avro-python3>=1.8.1,!=1.9.2,<1.10.0',
                           'jsonpickle==1.2', 'pandas>=1.0,<1.2.0', 'pyarrow>=0.15.1,<3.0.0',
                           'pytz>=2018.3', 'numpy>=1.14.3,<1.20', 'fastavro>=0.21.4,<0.24'],
+        extras_require={'lz4': ['lz4>=3.1.0,<4.0.0']},
         cmdclass={'build_ext': build_ext},
         tests_require=['pytest==4.4.1'],
         description='Apache Flink Python API',
@@ -0,0 +1,138 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one or more
+ * contributor license agreements.  See the NOTICE file distributed with
+ * this work for additional information regarding copyright ownership.
+ * The ASF licenses this file to You under the Apache License, Version 2.0
+ * (the "License"); you may not use this file except in compliance with
+ * the License.  You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.apache.flink.api.common.python;
+
+import org.apache.flink.annotation.Internal;
+import org.apache.flink.util.CloseableIterator;
+import org.apache.flink.util.ExceptionUtils;
+
+import java.util.Iterator;
+import java.util.NoSuchElementException;
+import java.util.concurrent.ArrayBlockingQueue;
+import java.util.concurrent.BlockingQueue;
+
+/**
+ * A {@link CloseableIterator} which fetches the elements of another iterator in a background
+ * thread. The elements which have already been fetched could be checked without blocking with
+ * {@link #hasBufferedNext()}, so that the results of slow or unbounded streams could be
+ * transferred to Python in batches without holding back the available elements.
+ */
+@Internal
+public final class PrefetchingIterator<T> implements CloseableIterator<T> {
+
+    /** The marker which follows the last element. */
+    private static final Object END = new Object();
+
+    private final Iterator<T> iterator;
+
+    private final BlockingQueue<Object> fetchedElements;
+
+    private final Thread fetchThread;
+
+    private volatile boolean closed;
+
+    private volatile Throwable fetchError;
+
+    /** The next element taken from the queue, or {@link #END} if there are no more elements. */
+    private Object nextElement;
+
+    public PrefetchingIterator(Iterator<T> iterator, int capacity) {
+        this.iterator = iterator;
+        this.fetchedElements = new ArrayBlockingQueue<>(capacity);
+        this.fetchThread = new Thread(this::fetch, "Python Collect Prefetcher");
+        this.fetchThread.setDaemon(true);
+        this.fetchThread.start();
+    }
+
+    @Override
+    public boolean hasNext() {
+        if (nextElement == null) {
+            if (closed) {
+                return false;
+            }
+            try {
+                nextElement = fetchedElements.take();
+            } catch (InterruptedException e) {
+                Thread.currentThread().interrupt();
+                throw new RuntimeException("Interrupted while waiting for the next element.", e);
+            }
+        }
+        if (nextElement == END) {
+            if (fetchError != null) {
+                ExceptionUtils.rethrow(fetchError, "Failed to fetch the next element.");
+            }
+            return false;
+        }
+        return true;
+    }
+
+    /** Returns whether the next element has already been fetched, without blocking. */
+    public boolean hasBufferedNext() {
+        if (nextElement == null) {
+            nextElement = fetchedElements.poll();
+        }
+        return nextElement != null && nextElement != END;
+    }
+
+    @Override
+    @SuppressWarnings("unchecked")
+    public T next() {
+        if (!hasNext()) {
+            throw new NoSuchElementException();
+        }
+        T element = (T) nextElement;
+        nextElement = null;
+        return element;
+    }
+
+    @Override
+    public void close() throws Exception {
+        closed = true;
+        fetchThread.interrupt();
+        try {
+            if (iterator instanceof AutoCloseable) {
+                ((AutoCloseable) iterator).close();
+            }
+        } finally {
+            // wakes up the consumer which may be waiting for the next element
+            fetchedElements.clear();
+            fetchedElements.offer(END);
+        }
+    }
+
+    private void fetch() {
+        try {
+            while (!closed && iterator.hasNext()) {
+                fetchedElements.put(iterator.next());
+            }
+        } catch (InterruptedException e) {
+            // the iterator has been closed
+            return;
+        } catch (Throwable t) {
+            if (closed) {
+                return;
+            }
+            fetchError = t;
+        }
+        try {
+            fetchedElements.put(END);
+        } catch (InterruptedException e) {
+            // the iterator has been closed
+        }
+    }
+}
@@ -30,6 +30,7 @@ import org.apache.flink.api.java.typeutils.MapTypeInfo;
 import org.apache.flink.api.java.typeutils.RowTypeInfo;
 import org.apache.flink.api.java.typeutils.TupleTypeInfo;
 import org.apache.flink.api.java.typeutils.TupleTypeInfoBase;
+import org.apache.flink.streaming.api.typeinfo.python.PickledByteArrayTypeInfo;
 import org.apache.flink.table.types.DataType;
 import org.apache.flink.table.types.logical.ArrayType;
 import org.apache.flink.table.types.logical.DateType;
@@ -59,6 +60,7 @@ import java.time.LocalDateTime;
 import java.time.LocalTime;
 import java.util.ArrayList;
 import java.util.Arrays;
+import java.util.Iterator;
 import java.util.LinkedList;
 import java.util.List;
 import java.util.Map;
@@ -377,6 +379,58 @@ public final class PythonBridgeUtils {
         return getPickledBytesFromJavaObject(row, RowType.of(logicalTypes));
     }
 
+    /**
+     * Pickles at most maxRows rows of the iterator into one list of the pickled rows, see {@link
+     * #getPickledBytesFromRow}, so that the rows could be fetched with one round trip. Only the
+     * first row is waited for, the following rows are added only if they are already available,
+     * see {@link #hasAvailableNext}. The returned list is empty only if the iterator is exhausted.
+     */
+    public static byte[] getPickledBytesFromRows(
+            Iterator<Row> rows, DataType[] dataTypes, int maxRows) throws IOException {
+        RowType rowType =
+                RowType.of(
+                        Arrays.stream(dataTypes)
+                                .map(DataType::getLogicalType)
+                                .toArray(LogicalType[]::new));
+        List<Object> rowsBytes = new ArrayList<>(maxRows);
+        while (rowsBytes.size() < maxRows
+                && (rowsBytes.isEmpty() || hasAvailableNext(rows))
+                && rows.hasNext()) {
+            rowsBytes.add(getPickledBytesFromJavaObject(rows.next(), rowType));
+        }
+        return new Pickler().dumps(rowsBytes);
+    }
+
+    /**
+     * Pickles at most maxNum objects of the iterator into one list, so that they could be fetched
+     * with one round trip. The objects of {@link PickledByteArrayTypeInfo} are already pickled
+     * and are added as they are, the other objects are pickled with {@link
+     * #getPickledBytesFromJavaObject(Object, TypeInformation)}. Only the first object is waited
+     * for, the following objects are added only if they are already available, see {@link
+     * #hasAvailableNext}. The returned list is empty only if the iterator is exhausted.
+     */
+    public static byte[] getPickledBytesFromJavaObjects(
+            Iterator<?> objects, TypeInformation<?> dataType, int maxNum) throws IOException {
+        boolean pickled = dataType instanceof PickledByteArrayTypeInfo;
+        List<Object> objectsBytes = new ArrayList<>(maxNum);
+        while (objectsBytes.size() < maxNum
+                && (objectsBytes.isEmpty() || hasAvailableNext(objects))
+                && objects.hasNext()) {
+            Object obj = objects.next();
+            objectsBytes.add(pickled ? obj : getPickledBytesFromJavaObject(obj, dataType));
+        }
+        return new Pickler().dumps(objectsBytes);
+    }
+
+    /**
+     * Returns whether the next element of the iterator could be taken without blocking. It is only
+     * known for a {@link PrefetchingIterator}, the other iterators are assumed to never block.
+     */
+    private static boolean hasAvailableNext(Iterator<?> iterator) {
+        return !(iterator instanceof PrefetchingIterator)
+                || ((PrefetchingIterator<?>) iterator).hasBufferedNext();
+    }
+
     private static boolean initialized = false;
 
     private static void initialize() {
@@ -36,6 +36,8 @@ import py4j.CallbackClient;
 import py4j.Gateway;
 import py4j.GatewayServer;
 
+import javax.annotation.Nullable;
+
 import java.io.File;
 import java.io.IOException;
 import java.lang.reflect.Field;
@@ -294,6 +296,18 @@ final class PythonEnvUtils {
      * @return The created GatewayServer
      */
     static GatewayServer startGatewayServer() throws ExecutionException, InterruptedException {
+        return startGatewayServer(null);
+    }
+
+    /**
+     * Creates a GatewayServer run in a daemon thread.
+     *
+     * @param authToken The token which the clients have to authenticate with, or null if the
+     *     clients are not authenticated.
+     * @return The created GatewayServer
+     */
+    static GatewayServer startGatewayServer(@Nullable String authToken)
+            throws ExecutionException, InterruptedException {
         CompletableFuture<GatewayServer> gatewayServerFuture = new CompletableFuture<>();
         Thread thread =
                 new Thread(
@@ -308,6 +322,7 @@ final class PythonEnvUtils {
                                                                         String, Object>(),
                                                                 new CallbackClient(freePort)))
                                                 .javaPort(0)
+                                                .authToken(authToken)
                                                 .build();
                                 resetCallbackClientExecutorService(server);
                                 gatewayServerFuture.complete(server);
@@ -25,6 +25,7 @@ import java.io.DataOutputStream;
 import java.io.File;
 import java.io.FileOutputStream;
 import java.io.IOException;
+import java.nio.charset.StandardCharsets;
 import java.nio.file.Files;
 import java.util.Map;
 import java.util.concurrent.ExecutionException;
@@ -35,6 +36,15 @@ import static org.apache.flink.client.python.PythonEnvUtils.TIMEOUT_MILLIS;
 /** The Py4j Gateway Server provides RPC service for user's python process. */
 public class PythonGatewayServer {
 
+    /**
+     * The environment variable which makes the server a standby daemon which is taken by a later
+     * Python process, see {@link #waitForClient}. Its value is the idle timeout in milliseconds.
+     */
+    static final String DAEMON_IDLE_TIMEOUT_ENV = "_PYFLINK_GATEWAY_DAEMON_IDLE_TIMEOUT";
+
+    /** The environment variable of the token which the Python process has to authenticate with. */
+    static final String AUTH_TOKEN_ENV = "_PYFLINK_GATEWAY_AUTH_TOKEN";
+
     /**
      * Main method to start a local GatewayServer on a ephemeral port. It tells python side via a
      * file.
@@ -43,7 +53,8 @@ public class PythonGatewayServer {
      */
     public static void main(String[] args)
             throws IOException, ExecutionException, InterruptedException {
-        GatewayServer gatewayServer = PythonEnvUtils.startGatewayServer();
+        String authToken = System.getenv(AUTH_TOKEN_ENV);
+        GatewayServer gatewayServer = PythonEnvUtils.startGatewayServer(authToken);
         PythonEnvUtils.setGatewayServer(gatewayServer);
 
         int boundPort = gatewayServer.getListeningPort();
@@ -64,6 +75,10 @@ public class PythonGatewayServer {
         DataOutputStream stream = new DataOutputStream(fileOutputStream);
         stream.writeInt(boundPort);
         stream.writeInt(callbackPort);
+        if (authToken != null) {
+            // the temporary file is only accessible by the owner
+            stream.write(authToken.getBytes(StandardCharsets.UTF_8));
+        }
         stream.close();
         fileOutputStream.close();
 
@@ -80,6 +95,13 @@ public class PythonGatewayServer {
             Map<String, Object> entryPoint =
                     (Map<String, Object>) gatewayServer.getGateway().getEntryPoint();
 
+            String daemonIdleTimeout = System.getenv(DAEMON_IDLE_TIMEOUT_ENV);
+            if (daemonIdleTimeout != null
+                    && !waitForClient(handshakeFile, Long.parseLong(daemonIdleTimeout))) {
+                gatewayServer.shutdown();
+                System.exit(0);
+            }
+
             for (int i = 0; i < TIMEOUT_MILLIS / CHECK_INTERVAL; i++) {
                 if (entryPoint.containsKey("Watchdog")) {
                     break;
@@ -101,6 +123,25 @@ public class PythonGatewayServer {
         }
     }
 
+    /**
+     * Waits until the standby daemon is taken by a Python process, which deletes the handshake file
+     * then. A daemon only serves one Python process, so that no state, e.g. the running jobs or the
+     * loaded jars, is shared between the Python processes. Returns false if the daemon hasn't been
+     * taken within the idle timeout, the handshake file is deleted then so that it could not be
+     * taken any more.
+     */
+    private static boolean waitForClient(File handshakeFile, long idleTimeoutMillis)
+            throws InterruptedException {
+        for (long idleMillis = 0; idleMillis < idleTimeoutMillis; idleMillis += CHECK_INTERVAL) {
+            if (!handshakeFile.exists()) {
+                return true;
+            }
+            Thread.sleep(CHECK_INTERVAL);
+        }
+        // the deletion fails if the handshake file has just been taken by a Python process
+        return !handshakeFile.delete();
+    }
+
     /** A simple watch dog interface. */
     public interface Watchdog {
         boolean ping() throws InterruptedException;
@@ -83,6 +83,21 @@ public class PythonConfig implements Serializable {
     /** Whether to use managed memory for the Python worker. */
     private final boolean isUsingManagedMemory;
 
+    /** Whether the Python workers are forked from the Python worker pool. */
+    private final boolean isWorkerPoolEnabled;
+
+    /** Whether the large buffers of pickled records are carried out of band. */
+    private final boolean isPickleOutOfBandEnabled;
+
+    /** The block compression of the data exchanged with the Python workers. */
+    private final String dataCompression;
+
+    /** The size of the shared memory via which the data is exchanged with the Python workers. */
+    private final long sharedMemorySize;
+
+    /** The maximum size of the results buffered in the Python workers before they are sent. */
+    private final long outputFlushSize;
+
     /** The Configuration that contains execution configs and dependencies info. */
     private final Configuration mergedConfig;
 
@@ -106,6 +121,11 @@ public class PythonConfig implements Serializable {
         pythonExec = config.get(PythonOptions.PYTHON_EXECUTABLE);
         metricEnabled = config.getBoolean(PythonOptions.PYTHON_METRIC_ENABLED);
         isUsingManagedMemory = config.getBoolean(PythonOptions.USE_MANAGED_MEMORY);
+        isWorkerPoolEnabled = config.getBoolean(PythonOptions.WORKER_POOL_ENABLED);
+        isPickleOutOfBandEnabled = config.getBoolean(PythonOptions.PICKLE_OUT_OF_BAND_ENABLED);
+        dataCompression = config.get(PythonOptions.DATA_COMPRESSION);
+        sharedMemorySize = config.get(PythonOptions.SHARED_MEMORY_SIZE);
+        outputFlushSize = config.get(PythonOptions.OUTPUT_FLUSH_SIZE);
     }
 
     public int getMaxBundleSize() {
@@ -148,6 +168,26 @@ public class PythonConfig implements Serializable {
         return isUsingManagedMemory;
     }
 
+    public boolean isWorkerPoolEnabled() {
+        return isWorkerPoolEnabled;
+    }
+
+    public boolean isPickleOutOfBandEnabled() {
+        return isPickleOutOfBandEnabled;
+    }
+
+    public String getDataCompression() {
+        return dataCompression;
+    }
+
+    public long getSharedMemorySize() {
+        return sharedMemorySize;
+    }
+
+    public long getOutputFlushSize() {
+        return outputFlushSize;
+    }
+
     public Configuration getMergedConfig() {
         return mergedConfig;
     }
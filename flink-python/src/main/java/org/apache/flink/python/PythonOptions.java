@@ -149,6 +149,84 @@ public class PythonOptions {
                                             + "configuration key %s.",
                                     TaskManagerOptions.TASK_OFF_HEAP_MEMORY.key()));
 
+    /** Whether the Python workers are forked from a pool of pre-initialized Python processes. */
+    @Experimental
+    public static final ConfigOption<Boolean> WORKER_POOL_ENABLED =
+            ConfigOptions.key("python.fn-execution.worker-pool.enabled")
+                    .defaultValue(false)
+                    .withDescription(
+                            "If set, the Python workers of the process mode are forked from a pool "
+                                    + "of Python processes which have already imported Apache Beam and PyFlink, "
+                                    + "instead of starting a new Python interpreter for each Python worker. It "
+                                    + "reduces the startup time of the Python workers on failover and rescaling. "
+                                    + "The pool is shared by the Python workers running on the same machine with "
+                                    + "the same Python interpreter, and is only supported on POSIX systems. Note "
+                                    + "that this is an experimental flag and might not be available in future "
+                                    + "releases.");
+
+    /** Whether the large buffers of pickled records are carried out of band. */
+    @Experimental
+    public static final ConfigOption<Boolean> PICKLE_OUT_OF_BAND_ENABLED =
+            ConfigOptions.key("python.fn-execution.pickle.out-of-band.enabled")
+                    .defaultValue(false)
+                    .withDescription(
+                            "If set, the records of the Python DataStream API without declared type "
+                                    + "information are pickled with pickle protocol 5, and the large buffers "
+                                    + "contained in them, e.g. the data of NumPy arrays, are written out of band "
+                                    + "instead of being copied into the pickled bytes. It avoids copying these "
+                                    + "buffers on encoding and decoding. It requires Python 3.8 or later and "
+                                    + "changes the serialized form of such records, so it should not be changed "
+                                    + "for a job restored from a savepoint whose keys have no declared type "
+                                    + "information. Note that this is an experimental flag and might not be "
+                                    + "available in future releases.");
+
+    /** The block compression of the data exchanged with the Python workers. */
+    @Experimental
+    public static final ConfigOption<String> DATA_COMPRESSION =
+            ConfigOptions.key("python.fn-execution.compression")
+                    .defaultValue("NONE")
+                    .withDescription(
+                            "The block compression of the data exchanged between the Java operators "
+                                    + "of the Python Table API user-defined functions and the Python workers. The "
+                                    + "supported compressions are 'NONE' and 'LZ4', and the Python package lz4 "
+                                    + "should be installed in the Python environment of the workers to use 'LZ4'. "
+                                    + "It reduces the bandwidth used by wide rows, e.g. rows which contain many "
+                                    + "strings, at the cost of more CPU usage. The Pandas user-defined functions "
+                                    + "are not affected. Note that this is an experimental flag and might not be "
+                                    + "available in future releases.");
+
+    /** The size of the shared memory via which the data is exchanged with the Python workers. */
+    @Experimental
+    public static final ConfigOption<Long> SHARED_MEMORY_SIZE =
+            ConfigOptions.key("python.fn-execution.shared-memory.size")
+                    .defaultValue(0L)
+                    .withDescription(
+                            "The size in bytes of the memory mapped files via which the data is "
+                                    + "exchanged between the Java operators of the Python Table API "
+                                    + "user-defined functions and the Python workers, one file is used for each "
+                                    + "direction of each operator. Only small references to the data are sent "
+                                    + "via gRPC then, which avoids the framing and copying of the data. The data "
+                                    + "which doesn't fit into the remaining space of a bundle is still sent via "
+                                    + "gRPC. It's disabled if it's not a positive value and it should be less "
+                                    + "than 2 GB. The Pandas user-defined functions are not affected. Note that "
+                                    + "this is an experimental flag and might not be available in future "
+                                    + "releases.");
+
+    /** The maximum size of the results buffered in a Python worker before they are sent. */
+    @Experimental
+    public static final ConfigOption<Long> OUTPUT_FLUSH_SIZE =
+            ConfigOptions.key("python.fn-execution.output.flush-size")
+                    .defaultValue(10L * 1024 * 1024)
+                    .withDescription(
+                            "The maximum size in bytes of the results buffered in a Python worker "
+                                    + "before they are sent to the Java operator. If the Python worker uses "
+                                    + "managed memory (see python.fn-execution.memory.managed), it's also "
+                                    + "bounded by 1/16 of the managed memory of the Python worker. A smaller "
+                                    + "value reduces the memory usage of the Python worker for the functions "
+                                    + "which produce many results or large results, at the cost of more "
+                                    + "messages. Note that this is an experimental flag and might not be "
+                                    + "available in future releases.");
+
     /** The maximum number of states cached in a Python UDF worker. */
     @Experimental
     public static final ConfigOption<Integer> STATE_CACHE_SIZE =
@@ -158,6 +236,29 @@ public class PythonOptions {
                             "The maximum number of states cached in a Python UDF worker. Note that this "
                                     + "is an experimental flag and might not be available in future releases.");
 
+    /** The maximum estimated size in bytes of the states cached in a Python UDF worker. */
+    @Experimental
+    public static final ConfigOption<Long> STATE_CACHE_MAX_BYTES =
+            ConfigOptions.key("python.state.cache-max-bytes")
+                    .defaultValue(0L)
+                    .withDescription(
+                            "The maximum estimated size in bytes of the states cached in a Python UDF "
+                                    + "worker, including both the pending writes of the states and the "
+                                    + "contents read from the Java side which are cached for them. The "
+                                    + "cache is only bounded by the number of the cached states "
+                                    + "(see python.state.cache-size) if it is not a positive value. Note that "
+                                    + "this is an experimental flag and might not be available in future releases.");
+
+    /** The eviction policy of the states cached in a Python UDF worker. */
+    @Experimental
+    public static final ConfigOption<String> STATE_CACHE_EVICTION_POLICY =
+            ConfigOptions.key("python.state.cache-eviction-policy")
+                    .defaultValue("LRU")
+                    .withDescription(
+                            "The policy used to evict the states cached in a Python UDF worker. The "
+                                    + "supported policies are 'LRU' and 'W-TinyLFU'. Note that this is an "
+                                    + "experimental flag and might not be available in future releases.");
+
     /** The maximum number of cached items which read from Java side in a Python MapState. */
     @Experimental
     public static final ConfigOption<Integer> MAP_STATE_READ_CACHE_SIZE =
@@ -76,6 +76,11 @@ public final class ProcessPythonEnvironmentManager implements PythonEnvironmentM
 
     @VisibleForTesting public static final String PYTHON_WORKING_DIR = "_PYTHON_WORKING_DIR";
 
+    public static final String PYTHON_WORKER_POOL_ENABLED = "_PYTHON_WORKER_POOL_ENABLED";
+
+    public static final String PYTHON_PICKLE_OUT_OF_BAND_ENABLED =
+            "_PYTHON_PICKLE_OUT_OF_BAND_ENABLED";
+
     @VisibleForTesting static final String PYTHON_REQUIREMENTS_DIR = "python-requirements";
     @VisibleForTesting static final String PYTHON_ARCHIVES_DIR = "python-archives";
     @VisibleForTesting static final String PYTHON_FILES_DIR = "python-files";
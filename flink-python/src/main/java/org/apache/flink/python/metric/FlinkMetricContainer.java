@@ -76,6 +76,11 @@ public final class FlinkMetricContainer {
         this.metricsContainers = new MetricsContainerStepMap();
     }
 
+    /** Returns the metric group of the operator which the metrics are registered to. */
+    public MetricGroup getMetricGroup() {
+        return baseMetricGroup;
+    }
+
     private MetricsContainerImpl getMetricsContainer(String stepName) {
         return metricsContainers.getContainer(stepName);
     }
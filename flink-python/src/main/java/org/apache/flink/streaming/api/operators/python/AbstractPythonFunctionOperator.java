@@ -36,6 +36,7 @@ import org.apache.flink.util.Preconditions;
 
 import java.io.IOException;
 import java.util.HashMap;
+import java.util.Map;
 import java.util.concurrent.ScheduledFuture;
 
 import static org.apache.flink.streaming.api.utils.ClassLeakCleaner.cleanUpLeakingClasses;
@@ -285,10 +286,17 @@ public abstract class AbstractPythonFunctionOperator<OUT> extends AbstractStream
                 PythonDependencyInfo.create(config, getRuntimeContext().getDistributedCache());
         PythonEnv pythonEnv = getPythonEnv();
         if (pythonEnv.getExecType() == PythonEnv.ExecType.PROCESS) {
+            Map<String, String> env = new HashMap<>(System.getenv());
+            if (config.isWorkerPoolEnabled()) {
+                env.put(ProcessPythonEnvironmentManager.PYTHON_WORKER_POOL_ENABLED, "true");
+            }
+            if (config.isPickleOutOfBandEnabled()) {
+                env.put(ProcessPythonEnvironmentManager.PYTHON_PICKLE_OUT_OF_BAND_ENABLED, "true");
+            }
             return new ProcessPythonEnvironmentManager(
                     dependencyInfo,
                     getContainingTask().getEnvironment().getTaskManagerInfo().getTmpDirectories(),
-                    new HashMap<>(System.getenv()));
+                    env);
         } else {
             throw new UnsupportedOperationException(
                     String.format(
@@ -0,0 +1,104 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one
+ * or more contributor license agreements.  See the NOTICE file
+ * distributed with this work for additional information
+ * regarding copyright ownership.  The ASF licenses this file
+ * to you under the Apache License, Version 2.0 (the
+ * "License"); you may not use this file except in compliance
+ * with the License.  You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.apache.flink.streaming.api.operators.python;
+
+import org.apache.flink.annotation.Internal;
+import org.apache.flink.api.common.typeinfo.TypeInformation;
+import org.apache.flink.api.common.typeinfo.Types;
+import org.apache.flink.api.java.tuple.Tuple2;
+import org.apache.flink.configuration.Configuration;
+import org.apache.flink.streaming.api.functions.python.DataStreamPythonFunctionInfo;
+import org.apache.flink.streaming.runtime.streamrecord.StreamRecord;
+import org.apache.flink.types.Row;
+
+/**
+ * {@link PythonAsyncMapOperator} is responsible for launching beam runner which will start a python
+ * harness to execute user defined python AsyncFunction.
+ *
+ * <p>The results of the AsyncFunction may be emitted in a different order than the input elements,
+ * so the timestamp of each input element is sent to the python harness together with the element
+ * and sent back together with the result, instead of being buffered in a queue.
+ */
+@Internal
+public class PythonAsyncMapOperator<IN, OUT>
+        extends OneInputPythonFunctionOperator<IN, OUT, Row, Row> {
+
+    private static final long serialVersionUID = 1L;
+
+    private static final String ASYNC_FUNCTION_URN = "flink:transform:datastream_async_function:v1";
+
+    private static final String MAP_CODER_URN = "flink:coder:map:v1";
+
+    /** Reusable row for normal data runner inputs. */
+    private transient Row reusableInput;
+
+    public PythonAsyncMapOperator(
+            Configuration config,
+            TypeInformation<IN> inputTypeInfo,
+            TypeInformation<OUT> outputTypeInfo,
+            DataStreamPythonFunctionInfo pythonFunctionInfo) {
+        super(
+                config,
+                Types.ROW(Types.LONG, inputTypeInfo),
+                Types.ROW(Types.LONG, outputTypeInfo),
+                pythonFunctionInfo);
+    }
+
+    @Override
+    public void open() throws Exception {
+        super.open();
+        reusableInput = new Row(2);
+    }
+
+    @Override
+    @SuppressWarnings("unchecked")
+    public void emitResult(Tuple2<byte[], Integer> resultTuple) throws Exception {
+        byte[] rawResult = resultTuple.f0;
+        int length = resultTuple.f1;
+        // each input element produces exactly one result
+        bufferedTimestamp.poll();
+        bais.setBuffer(rawResult, 0, length);
+        Row runnerOutput = runnerOutputTypeSerializer.deserialize(baisWrapper);
+        Long timestamp = (Long) runnerOutput.getField(0);
+        if (timestamp == null) {
+            collector.eraseTimestamp();
+        } else {
+            collector.setAbsoluteTimestamp(timestamp);
+        }
+        collector.collect((OUT) runnerOutput.getField(1));
+    }
+
+    @Override
+    public void processElement(StreamRecord<IN> element) throws Exception {
+        reusableInput.setField(0, element.hasTimestamp() ? element.getTimestamp() : null);
+        reusableInput.setField(1, element.getValue());
+        element.replace(reusableInput);
+        super.processElement(element);
+    }
+
+    @Override
+    public String getFunctionUrn() {
+        return ASYNC_FUNCTION_URN;
+    }
+
+    @Override
+    public String getCoderUrn() {
+        return MAP_CODER_URN;
+    }
+}
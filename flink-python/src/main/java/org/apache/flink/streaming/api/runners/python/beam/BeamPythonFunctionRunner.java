@@ -19,6 +19,7 @@
 package org.apache.flink.streaming.api.runners.python.beam;
 
 import org.apache.flink.annotation.Internal;
+import org.apache.flink.annotation.VisibleForTesting;
 import org.apache.flink.api.common.ExecutionConfig;
 import org.apache.flink.api.common.state.ListState;
 import org.apache.flink.api.common.state.ListStateDescriptor;
@@ -29,6 +30,8 @@ import org.apache.flink.api.common.typeinfo.PrimitiveArrayTypeInfo;
 import org.apache.flink.api.common.typeutils.TypeSerializer;
 import org.apache.flink.api.java.tuple.Tuple2;
 import org.apache.flink.api.java.typeutils.runtime.RowSerializer;
+import org.apache.flink.metrics.Gauge;
+import org.apache.flink.metrics.MetricGroup;
 import org.apache.flink.core.memory.ByteArrayInputStreamWithPos;
 import org.apache.flink.core.memory.ByteArrayOutputStreamWithPos;
 import org.apache.flink.core.memory.DataInputViewStreamWrapper;
@@ -41,6 +44,10 @@ import org.apache.flink.python.env.ProcessPythonEnvironment;
 import org.apache.flink.python.env.PythonEnvironment;
 import org.apache.flink.python.env.PythonEnvironmentManager;
 import org.apache.flink.python.metric.FlinkMetricContainer;
+import org.apache.flink.runtime.io.compression.BlockCompressionFactory;
+import org.apache.flink.runtime.io.compression.BlockCompressor;
+import org.apache.flink.runtime.io.compression.BlockDecompressor;
+import org.apache.flink.runtime.io.compression.Lz4BlockCompressionFactory;
 import org.apache.flink.runtime.memory.MemoryManager;
 import org.apache.flink.runtime.memory.OpaqueMemoryResource;
 import org.apache.flink.runtime.state.KeyedStateBackend;
@@ -81,6 +88,7 @@ import org.apache.beam.sdk.options.PipelineOptionsFactory;
 import org.apache.beam.sdk.options.PortablePipelineOptions;
 import org.apache.beam.sdk.transforms.windowing.BoundedWindow;
 import org.apache.beam.sdk.transforms.windowing.GlobalWindow;
+import org.apache.beam.sdk.util.VarInt;
 import org.apache.beam.sdk.util.WindowedValue;
 import org.apache.beam.vendor.grpc.v1p26p0.com.google.common.base.Charsets;
 import org.apache.beam.vendor.grpc.v1p26p0.com.google.protobuf.ByteString;
@@ -93,11 +101,14 @@ import javax.annotation.Nullable;
 
 import java.io.ByteArrayOutputStream;
 import java.io.IOException;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
 import java.util.Arrays;
 import java.util.Collection;
 import java.util.Collections;
 import java.util.HashMap;
 import java.util.Iterator;
+import java.util.Locale;
 import java.util.LinkedList;
 import java.util.List;
 import java.util.Map;
@@ -130,6 +141,10 @@ public abstract class BeamPythonFunctionRunner implements PythonFunctionRunner {
 
     private static final String MANAGED_MEMORY_RESOURCE_ID = "python-process-managed-memory";
     private static final String PYTHON_WORKER_MEMORY_LIMIT = "_PYTHON_WORKER_MEMORY_LIMIT";
+    private static final String PYTHON_OUTPUT_FLUSH_SIZE = "_PYTHON_OUTPUT_FLUSH_SIZE";
+
+    /** The size in bytes of the input elements which are sent as one block. */
+    private static final int BLOCK_SIZE = 64 * 1024;
 
     protected final FlinkFnApi.CoderParam.OutputMode outputMode;
 
@@ -193,6 +208,39 @@ public abstract class BeamPythonFunctionRunner implements PythonFunctionRunner {
     /** The shared resource among Python operators of the same slot. */
     private OpaqueMemoryResource<PythonSharedResources> sharedResources;
 
+    /** The compression of the data exchanged between this runner and the Python worker. */
+    protected transient FlinkFnApi.CoderParam.Compression compression;
+
+    /** The compressor of the input blocks, it's null if the data is not compressed. */
+    @Nullable private transient BlockCompressor compressor;
+
+    /** The decompressor of the output blocks, it's null if the data is not compressed. */
+    @Nullable private transient BlockDecompressor decompressor;
+
+    /**
+     * The shared memory via which the input blocks are sent, it's null if the data is sent via
+     * gRPC.
+     */
+    @Nullable private transient PythonSharedMemory inputSharedMemory;
+
+    /**
+     * The shared memory via which the output blocks are received, it's null if the data is
+     * received via gRPC.
+     */
+    @Nullable private transient PythonSharedMemory outputSharedMemory;
+
+    /**
+     * The length-prefixed input elements which will be sent as the next block, it's null if the
+     * input elements are sent one by one.
+     */
+    @Nullable private transient ByteArrayOutputStreamWithPos inputBlock;
+
+    /** The total size in bytes of the data exchanged with the Python worker before compression. */
+    private transient long uncompressedBytes;
+
+    /** The total size in bytes of the data exchanged with the Python worker after compression. */
+    private transient long compressedBytes;
+
     public BeamPythonFunctionRunner(
             String taskName,
             PythonEnvironmentManager environmentManager,
@@ -223,6 +271,9 @@ public abstract class BeamPythonFunctionRunner implements PythonFunctionRunner {
     public void open(PythonConfig config) throws Exception {
         this.bundleStarted = false;
         this.resultBuffer = new LinkedBlockingQueue<>();
+        // The compression and the shared memory should be determined before the creation of the
+        // executable stage as they're part of the coders.
+        openDataBlocks(config);
 
         // The creation of stageBundleFactory depends on the initialized environment manager.
         environmentManager.open();
@@ -230,16 +281,20 @@ public abstract class BeamPythonFunctionRunner implements PythonFunctionRunner {
         PortablePipelineOptions portableOptions =
                 PipelineOptionsFactory.as(PortablePipelineOptions.class);
 
-        if (jobOptions.containsKey(PythonOptions.STATE_CACHE_SIZE.key())) {
-            portableOptions
-                    .as(ExperimentalOptions.class)
-                    .setExperiments(
-                            Collections.singletonList(
-                                    ExperimentalOptions.STATE_CACHE_SIZE
-                                            + "="
-                                            + jobOptions.get(
-                                                    PythonOptions.STATE_CACHE_SIZE.key())));
-        }
+        // The state cache of the Python worker is always enabled (unless its size is configured
+        // to 0), so that the state read in one bundle stays valid in the following bundles as
+        // long as the cache token of this runner doesn't change.
+        portableOptions
+                .as(ExperimentalOptions.class)
+                .setExperiments(
+                        Collections.singletonList(
+                                ExperimentalOptions.STATE_CACHE_SIZE
+                                        + "="
+                                        + jobOptions.getOrDefault(
+                                                PythonOptions.STATE_CACHE_SIZE.key(),
+                                                PythonOptions.STATE_CACHE_SIZE
+                                                        .defaultValue()
+                                                        .toString())));
 
         Struct pipelineOptions = PipelineOptionsTranslation.toProto(portableOptions);
 
@@ -254,7 +309,7 @@ public abstract class BeamPythonFunctionRunner implements PythonFunctionRunner {
                     (size) ->
                             new PythonSharedResources(
                                     createJobBundleFactory(pipelineOptions),
-                                    createPythonExecutionEnvironment(size));
+                                    createPythonExecutionEnvironment(config, size));
 
             sharedResources =
                     memoryManager.getSharedMemoryResourceForManagedMemory(
@@ -273,19 +328,27 @@ public abstract class BeamPythonFunctionRunner implements PythonFunctionRunner {
             jobBundleFactory = createJobBundleFactory(pipelineOptions);
             stageBundleFactory =
                     createStageBundleFactory(
-                            jobBundleFactory, createPythonExecutionEnvironment(-1));
+                            jobBundleFactory, createPythonExecutionEnvironment(config, -1));
         }
         progressHandler = getProgressHandler(flinkMetricContainer);
     }
 
     @Override
     public void close() throws Exception {
+        if (compressor != null && compressedBytes > 0) {
+            LOG.info(
+                    "Compressed {} bytes of the data exchanged with the Python worker to {} bytes.",
+                    uncompressedBytes,
+                    compressedBytes);
+        }
+
         try {
             if (jobBundleFactory != null) {
                 jobBundleFactory.close();
             }
         } finally {
             jobBundleFactory = null;
+            closeSharedMemory();
         }
 
         try {
@@ -308,7 +371,15 @@ public abstract class BeamPythonFunctionRunner implements PythonFunctionRunner {
     @Override
     public void process(byte[] data) throws Exception {
         checkInvokeStartBundle();
-        mainInputReceiver.accept(WindowedValue.valueInGlobalWindow(data));
+        if (inputBlock != null) {
+            VarInt.encode(data.length, inputBlock);
+            inputBlock.write(data);
+            if (inputBlock.getPosition() >= BLOCK_SIZE) {
+                sendBlock();
+            }
+        } else {
+            mainInputReceiver.accept(WindowedValue.valueInGlobalWindow(data));
+        }
     }
 
     @Override
@@ -326,6 +397,9 @@ public abstract class BeamPythonFunctionRunner implements PythonFunctionRunner {
     @Override
     public void flush() throws Exception {
         if (bundleStarted) {
+            if (inputBlock != null && inputBlock.getPosition() > 0) {
+                sendBlock();
+            }
             finishBundle();
             bundleStarted = false;
         }
@@ -344,14 +418,15 @@ public abstract class BeamPythonFunctionRunner implements PythonFunctionRunner {
      * Creates a specification which specifies the portability Python execution environment. It's
      * used by Beam's portability framework to creates the actual Python execution environment.
      */
-    private RunnerApi.Environment createPythonExecutionEnvironment(long memoryLimitBytes)
-            throws Exception {
+    private RunnerApi.Environment createPythonExecutionEnvironment(
+            PythonConfig config, long memoryLimitBytes) throws Exception {
         PythonEnvironment environment = environmentManager.createEnvironment();
         if (environment instanceof ProcessPythonEnvironment) {
             ProcessPythonEnvironment processEnvironment = (ProcessPythonEnvironment) environment;
             Map<String, String> env = processEnvironment.getEnv();
             env.putAll(jobOptions);
             env.put(PYTHON_WORKER_MEMORY_LIMIT, String.valueOf(memoryLimitBytes));
+            env.put(PYTHON_OUTPUT_FLUSH_SIZE, String.valueOf(config.getOutputFlushSize()));
             return Environments.createProcessEnvironment(
                     "", "", processEnvironment.getCommand(), env);
         }
@@ -359,6 +434,11 @@ public abstract class BeamPythonFunctionRunner implements PythonFunctionRunner {
     }
 
     protected void startBundle() {
+        if (inputSharedMemory != null) {
+            // all the blocks of the previous bundle have been consumed
+            inputSharedMemory.reset();
+            outputSharedMemory.reset();
+        }
         try {
             remoteBundle =
                     stageBundleFactory.getBundle(
@@ -389,11 +469,195 @@ public abstract class BeamPythonFunctionRunner implements PythonFunctionRunner {
             @SuppressWarnings("unchecked")
             @Override
             public FnDataReceiver<WindowedValue<byte[]>> create(String pCollectionId) {
+                if (inputBlock != null) {
+                    return input -> receiveBlock(input.getValue());
+                }
                 return input -> resultBuffer.add(input.getValue());
             }
         };
     }
 
+    /**
+     * Whether the coders of this runner support exchanging the data with the Python worker as
+     * blocks, which is required by {@link PythonOptions#DATA_COMPRESSION} and {@link
+     * PythonOptions#SHARED_MEMORY_SIZE}.
+     */
+    protected boolean isDataBlockSupported() {
+        return false;
+    }
+
+    /** Returns the path of the shared memory via which the input data is sent, or "". */
+    protected String getInputSharedMemoryPath() {
+        return inputSharedMemory == null ? "" : inputSharedMemory.getPath();
+    }
+
+    /** Returns the path of the shared memory via which the output data is received, or "". */
+    protected String getOutputSharedMemoryPath() {
+        return outputSharedMemory == null ? "" : outputSharedMemory.getPath();
+    }
+
+    private void openDataBlocks(PythonConfig config) throws IOException {
+        compression = FlinkFnApi.CoderParam.Compression.NONE;
+        compressor = null;
+        decompressor = null;
+        inputBlock = null;
+        String configured = config.getDataCompression().toUpperCase(Locale.ROOT);
+        switch (configured) {
+            case "NONE":
+                break;
+            case "LZ4":
+                if (isDataBlockSupported()) {
+                    compression = FlinkFnApi.CoderParam.Compression.LZ4;
+                }
+                break;
+            default:
+                throw new IllegalArgumentException(
+                        String.format(
+                                "Unsupported value '%s' of the config option '%s', "
+                                        + "the supported values are NONE and LZ4.",
+                                config.getDataCompression(),
+                                PythonOptions.DATA_COMPRESSION.key()));
+        }
+
+        if (compression == FlinkFnApi.CoderParam.Compression.LZ4) {
+            BlockCompressionFactory compressionFactory = new Lz4BlockCompressionFactory();
+            compressor = compressionFactory.getCompressor();
+            decompressor = compressionFactory.getDecompressor();
+            uncompressedBytes = 0;
+            compressedBytes = 0;
+            registerCompressionMetrics();
+        }
+
+        if (config.getSharedMemorySize() > 0 && isDataBlockSupported()) {
+            try {
+                inputSharedMemory = PythonSharedMemory.create(config.getSharedMemorySize());
+                outputSharedMemory = PythonSharedMemory.create(config.getSharedMemorySize());
+            } catch (Throwable t) {
+                closeSharedMemory();
+                throw t;
+            }
+        }
+
+        if (compressor != null || inputSharedMemory != null) {
+            inputBlock = new ByteArrayOutputStreamWithPos(BLOCK_SIZE * 2);
+        }
+    }
+
+    private void closeSharedMemory() throws IOException {
+        try {
+            if (inputSharedMemory != null) {
+                inputSharedMemory.close();
+            }
+        } finally {
+            inputSharedMemory = null;
+            if (outputSharedMemory != null) {
+                outputSharedMemory.close();
+                outputSharedMemory = null;
+            }
+        }
+    }
+
+    /**
+     * Sends the buffered input elements as one block to the Python worker, which is compressed and
+     * written to the shared memory if configured.
+     */
+    private void sendBlock() throws Exception {
+        byte[] block = inputBlock.getBuf();
+        int length = inputBlock.getPosition();
+        if (compressor != null) {
+            ByteBuffer compressed = compressBlock(compressor, block, length);
+            uncompressedBytes += length;
+            compressedBytes += compressed.remaining();
+            block = compressed.array();
+            length = compressed.remaining();
+        }
+        byte[] element =
+                inputSharedMemory != null
+                        ? inputSharedMemory.writeBlock(block, 0, length)
+                        : Arrays.copyOf(block, length);
+        inputBlock.reset();
+        mainInputReceiver.accept(WindowedValue.valueInGlobalWindow(element));
+    }
+
+    /** Splits the block sent by the Python worker into the results. */
+    private void receiveBlock(byte[] element) throws Exception {
+        ByteBuffer block =
+                outputSharedMemory != null
+                        ? outputSharedMemory.readBlock(element)
+                        : ByteBuffer.wrap(element);
+        if (decompressor != null) {
+            compressedBytes += block.remaining();
+            block = decompressBlock(decompressor, block);
+            uncompressedBytes += block.remaining();
+        }
+        splitBlock(block, resultBuffer);
+    }
+
+    /**
+     * Compresses the first length bytes of the given block in the format expected by
+     * pyflink.fn_execution.utils.compression_utils, i.e. the compressed length and the original
+     * length as little endian integers followed by the compressed data.
+     */
+    @VisibleForTesting
+    static ByteBuffer compressBlock(BlockCompressor compressor, byte[] block, int length) {
+        byte[] compressed = new byte[compressor.getMaxCompressedSize(length)];
+        int compressedLength = compressor.compress(block, 0, length, compressed, 0);
+        return ByteBuffer.wrap(compressed, 0, compressedLength);
+    }
+
+    /** Decompresses the given block which is compressed by the Python worker. */
+    @VisibleForTesting
+    static ByteBuffer decompressBlock(BlockDecompressor decompressor, ByteBuffer block) {
+        // the header of a block consists of the compressed length and the original length
+        int originalLength = block.order(ByteOrder.LITTLE_ENDIAN).getInt(block.position() + 4);
+        ByteBuffer decompressed = ByteBuffer.allocate(originalLength);
+        decompressor.decompress(block, 0, block.remaining(), decompressed, 0);
+        decompressed.flip();
+        return decompressed;
+    }
+
+    /** Splits the given uncompressed block into the length-prefixed elements. */
+    @VisibleForTesting
+    static void splitBlock(ByteBuffer block, Collection<byte[]> elements) {
+        while (block.hasRemaining()) {
+            byte[] element = new byte[readVarInt(block)];
+            block.get(element);
+            elements.add(element);
+        }
+    }
+
+    private static int readVarInt(ByteBuffer buffer) {
+        int result = 0;
+        int shift = 0;
+        byte b;
+        do {
+            b = buffer.get();
+            result |= (b & 0x7F) << shift;
+            shift += 7;
+        } while ((b & 0x80) != 0);
+        return result;
+    }
+
+    /**
+     * Registers the sizes of the data exchanged with the Python worker before and after the
+     * compression and the compression ratio. Ignored if the metrics are turned off.
+     */
+    private void registerCompressionMetrics() {
+        if (flinkMetricContainer == null) {
+            return;
+        }
+        MetricGroup metricGroup = flinkMetricContainer.getMetricGroup();
+        metricGroup.gauge("pythonDataUncompressedBytes", (Gauge<Long>) () -> uncompressedBytes);
+        metricGroup.gauge("pythonDataCompressedBytes", (Gauge<Long>) () -> compressedBytes);
+        metricGroup.gauge(
+                "pythonDataCompressionRatio",
+                (Gauge<Double>)
+                        () ->
+                                compressedBytes == 0
+                                        ? 1.0
+                                        : (double) uncompressedBytes / compressedBytes);
+    }
+
     /**
      * Ignore bundle progress if flinkMetricContainer is null. The flinkMetricContainer will be set
      * to null if metric is configured to be turned off.
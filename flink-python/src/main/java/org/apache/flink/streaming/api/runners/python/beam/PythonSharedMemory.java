@@ -0,0 +1,157 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one
+ * or more contributor license agreements.  See the NOTICE file
+ * distributed with this work for additional information
+ * regarding copyright ownership.  The ASF licenses this file
+ * to you under the Apache License, Version 2.0 (the
+ * "License"); you may not use this file except in compliance
+ * with the License.  You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.apache.flink.streaming.api.runners.python.beam;
+
+import org.apache.flink.annotation.Internal;
+import org.apache.flink.util.Preconditions;
+
+import java.io.File;
+import java.io.IOException;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.nio.MappedByteBuffer;
+import java.nio.channels.FileChannel;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.StandardOpenOption;
+
+/**
+ * A memory mapped file via which the blocks of data are exchanged with the Python worker in one
+ * direction. Only a reference to a block written to the file is sent via gRPC, and the block which
+ * doesn't fit into the remaining space of the file is sent via gRPC as is. Each block is sent as
+ * one element of either:
+ *
+ * <pre>
+ *     INLINE | block
+ *     SHARED_MEMORY | offset | length
+ * </pre>
+ *
+ * <p>The file starts with the write position of the writer. The offset, the length and the write
+ * position are little endian integers. It's the same as the format of
+ * pyflink.fn_execution.utils.shared_memory_utils.
+ */
+@Internal
+public final class PythonSharedMemory implements AutoCloseable {
+
+    private static final byte INLINE = 0;
+    private static final byte SHARED_MEMORY = 1;
+
+    private static final int HEADER_LENGTH = 8;
+    private static final int REFERENCE_LENGTH = 9;
+
+    /** The directory of the files, it's backed by memory on Linux. */
+    private static final String SHARED_MEMORY_DIRECTORY = "/dev/shm";
+
+    private final Path path;
+
+    private final MappedByteBuffer buffer;
+
+    private PythonSharedMemory(Path path, MappedByteBuffer buffer) {
+        this.path = path;
+        this.buffer = buffer;
+        this.buffer.order(ByteOrder.LITTLE_ENDIAN);
+        reset();
+    }
+
+    /** Creates a memory mapped file of the given size in bytes. */
+    public static PythonSharedMemory create(long size) throws IOException {
+        Preconditions.checkArgument(
+                size > HEADER_LENGTH && size <= Integer.MAX_VALUE,
+                "The size of the shared memory must be within (%s, %s], was: %s.",
+                HEADER_LENGTH,
+                Integer.MAX_VALUE,
+                size);
+        File directory = new File(SHARED_MEMORY_DIRECTORY);
+        Path path =
+                directory.isDirectory() && directory.canWrite()
+                        ? Files.createTempFile(directory.toPath(), "flink-python-", ".shm")
+                        : Files.createTempFile("flink-python-", ".shm");
+        try (FileChannel channel =
+                FileChannel.open(path, StandardOpenOption.READ, StandardOpenOption.WRITE)) {
+            // the file stays mapped after the channel is closed
+            MappedByteBuffer buffer = channel.map(FileChannel.MapMode.READ_WRITE, 0, size);
+            return new PythonSharedMemory(path, buffer);
+        } catch (Throwable t) {
+            Files.deleteIfExists(path);
+            throw t;
+        }
+    }
+
+    public String getPath() {
+        return path.toString();
+    }
+
+    /**
+     * Resets the write position. It should only be called when all the blocks written to the file
+     * have been consumed, e.g. at the start of a bundle.
+     */
+    public void reset() {
+        buffer.putLong(0, HEADER_LENGTH);
+    }
+
+    /**
+     * Appends the block to the file if there is enough space and returns the element which should
+     * be sent via gRPC.
+     */
+    public byte[] writeBlock(byte[] block, int offset, int length) {
+        long position = Math.max(buffer.getLong(0), HEADER_LENGTH);
+        if (position + length > buffer.capacity()) {
+            byte[] element = new byte[length + 1];
+            element[0] = INLINE;
+            System.arraycopy(block, offset, element, 1, length);
+            return element;
+        }
+        ByteBuffer target = buffer.duplicate();
+        target.position((int) position);
+        target.put(block, offset, length);
+        buffer.putLong(0, position + length);
+        return ByteBuffer.allocate(REFERENCE_LENGTH)
+                .order(ByteOrder.LITTLE_ENDIAN)
+                .put(SHARED_MEMORY)
+                .putInt((int) position)
+                .putInt(length)
+                .array();
+    }
+
+    /**
+     * Returns the block of the element received via gRPC. It's a view of the file if the block is
+     * written to the file, which should be consumed before the write position is reset.
+     */
+    public ByteBuffer readBlock(byte[] element) {
+        if (element[0] == INLINE) {
+            return ByteBuffer.wrap(element, 1, element.length - 1);
+        }
+        ByteBuffer reference = ByteBuffer.wrap(element).order(ByteOrder.LITTLE_ENDIAN);
+        int offset = reference.getInt(1);
+        int length = reference.getInt(5);
+        ByteBuffer block = buffer.duplicate();
+        block.limit(offset + length);
+        block.position(offset);
+        return block;
+    }
+
+    /**
+     * Deletes the file. The memory is released when the mapped buffer is garbage collected as it
+     * can't be unmapped explicitly.
+     */
+    @Override
+    public void close() throws IOException {
+        Files.deleteIfExists(path);
+    }
+}
@@ -170,10 +170,12 @@ import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 
 import java.io.ByteArrayOutputStream;
+import java.io.DataOutputStream;
 import java.io.EOFException;
 import java.io.FileInputStream;
 import java.io.IOException;
 import java.math.BigDecimal;
+import java.net.Socket;
 import java.nio.ByteBuffer;
 import java.nio.channels.Channels;
 import java.nio.channels.ReadableByteChannel;
@@ -585,11 +587,32 @@ public final class ArrowUtils {
     public static AbstractArrowTableSource createArrowTableSource(
             DataType dataType, String fileName) throws IOException {
         try (FileInputStream fis = new FileInputStream(fileName)) {
-            if (RowData.class.isAssignableFrom(dataType.getConversionClass())) {
-                return new ArrowTableSource(dataType, readArrowBatches(fis.getChannel()));
-            } else {
-                return new RowArrowTableSource(dataType, readArrowBatches(fis.getChannel()));
-            }
+            return createArrowTableSource(dataType, readArrowBatches(fis.getChannel()));
+        }
+    }
+
+    /**
+     * Creates an {@link AbstractArrowTableSource} from the Arrow batches served by the Python
+     * process on the given host and port, which is the address its server socket is bound to. The
+     * secret is sent first to authenticate the connection.
+     */
+    public static AbstractArrowTableSource createArrowTableSource(
+            DataType dataType, String host, int port, String secret) throws IOException {
+        try (Socket socket = new Socket(host, port)) {
+            DataOutputStream out = new DataOutputStream(socket.getOutputStream());
+            out.writeUTF(secret);
+            out.flush();
+            return createArrowTableSource(
+                    dataType, readArrowBatches(Channels.newChannel(socket.getInputStream())));
+        }
+    }
+
+    private static AbstractArrowTableSource createArrowTableSource(
+            DataType dataType, byte[][] arrowData) {
+        if (RowData.class.isAssignableFrom(dataType.getConversionClass())) {
+            return new ArrowTableSource(dataType, arrowData);
+        } else {
+            return new RowArrowTableSource(dataType, arrowData);
         }
     }
 
@@ -250,10 +250,17 @@ public abstract class AbstractPythonStatelessFunctionFlatMap extends RichFlatMap
                 PythonDependencyInfo.create(config, getRuntimeContext().getDistributedCache());
         PythonEnv pythonEnv = getPythonEnv();
         if (pythonEnv.getExecType() == PythonEnv.ExecType.PROCESS) {
+            Map<String, String> env = new HashMap<>(System.getenv());
+            if (config.isWorkerPoolEnabled()) {
+                env.put(ProcessPythonEnvironmentManager.PYTHON_WORKER_POOL_ENABLED, "true");
+            }
+            if (config.isPickleOutOfBandEnabled()) {
+                env.put(ProcessPythonEnvironmentManager.PYTHON_PICKLE_OUT_OF_BAND_ENABLED, "true");
+            }
             return new ProcessPythonEnvironmentManager(
                     dependencyInfo,
                     ConfigurationUtils.splitPaths(System.getProperty("java.io.tmpdir")),
-                    System.getenv());
+                    env);
         } else {
             throw new UnsupportedOperationException(
                     String.format(
@@ -294,6 +294,12 @@ public abstract class AbstractPythonStreamAggregateOperator
         jobOptions.put(
                 PythonOptions.STATE_CACHE_SIZE.key(),
                 String.valueOf(config.get(PythonOptions.STATE_CACHE_SIZE)));
+        jobOptions.put(
+                PythonOptions.STATE_CACHE_MAX_BYTES.key(),
+                String.valueOf(config.get(PythonOptions.STATE_CACHE_MAX_BYTES)));
+        jobOptions.put(
+                PythonOptions.STATE_CACHE_EVICTION_POLICY.key(),
+                config.get(PythonOptions.STATE_CACHE_EVICTION_POLICY));
         jobOptions.put(
                 PythonOptions.MAP_STATE_ITERATE_RESPONSE_BATCH_SIZE.key(),
                 String.valueOf(config.get(PythonOptions.MAP_STATE_ITERATE_RESPONSE_BATCH_SIZE)));
@@ -81,13 +81,20 @@ public class BeamTableStatefulPythonFunctionRunner extends BeamPythonFunctionRun
         return this.userDefinedAggregateFunctions.toByteArray();
     }
 
+    @Override
+    protected boolean isDataBlockSupported() {
+        return true;
+    }
+
     @Override
     protected RunnerApi.Coder getInputCoderProto() {
-        return getRowCoderProto(inputType, coderUrn, outputMode);
+        return getRowCoderProto(
+                inputType, coderUrn, outputMode, compression, getInputSharedMemoryPath());
     }
 
     @Override
     protected RunnerApi.Coder getOutputCoderProto() {
-        return getRowCoderProto(outputType, coderUrn, outputMode);
+        return getRowCoderProto(
+                outputType, coderUrn, outputMode, compression, getOutputSharedMemoryPath());
     }
 }
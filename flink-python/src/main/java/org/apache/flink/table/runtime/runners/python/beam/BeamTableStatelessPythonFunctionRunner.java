@@ -29,7 +29,10 @@ import org.apache.flink.util.Preconditions;
 
 import org.apache.beam.model.pipeline.v1.RunnerApi;
 
+import java.util.Arrays;
+import java.util.HashSet;
 import java.util.Map;
+import java.util.Set;
 
 import static org.apache.flink.table.runtime.typeutils.PythonTypeUtils.getRowCoderProto;
 
@@ -37,6 +40,13 @@ import static org.apache.flink.table.runtime.typeutils.PythonTypeUtils.getRowCod
 @Internal
 public class BeamTableStatelessPythonFunctionRunner extends BeamPythonFunctionRunner {
 
+    /** The coders which support exchanging the data with the Python worker as blocks. */
+    private static final Set<String> DATA_BLOCK_SUPPORTED_CODER_URNS =
+            new HashSet<>(
+                    Arrays.asList(
+                            "flink:coder:schema:scalar_function:v1",
+                            "flink:coder:schema:table_function:v1"));
+
     private final RowType inputType;
     private final RowType outputType;
     private final String coderUrn;
@@ -78,13 +88,21 @@ public class BeamTableStatelessPythonFunctionRunner extends BeamPythonFunctionRu
         return this.userDefinedFunctions.toByteArray();
     }
 
+    @Override
+    protected boolean isDataBlockSupported() {
+        // the Arrow coders used by the Pandas UDFs don't support exchanging the data as blocks
+        return DATA_BLOCK_SUPPORTED_CODER_URNS.contains(coderUrn);
+    }
+
     @Override
     protected RunnerApi.Coder getInputCoderProto() {
-        return getRowCoderProto(inputType, coderUrn, outputMode);
+        return getRowCoderProto(
+                inputType, coderUrn, outputMode, compression, getInputSharedMemoryPath());
     }
 
     @Override
     protected RunnerApi.Coder getOutputCoderProto() {
-        return getRowCoderProto(outputType, coderUrn, outputMode);
+        return getRowCoderProto(
+                outputType, coderUrn, outputMode, compression, getOutputSharedMemoryPath());
     }
 }
@@ -92,11 +92,17 @@ public final class PythonTypeUtils {
     private static final long MILLIS_PER_DAY = 86400000L; // = 24 * 60 * 60 * 1000
 
     public static RunnerApi.Coder getRowCoderProto(
-            RowType rowType, String coderUrn, FlinkFnApi.CoderParam.OutputMode outputMode) {
+            RowType rowType,
+            String coderUrn,
+            FlinkFnApi.CoderParam.OutputMode outputMode,
+            FlinkFnApi.CoderParam.Compression compression,
+            String sharedMemoryPath) {
         FlinkFnApi.Schema rowSchema = toProtoType(rowType).getRowSchema();
         FlinkFnApi.CoderParam.Builder coderParamBuilder = FlinkFnApi.CoderParam.newBuilder();
         coderParamBuilder.setSchema(rowSchema);
         coderParamBuilder.setOutputMode(outputMode);
+        coderParamBuilder.setCompression(compression);
+        coderParamBuilder.setSharedMemoryPath(sharedMemoryPath);
         return RunnerApi.Coder.newBuilder()
                 .setSpec(
                         RunnerApi.FunctionSpec.newBuilder()
@@ -0,0 +1,124 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one or more
+ * contributor license agreements.  See the NOTICE file distributed with
+ * this work for additional information regarding copyright ownership.
+ * The ASF licenses this file to You under the Apache License, Version 2.0
+ * (the "License"); you may not use this file except in compliance with
+ * the License.  You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.apache.flink.api.common.python;
+
+import org.junit.Test;
+
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Iterator;
+import java.util.List;
+import java.util.concurrent.CountDownLatch;
+
+import static org.junit.Assert.assertEquals;
+import static org.junit.Assert.assertFalse;
+import static org.junit.Assert.assertTrue;
+
+/** Tests for {@link PrefetchingIterator}. */
+public class PrefetchingIteratorTest {
+
+    @Test
+    public void testIterate() throws Exception {
+        List<Integer> elements = new ArrayList<>();
+        for (int i = 0; i < 100; i++) {
+            elements.add(i);
+        }
+        try (PrefetchingIterator<Integer> iterator =
+                new PrefetchingIterator<>(elements.iterator(), 7)) {
+            List<Integer> results = new ArrayList<>();
+            while (iterator.hasNext()) {
+                results.add(iterator.next());
+            }
+            assertEquals(elements, results);
+            assertFalse(iterator.hasBufferedNext());
+        }
+    }
+
+    @Test
+    public void testBufferedNextOfBlockedIterator() throws Exception {
+        CountDownLatch release = new CountDownLatch(1);
+        try (PrefetchingIterator<Integer> iterator =
+                new PrefetchingIterator<>(new BlockingIterator(Arrays.asList(1, 2), release), 7)) {
+            assertTrue(iterator.hasNext());
+            assertEquals(1, (int) iterator.next());
+            assertTrue(iterator.hasNext());
+            assertEquals(2, (int) iterator.next());
+            // the next element is blocked, which must not block the check
+            assertFalse(iterator.hasBufferedNext());
+        }
+    }
+
+    @Test
+    public void testCloseWhileBlocked() throws Exception {
+        CountDownLatch release = new CountDownLatch(1);
+        PrefetchingIterator<Integer> iterator =
+                new PrefetchingIterator<>(new BlockingIterator(Arrays.asList(1), release), 7);
+        assertEquals(1, (int) iterator.next());
+        iterator.close();
+        assertFalse(iterator.hasNext());
+        assertFalse(iterator.hasBufferedNext());
+    }
+
+    @Test(expected = IllegalStateException.class)
+    public void testFetchError() {
+        Iterator<Integer> failingIterator =
+                new Iterator<Integer>() {
+                    @Override
+                    public boolean hasNext() {
+                        return true;
+                    }
+
+                    @Override
+                    public Integer next() {
+                        throw new IllegalStateException("expected");
+                    }
+                };
+        new PrefetchingIterator<>(failingIterator, 7).hasNext();
+    }
+
+    /** An iterator which blocks after the given elements until it is released. */
+    private static class BlockingIterator implements Iterator<Integer> {
+
+        private final Iterator<Integer> elements;
+
+        private final CountDownLatch release;
+
+        BlockingIterator(List<Integer> elements, CountDownLatch release) {
+            this.elements = elements.iterator();
+            this.release = release;
+        }
+
+        @Override
+        public boolean hasNext() {
+            if (!elements.hasNext()) {
+                try {
+                    release.await();
+                } catch (InterruptedException e) {
+                    Thread.currentThread().interrupt();
+                }
+                return false;
+            }
+            return true;
+        }
+
+        @Override
+        public Integer next() {
+            return elements.next();
+        }
+    }
+}
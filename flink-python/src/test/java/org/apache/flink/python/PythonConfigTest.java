@@ -53,6 +53,21 @@ public class PythonConfigTest {
         assertThat(
                 pythonConfig.isUsingManagedMemory(),
                 is(equalTo(PythonOptions.USE_MANAGED_MEMORY.defaultValue())));
+        assertThat(
+                pythonConfig.isWorkerPoolEnabled(),
+                is(equalTo(PythonOptions.WORKER_POOL_ENABLED.defaultValue())));
+        assertThat(
+                pythonConfig.isPickleOutOfBandEnabled(),
+                is(equalTo(PythonOptions.PICKLE_OUT_OF_BAND_ENABLED.defaultValue())));
+        assertThat(
+                pythonConfig.getDataCompression(),
+                is(equalTo(PythonOptions.DATA_COMPRESSION.defaultValue())));
+        assertThat(
+                pythonConfig.getSharedMemorySize(),
+                is(equalTo(PythonOptions.SHARED_MEMORY_SIZE.defaultValue())));
+        assertThat(
+                pythonConfig.getOutputFlushSize(),
+                is(equalTo(PythonOptions.OUTPUT_FLUSH_SIZE.defaultValue())));
     }
 
     @Test
@@ -143,4 +158,44 @@ public class PythonConfigTest {
         PythonConfig pythonConfig = new PythonConfig(config);
         assertThat(pythonConfig.isUsingManagedMemory(), is(equalTo(true)));
     }
+
+    @Test
+    public void testWorkerPoolEnabled() {
+        Configuration config = new Configuration();
+        config.set(PythonOptions.WORKER_POOL_ENABLED, true);
+        PythonConfig pythonConfig = new PythonConfig(config);
+        assertThat(pythonConfig.isWorkerPoolEnabled(), is(equalTo(true)));
+    }
+
+    @Test
+    public void testPickleOutOfBandEnabled() {
+        Configuration config = new Configuration();
+        config.set(PythonOptions.PICKLE_OUT_OF_BAND_ENABLED, true);
+        PythonConfig pythonConfig = new PythonConfig(config);
+        assertThat(pythonConfig.isPickleOutOfBandEnabled(), is(equalTo(true)));
+    }
+
+    @Test
+    public void testDataCompression() {
+        Configuration config = new Configuration();
+        config.set(PythonOptions.DATA_COMPRESSION, "LZ4");
+        PythonConfig pythonConfig = new PythonConfig(config);
+        assertThat(pythonConfig.getDataCompression(), is(equalTo("LZ4")));
+    }
+
+    @Test
+    public void testSharedMemorySize() {
+        Configuration config = new Configuration();
+        config.set(PythonOptions.SHARED_MEMORY_SIZE, 64L * 1024 * 1024);
+        PythonConfig pythonConfig = new PythonConfig(config);
+        assertThat(pythonConfig.getSharedMemorySize(), is(equalTo(64L * 1024 * 1024)));
+    }
+
+    @Test
+    public void testOutputFlushSize() {
+        Configuration config = new Configuration();
+        config.set(PythonOptions.OUTPUT_FLUSH_SIZE, 1024L * 1024);
+        PythonConfig pythonConfig = new PythonConfig(config);
+        assertThat(pythonConfig.getOutputFlushSize(), is(equalTo(1024L * 1024)));
+    }
 }
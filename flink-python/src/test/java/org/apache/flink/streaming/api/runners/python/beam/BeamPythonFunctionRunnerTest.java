@@ -0,0 +1,110 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one or more
+ * contributor license agreements.  See the NOTICE file distributed with
+ * this work for additional information regarding copyright ownership.
+ * The ASF licenses this file to You under the Apache License, Version 2.0
+ * (the "License"); you may not use this file except in compliance with
+ * the License.  You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.apache.flink.streaming.api.runners.python.beam;
+
+import org.apache.flink.core.memory.ByteArrayOutputStreamWithPos;
+import org.apache.flink.runtime.io.compression.BlockCompressionFactory;
+import org.apache.flink.runtime.io.compression.Lz4BlockCompressionFactory;
+
+import org.apache.beam.sdk.util.VarInt;
+import org.junit.Test;
+
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.nio.charset.StandardCharsets;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.List;
+
+import static org.junit.Assert.assertArrayEquals;
+import static org.junit.Assert.assertEquals;
+import static org.junit.Assert.assertTrue;
+
+/** Tests for the data blocks exchanged by {@link BeamPythonFunctionRunner}. */
+public class BeamPythonFunctionRunnerTest {
+
+    /**
+     * The elements "flink" and "python" * 8 compressed as one block by
+     * pyflink.fn_execution.utils.compression_utils.compress, see also test_coders.py.
+     */
+    private static final byte[] PYTHON_LZ4_BLOCK =
+            new byte[] {
+                23, 0, 0, 0, 55, 0, 0, 0, -33, 5, 102, 108, 105, 110, 107, 48, 112, 121, 116, 104,
+                111, 110, 6, 0, 18, 80, 121, 116, 104, 111, 110
+            };
+
+    private final BlockCompressionFactory compressionFactory = new Lz4BlockCompressionFactory();
+
+    @Test
+    public void testReceivePythonBlock() {
+        ByteBuffer block =
+                BeamPythonFunctionRunner.decompressBlock(
+                        compressionFactory.getDecompressor(), ByteBuffer.wrap(PYTHON_LZ4_BLOCK));
+        List<byte[]> elements = new ArrayList<>();
+        BeamPythonFunctionRunner.splitBlock(block, elements);
+
+        assertEquals(2, elements.size());
+        assertArrayEquals(bytes("flink"), elements.get(0));
+        assertArrayEquals(
+                bytes("pythonpythonpythonpythonpythonpythonpythonpython"), elements.get(1));
+    }
+
+    @Test
+    public void testSendAndReceiveBlock() throws Exception {
+        List<byte[]> elements = new ArrayList<>();
+        ByteArrayOutputStreamWithPos inputBlock = new ByteArrayOutputStreamWithPos();
+        for (int i = 0; inputBlock.getPosition() < 64 * 1024; i++) {
+            // the elements of different sizes, including the ones with multi-byte lengths
+            byte[] element = bytes(String.valueOf(i));
+            element = Arrays.copyOf(element, element.length + i % 300);
+            elements.add(element);
+            VarInt.encode(element.length, inputBlock);
+            inputBlock.write(element);
+        }
+        int length = inputBlock.getPosition();
+
+        ByteBuffer compressed =
+                BeamPythonFunctionRunner.compressBlock(
+                        compressionFactory.getCompressor(), inputBlock.getBuf(), length);
+
+        // the header is read by pyflink.fn_execution.utils.compression_utils.decompress
+        ByteBuffer header = compressed.duplicate().order(ByteOrder.LITTLE_ENDIAN);
+        assertEquals(compressed.remaining() - 8, header.getInt(compressed.position()));
+        assertEquals(length, header.getInt(compressed.position() + 4));
+        assertTrue(compressed.remaining() < length);
+
+        // the block is sent as an array, which starts from the header
+        ByteBuffer received =
+                ByteBuffer.wrap(Arrays.copyOf(compressed.array(), compressed.remaining()));
+        ByteBuffer decompressed =
+                BeamPythonFunctionRunner.decompressBlock(
+                        compressionFactory.getDecompressor(), received);
+        assertEquals(length, decompressed.remaining());
+        List<byte[]> results = new ArrayList<>();
+        BeamPythonFunctionRunner.splitBlock(decompressed, results);
+
+        assertEquals(elements.size(), results.size());
+        for (int i = 0; i < elements.size(); i++) {
+            assertArrayEquals(elements.get(i), results.get(i));
+        }
+    }
+
+    private static byte[] bytes(String value) {
+        return value.getBytes(StandardCharsets.UTF_8);
+    }
+}
@@ -0,0 +1,109 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one or more
+ * contributor license agreements.  See the NOTICE file distributed with
+ * this work for additional information regarding copyright ownership.
+ * The ASF licenses this file to You under the Apache License, Version 2.0
+ * (the "License"); you may not use this file except in compliance with
+ * the License.  You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.apache.flink.streaming.api.runners.python.beam;
+
+import org.junit.After;
+import org.junit.Before;
+import org.junit.Test;
+
+import java.io.IOException;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Paths;
+import java.util.Arrays;
+
+import static org.junit.Assert.assertArrayEquals;
+import static org.junit.Assert.assertEquals;
+import static org.junit.Assert.assertFalse;
+import static org.junit.Assert.assertTrue;
+
+/** Tests for {@link PythonSharedMemory}. */
+public class PythonSharedMemoryTest {
+
+    private PythonSharedMemory sharedMemory;
+
+    @Before
+    public void setUp() throws IOException {
+        // the header of 8 bytes and 10 bytes for the blocks
+        sharedMemory = PythonSharedMemory.create(18);
+    }
+
+    @After
+    public void tearDown() throws IOException {
+        sharedMemory.close();
+    }
+
+    @Test
+    public void testWriteAndReadBlock() throws IOException {
+        byte[] element = sharedMemory.writeBlock(bytes("xhello"), 1, 5);
+        // the same elements are written by test_coders.py
+        assertArrayEquals(new byte[] {1, 8, 0, 0, 0, 5, 0, 0, 0}, element);
+        assertArrayEquals(bytes("hello"), read(sharedMemory.readBlock(element)));
+
+        // the file starts with the write position, which is read by the Python worker
+        byte[] content = Files.readAllBytes(Paths.get(sharedMemory.getPath()));
+        assertEquals(18, content.length);
+        assertEquals(13L, ByteBuffer.wrap(content).order(ByteOrder.LITTLE_ENDIAN).getLong(0));
+        assertArrayEquals(bytes("hello"), Arrays.copyOfRange(content, 8, 13));
+
+        element = sharedMemory.writeBlock(bytes("abc"), 0, 3);
+        assertArrayEquals(new byte[] {1, 13, 0, 0, 0, 3, 0, 0, 0}, element);
+        assertArrayEquals(bytes("abc"), read(sharedMemory.readBlock(element)));
+    }
+
+    @Test
+    public void testInlineBlockWhenFull() {
+        sharedMemory.writeBlock(bytes("hello"), 0, 5);
+        byte[] element = sharedMemory.writeBlock(bytes("world!"), 0, 6);
+        assertArrayEquals(bytes("\0world!"), element);
+        assertArrayEquals(bytes("world!"), read(sharedMemory.readBlock(element)));
+
+        // the block which is larger than the file is always sent inline
+        element = sharedMemory.writeBlock(new byte[11], 0, 11);
+        assertEquals(12, element.length);
+        assertEquals(0, element[0]);
+    }
+
+    @Test
+    public void testReset() {
+        sharedMemory.writeBlock(bytes("hello"), 0, 5);
+        sharedMemory.reset();
+        byte[] element = sharedMemory.writeBlock(bytes("world!"), 0, 6);
+        assertArrayEquals(new byte[] {1, 8, 0, 0, 0, 6, 0, 0, 0}, element);
+        assertArrayEquals(bytes("world!"), read(sharedMemory.readBlock(element)));
+    }
+
+    @Test
+    public void testClose() throws IOException {
+        assertTrue(Files.exists(Paths.get(sharedMemory.getPath())));
+        sharedMemory.close();
+        assertFalse(Files.exists(Paths.get(sharedMemory.getPath())));
+    }
+
+    private static byte[] read(ByteBuffer block) {
+        byte[] result = new byte[block.remaining()];
+        block.get(result);
+        return result;
+    }
+
+    private static byte[] bytes(String value) {
+        return value.getBytes(StandardCharsets.UTF_8);
+    }
+}
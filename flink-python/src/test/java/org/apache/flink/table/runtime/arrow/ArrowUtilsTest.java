@@ -39,6 +39,7 @@ import org.apache.flink.table.runtime.arrow.readers.TimestampFieldReader;
 import org.apache.flink.table.runtime.arrow.readers.TinyIntFieldReader;
 import org.apache.flink.table.runtime.arrow.readers.VarBinaryFieldReader;
 import org.apache.flink.table.runtime.arrow.readers.VarCharFieldReader;
+import org.apache.flink.table.runtime.arrow.sources.AbstractArrowTableSource;
 import org.apache.flink.table.runtime.arrow.vectors.ArrowArrayColumnVector;
 import org.apache.flink.table.runtime.arrow.vectors.ArrowBigIntColumnVector;
 import org.apache.flink.table.runtime.arrow.vectors.ArrowBooleanColumnVector;
@@ -86,6 +87,7 @@ import org.apache.flink.table.runtime.arrow.writers.TimestampWriter;
 import org.apache.flink.table.runtime.arrow.writers.TinyIntWriter;
 import org.apache.flink.table.runtime.arrow.writers.VarBinaryWriter;
 import org.apache.flink.table.runtime.arrow.writers.VarCharWriter;
+import org.apache.flink.table.types.DataType;
 import org.apache.flink.table.types.logical.ArrayType;
 import org.apache.flink.table.types.logical.BigIntType;
 import org.apache.flink.table.types.logical.BooleanType;
@@ -103,6 +105,7 @@ import org.apache.flink.table.types.logical.TimestampType;
 import org.apache.flink.table.types.logical.TinyIntType;
 import org.apache.flink.table.types.logical.VarBinaryType;
 import org.apache.flink.table.types.logical.VarCharType;
+import org.apache.flink.table.types.utils.TypeConversions;
 import org.apache.flink.types.Row;
 
 import org.apache.flink.shaded.guava18.com.google.common.collect.Lists;
@@ -121,11 +124,16 @@ import org.junit.Test;
 
 import java.io.ByteArrayInputStream;
 import java.io.ByteArrayOutputStream;
+import java.io.DataInputStream;
 import java.io.IOException;
+import java.net.InetAddress;
+import java.net.ServerSocket;
+import java.net.Socket;
 import java.nio.channels.Channels;
 import java.util.ArrayList;
 import java.util.Arrays;
 import java.util.List;
+import java.util.concurrent.CompletableFuture;
 
 import static org.junit.Assert.assertEquals;
 
@@ -474,6 +482,46 @@ public class ArrowUtilsTest {
 
     @Test
     public void testReadArrowBatches() throws IOException {
+        assertEquals(
+                3,
+                ArrowUtils.readArrowBatches(
+                                Channels.newChannel(new ByteArrayInputStream(writeArrowBatches())))
+                        .length);
+    }
+
+    @Test
+    public void testCreateArrowTableSourceFromSocket() throws Exception {
+        byte[] arrowData = writeArrowBatches();
+        // the server socket of the Python process is bound to 127.0.0.1
+        try (ServerSocket serverSocket =
+                new ServerSocket(0, 1, InetAddress.getByName("127.0.0.1"))) {
+            CompletableFuture<String> receivedSecret =
+                    CompletableFuture.supplyAsync(
+                            () -> {
+                                try (Socket socket = serverSocket.accept()) {
+                                    String secret =
+                                            new DataInputStream(socket.getInputStream()).readUTF();
+                                    socket.getOutputStream().write(arrowData);
+                                    return secret;
+                                } catch (IOException e) {
+                                    throw new RuntimeException(e);
+                                }
+                            });
+
+            DataType dataType = TypeConversions.fromLogicalToDataType(rowType);
+            AbstractArrowTableSource<?> tableSource =
+                    ArrowUtils.createArrowTableSource(
+                            dataType,
+                            serverSocket.getInetAddress().getHostAddress(),
+                            serverSocket.getLocalPort(),
+                            "secret");
+            assertEquals("secret", receivedSecret.get());
+            assertEquals(dataType, tableSource.getProducedDataType());
+        }
+    }
+
+    /** Writes the test data as 3 Arrow batches in the Arrow streaming format. */
+    private static byte[] writeArrowBatches() throws IOException {
         VectorSchemaRoot root =
                 VectorSchemaRoot.create(ArrowUtils.toArrowSchema(rowType), allocator);
         ArrowWriter<RowData> arrowWriter = ArrowUtils.createRowDataArrowWriter(root, rowType);
@@ -498,11 +546,7 @@ public class ArrowUtilsTest {
             arrowStreamWriter.writeBatch();
             arrowWriter.reset();
         }
-
-        assertEquals(
-                batches,
-                ArrowUtils.readArrowBatches(
-                                Channels.newChannel(new ByteArrayInputStream(baos.toByteArray())))
-                        .length);
+        arrowStreamWriter.end();
+        return baos.toByteArray();
     }
 }